@@ -32,8 +32,11 @@ import time
 from typing import Any, Dict, List, Optional
 
 from ...brazil import (
+    ComputeQuotesAnalyticsUseCaseB3,
     CreateDocsToExtractUseCaseB3,
     DocsToExtractorB3,
+    DownloadCotahistUseCaseB3,
+    ExportPriceMatricesUseCaseB3,
     ExtractHistoricalQuotesUseCaseB3,
     GetAvailableAssetsUseCaseB3,
     GetAvailableYearsUseCaseB3,
@@ -104,6 +107,12 @@ class HistoricalQuotesB3:
         self.__available_assets_use_case = GetAvailableAssetsUseCaseB3()
         self.__available_years_use_case = GetAvailableYearsUseCaseB3()
         self.__validate_config_use_case = ValidateExtractionConfigUseCaseB3()
+        self.__analytics_use_case: Optional[
+            ComputeQuotesAnalyticsUseCaseB3
+        ] = None
+        self.__export_matrices_use_case: Optional[
+            ExportPriceMatricesUseCaseB3
+        ] = None
         self.__result_formatter = ExtractionResultFormatter(use_colors=True)
 
         logger.info('HistoricalQuotesB3 client initialized')
@@ -117,6 +126,10 @@ class HistoricalQuotesB3:
         destination_path: Optional[str] = None,
         output_filename: str = 'cotahist_extracted',
         processing_mode: str = 'fast',
+        cache_dir: Optional[str] = None,
+        resume: bool = False,
+        on_conflict: Optional[str] = None,
+        download_missing: bool = False,
     ) -> Dict[str, Any]:
         """Extract historical quotes from COTAHIST ZIP files to Parquet format.
 
@@ -158,6 +171,35 @@ class HistoricalQuotesB3:
                            - Dict[str, Any]'slow': Resource-efficient mode
                              Uses less CPU/RAM, suitable for limited resources
                            Example: "fast"
+            cache_dir: Optional directory for the canonical parse cache.
+                     When set, each ZIP is parsed once with every market type
+                     and stored there keyed by ZIP hash and parser version.
+                     Later extractions with any assets_list only filter the
+                     cached files instead of reparsing the ZIPs.
+                     Default: None (no cache)
+                     Example: "/data/cotahist_cache"
+            resume: Resume an interrupted extraction into the same output.
+                  Each completed ZIP is checkpointed in a run journal
+                  ('<output_filename>.parquet.journal.json') and its temp
+                  file is kept until the final merge succeeds. A rerun with
+                  resume=True skips validated ZIPs and continues with the
+                  remaining ones and the merge.
+                  Default: False
+            on_conflict: How to write into an existing output file.
+                       - None: overwrite the output file (default)
+                       - 'replace': upsert, new records replace existing ones
+                       - 'skip': keep existing records, add only new ones
+                       - 'error': fail if any record already exists
+                       Records are matched on (data_pregao, ticker,
+                       tipo_mercado, prazo_termo) and only row groups whose
+                       dates overlap the new data are rewritten.
+                       Example: "replace"
+            download_missing: Download the annual COTAHIST files of years
+                            that have no file in path_of_docs from the B3
+                            portal before extracting. The current year's
+                            file is also refreshed if it changed. The
+                            directory is created if needed.
+                            Default: False
 
         Returns:
             Dictionary containing extraction results with the following keys:
@@ -169,12 +211,17 @@ class HistoricalQuotesB3:
             - total_records (int): Total number of records extracted
             - output_file (str): Path to the generated Parquet file
             - errors (List[str], optional): List of error messages if any
+            - downloads (dict, optional): With download_missing, the
+              'downloaded', 'not_modified', 'unavailable' and 'errors' of
+              the download step
 
         Raises:
             EmptyAssetListError: If assets_list is empty or not a list.
             InvalidAssetsName: If any asset class in assets_list is invalid.
             InvalidFirstYear: If initial_year is outside valid range (1986 - current year).
             InvalidLastYear: If last_year is outside valid range or < initial_year.
+            InvalidConflictPolicy: If on_conflict is not a valid policy.
+            DuplicateQuotesError: If on_conflict='error' and records exist.
             ValueError: If path_of_docs is invalid.
             OSError: If directories cannot be created or accessed.
 
@@ -221,6 +268,10 @@ class HistoricalQuotesB3:
             )
         )
 
+        on_conflict = self.__validate_config_use_case.validate_on_conflict(
+            on_conflict
+        )
+
         logger.info(
             f'Extraction requested: path={path_of_docs}, '
             f'destination={destination_path or path_of_docs}, '
@@ -228,13 +279,23 @@ class HistoricalQuotesB3:
             f'mode={processing_mode}'
         )
 
-        docs_to_extract: DocsToExtractorB3 = CreateDocsToExtractUseCaseB3(
+        create_docs_use_case = CreateDocsToExtractUseCaseB3(
             path_of_docs=path_of_docs,
             assets_list=assets_list,
             initial_year=initial_year,
             last_year=last_year,
             destination_path=destination_path,
-        ).execute()
+        )
+
+        downloads: Optional[Dict[str, Any]] = None
+        if download_missing:
+            # Reject bad assets or destinations before a long download
+            create_docs_use_case.validate()
+            downloads = DownloadCotahistUseCaseB3().execute_sync(
+                initial_year, last_year, path_of_docs
+            )
+
+        docs_to_extract: DocsToExtractorB3 = create_docs_use_case.execute()
 
         logger.info(
             f'Found {len(docs_to_extract.set_documents_to_download)} ZIP files to process'
@@ -246,6 +307,9 @@ class HistoricalQuotesB3:
             docs_to_extract=docs_to_extract,
             processing_mode=processing_mode,
             output_filename=output_filename_with_ext,
+            cache_dir=cache_dir,
+            resume=resume,
+            on_conflict=on_conflict,
         )
 
         elapsed_time = time.time() - start_time
@@ -254,6 +318,9 @@ class HistoricalQuotesB3:
             HistoricalQuotesResultFormatter.enrich_result(result)
         )
 
+        if downloads is not None:
+            result_dict['downloads'] = downloads
+
         # Add metadata for the formatter
         result['assets'] = assets_list
         result['processing_mode'] = processing_mode
@@ -269,6 +336,122 @@ class HistoricalQuotesB3:
 
         return result_dict
 
+    def compute_analytics(
+        self,
+        source_file: str,
+        windows: Optional[List[int]] = None,
+        destination_path: Optional[str] = None,
+        output_filename: Optional[str] = None,
+        benchmark_ticker: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Compute per-ticker returns and rolling statistics.
+
+        Reads a Parquet file produced by extract() and materialises a
+        companion dataset keyed by (ticker, data_pregao) with log returns,
+        annualized rolling volatility, rolling ADTV and rolling beta for
+        every window in one vectorized pass per ticker batch.
+
+        Args:
+            source_file: Path to the extracted quotes Parquet file
+            windows: Rolling window sizes in trading sessions.
+                Default: [21, 63, 252]
+            destination_path: Output directory. Default: source file dir
+            output_filename: Output file name.
+                Default: '<source_stem>_analytics.parquet'
+            benchmark_ticker: Ticker used as market proxy for beta
+                (e.g., 'BOVA11'). Default: equal-weighted session mean
+
+        Returns:
+            Dictionary with total_records, total_tickers, windows and
+            output_file
+
+        Raises:
+            InvalidAnalyticsWindows: If windows are invalid
+            FileNotFoundError: If source_file does not exist
+
+        Example:
+            >>> b3 = HistoricalQuotesB3()
+            >>> result = b3.compute_analytics(
+            ...     source_file="/data/output/cotahist_extracted.parquet",
+            ...     windows=[21, 252],
+            ...     benchmark_ticker="BOVA11"
+            ... )
+            >>> print(result['output_file'])
+        """
+        if self.__analytics_use_case is None:
+            self.__analytics_use_case = ComputeQuotesAnalyticsUseCaseB3()
+
+        logger.info(
+            f'Analytics requested: source={source_file}, windows={windows}, '
+            f'benchmark={benchmark_ticker}'
+        )
+
+        result: Dict[str, Any] = self.__analytics_use_case.execute(
+            source_file=source_file,
+            windows=windows,
+            destination_path=destination_path,
+            output_filename=output_filename,
+            benchmark_ticker=benchmark_ticker,
+        )
+        return result
+
+    def export_matrices(
+        self,
+        source_file: str,
+        destination_path: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        incremental: bool = True,
+    ) -> Dict[str, Any]:
+        """Export quotes as aligned dates x tickers ``.npy`` matrices.
+
+        Writes ``dates.npy``, ``tickers.npy``, ``close.npy``, ``volume.npy``
+        and ``returns.npy`` to the destination directory. The matrices can
+        be opened with ``np.load(path, mmap_mode='r')`` for zero-copy
+        slicing. Exporting into a directory that already holds matrices
+        merges the new dates and tickers into them.
+
+        Args:
+            source_file: Path to the extracted quotes Parquet file
+            destination_path: Output directory.
+                Default: '<source_dir>/<source_stem>_matrices'
+            tickers: Optional subset of tickers to export.
+                Default: every ticker in the source file
+            incremental: Update existing matrices instead of rebuilding.
+                Default: True
+
+        Returns:
+            Dictionary with total_dates, total_tickers, new_dates,
+            new_tickers, output_dir and files
+
+        Raises:
+            FileNotFoundError: If source_file does not exist
+
+        Example:
+            >>> import numpy as np
+            >>> b3 = HistoricalQuotesB3()
+            >>> result = b3.export_matrices(
+            ...     source_file="/data/output/cotahist_extracted.parquet",
+            ...     destination_path="/data/matrices"
+            ... )
+            >>> close = np.load("/data/matrices/close.npy", mmap_mode="r")
+            >>> tickers = np.load("/data/matrices/tickers.npy")
+        """
+        if self.__export_matrices_use_case is None:
+            self.__export_matrices_use_case = ExportPriceMatricesUseCaseB3()
+
+        logger.info(
+            f'Matrix export requested: source={source_file}, '
+            f'destination={destination_path}, incremental={incremental}'
+        )
+
+        result: Dict[str, Any] = self.__export_matrices_use_case.execute(
+            source_file=source_file,
+            destination_path=destination_path,
+            tickers=tickers,
+            incremental=incremental,
+        )
+        return result
+
     def get_available_assets(self) -> List[str]:
         """Get all available B3 asset classes that can be extracted.
 
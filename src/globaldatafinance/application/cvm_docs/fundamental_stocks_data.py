@@ -25,6 +25,15 @@ Example:
     ...     last_year=2023
     ... )
     >>> print(f"Downloaded {result.success_count_downloads} files successfully")
+    >>>
+    >>> # Reuse one HTTP connection pool across several downloads
+    >>> async with FundamentalStocksDataCVM() as cvm:
+    ...     await cvm.download_async("/path/to/save", list_docs=["DFP"])
+    ...     await cvm.download_async("/path/to/save", list_docs=["ITR"])
+    >>>
+    >>> # Keep a shared mirror up to date and read from it on the workers
+    >>> FundamentalStocksDataCVM().sync_mirror("/srv/cvm-mirror")
+    >>> cvm = FundamentalStocksDataCVM(mirror_url="/srv/cvm-mirror")
 """
 
 from typing import Dict, List, Optional
@@ -36,6 +45,7 @@ from ...brazil import (
     GetAvailableDocsUseCaseCVM,
     GetAvailableYearsUseCaseCVM,
     ParquetExtractorAdapterCVM,
+    SyncMirrorUseCaseCVM,
 )
 from ...core import get_logger
 from .download_result_formatter import DownloadResultFormatter
@@ -80,16 +90,43 @@ class FundamentalStocksDataCVM:
         ...     print(f"Some downloads failed: {result.errors}")
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        mirror_url: Optional[str] = None,
+        discover_files: bool = False,
+    ):
         """Initialize the FundamentalStocksDataCVM client.
 
         The automatic_extractor option can be passed per download call.
         See download() method for details.
+
+        Args:
+            mirror_url: Mirror of the CVM portal tried before it for every
+                file: a base URL ("http://mirror.lan:8000") or a local
+                directory maintained with sync_mirror(). Files missing
+                from the mirror are downloaded from the CVM portal.
+            discover_files: Read the portal's directory listings before
+                downloading, so years that were not published are not
+                requested and files unchanged since the last download
+                are skipped without a request.
         """
+        if mirror_url is not None and not isinstance(mirror_url, str):
+            raise TypeError(
+                f'mirror_url must be a string or None, '
+                f'got {type(mirror_url).__name__}'
+            )
+        if not isinstance(discover_files, bool):
+            raise TypeError(
+                f'discover_files must be a boolean (True or False), '
+                f'got {type(discover_files).__name__}: {discover_files!r}'
+            )
+
         # Initialize with ParquetExtractorAdapterCVM and automatic_extractor=False by default
         # automatic_extractor can be overridden per download call
         self.download_adapter = AsyncDownloadAdapterCVM(
-            file_extractor_repository=ParquetExtractorAdapterCVM()
+            file_extractor_repository=ParquetExtractorAdapterCVM(),
+            mirror_url=mirror_url,
+            discover_files=discover_files,
         )
         self.__download_use_case = DownloadDocumentsUseCaseCVM(
             self.download_adapter
@@ -110,6 +147,7 @@ class FundamentalStocksDataCVM:
         initial_year: Optional[int] = None,
         last_year: Optional[int] = None,
         automatic_extractor: bool = False,
+        keep_zip: bool = True,
     ) -> DownloadResultCVM:
         """Download CVM financial documents to a specified location.
 
@@ -138,6 +176,10 @@ class FundamentalStocksDataCVM:
                                 to Parquet format. If False or None, keeps ZIP files.
                                 Default: False (keeps original ZIP files)
                                 Example: True
+            keep_zip: With automatic_extractor, write each ZIP to disk
+                     before converting it (default). False spools the ZIP
+                     in memory and converts it from there, so the archive
+                     is never written to destination_path.
 
         Returns:
             DownloadResultCVM object containing:
@@ -176,11 +218,93 @@ class FundamentalStocksDataCVM:
             >>> if result.error_count_downloads > 0:
             ...     print(f"Some downloads failed: {result.failed_downloads}")
         """
+        self.__prepare_download(
+            destination_path,
+            list_docs,
+            initial_year,
+            last_year,
+            automatic_extractor,
+            keep_zip,
+        )
+
+        result: DownloadResultCVM = self.__download_use_case.execute(
+            destination_path=destination_path,
+            list_docs=list_docs,
+            initial_year=initial_year,
+            last_year=last_year,
+            keep_zip=keep_zip,
+        )
+
+        return self.__finish_download(result)
+
+    async def download_async(
+        self,
+        destination_path: str,
+        list_docs: Optional[List[str]] = None,
+        initial_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+        automatic_extractor: bool = False,
+        keep_zip: bool = True,
+    ) -> DownloadResultCVM:
+        """Download CVM financial documents from a running event loop.
+
+        Same arguments, result and errors as download(). Inside
+        ``async with FundamentalStocksDataCVM() as cvm:`` every call reuses
+        the same pooled HTTP connections.
+
+        Example:
+            >>> async with FundamentalStocksDataCVM() as cvm:
+            ...     dfp = await cvm.download_async("/data", list_docs=["DFP"])
+            ...     itr = await cvm.download_async("/data", list_docs=["ITR"])
+        """
+        self.__prepare_download(
+            destination_path,
+            list_docs,
+            initial_year,
+            last_year,
+            automatic_extractor,
+            keep_zip,
+        )
+
+        result: DownloadResultCVM = (
+            await self.__download_use_case.execute_async(
+                destination_path=destination_path,
+                list_docs=list_docs,
+                initial_year=initial_year,
+                last_year=last_year,
+                keep_zip=keep_zip,
+            )
+        )
+
+        return self.__finish_download(result)
+
+    async def __aenter__(self) -> 'FundamentalStocksDataCVM':
+        """Open a pooled HTTP client shared by download_async() calls."""
+        await self.download_adapter.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.download_adapter.aclose()
+
+    def __prepare_download(
+        self,
+        destination_path: str,
+        list_docs: Optional[List[str]],
+        initial_year: Optional[int],
+        last_year: Optional[int],
+        automatic_extractor: bool,
+        keep_zip: bool = True,
+    ) -> None:
         if not isinstance(automatic_extractor, bool):
             raise TypeError(
                 f'automatic_extractor must be a boolean (True or False), '
                 f'got {type(automatic_extractor).__name__}: {automatic_extractor!r}'
             )
+        if not isinstance(keep_zip, bool):
+            raise TypeError(
+                f'keep_zip must be a boolean (True or False), '
+                f'got {type(keep_zip).__name__}: {keep_zip!r}'
+            )
 
         # Override automatic_extractor if explicitly provided
         if automatic_extractor:
@@ -195,13 +319,9 @@ class FundamentalStocksDataCVM:
             f'auto_extract={automatic_extractor}'
         )
 
-        result: DownloadResultCVM = self.__download_use_case.execute(
-            destination_path=destination_path,
-            list_docs=list_docs,
-            initial_year=initial_year,
-            last_year=last_year,
-        )
-
+    def __finish_download(
+        self, result: DownloadResultCVM
+    ) -> DownloadResultCVM:
         logger.info(
             f'Download completed: {result.success_count_downloads} successful, '
             f'{result.error_count_downloads} errors'
@@ -213,6 +333,58 @@ class FundamentalStocksDataCVM:
         # Return the result for programmatic access
         return result
 
+    def sync_mirror(
+        self,
+        mirror_path: str,
+        list_docs: Optional[List[str]] = None,
+        initial_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+    ) -> DownloadResultCVM:
+        """Create or update a local mirror of the CVM ZIP files.
+
+        The ZIPs are stored under mirror_path with the same paths they
+        have on dados.cvm.gov.br. Run it periodically on one machine and
+        point the others at the directory (or at a static web server
+        serving it) with FundamentalStocksDataCVM(mirror_url=...). Later
+        runs send conditional requests, so only files changed on the
+        portal are transferred again.
+
+        Args:
+            mirror_path: Root directory of the mirror.
+            list_docs: Document type codes to mirror; all if None.
+            initial_year: Starting year (inclusive).
+            last_year: Ending year (inclusive).
+
+        Returns:
+            DownloadResultCVM with the updated files as successful
+            downloads and the unchanged ones as skipped.
+
+        Example:
+            >>> cvm = FundamentalStocksDataCVM()
+            >>> cvm.sync_mirror("/srv/cvm-mirror", list_docs=["DFP", "ITR"])
+        """
+        logger.info(
+            f'Mirror sync requested: path={mirror_path}, '
+            f'docs={list_docs}, years={initial_year}-{last_year}'
+        )
+
+        # Always fetch from the portal itself and keep the ZIPs; the
+        # listings avoid requesting years that were never published
+        use_case = SyncMirrorUseCaseCVM(
+            AsyncDownloadAdapterCVM(
+                file_extractor_repository=ParquetExtractorAdapterCVM(),
+                discover_files=True,
+            )
+        )
+        result: DownloadResultCVM = use_case.execute(
+            mirror_path=mirror_path,
+            list_docs=list_docs,
+            initial_year=initial_year,
+            last_year=last_year,
+        )
+
+        return self.__finish_download(result)
+
     def get_available_docs(self) -> Dict[str, str]:
         """Get all available CVM document types with descriptions.
 
@@ -1,6 +1,9 @@
 # Low-level imports for advanced usage
 from .b3_data import (
+    ComputeQuotesAnalyticsUseCaseB3,
+    ExportPriceMatricesUseCaseB3,
     CreateDocsToExtractUseCaseB3,
+    DownloadCotahistUseCaseB3,
     DocsToExtractorB3,
     ExtractHistoricalQuotesUseCaseB3,
     GetAvailableAssetsUseCaseB3,
@@ -14,11 +17,15 @@ from .cvm import (
     GetAvailableDocsUseCaseCVM,
     GetAvailableYearsUseCaseCVM,
     ParquetExtractorAdapterCVM,
+    SyncMirrorUseCaseCVM,
 )
 
 __all__ = [
     # B3 - Low-level
+    'ComputeQuotesAnalyticsUseCaseB3',
+    'ExportPriceMatricesUseCaseB3',
     'CreateDocsToExtractUseCaseB3',
+    'DownloadCotahistUseCaseB3',
     'ExtractHistoricalQuotesUseCaseB3',
     'GetAvailableAssetsUseCaseB3',
     'GetAvailableYearsUseCaseB3',
@@ -31,6 +38,7 @@ __all__ = [
     'GetAvailableYearsUseCaseCVM',
     'AsyncDownloadAdapterCVM',
     'ParquetExtractorAdapterCVM',
+    'SyncMirrorUseCaseCVM',
 ]
 
 
@@ -1,5 +1,8 @@
 from .historical_quotes import (
+    ComputeQuotesAnalyticsUseCaseB3,
+    ExportPriceMatricesUseCaseB3,
     CreateDocsToExtractUseCaseB3,
+    DownloadCotahistUseCaseB3,
     DocsToExtractorB3,
     ExtractHistoricalQuotesUseCaseB3,
     GetAvailableAssetsUseCaseB3,
@@ -9,7 +12,10 @@ from .historical_quotes import (
 
 __all__ = [
     # Application Layer
+    'ComputeQuotesAnalyticsUseCaseB3',
+    'ExportPriceMatricesUseCaseB3',
     'CreateDocsToExtractUseCaseB3',
+    'DownloadCotahistUseCaseB3',
     'ExtractHistoricalQuotesUseCaseB3',
     'GetAvailableAssetsUseCaseB3',
     'GetAvailableYearsUseCaseB3',
@@ -1,5 +1,8 @@
 from .application import (
+    ComputeQuotesAnalyticsUseCaseB3,
+    ExportPriceMatricesUseCaseB3,
     CreateDocsToExtractUseCaseB3,
+    DownloadCotahistUseCaseB3,
     ExtractHistoricalQuotesUseCaseB3,
     GetAvailableAssetsUseCaseB3,
     GetAvailableYearsUseCaseB3,
@@ -9,7 +12,10 @@ from .domain import DocsToExtractorB3
 
 __all__ = [
     # Application Layer
+    'ComputeQuotesAnalyticsUseCaseB3',
+    'ExportPriceMatricesUseCaseB3',
     'CreateDocsToExtractUseCaseB3',
+    'DownloadCotahistUseCaseB3',
     'ExtractHistoricalQuotesUseCaseB3',
     'GetAvailableAssetsUseCaseB3',
     'GetAvailableYearsUseCaseB3',
@@ -1,8 +1,11 @@
 from .use_cases import (
+    ComputeQuotesAnalyticsUseCaseB3,
+    ExportPriceMatricesUseCaseB3,
     CreateDocsToExtractUseCaseB3,
     CreateRangeYearsUseCaseB3,
     CreateSetAssetsUseCaseB3,
     CreateSetToDownloadUseCaseB3,
+    DownloadCotahistUseCaseB3,
     ExtractHistoricalQuotesUseCaseB3,
     GetAvailableAssetsUseCaseB3,
     GetAvailableYearsUseCaseB3,
@@ -11,7 +14,10 @@ from .use_cases import (
 )
 
 __all__ = [
+    'ComputeQuotesAnalyticsUseCaseB3',
+    'ExportPriceMatricesUseCaseB3',
     'CreateDocsToExtractUseCaseB3',
+    'DownloadCotahistUseCaseB3',
     'ExtractHistoricalQuotesUseCaseB3',
     'GetAvailableYearsUseCaseB3',
     'GetAvailableAssetsUseCaseB3',
@@ -1,4 +1,9 @@
+from .compute_quotes_analytics_use_case import (
+    ComputeQuotesAnalyticsUseCaseB3,
+)
 from .docs_to_extraction_use_case import CreateDocsToExtractUseCaseB3
+from .download_cotahist_use_case import DownloadCotahistUseCaseB3
+from .export_price_matrices_use_case import ExportPriceMatricesUseCaseB3
 from .extract_historical_quotes_use_case import (
     ExtractHistoricalQuotesUseCaseB3,
 )
@@ -13,7 +18,10 @@ from .validate_extraction_config_use_case import (
 )
 
 __all__ = [
+    'ComputeQuotesAnalyticsUseCaseB3',
+    'ExportPriceMatricesUseCaseB3',
     'CreateDocsToExtractUseCaseB3',
+    'DownloadCotahistUseCaseB3',
     'ExtractHistoricalQuotesUseCaseB3',
     'GetAvailableYearsUseCaseB3',
     'GetAvailableAssetsUseCaseB3',
@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...domain import AnalyticsConfigServiceB3
+from ...infra import QuotesAnalyticsServiceB3
+from .validate_destination_path_use_case import VerifyDestinationPathsUseCaseB3
+
+
+class ComputeQuotesAnalyticsUseCaseB3:
+    """Use case for materialising per-ticker analytics over extracted quotes.
+
+    Validates the analytics configuration, resolves the output location and
+    delegates the computation to QuotesAnalyticsServiceB3. The output is a
+    companion Parquet dataset keyed by (ticker, data_pregao).
+    """
+
+    def __init__(self) -> None:
+        self.analytics_service = QuotesAnalyticsServiceB3()
+
+    def execute(
+        self,
+        source_file: str,
+        windows: Optional[List[int]] = None,
+        destination_path: Optional[str] = None,
+        output_filename: Optional[str] = None,
+        benchmark_ticker: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Execute the analytics computation.
+
+        Args:
+            source_file: Parquet file produced by the extraction
+            windows: Rolling window sizes in trading sessions
+            destination_path: Output directory (defaults to the source dir)
+            output_filename: Output file name (defaults to
+                '<source_stem>_analytics.parquet')
+            benchmark_ticker: Ticker used as market proxy for beta. If None,
+                the equal-weighted session mean return is used.
+
+        Returns:
+            Dictionary with total_records, total_tickers, windows and
+            output_file
+
+        Raises:
+            InvalidAnalyticsWindows: If windows are invalid
+            FileNotFoundError: If source_file does not exist
+        """
+        validated_windows = AnalyticsConfigServiceB3.validate_windows(windows)
+
+        source_path = Path(source_file).expanduser().resolve()
+        if not source_path.is_file():
+            raise FileNotFoundError(f'Quotes file not found: {source_path}')
+
+        if destination_path is None:
+            destination_path = str(source_path.parent)
+        VerifyDestinationPathsUseCaseB3.execute(destination_path)
+
+        if not output_filename:
+            output_filename = f'{source_path.stem}_analytics.parquet'
+        elif not output_filename.endswith('.parquet'):
+            output_filename = f'{output_filename}.parquet'
+
+        output_path = (
+            Path(destination_path).expanduser().resolve() / output_filename
+        )
+
+        return self.analytics_service.compute(
+            source_path=source_path,
+            output_path=output_path,
+            windows=validated_windows,
+            benchmark_ticker=benchmark_ticker,
+        )
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from ...domain import DocsToExtractorB3
 from .range_years_use_case import CreateRangeYearsUseCaseB3
@@ -67,14 +67,14 @@ class CreateDocsToExtractUseCaseB3:
             destination_path if destination_path else path_of_docs
         )
 
-    def execute(self) -> DocsToExtractorB3:
-        """Execute the use case to create a validated DocsToExtractorB3 entity.
+    def validate(self) -> Tuple[Set[str], range]:
+        """Validate the assets, years and destination only.
 
-        This method orchestrates all validations using Domain services and
-        other use cases, then uses the Domain builder to construct the entity.
+        path_of_docs is not looked at, which lets callers reject a bad request before filling path_of_docs,
+        e.g. by downloading the COTAHIST files.
 
         Returns:
-            DocsToExtractorB3: Entity containing all validated extraction parameters
+            The validated set of assets and range of years
 
         Raises:
             Various exceptions: For validation failures
@@ -86,6 +86,22 @@ class CreateDocsToExtractUseCaseB3:
         )
 
         VerifyDestinationPathsUseCaseB3().execute(self.destination_path)
+        return set_assets, range_years
+
+    def execute(self) -> DocsToExtractorB3:
+        """Execute the use case to create a validated DocsToExtractorB3 entity.
+
+        This method orchestrates all validations using Domain services and
+        other use cases, then uses the Domain builder to construct the entity.
+
+        Returns:
+            DocsToExtractorB3: Entity containing all validated extraction parameters
+
+        Raises:
+            Various exceptions: For validation failures
+        """
+        set_assets, range_years = self.validate()
+
         set_documents_to_download = CreateSetToDownloadUseCaseB3.execute(
             range_years, self.path_of_docs
         )
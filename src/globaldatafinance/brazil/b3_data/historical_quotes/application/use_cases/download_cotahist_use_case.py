@@ -0,0 +1,83 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ......core import get_logger
+from ...domain import YearValidationServiceB3
+from ...infra import CotahistDownloadAdapterB3
+from .range_years_use_case import CreateRangeYearsUseCaseB3
+from .validate_destination_path_use_case import VerifyDestinationPathsUseCaseB3
+
+logger = get_logger(__name__)
+
+
+class DownloadCotahistUseCaseB3:
+    """Use case for fetching the annual COTAHIST files an extraction needs.
+
+    Years path_of_docs holds neither the annual file nor all monthly
+    files of are downloaded. The file of the current year is also
+    revalidated when present, since B3 appends every trading day to it;
+    an unchanged file costs a 304 only.
+    """
+
+    def __init__(self, adapter: Optional[CotahistDownloadAdapterB3] = None):
+        self.adapter = adapter or CotahistDownloadAdapterB3()
+
+    async def execute(
+        self, initial_year: int, last_year: int, path_of_docs: str
+    ) -> Dict[str, Any]:
+        """Download the missing annual files from initial_year to last_year.
+
+        Args:
+            initial_year: Starting year (inclusive)
+            last_year: Ending year (inclusive)
+            path_of_docs: Directory holding the COTAHIST ZIP files; it is
+                created if it does not exist
+
+        Returns:
+            Download summary from CotahistDownloadAdapterB3.download_files()
+
+        Raises:
+            InvalidFirstYear: If initial_year is invalid
+            InvalidLastYear: If last_year is invalid
+            TypeError: If path_of_docs is not a string
+            InvalidDestinationPathError: If path_of_docs is empty
+            PathIsNotDirectoryError: If path_of_docs is not a directory
+            PathPermissionError: If path_of_docs is not writable
+        """
+        range_years = CreateRangeYearsUseCaseB3.execute(
+            initial_year, last_year
+        )
+        VerifyDestinationPathsUseCaseB3.execute(path_of_docs)
+        directory = Path(path_of_docs).expanduser().resolve()
+
+        file_names = self._files_to_fetch(directory, range_years)
+        logger.info(
+            f'Fetching {len(file_names)} COTAHIST files into {directory}'
+        )
+        result: Dict[str, Any] = await self.adapter.download_files(
+            file_names, str(directory)
+        )
+        return result
+
+    def execute_sync(
+        self, initial_year: int, last_year: int, path_of_docs: str
+    ) -> Dict[str, Any]:
+        """Synchronous wrapper for execute() method."""
+        return asyncio.run(self.execute(initial_year, last_year, path_of_docs))
+
+    def _files_to_fetch(
+        self, directory: Path, range_years: range
+    ) -> List[str]:
+        years = self.adapter.missing_years(directory, range_years)
+
+        current_year = YearValidationServiceB3.get_current_year()
+        current_file = self.adapter.annual_file_name(current_year)
+        if (
+            current_year in range_years
+            and current_year not in years
+            and (directory / current_file).is_file()
+        ):
+            years.append(current_year)
+
+        return [self.adapter.annual_file_name(year) for year in years]
@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...infra import PriceMatrixExporterB3
+from .validate_destination_path_use_case import VerifyDestinationPathsUseCaseB3
+
+
+class ExportPriceMatricesUseCaseB3:
+    """Use case for exporting quotes as dense memory-mapped matrices.
+
+    Resolves the output directory and delegates the export to
+    PriceMatrixExporterB3. Re-running it against the same directory
+    updates the matrices incrementally.
+    """
+
+    def __init__(self) -> None:
+        self.exporter = PriceMatrixExporterB3()
+
+    def execute(
+        self,
+        source_file: str,
+        destination_path: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        incremental: bool = True,
+    ) -> Dict[str, Any]:
+        """Execute the matrix export.
+
+        Args:
+            source_file: Parquet file produced by the extraction
+            destination_path: Output directory for the ``.npy`` files
+                (defaults to '<source_dir>/<source_stem>_matrices')
+            tickers: Optional subset of tickers to export
+            incremental: Merge into existing matrices instead of rebuilding
+
+        Returns:
+            Dictionary with total_dates, total_tickers, new_dates,
+            new_tickers, output_dir and files
+
+        Raises:
+            FileNotFoundError: If source_file does not exist
+            ValueError: If tickers is an empty list
+        """
+        source_path = Path(source_file).expanduser().resolve()
+        if not source_path.is_file():
+            raise FileNotFoundError(f'Quotes file not found: {source_path}')
+
+        if tickers is not None and not tickers:
+            raise ValueError('tickers cannot be an empty list')
+
+        if destination_path is None:
+            destination_path = str(
+                source_path.parent / f'{source_path.stem}_matrices'
+            )
+        VerifyDestinationPathsUseCaseB3.execute(destination_path)
+
+        return self.exporter.export(
+            source_path=source_path,
+            output_dir=Path(destination_path).expanduser().resolve(),
+            tickers=tickers,
+            incremental=incremental,
+        )
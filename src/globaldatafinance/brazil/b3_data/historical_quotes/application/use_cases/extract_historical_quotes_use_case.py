@@ -1,8 +1,12 @@
 import asyncio
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, Optional, Set
 
-from ...domain import AvailableAssetsServiceB3, DocsToExtractorB3
+from ...domain import (
+    AvailableAssetsServiceB3,
+    ConflictPolicyEnumB3,
+    DocsToExtractorB3,
+)
 from ...infra import (
     CotahistParserB3,
     ExtractionServiceFactoryB3,
@@ -35,6 +39,9 @@ class ExtractHistoricalQuotesUseCaseB3:
         docs_to_extract: DocsToExtractorB3,
         processing_mode: str = 'fast',
         output_filename: str = 'cotahist_extracted.parquet',
+        cache_dir: Optional[str] = None,
+        resume: bool = False,
+        on_conflict: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Execute the extraction process.
 
@@ -42,6 +49,10 @@ class ExtractHistoricalQuotesUseCaseB3:
             docs_to_extract: Entity containing validated extraction parameters
             processing_mode: 'fast' or 'slow' for resource management
             output_filename: Name of the output Parquet file
+            cache_dir: Optional directory for the canonical parse cache
+            resume: Skip ZIPs completed by a previous interrupted run
+            on_conflict: 'replace', 'skip' or 'error' to merge into an
+                existing output by key. None overwrites the output.
 
         Returns:
             Dictionary with raw extraction results (without success/message fields)
@@ -51,6 +62,7 @@ class ExtractHistoricalQuotesUseCaseB3:
             parser=self.parser,
             data_writer=self.data_writer,
             processing_mode=processing_mode,
+            cache_dir=cache_dir,
         )
 
         target_tpmerc_codes = (
@@ -77,6 +89,10 @@ class ExtractHistoricalQuotesUseCaseB3:
             zip_files=zip_files,
             target_tpmerc_codes=target_tpmerc_codes,
             output_path=output_path,
+            resume=resume,
+            on_conflict=(
+                ConflictPolicyEnumB3(on_conflict) if on_conflict else None
+            ),
         )
 
         return result
@@ -86,6 +102,9 @@ class ExtractHistoricalQuotesUseCaseB3:
         docs_to_extract: DocsToExtractorB3,
         processing_mode: str = 'fast',
         output_filename: str = 'cotahist_extracted.parquet',
+        cache_dir: Optional[str] = None,
+        resume: bool = False,
+        on_conflict: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Synchronous wrapper for execute() method.
 
@@ -95,10 +114,21 @@ class ExtractHistoricalQuotesUseCaseB3:
             docs_to_extract: Entity containing validated extraction parameters
             processing_mode: 'fast' or 'slow' for resource management
             output_filename: Name of the output Parquet file
+            cache_dir: Optional directory for the canonical parse cache
+            resume: Skip ZIPs completed by a previous interrupted run
+            on_conflict: 'replace', 'skip' or 'error' to merge into an
+                existing output by key. None overwrites the output.
 
         Returns:
             Dictionary with extraction results and statistics
         """
         return asyncio.run(
-            self.execute(docs_to_extract, processing_mode, output_filename)
+            self.execute(
+                docs_to_extract,
+                processing_mode,
+                output_filename,
+                cache_dir,
+                resume,
+                on_conflict,
+            )
         )
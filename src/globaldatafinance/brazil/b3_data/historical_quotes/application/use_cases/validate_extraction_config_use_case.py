@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ...domain import ExtractionConfigServiceB3
 
@@ -24,3 +24,15 @@ class ValidateExtractionConfigUseCaseB3:
             output_filename
         )
         return valid_mode, valid_filename
+
+    @staticmethod
+    def validate_on_conflict(on_conflict: Optional[str]) -> Optional[str]:
+        """Validate the on_conflict write mode.
+
+        Args:
+            on_conflict: 'replace', 'skip', 'error' or None.
+
+        Returns:
+            The validated on_conflict value or None.
+        """
+        return ExtractionConfigServiceB3.validate_conflict_policy(on_conflict)
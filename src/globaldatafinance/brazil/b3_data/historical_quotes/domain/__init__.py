@@ -1,16 +1,23 @@
 from .entities import DocsToExtractorB3
 from .services import (
+    AnalyticsConfigServiceB3,
     AvailableAssetsServiceB3,
     ExtractionConfigServiceB3,
     YearValidationServiceB3,
 )
-from .value_objects import ProcessingModeEnumB3, YearRangeB3
+from .value_objects import (
+    ConflictPolicyEnumB3,
+    ProcessingModeEnumB3,
+    YearRangeB3,
+)
 
 __all__ = [
     'DocsToExtractorB3',
+    'AnalyticsConfigServiceB3',
     'AvailableAssetsServiceB3',
     'ExtractionConfigServiceB3',
     'YearValidationServiceB3',
+    'ConflictPolicyEnumB3',
     'ProcessingModeEnumB3',
     'YearRangeB3',
 ]
@@ -1,8 +1,10 @@
+from .analytics_config_service import AnalyticsConfigServiceB3
 from .available_assets_service import AvailableAssetsServiceB3
 from .extraction_config_service import ExtractionConfigServiceB3
 from .year_validation_service import YearValidationServiceB3
 
 __all__ = [
+    'AnalyticsConfigServiceB3',
     'AvailableAssetsServiceB3',
     'ExtractionConfigServiceB3',
     'YearValidationServiceB3',
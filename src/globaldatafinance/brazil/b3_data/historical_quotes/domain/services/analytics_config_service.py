@@ -0,0 +1,47 @@
+from typing import List, Optional, Sequence, Tuple
+
+from ...exceptions import InvalidAnalyticsWindows
+
+
+class AnalyticsConfigServiceB3:
+    """Domain service for validating quote analytics parameters.
+
+    Rolling windows are expressed in trading sessions (rows per ticker),
+    so a window of 21 is roughly one month and 252 roughly one year.
+    """
+
+    DEFAULT_WINDOWS: Tuple[int, ...] = (21, 63, 252)
+    MIN_WINDOW = 2
+
+    @classmethod
+    def validate_windows(
+        cls, windows: Optional[Sequence[int]] = None
+    ) -> List[int]:
+        """Validate rolling windows and return them sorted and unique.
+
+        Args:
+            windows: Window sizes in trading sessions. If None, uses
+                DEFAULT_WINDOWS.
+
+        Returns:
+            Sorted list of unique window sizes.
+
+        Raises:
+            InvalidAnalyticsWindows: If windows is empty, not a list/tuple,
+                or contains values that are not integers >= MIN_WINDOW.
+        """
+        if windows is None:
+            return list(cls.DEFAULT_WINDOWS)
+
+        if not isinstance(windows, (list, tuple)) or not windows:
+            raise InvalidAnalyticsWindows(windows)
+
+        for window in windows:
+            if (
+                not isinstance(window, int)
+                or isinstance(window, bool)
+                or window < cls.MIN_WINDOW
+            ):
+                raise InvalidAnalyticsWindows(windows)
+
+        return sorted(set(windows))
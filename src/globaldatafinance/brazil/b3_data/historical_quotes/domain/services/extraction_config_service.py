@@ -1,5 +1,11 @@
-from ...exceptions import InvalidOutputFilename, InvalidProcessingMode
-from ..value_objects import ProcessingModeEnumB3
+from typing import Optional
+
+from ...exceptions import (
+    InvalidConflictPolicy,
+    InvalidOutputFilename,
+    InvalidProcessingMode,
+)
+from ..value_objects import ConflictPolicyEnumB3, ProcessingModeEnumB3
 
 
 class ExtractionConfigServiceB3:
@@ -63,3 +69,34 @@ class ExtractionConfigServiceB3:
             return f'{filename}.parquet'
 
         return filename
+
+    @staticmethod
+    def validate_conflict_policy(policy: Optional[str]) -> Optional[str]:
+        """Validate the on_conflict write mode.
+
+        Args:
+            policy: 'replace', 'skip', 'error' or None. None keeps the
+                legacy behaviour of overwriting the output file.
+
+        Returns:
+            The validated policy string (lowercase) or None.
+
+        Raises:
+            TypeError: If policy is neither a string nor None.
+            InvalidConflictPolicy: If policy is not a valid conflict policy.
+        """
+        if policy is None:
+            return None
+
+        if not isinstance(policy, str):
+            raise TypeError(
+                f'on_conflict must be a string, got {type(policy).__name__}'
+            )
+
+        try:
+            valid_policy: str = ConflictPolicyEnumB3(policy.lower()).value
+            return valid_policy
+        except ValueError:
+            raise InvalidConflictPolicy(
+                policy, [p.value for p in ConflictPolicyEnumB3]
+            )
@@ -1,7 +1,9 @@
+from .conflict_policy import ConflictPolicyEnumB3
 from .processing_mode import ProcessingModeEnumB3
 from .year_range import YearRangeB3
 
 __all__ = [
+    'ConflictPolicyEnumB3',
     'ProcessingModeEnumB3',
     'YearRangeB3',
 ]
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class ConflictPolicyEnumB3(str, Enum):
+    """How extracted quotes are merged into an existing output file.
+
+    Records are matched on (data_pregao, ticker, tipo_mercado, prazo_termo).
+
+    - REPLACE: incoming records replace existing ones with the same key
+    - SKIP: existing records are kept and conflicting incoming ones dropped
+    - ERROR: the merge is aborted if any key already exists
+    """
+
+    REPLACE = 'replace'
+    SKIP = 'skip'
+    ERROR = 'error'
@@ -1,6 +1,9 @@
 from .exceptions import (
+    DuplicateQuotesError,
     EmptyAssetListError,
+    InvalidAnalyticsWindows,
     InvalidAssetsName,
+    InvalidConflictPolicy,
     InvalidFirstYear,
     InvalidLastYear,
     InvalidOutputFilename,
@@ -14,4 +17,7 @@ __all__ = [
     'EmptyAssetListError',
     'InvalidOutputFilename',
     'InvalidProcessingMode',
+    'InvalidAnalyticsWindows',
+    'InvalidConflictPolicy',
+    'DuplicateQuotesError',
 ]
@@ -39,3 +39,24 @@ class InvalidProcessingMode(Exception):
 class InvalidOutputFilename(Exception):
     def __init__(self, message: str):
         super().__init__(f'Invalid output filename: {message}')
+
+
+class InvalidAnalyticsWindows(Exception):
+    def __init__(self, windows):
+        super().__init__(
+            f'Invalid analytics windows: {windows!r}. Windows must be a non-empty list of integers greater than or equal to 2.'
+        )
+
+
+class InvalidConflictPolicy(Exception):
+    def __init__(self, policy: str, valid_policies: List[str]):
+        super().__init__(
+            f"Invalid on_conflict '{policy}'. Must be one of: {valid_policies}"
+        )
+
+
+class DuplicateQuotesError(Exception):
+    def __init__(self, conflict_count: int, output_path: str):
+        super().__init__(
+            f'{conflict_count} extracted records already exist in {output_path}. Use on_conflict="replace" or on_conflict="skip" to merge them.'
+        )
@@ -1,15 +1,27 @@
+from .cotahist_download_adapter import CotahistDownloadAdapterB3
 from .cotahist_parser import CotahistParserB3
+from .extraction_journal import ExtractionJournalB3
 from .extraction_service import ExtractionServiceB3
 from .extraction_service_factory import ExtractionServiceFactoryB3
 from .file_system_service import FileSystemServiceB3
+from .parquet_upsert_merger import ParquetUpsertMergerB3
 from .parquet_writer import ParquetWriterB3
+from .parse_cache import ParseCacheB3
+from .price_matrix_exporter import PriceMatrixExporterB3
+from .quotes_analytics_service import QuotesAnalyticsServiceB3
 from .zip_reader import ZipFileReaderB3
 
 __all__ = [
+    'CotahistDownloadAdapterB3',
     'CotahistParserB3',
+    'ExtractionJournalB3',
     'ExtractionServiceB3',
     'ExtractionServiceFactoryB3',
     'FileSystemServiceB3',
+    'ParquetUpsertMergerB3',
     'ParquetWriterB3',
+    'ParseCacheB3',
+    'PriceMatrixExporterB3',
+    'QuotesAnalyticsServiceB3',
     'ZipFileReaderB3',
 ]
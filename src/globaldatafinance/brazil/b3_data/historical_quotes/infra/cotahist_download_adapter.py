@@ -0,0 +1,391 @@
+import asyncio
+import contextlib
+import json
+import os
+import re
+import zipfile
+from datetime import date
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from .....core import (
+    RetryBudget,
+    RetryStrategy,
+    SimpleProgressBar,
+    get_logger,
+)
+from .....macro_infra import DownloadInfo, RequestsAdapter
+
+logger = get_logger(__name__)
+
+
+class CotahistDownloadAdapterB3:
+    """Concurrent downloader of COTAHIST ZIP files from the B3 portal.
+
+    B3 publishes one ZIP per year (``COTAHIST_A2024.ZIP``), month
+    (``COTAHIST_M012024.ZIP``) and trading day (``COTAHIST_D02012024.ZIP``)
+    under the same folder. download_files() fetches any of them into a
+    directory through one pooled httpx client, at most max_concurrent at
+    a time.
+
+    Each file is written to a ``.download`` temp file and only replaces
+    the destination once the whole body arrived and is a valid ZIP, so an
+    interrupted run never leaves a truncated COTAHIST behind. Transient
+    failures (timeouts, dropped connections, 429/5xx) are retried with a
+    jittered exponential backoff, honouring Retry-After, within a retry
+    budget for the run.
+
+    With conditional_requests enabled, the ETag and Last-Modified of each
+    download are kept in a manifest in the destination directory. A file
+    that is already there is requested with If-None-Match /
+    If-Modified-Since (its modification time when the manifest does not
+    know it), so an unchanged file costs a 304 instead of a transfer.
+
+    Files the portal does not have (404/410, or an error page served
+    instead of a ZIP) are reported as unavailable rather than as errors:
+    the current day or month is often not published yet.
+
+    Args:
+        base_url: Folder the files are fetched from. Defaults to the B3
+            portal; point it at any HTTP server holding the same file
+            names, such as a local stand-in in tests.
+        max_concurrent: Maximum number of simultaneous downloads
+        chunk_size: Chunk size for streaming
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries per file
+        initial_backoff: Initial backoff in seconds
+        max_backoff: Maximum backoff in seconds
+        backoff_multiplier: Exponential backoff multiplier
+        http2: Enable HTTP/2
+        conditional_requests: Revalidate files already on disk instead of
+            downloading them again
+        retry_budget_ratio: Retries allowed per file in a run, on top of
+            min_retry_budget
+        min_retry_budget: Retries always allowed in a run
+    """
+
+    BASE_URL = 'https://bvmf.bmfbovespa.com.br/InstDados/SerHist'
+    MANIFEST_NAME = '.cotahist_downloads.json'
+    TEMP_SUFFIX = '.download'
+    _FILE_NAME_PATTERN = re.compile(
+        r'COTAHIST_(?:A(?P<year>\d{4})'
+        r'|M(?P<m_month>\d{2})(?P<m_year>\d{4})'
+        r'|D(?P<d_day>\d{2})(?P<d_month>\d{2})(?P<d_year>\d{4}))\.ZIP',
+        re.IGNORECASE,
+    )
+    # Answers meaning the file is not published
+    _UNAVAILABLE_STATUSES = (httpx.codes.NOT_FOUND, httpx.codes.GONE)
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrent: int = 4,
+        chunk_size: int = 64 * 1024,
+        timeout: float = 120.0,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        backoff_multiplier: float = 2.0,
+        http2: bool = True,
+        conditional_requests: bool = True,
+        retry_budget_ratio: float = 0.2,
+        min_retry_budget: int = 10,
+    ):
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.max_concurrent = max(1, max_concurrent)
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.conditional_requests = conditional_requests
+
+        self.requests_adapter = RequestsAdapter(
+            timeout=timeout,
+            http2=http2,
+            max_connections=self.max_concurrent,
+            max_keepalive_connections=self.max_concurrent,
+        )
+        self.retry_strategy = RetryStrategy(
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+            multiplier=backoff_multiplier,
+            jitter=True,
+        )
+        self.retry_budget = RetryBudget(retry_budget_ratio, min_retry_budget)
+
+    @staticmethod
+    def annual_file_name(year: int) -> str:
+        """File name of the quotes of a whole year."""
+        return f'COTAHIST_A{year}.ZIP'
+
+    @staticmethod
+    def monthly_file_name(year: int, month: int) -> str:
+        """File name of the quotes of one month."""
+        if not 1 <= month <= 12:
+            raise ValueError(f'month must be between 1 and 12, got {month}')
+        return f'COTAHIST_M{month:02d}{year}.ZIP'
+
+    @staticmethod
+    def daily_file_name(day: date) -> str:
+        """File name of the quotes of one trading day."""
+        return f'COTAHIST_D{day:%d%m%Y}.ZIP'
+
+    @classmethod
+    def parse_file_name(cls, name: str) -> Optional[Tuple[str, date]]:
+        """Period and first day covered by a COTAHIST file name.
+
+        Returns:
+            ('A', 'M' or 'D', first day of the year, month or trading day),
+            or None if name does not follow the portal's naming
+        """
+        match = cls._FILE_NAME_PATTERN.fullmatch(name)
+        if match is None:
+            return None
+
+        groups = match.groupdict()
+        try:
+            if groups['year']:
+                return 'A', date(int(groups['year']), 1, 1)
+            if groups['m_year']:
+                return 'M', date(
+                    int(groups['m_year']), int(groups['m_month']), 1
+                )
+            return 'D', date(
+                int(groups['d_year']),
+                int(groups['d_month']),
+                int(groups['d_day']),
+            )
+        except ValueError:
+            return None
+
+    @classmethod
+    def missing_years(cls, directory: Path, years: Iterable[int]) -> List[int]:
+        """Years directory holds no complete COTAHIST file set for.
+
+        A year is covered by its annual file or by all twelve monthly
+        files. Daily files, and names not following the portal's
+        pattern, do not cover a year.
+        """
+        if not directory.is_dir():
+            return list(years)
+
+        annual: Set[int] = set()
+        months: Dict[int, Set[int]] = {}
+        for f in directory.iterdir():
+            parsed = cls.parse_file_name(f.name) if f.is_file() else None
+            if parsed is None:
+                continue
+            period, first_day = parsed
+            if period == 'A':
+                annual.add(first_day.year)
+            elif period == 'M':
+                months.setdefault(first_day.year, set()).add(first_day.month)
+
+        return [
+            year
+            for year in years
+            if year not in annual and len(months.get(year, ())) < 12
+        ]
+
+    def url_for(self, file_name: str) -> str:
+        return f'{self.base_url}/{file_name}'
+
+    async def download_files(
+        self, file_names: Iterable[str], destination_path: str
+    ) -> Dict[str, Any]:
+        """Download COTAHIST files into destination_path.
+
+        Args:
+            file_names: Names of the files, e.g. from annual_file_name()
+            destination_path: Existing directory the files are saved to
+
+        Returns:
+            Dictionary with the paths of the files 'downloaded', the
+            paths of the files found 'not_modified', the names of the
+            'unavailable' files and 'errors' mapping names to messages
+        """
+        names = list(dict.fromkeys(file_names))
+        directory = Path(destination_path)
+        result: Dict[str, Any] = {
+            'downloaded': [],
+            'not_modified': [],
+            'unavailable': [],
+            'errors': {},
+        }
+        if not names:
+            return result
+
+        manifest = self._load_manifest(directory)
+        self.retry_budget.reset()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        progress_bar = SimpleProgressBar(
+            total=len(names), desc='Downloading COTAHIST'
+        )
+
+        async def download_one(name: str) -> None:
+            async with semaphore:
+                try:
+                    status = await self._download_file(
+                        name, directory, manifest
+                    )
+                except Exception as e:
+                    logger.error(f'Failed to download {name}: {e}')
+                    result['errors'][name] = f'{type(e).__name__}: {e}'
+                else:
+                    if status == 'unavailable':
+                        result['unavailable'].append(name)
+                    else:
+                        result[status].append(str(directory / name))
+                finally:
+                    progress_bar.update(1)
+
+        try:
+            async with self.requests_adapter.session():
+                await asyncio.gather(*[download_one(name) for name in names])
+        finally:
+            progress_bar.close()
+            self._save_manifest(directory, manifest)
+
+        logger.info(
+            f'COTAHIST download completed: '
+            f'{len(result["downloaded"])} downloaded, '
+            f'{len(result["not_modified"])} not modified, '
+            f'{len(result["unavailable"])} unavailable, '
+            f'{len(result["errors"])} errors'
+        )
+        return result
+
+    def download_files_sync(
+        self, file_names: Iterable[str], destination_path: str
+    ) -> Dict[str, Any]:
+        """Synchronous wrapper for download_files()."""
+        return asyncio.run(self.download_files(file_names, destination_path))
+
+    async def _download_file(
+        self,
+        name: str,
+        directory: Path,
+        manifest: Dict[str, Dict[str, Any]],
+    ) -> str:
+        """Fetch one file into directory.
+
+        Returns:
+            'downloaded', 'not_modified' or 'unavailable'
+        """
+        target = directory / name
+        temp = directory / f'{name}{self.TEMP_SUFFIX}'
+        headers = self._conditional_headers(target, manifest.get(name))
+
+        self.retry_budget.record_request()
+        retry_count = 0
+        try:
+            while True:
+                try:
+                    info: DownloadInfo = (
+                        await self.requests_adapter.async_download_file(
+                            self.url_for(name),
+                            str(temp),
+                            chunk_size=self.chunk_size,
+                            headers=headers,
+                        )
+                    )
+                    break
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code in self._UNAVAILABLE_STATUSES:
+                        logger.info(f'{name} is not available')
+                        return 'unavailable'
+                    if not self._should_retry(e, retry_count):
+                        raise
+                    await asyncio.sleep(self._backoff(e, retry_count))
+                except Exception as e:
+                    if not self._should_retry(e, retry_count):
+                        raise
+                    await asyncio.sleep(self._backoff(e, retry_count))
+                retry_count += 1
+                logger.warning(
+                    f'Retrying {name} ({retry_count}/{self.max_retries})'
+                )
+
+            if info.not_modified:
+                logger.debug(f'{name} not modified')
+                return 'not_modified'
+
+            if not zipfile.is_zipfile(temp):
+                logger.warning(
+                    f'{name} is not a ZIP file; treating as missing'
+                )
+                return 'unavailable'
+
+            os.replace(temp, target)
+            manifest[name] = {
+                'etag': info.etag,
+                'last_modified': info.last_modified,
+                'size': info.bytes_written,
+            }
+            return 'downloaded'
+        finally:
+            with contextlib.suppress(OSError):
+                temp.unlink()
+
+    def _should_retry(self, exception: Exception, retry_count: int) -> bool:
+        return (
+            retry_count < self.max_retries
+            and self.retry_strategy.is_retryable(exception)
+            and self.retry_budget.try_spend()
+        )
+
+    def _backoff(self, exception: Exception, retry_count: int) -> float:
+        backoff = self.retry_strategy.calculate_backoff(retry_count)
+        throttle = RequestsAdapter.throttle_delay(exception)
+        return max(backoff, throttle or 0.0)
+
+    def _conditional_headers(
+        self, target: Path, entry: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """Validators for a file already on disk, if any."""
+        if not self.conditional_requests:
+            return None
+
+        try:
+            stat = target.stat()
+        except OSError:
+            return None
+
+        if entry is not None and entry.get('size') == stat.st_size:
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            if headers:
+                return headers
+
+        return {'If-Modified-Since': formatdate(stat.st_mtime, usegmt=True)}
+
+    def _load_manifest(self, directory: Path) -> Dict[str, Dict[str, Any]]:
+        path = directory / self.MANIFEST_NAME
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable manifest {path}: {e}')
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_manifest(
+        self, directory: Path, manifest: Dict[str, Dict[str, Any]]
+    ) -> None:
+        if not self.conditional_requests or not manifest:
+            return
+
+        path = directory / self.MANIFEST_NAME
+        temp = path.with_name(f'{path.name}.tmp')
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(temp, path)
+        except OSError as e:
+            logger.warning(f'Could not save manifest {path}: {e}')
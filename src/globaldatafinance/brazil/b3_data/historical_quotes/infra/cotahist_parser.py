@@ -14,6 +14,10 @@ class CotahistParserB3:
     Includes robust error handling and validation for malformed data.
     """
 
+    # Version of the parsed output layout. Bump it whenever the fields
+    # returned by parse_line change so cached parses are invalidated.
+    PARSER_VERSION = '2'
+
     # Expected line length for COTAHIST format
     EXPECTED_LINE_LENGTH = 245
 
@@ -27,13 +31,14 @@ class CotahistParserB3:
     _log_filtering_interval = 100_000  # Log filtering stats every 100k lines
 
     def parse_line(
-        self, line: str, target_tpmerc_codes: Set[str]
+        self, line: str, target_tpmerc_codes: Optional[Set[str]]
     ) -> Optional[Dict[str, Any]]:
         """Parse a single line from COTAHIST file with robust error handling.
 
         Args:
             line: A line from COTAHIST file (expected 245 bytes)
-            target_tpmerc_codes: Set of TPMERC codes to filter (e.g., {'010', '020'})
+            target_tpmerc_codes: Set of TPMERC codes to filter (e.g., {'010', '020'}).
+                If None, records of every market type are returned.
 
         Returns:
             Dictionary with parsed data if TPMERC matches filter, None otherwise
@@ -73,7 +78,10 @@ class CotahistParserB3:
             tpmerc = line[24:27].strip()
 
             # Filter by target market types
-            if tpmerc not in target_tpmerc_codes:
+            if (
+                target_tpmerc_codes is not None
+                and tpmerc not in target_tpmerc_codes
+            ):
                 self._filtered_count += 1
 
                 # Log filtering statistics periodically
@@ -137,6 +145,8 @@ class CotahistParserB3:
                 'nome_resumido': self._safe_slice(line, 27, 39).strip(),
                 # Especificação do Papel (positions 40-49)
                 'especificacao_papel': self._safe_slice(line, 39, 49).strip(),
+                # Prazo em dias do mercado a termo (positions 50-52)
+                'prazo_termo': self._safe_slice(line, 49, 52).strip(),
                 # Preço de Abertura (positions 57-69, format (11)V99)
                 'preco_abertura': self._parse_decimal_v99(
                     self._safe_slice(line, 56, 69)
@@ -201,6 +211,7 @@ class CotahistParserB3:
                 'tipo_mercado': '',
                 'nome_resumido': '',
                 'especificacao_papel': '',
+                'prazo_termo': '',
                 'preco_abertura': Decimal('0'),
                 'preco_maximo': Decimal('0'),
                 'preco_minimo': Decimal('0'),
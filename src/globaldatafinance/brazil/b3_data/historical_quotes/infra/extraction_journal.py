@@ -0,0 +1,200 @@
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None  # type: ignore
+
+from .....core import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractionJournalB3:
+    """Run journal with per-ZIP checkpoints for resumable extractions.
+
+    The journal lives next to the output file as
+    ``<output_filename>.journal.json`` and records, for every ZIP that was
+    fully processed, its temporary Parquet file and record count, along
+    with the ZIP's size and modification time. A checkpoint is only
+    trusted if the ZIP is unchanged and the temporary file's Parquet
+    footer can be read and reports the same number of rows, so ZIPs
+    replaced since (such as a re-downloaded current year) and files
+    truncated by a crash are reprocessed.
+
+    A journal written for a different TPMERC filter is ignored, since its
+    temporary files hold different records.
+
+    ZIPs whose records were already upserted into the output by a run
+    that partially failed are kept as merged checkpoints without a
+    temporary file, so a rerun neither reprocesses nor merges them again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, output_path: Path, target_tpmerc_codes: Set[str]):
+        self.output_path = output_path
+        self.path = output_path.parent / f'{output_path.name}.journal.json'
+        self.target_tpmerc_codes = sorted(target_tpmerc_codes)
+        self._completed: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> None:
+        """Load checkpoints from a previous run, if compatible."""
+        self._completed = {}
+
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable extraction journal: {e}')
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != self.VERSION
+            or data.get('target_tpmerc_codes') != self.target_tpmerc_codes
+        ):
+            logger.warning(
+                'Ignoring extraction journal from an incompatible run',
+                extra={'journal': str(self.path)},
+            )
+            return
+
+        completed = data.get('completed', {})
+        if isinstance(completed, dict):
+            self._completed = completed
+
+        logger.info(
+            f'Loaded extraction journal with {len(self._completed)} '
+            'completed ZIP files',
+            extra={'journal': str(self.path)},
+        )
+
+    def get_checkpoint(self, zip_file: str) -> Optional[Dict[str, Any]]:
+        """Return the validated checkpoint for zip_file, if any.
+
+        Returns:
+            Dictionary with records and temp_file, plus merged=True if the
+            records are already in the output, or None if the ZIP was not
+            completed or its temporary file failed validation.
+        """
+        entry = self._completed.get(self._key(zip_file))
+        if entry is None:
+            return None
+
+        if entry.get('source') != self._source_stamp(zip_file):
+            logger.warning(
+                f'Discarding checkpoint for {zip_file} - the ZIP changed '
+                'since it was processed'
+            )
+            self.discard(zip_file)
+            return None
+
+        if entry.get('merged') is True and isinstance(
+            entry.get('records'), int
+        ):
+            return {
+                'records': entry['records'],
+                'temp_file': entry.get('temp_file'),
+                'merged': True,
+            }
+
+        if not self._is_valid(entry):
+            logger.warning(
+                f'Discarding invalid checkpoint for {zip_file}',
+                extra={'temp_file': entry.get('temp_file')},
+            )
+            self.discard(zip_file)
+            return None
+
+        return {'records': entry['records'], 'temp_file': entry['temp_file']}
+
+    def mark_completed(
+        self, zip_file: str, temp_file: str, records: int
+    ) -> None:
+        """Record a completed ZIP and persist the journal atomically."""
+        self._completed[self._key(zip_file)] = {
+            'temp_file': temp_file,
+            'records': records,
+            'source': self._source_stamp(zip_file),
+        }
+        self._save()
+
+    def mark_merged(self, zip_files: List[str]) -> None:
+        """Record that the records of zip_files are in the output."""
+        for zip_file in zip_files:
+            entry = self._completed.get(self._key(zip_file))
+            if entry is not None:
+                entry['merged'] = True
+        self._save()
+
+    def discard(self, zip_file: str) -> None:
+        if self._completed.pop(self._key(zip_file), None) is not None:
+            self._save()
+
+    def clear(self) -> None:
+        """Remove the journal once the run has been committed."""
+        self._completed = {}
+        if self.path.exists():
+            with contextlib.suppress(Exception):
+                self.path.unlink()
+
+    @staticmethod
+    def _key(zip_file: str) -> str:
+        return str(Path(zip_file).resolve())
+
+    @staticmethod
+    def _source_stamp(zip_file: str) -> Optional[Dict[str, int]]:
+        try:
+            stat = os.stat(zip_file)
+        except OSError:
+            return None
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    @staticmethod
+    def _is_valid(entry: Dict[str, Any]) -> bool:
+        records = entry.get('records')
+        temp_file = entry.get('temp_file')
+        if not isinstance(records, int) or not isinstance(temp_file, str):
+            return False
+
+        temp_path = Path(temp_file)
+        if records == 0:
+            return not temp_path.exists()
+
+        if pq is None or not temp_path.exists():
+            return False
+
+        try:
+            num_rows: int = pq.ParquetFile(str(temp_path)).metadata.num_rows
+        except Exception:
+            return False
+
+        return num_rows == records
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_suffix('.json.tmp')
+        data = {
+            'version': self.VERSION,
+            'output': str(self.output_path),
+            'target_tpmerc_codes': self.target_tpmerc_codes,
+            'completed': self._completed,
+        }
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f'Failed to write extraction journal: {e}')
+            with contextlib.suppress(Exception):
+                tmp_path.unlink()
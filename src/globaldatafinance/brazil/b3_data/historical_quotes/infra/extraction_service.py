@@ -1,9 +1,12 @@
 import contextlib
 import asyncio
 import gc
+import zipfile
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .....core import (
     ResourceMonitor,
@@ -12,9 +15,14 @@ from .....core import (
     get_logger,
     log_execution_time,
 )
-from ..domain import ProcessingModeEnumB3
+from ..domain import ConflictPolicyEnumB3, ProcessingModeEnumB3
+from ..exceptions import DuplicateQuotesError
+from .cotahist_download_adapter import CotahistDownloadAdapterB3
 from .cotahist_parser import CotahistParserB3
+from .extraction_journal import ExtractionJournalB3
+from .parquet_upsert_merger import ParquetUpsertMergerB3
 from .parquet_writer import ParquetWriterB3
+from .parse_cache import ParseCacheB3
 from .zip_reader import ZipFileReaderB3
 
 logger = get_logger(__name__)
@@ -44,12 +52,19 @@ class ExtractionServiceB3:
         parser: CotahistParserB3,
         data_writer: ParquetWriterB3,
         processing_mode: ProcessingModeEnumB3,
+        parse_cache: Optional[ParseCacheB3] = None,
     ):
-        """Initialize with dependencies and configure concurrency and batch sizes."""
+        """Initialize with dependencies and configure concurrency and batch sizes.
+
+        When parse_cache is given, each ZIP is parsed once with no TPMERC
+        filter into the cache and every extraction is served by filtering
+        the cached file.
+        """
         self.zip_reader = zip_reader
         self.parser = parser
         self.data_writer = data_writer
         self.processing_mode = processing_mode
+        self.parse_cache = parse_cache
         self.resource_monitor = ResourceMonitor()
 
         # Configure concurrency based on mode and available resources
@@ -90,6 +105,9 @@ class ExtractionServiceB3:
                 'max_workers': self.max_workers,
                 'flush_batch_size': self.flush_batch_size,
                 'parse_batch_size': self.parse_batch_size,
+                'parse_cache': (
+                    str(parse_cache.cache_dir) if parse_cache else None
+                ),
                 'estimated_memory_per_file_mb': self.flush_batch_size
                 * 3
                 // 1024,  # ~3KB per record
@@ -116,13 +134,42 @@ class ExtractionServiceB3:
         zip_files: Set[str],
         target_tpmerc_codes: Set[str],
         output_path: Path,
+        resume: bool = False,
+        on_conflict: Optional[ConflictPolicyEnumB3] = None,
     ) -> Dict[str, Any]:
         """
         Extracts from multiple ZIP files, writing each to a temp file and merging at the end.
         Returns extraction statistics only.
+
+        With on_conflict=None the output file is overwritten. Otherwise the
+        extracted records are deduplicated and merged into the existing
+        output, keyed on (data_pregao, ticker, tipo_mercado, prazo_termo),
+        following the given policy. A conflict under
+        ConflictPolicyEnumB3.ERROR raises DuplicateQuotesError and leaves
+        the existing output untouched.
+
+        With resume=True, every completed ZIP is checkpointed in a run
+        journal next to the output file and its temp file is kept until the
+        merge commits. A rerun skips ZIPs whose temp files still pass footer
+        and row count validation, so an interrupted run continues with the
+        remaining ZIPs and the merge. When some ZIPs fail and on_conflict
+        is set, the records of the others are upserted anyway; their temp
+        files are then removed and their checkpoints marked as merged, so
+        the rerun only upserts the ZIPs that failed.
+
+        ZIPs are started largest first, by the uncompressed size recorded
+        in their central directory, and each of the max_concurrent_files
+        slots takes the next ZIP as soon as it is free. Recent years are
+        many times larger than the 1990s files, so starting them first
+        keeps a large file from running alone at the end.
         """
         self._adjust_batch_sizes()
 
+        journal = None
+        if resume:
+            journal = ExtractionJournalB3(output_path, target_tpmerc_codes)
+            journal.load()
+
         logger.info(
             'Starting extraction with incremental flush',
             extra={
@@ -132,6 +179,8 @@ class ExtractionServiceB3:
                 'processing_mode': str(self.processing_mode),
                 'flush_batch_size': self.flush_batch_size,
                 'parse_batch_size': self.parse_batch_size,
+                'resume': resume,
+                'on_conflict': on_conflict.value if on_conflict else None,
             },
         )
 
@@ -142,17 +191,35 @@ class ExtractionServiceB3:
             total_records_written = 0
             success_count = 0
             error_count = 0
+            resumed_count = 0
             errors = {}
-            temp_files: List[Path] = []  # Collect temp files for merge
+            completed: List[Tuple[str, Path]] = []  # ZIPs and temp files
 
             progress_bar = SimpleProgressBar(
                 total=len(zip_files), desc='Extracting (async)'
             )
-            semaphore = asyncio.Semaphore(self.max_concurrent_files)
+            schedule = deque(await self._order_largest_first(zip_files))
 
             async def process_single_file(zip_file: str):
                 # Process a single ZIP file and write to a temp file
-                nonlocal success_count, error_count, errors
+                nonlocal success_count, error_count, resumed_count, errors
+
+                if journal is not None:
+                    checkpoint = journal.get_checkpoint(zip_file)
+                    if checkpoint is not None and (
+                        checkpoint.get('merged') and on_conflict is None
+                    ):
+                        # Overwriting the output needs these records again
+                        journal.discard(zip_file)
+                        checkpoint = None
+                    if checkpoint is not None:
+                        logger.info(
+                            f'Skipping {zip_file} - completed in a previous run',
+                            extra={'temp_file': checkpoint['temp_file']},
+                        )
+                        resumed_count += 1
+                        progress_bar.update(1)
+                        return (zip_file, checkpoint)
 
                 # Check resources before processing
                 if not await self._wait_for_resources(timeout_seconds=30):
@@ -161,37 +228,58 @@ class ExtractionServiceB3:
                     progress_bar.update(1)
                     return (zip_file, Exception(error_msg))
 
-                async with semaphore:
-                    try:
-                        # Process and write to temp file (returns dict with records and temp_file)
-                        result_data = await self._process_and_write_zip(
-                            zip_file=zip_file,
-                            target_tpmerc_codes=target_tpmerc_codes,
-                            output_path=output_path,
-                        )
+                try:
+                    # Process and write to temp file (returns dict with records and temp_file)
+                    result_data = await self._process_and_write_zip(
+                        zip_file=zip_file,
+                        target_tpmerc_codes=target_tpmerc_codes,
+                        output_path=output_path,
+                    )
 
-                        logger.info(
-                            f'Completed {zip_file}',
-                            extra={
-                                'records_extracted': result_data['records'],
-                                'temp_file': result_data['temp_file'],
-                            },
+                    if journal is not None:
+                        journal.mark_completed(
+                            zip_file,
+                            result_data['temp_file'],
+                            result_data['records'],
                         )
-                        progress_bar.update(1)
-                        return (zip_file, result_data)
 
+                    logger.info(
+                        f'Completed {zip_file}',
+                        extra={
+                            'records_extracted': result_data['records'],
+                            'temp_file': result_data['temp_file'],
+                        },
+                    )
+                    progress_bar.update(1)
+                    return (zip_file, result_data)
+
+                except Exception as e:
+                    logger.error(
+                        f'Error processing {zip_file}: {e}', exc_info=True
+                    )
+                    progress_bar.update(1)
+                    return (zip_file, e)
+
+            results: List[Any] = []
+
+            async def worker():
+                # Each worker is one concurrency slot pulling the next ZIP
+                while schedule:
+                    zip_file = schedule.popleft()
+                    try:
+                        results.append(await process_single_file(zip_file))
                     except Exception as e:
-                        logger.error(
-                            f'Error processing {zip_file}: {e}', exc_info=True
-                        )
-                        progress_bar.update(1)
-                        return (zip_file, e)
+                        results.append(e)
 
             try:
                 # Process all files with controlled concurrency
-                results = await asyncio.gather(
-                    *[process_single_file(zip_file) for zip_file in zip_files],
-                    return_exceptions=True,
+                await asyncio.gather(
+                    *[
+                        worker()
+                        for _ in range(
+                            min(self.max_concurrent_files, len(schedule))
+                        )
+                    ]
                 )
             finally:
                 progress_bar.close()
@@ -215,14 +303,24 @@ class ExtractionServiceB3:
                     # Successful processing - collect temp file
                     success_count += 1
                     total_records_written += result_data['records']
+                    if result_data.get('merged'):
+                        # Upserted by a previous run
+                        continue
                     temp_file_path = Path(result_data['temp_file'])
                     if temp_file_path.exists():
-                        temp_files.append(temp_file_path)
+                        completed.append((zip_file, temp_file_path))
                     else:
                         logger.warning(
                             f'Temp file not found: {temp_file_path}'
                         )
 
+            # Duplicate keys across ZIPs (an annual and a daily file of the
+            # same days) keep the record merged last, so the merge order
+            # must not depend on which ZIP finished first
+            completed.sort(key=lambda item: _source_order(item[0]))
+            merged_zip_files = [zip_file for zip_file, _ in completed]
+            temp_files = [temp_file for _, temp_file in completed]
+
             # MERGE FINAL - combine all temp files into one
             if temp_files:
                 logger.info(
@@ -230,15 +328,39 @@ class ExtractionServiceB3:
                     extra={'temp_files': [f.name for f in temp_files]},
                 )
 
+                merge_output = output_path
+                if on_conflict is not None:
+                    merge_output = (
+                        output_path.parent
+                        / f'{output_path.stem}_incoming_tmp.parquet'
+                    )
+
                 try:
                     final_record_count = (
                         await self._merge_temp_files_streaming(
                             temp_files=temp_files,
-                            final_output=output_path,
+                            final_output=merge_output,
+                            resumable=resume,
                         )
                     )
+
+                    if on_conflict is not None:
+                        upsert_result = await self._upsert_into_output(
+                            merge_output, output_path, on_conflict
+                        )
+                        final_record_count = upsert_result['total_records']
+
                     total_records_written = final_record_count
 
+                    if journal is not None:
+                        self._commit_resumable_run(
+                            journal,
+                            temp_files,
+                            merged_zip_files,
+                            error_count,
+                            upserted=on_conflict is not None,
+                        )
+
                     logger.info(
                         'Final merge completed',
                         extra={
@@ -246,6 +368,8 @@ class ExtractionServiceB3:
                             'output_file': str(output_path),
                         },
                     )
+                except DuplicateQuotesError:
+                    raise
                 except Exception as e:
                     logger.error(
                         f'Failed to merge temporary files: {e}', exc_info=True
@@ -254,10 +378,14 @@ class ExtractionServiceB3:
                     # The error is in the merge step
                     errors['MERGE'] = str(e)
 
+            elif journal is not None and error_count == 0:
+                journal.clear()
+
             result_summary = {
                 'total_files': len(zip_files),
                 'success_count': success_count,
                 'error_count': error_count,
+                'resumed_count': resumed_count,
                 'total_records': total_records_written,
                 'errors': errors,
                 'output_file': str(output_path),
@@ -267,6 +395,92 @@ class ExtractionServiceB3:
 
             return result_summary
 
+    async def _order_largest_first(self, zip_files: Set[str]) -> List[str]:
+        """Sort ZIPs by uncompressed size, largest first.
+
+        Unreadable ZIPs count as empty and go last; they fail quickly.
+        """
+        loop = asyncio.get_event_loop()
+        sizes = await loop.run_in_executor(
+            None, lambda: {f: _uncompressed_size(f) for f in zip_files}
+        )
+        ordered = sorted(zip_files, key=lambda f: (-sizes[f], f))
+
+        logger.debug(
+            'Scheduled ZIP files largest first',
+            extra={'schedule': [(f, sizes[f]) for f in ordered]},
+        )
+        return ordered
+
+    async def _upsert_into_output(
+        self,
+        incoming_path: Path,
+        output_path: Path,
+        on_conflict: ConflictPolicyEnumB3,
+    ) -> Dict[str, Any]:
+        """Merge the newly extracted file into the output by key."""
+        loop = asyncio.get_event_loop()
+        try:
+            result: Dict[str, Any] = await loop.run_in_executor(
+                None,
+                ParquetUpsertMergerB3().merge,
+                incoming_path,
+                output_path,
+                on_conflict,
+            )
+        finally:
+            if incoming_path.exists():
+                with contextlib.suppress(Exception):
+                    incoming_path.unlink()
+
+        logger.info(
+            'Upsert into existing output completed',
+            extra={'on_conflict': on_conflict.value, **result},
+        )
+        return result
+
+    def _commit_resumable_run(
+        self,
+        journal: ExtractionJournalB3,
+        temp_files: List[Path],
+        zip_files: List[str],
+        error_count: int,
+        upserted: bool = False,
+    ) -> None:
+        """Clean up a resumable run once its merge has been committed.
+
+        If some ZIPs failed, the temp files and journal are kept so a rerun
+        only processes the failed ZIPs before merging everything again.
+        After an upsert the merged records are already in the output, so
+        merging them again would duplicate them or, with
+        ConflictPolicyEnumB3.ERROR, fail; their checkpoints are marked as
+        merged and only the failed ZIPs stay pending.
+        """
+        if error_count > 0 and upserted:
+            journal.mark_merged(zip_files)
+            logger.info(
+                'Keeping journal for resume of the failed files',
+                extra={
+                    'journal': str(journal.path),
+                    'failed_files': error_count,
+                },
+            )
+        elif error_count > 0:
+            logger.info(
+                'Keeping temp files and journal for resume',
+                extra={
+                    'journal': str(journal.path),
+                    'failed_files': error_count,
+                },
+            )
+            return
+        else:
+            journal.clear()
+
+        for temp_file in temp_files:
+            with contextlib.suppress(Exception):
+                temp_file.unlink()
+
     async def _process_and_write_zip(
         self,
         zip_file: str,
@@ -281,10 +495,71 @@ class ExtractionServiceB3:
             / f'{output_path.stem}_{zip_basename}_temp.parquet'
         )
 
+        if self.parse_cache is not None:
+            total_written = await self._process_zip_from_cache(
+                zip_file, target_tpmerc_codes, temp_output
+            )
+        else:
+            total_written = await self._parse_zip_to_parquet(
+                zip_file, target_tpmerc_codes, temp_output
+            )
+
+        return {'records': total_written, 'temp_file': str(temp_output)}
+
+    async def _process_zip_from_cache(
+        self,
+        zip_file: str,
+        target_tpmerc_codes: Set[str],
+        temp_output: Path,
+    ) -> int:
+        """Serve a ZIP from the parse cache, parsing it in full on a miss."""
+        cache = self.parse_cache
+        assert cache is not None
+
+        loop = asyncio.get_event_loop()
+        key = await loop.run_in_executor(None, cache.cache_key, zip_file)
+
+        if cache.contains(key):
+            logger.debug(
+                f'Parse cache hit: {zip_file}', extra={'cache_key': key}
+            )
+        else:
+            logger.debug(
+                f'Parse cache miss: {zip_file}', extra={'cache_key': key}
+            )
+            staging = cache.staging_path(key)
+            records = await self._parse_zip_to_parquet(zip_file, None, staging)
+            if records == 0 or not staging.exists():
+                return 0
+            cache.commit(key, staging)
+
+        records_written: int = await loop.run_in_executor(
+            None,
+            cache.materialize,
+            key,
+            target_tpmerc_codes,
+            temp_output,
+        )
+        return records_written
+
+    async def _parse_zip_to_parquet(
+        self,
+        zip_file: str,
+        target_tpmerc_codes: Optional[Set[str]],
+        temp_output: Path,
+    ) -> int:
+        """Parse a ZIP with incremental flushes to temp_output. Returns records written.
+
+        A target_tpmerc_codes of None keeps records of every market type.
+        """
         logger.debug(
             f'Processing ZIP: {zip_file}',
             extra={
-                'target_codes': len(target_tpmerc_codes),
+                'target_codes': (
+                    len(target_tpmerc_codes)
+                    if target_tpmerc_codes is not None
+                    else 'all'
+                ),
                 'parallel_parsing': self.use_parallel_parsing,
                 'temp_output': str(temp_output),
             },
@@ -401,7 +676,7 @@ class ExtractionServiceB3:
                 },
             )
 
-            return {'records': total_written, 'temp_file': str(temp_output)}
+            return total_written
 
         except Exception as e:
             logger.error(
@@ -428,7 +703,7 @@ class ExtractionServiceB3:
             raise
 
     async def _parse_lines_batch_parallel(
-        self, lines: List[str], target_tpmerc_codes: Set[str]
+        self, lines: List[str], target_tpmerc_codes: Optional[Set[str]]
     ) -> List[Dict[str, Any]]:
         """Parse a batch of lines in parallel using ThreadPoolExecutor."""
         loop = asyncio.get_event_loop()
@@ -545,10 +820,14 @@ class ExtractionServiceB3:
         self,
         temp_files: List[Path],
         final_output: Path,
+        resumable: bool = False,
     ) -> int:
         """
         Merge multiple parquet files using PyArrow streaming, never loading all data in RAM.
         Returns total number of records in the final file.
+
+        When resumable is True, temp files are left untouched (also on
+        failure) so the caller can delete them after the run is committed.
         """
         import pyarrow.parquet as pq  # type: ignore
 
@@ -556,7 +835,7 @@ class ExtractionServiceB3:
             logger.warning('No temporary files to merge')
             return 0
 
-        if len(temp_files) == 1:
+        if len(temp_files) == 1 and not resumable:
             # Only one file - just rename it
             logger.info('Only one temp file, renaming to final output')
             temp_files[0].rename(final_output)
@@ -608,13 +887,16 @@ class ExtractionServiceB3:
                 )
 
                 # Clean up temporary file
-                try:
-                    temp_file.unlink()
-                    logger.debug(f'Deleted temporary file: {temp_file.name}')
-                except Exception as e:
-                    logger.warning(
-                        f'Failed to delete temp file {temp_file.name}: {e}'
-                    )
+                if not resumable:
+                    try:
+                        temp_file.unlink()
+                        logger.debug(
+                            f'Deleted temporary file: {temp_file.name}'
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f'Failed to delete temp file {temp_file.name}: {e}'
+                        )
 
                 # Check resources periodically (less frequently)
                 if total_rows % 500_000 == 0 and total_rows > 0:
@@ -648,11 +930,12 @@ class ExtractionServiceB3:
                 with contextlib.suppress(Exception):
                     temp_merge.unlink()
 
-            # Cleanup remaining temp files
-            for temp_file in temp_files:
-                if temp_file.exists():
-                    with contextlib.suppress(Exception):
-                        temp_file.unlink()
+            # Cleanup remaining temp files (kept for a resumable run)
+            if not resumable:
+                for temp_file in temp_files:
+                    if temp_file.exists():
+                        with contextlib.suppress(Exception):
+                            temp_file.unlink()
 
             raise IOError(f'Merge operation failed: {e}')
 
@@ -679,8 +962,33 @@ class ExtractionServiceB3:
         )
 
 
+def _uncompressed_size(zip_path: str) -> int:
+    """Uncompressed size listed in the central directory, 0 if unreadable."""
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            return sum(info.file_size for info in zf.infolist())
+    except (OSError, zipfile.BadZipFile):
+        return 0
+
+
+_PERIOD_ORDER = {'A': 0, 'M': 1, 'D': 2}
+
+
+def _source_order(zip_file: str) -> Tuple[int, date, str]:
+    """Merge order of a ZIP: annual, then monthly, then daily files.
+
+    Files named outside the portal's pattern are ranked as annual.
+    """
+    name = Path(zip_file).name
+    parsed = CotahistDownloadAdapterB3.parse_file_name(name)
+    if parsed is None:
+        return _PERIOD_ORDER['A'], date.min, name
+    period, first_day = parsed
+    return _PERIOD_ORDER[period], first_day, name
+
+
 def _parse_lines_batch(
-    lines: List[str], target_tpmerc_codes: Set[str]
+    lines: List[str], target_tpmerc_codes: Optional[Set[str]]
 ) -> List[Dict[str, Any]]:
     """Parse a batch of lines using a fresh parser instance (for ThreadPoolExecutor)."""
     parser = CotahistParserB3()
@@ -1,7 +1,11 @@
+from pathlib import Path
+from typing import Optional
+
 from ..domain import ProcessingModeEnumB3
 from .cotahist_parser import CotahistParserB3
 from .extraction_service import ExtractionServiceB3
 from .parquet_writer import ParquetWriterB3
+from .parse_cache import ParseCacheB3
 from .zip_reader import ZipFileReaderB3
 
 
@@ -18,6 +22,7 @@ class ExtractionServiceFactoryB3:
         parser: CotahistParserB3,
         data_writer: ParquetWriterB3,
         processing_mode: str = 'fast',
+        cache_dir: Optional[str] = None,
     ) -> ExtractionServiceB3:
         """Create an ExtractionServiceB3 with the specified configuration.
 
@@ -26,6 +31,8 @@ class ExtractionServiceFactoryB3:
             parser: COTAHIST parser implementation
             data_writer: Parquet data writer implementation
             processing_mode: Processing strategy - "fast" or "slow"
+            cache_dir: Optional directory for the canonical parse cache.
+                If None, ZIPs are parsed with the TPMERC filter on every run.
 
         Returns:
             Configured ExtractionServiceB3 instance
@@ -42,6 +49,15 @@ class ExtractionServiceFactoryB3:
                 f'Must be one of: {valid_modes}'
             )
 
+        if cache_dir:
+            return ExtractionServiceB3(
+                zip_reader=zip_reader,
+                parser=parser,
+                data_writer=data_writer,
+                processing_mode=mode,
+                parse_cache=ParseCacheB3(Path(cache_dir)),
+            )
+
         return ExtractionServiceB3(
             zip_reader=zip_reader,
             parser=parser,
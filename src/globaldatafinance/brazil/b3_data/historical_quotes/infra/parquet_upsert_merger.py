@@ -0,0 +1,294 @@
+import contextlib
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # type: ignore
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None  # type: ignore
+
+from .....core import get_logger, log_execution_time
+from ..domain import ConflictPolicyEnumB3
+from ..exceptions import DuplicateQuotesError
+
+logger = get_logger(__name__)
+
+
+class ParquetUpsertMergerB3:
+    """Keyed merge of newly extracted quotes into an existing Parquet file.
+
+    Records are identified by ``(data_pregao, ticker, tipo_mercado,
+    prazo_termo)``. The incoming data is first deduplicated on that key, so
+    overlapping annual and daily files in the same run do not produce
+    duplicates; the record that comes last in the incoming file wins,
+    which ExtractionServiceB3 makes the one from the most granular file.
+
+    The existing file is streamed one row group at a time. Row groups whose
+    ``data_pregao`` statistics do not overlap the incoming date range are
+    copied through without any join; only overlapping row groups are
+    anti/semi-joined against the incoming keys of the same date range. The
+    result is written to a temporary file and atomically replaces the
+    output, so the existing dataset is untouched if the merge fails.
+
+    Raises:
+        ImportError: If polars or pyarrow are not installed
+    """
+
+    KEY_COLUMNS = ('data_pregao', 'ticker', 'tipo_mercado', 'prazo_termo')
+    _KEY = '__upsert_key'
+    BATCH_SIZE = 500_000
+
+    def __init__(self):
+        if pl is None or pq is None:
+            raise ImportError(
+                'polars and pyarrow are required for ParquetUpsertMergerB3. '
+                'Install them with: pip install polars pyarrow'
+            )
+
+    def merge(
+        self,
+        incoming_path: Path,
+        output_path: Path,
+        policy: ConflictPolicyEnumB3,
+    ) -> Dict[str, Any]:
+        """Merge incoming_path into output_path according to policy.
+
+        Args:
+            incoming_path: Parquet file with the newly extracted records.
+                It is left in place; the caller owns its cleanup.
+            output_path: Existing dataset (created if it does not exist)
+            policy: Conflict resolution policy
+
+        Returns:
+            Dictionary with total_records, inserted, replaced and skipped
+
+        Raises:
+            DuplicateQuotesError: If policy is ERROR and keys overlap
+        """
+        dedup_path = output_path.with_suffix('.parquet.dedup_tmp')
+        merge_path = output_path.with_suffix('.parquet.upsert_tmp')
+
+        try:
+            with log_execution_time(
+                logger, 'Upsert merge', policy=policy.value
+            ):
+                self._deduplicate(incoming_path, dedup_path)
+
+                if not output_path.exists():
+                    dedup_path.replace(output_path)
+                    total = pq.ParquetFile(str(output_path)).metadata.num_rows
+                    return {
+                        'total_records': total,
+                        'inserted': total,
+                        'replaced': 0,
+                        'skipped': 0,
+                    }
+
+                stats = self._merge_into(
+                    dedup_path, output_path, merge_path, policy
+                )
+                merge_path.replace(output_path)
+
+        finally:
+            for tmp in (dedup_path, merge_path):
+                if tmp.exists():
+                    with contextlib.suppress(Exception):
+                        tmp.unlink()
+
+        logger.info('Upsert merge completed', extra=stats)
+        return stats
+
+    def _deduplicate(self, incoming_path: Path, dedup_path: Path) -> None:
+        """Drop duplicate keys from the incoming data, keeping the last."""
+        (
+            pl.scan_parquet(str(incoming_path))
+            .with_columns(self._key_expr())
+            .unique(subset=[self._KEY], keep='last', maintain_order=True)
+            .drop(self._KEY)
+            .sink_parquet(
+                str(dedup_path), compression='zstd', compression_level=3
+            )
+        )
+
+    def _merge_into(
+        self,
+        incoming_path: Path,
+        existing_path: Path,
+        merge_path: Path,
+        policy: ConflictPolicyEnumB3,
+    ) -> Dict[str, Any]:
+        incoming = pl.scan_parquet(str(incoming_path))
+        schema = incoming.collect_schema()
+        arrow_schema = pl.DataFrame(schema=schema).to_arrow().schema
+
+        bounds = incoming.select(
+            pl.col('data_pregao').min().alias('lo'),
+            pl.col('data_pregao').max().alias('hi'),
+        ).collect()
+        incoming_range = (bounds['lo'][0], bounds['hi'][0])
+
+        existing = pq.ParquetFile(str(existing_path))
+        date_column = self._column_index(existing, 'data_pregao')
+
+        replaced = 0
+        conflicts = 0
+        existing_rows = 0
+        conflicting_keys: List['pl.DataFrame'] = []
+
+        writer = pq.ParquetWriter(
+            str(merge_path),
+            arrow_schema,
+            compression='zstd',
+            compression_level=3,
+        )
+
+        try:
+            for i in range(existing.num_row_groups):
+                frame = self._align(
+                    pl.DataFrame(existing.read_row_group(i)), schema
+                )
+                group_range = self._row_group_range(existing, i, date_column)
+
+                if not self._overlaps(group_range, incoming_range):
+                    writer.write_table(frame.to_arrow().cast(arrow_schema))
+                    existing_rows += frame.height
+                    continue
+
+                frame = frame.with_columns(self._key_expr())
+                incoming_keys = self._incoming_keys(incoming, frame)
+                matches = frame.join(incoming_keys, on=self._KEY, how='semi')
+
+                if policy == ConflictPolicyEnumB3.ERROR:
+                    conflicts += matches.height
+                elif policy == ConflictPolicyEnumB3.REPLACE:
+                    replaced += matches.height
+                    frame = frame.join(incoming_keys, on=self._KEY, how='anti')
+                else:
+                    conflicting_keys.append(matches.select(self._KEY))
+
+                frame = frame.drop(self._KEY)
+                writer.write_table(frame.to_arrow().cast(arrow_schema))
+                existing_rows += frame.height
+
+            if conflicts:
+                raise DuplicateQuotesError(conflicts, str(existing_path))
+
+            skip_keys = (
+                pl.concat(conflicting_keys) if conflicting_keys else None
+            )
+
+            inserted = 0
+            for batch in pq.ParquetFile(str(incoming_path)).iter_batches(
+                batch_size=self.BATCH_SIZE
+            ):
+                records = pl.DataFrame(batch)
+                if skip_keys is not None:
+                    records = (
+                        records.with_columns(self._key_expr())
+                        .join(skip_keys, on=self._KEY, how='anti')
+                        .drop(self._KEY)
+                    )
+                writer.write_table(records.to_arrow().cast(arrow_schema))
+                inserted += records.height
+
+        finally:
+            writer.close()
+
+        incoming_total = pq.ParquetFile(str(incoming_path)).metadata.num_rows
+
+        return {
+            'total_records': existing_rows + inserted,
+            'inserted': inserted,
+            'replaced': replaced,
+            'skipped': incoming_total - inserted,
+        }
+
+    def _incoming_keys(
+        self, incoming: 'pl.LazyFrame', frame: 'pl.DataFrame'
+    ) -> 'pl.DataFrame':
+        """Keys of the incoming records within the frame's date range."""
+        lo = frame['data_pregao'].min()
+        hi = frame['data_pregao'].max()
+
+        query = incoming
+        if lo is not None and hi is not None:
+            query = query.filter(
+                pl.col('data_pregao').is_between(lo, hi)
+                | pl.col('data_pregao').is_null()
+            )
+
+        return query.select(self._key_expr()).collect()
+
+    @classmethod
+    def _key_expr(cls) -> 'pl.Expr':
+        return pl.concat_str(
+            [
+                pl.col(column).cast(pl.Utf8).fill_null('')
+                for column in cls.KEY_COLUMNS
+            ],
+            separator='|',
+        ).alias(cls._KEY)
+
+    @staticmethod
+    def _align(frame: 'pl.DataFrame', schema: 'pl.Schema') -> 'pl.DataFrame':
+        """Project an existing row group onto the incoming schema.
+
+        Columns missing from older outputs (e.g. prazo_termo) are added,
+        as empty strings for text columns and nulls otherwise.
+        """
+        missing = [
+            (
+                pl.lit('', dtype=dtype)
+                if dtype == pl.Utf8
+                else pl.lit(None, dtype=dtype)
+            ).alias(name)
+            for name, dtype in schema.items()
+            if name not in frame.columns
+        ]
+        if missing:
+            frame = frame.with_columns(missing)
+
+        return frame.select(
+            [pl.col(name).cast(dtype) for name, dtype in schema.items()]
+        )
+
+    @staticmethod
+    def _column_index(parquet_file: Any, name: str) -> Optional[int]:
+        names = parquet_file.schema_arrow.names
+        return names.index(name) if name in names else None
+
+    @staticmethod
+    def _row_group_range(
+        parquet_file: Any, index: int, column: Optional[int]
+    ) -> Optional[Tuple[date, date]]:
+        if column is None:
+            return None
+
+        statistics = (
+            parquet_file.metadata.row_group(index).column(column).statistics
+        )
+        if (
+            statistics is None
+            or not statistics.has_min_max
+            or statistics.null_count
+        ):
+            return None
+
+        return statistics.min, statistics.max
+
+    @staticmethod
+    def _overlaps(
+        group_range: Optional[Tuple[date, date]],
+        incoming_range: Tuple[Optional[date], Optional[date]],
+    ) -> bool:
+        lo, hi = incoming_range
+        if group_range is None or lo is None or hi is None:
+            return True
+
+        return not (group_range[1] < lo or group_range[0] > hi)
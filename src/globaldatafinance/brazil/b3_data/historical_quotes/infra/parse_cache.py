@@ -0,0 +1,190 @@
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # type: ignore
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None  # type: ignore
+
+from .....core import get_logger
+from .cotahist_parser import CotahistParserB3
+
+logger = get_logger(__name__)
+
+
+class ParseCacheB3:
+    """Content-addressed cache of fully parsed COTAHIST ZIP files.
+
+    Each source ZIP is parsed once with no TPMERC filter and stored as a
+    canonical all-records Parquet file named after the SHA-256 of the ZIP
+    and ``CotahistParserB3.PARSER_VERSION``. Later extractions with any
+    asset combination become a filter-and-project over the cached file
+    instead of decompress-and-parse.
+
+    Hashing large ZIPs is not free, so digests are remembered in
+    ``index.json`` keyed by ZIP path and invalidated when the file size or
+    modification time changes. Bumping ``PARSER_VERSION`` naturally
+    invalidates every entry.
+
+    Raises:
+        ImportError: If polars or pyarrow are not installed
+    """
+
+    INDEX_FILE = 'index.json'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: Path):
+        if pl is None or pq is None:
+            raise ImportError(
+                'polars and pyarrow are required for ParseCacheB3. '
+                'Install them with: pip install polars pyarrow'
+            )
+
+        self.cache_dir = Path(cache_dir).expanduser().resolve()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_lock = threading.Lock()
+
+        logger.debug(
+            'ParseCacheB3 initialized',
+            extra={
+                'cache_dir': str(self.cache_dir),
+                'parser_version': CotahistParserB3.PARSER_VERSION,
+            },
+        )
+
+    def cache_key(self, zip_file: str) -> str:
+        """Return the cache key for a ZIP (content hash + parser version).
+
+        Args:
+            zip_file: Path to the COTAHIST ZIP file
+
+        Returns:
+            Key used to name the cached Parquet file
+        """
+        digest = self._zip_digest(Path(zip_file).resolve())
+        return f'{digest}-v{CotahistParserB3.PARSER_VERSION}'
+
+    def cached_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.parquet'
+
+    def contains(self, key: str) -> bool:
+        return self.cached_path(key).exists()
+
+    def staging_path(self, key: str) -> Path:
+        """Return a unique path to write a new cache entry to.
+
+        Concurrent runs sharing the cache each get their own staging file
+        and the last one to commit wins, which is harmless because the
+        contents are identical.
+        """
+        return self.cache_dir / f'{key}.{uuid.uuid4().hex}.staging.parquet'
+
+    def commit(self, key: str, staging: Path) -> Path:
+        """Atomically publish a staged cache entry."""
+        target = self.cached_path(key)
+        os.replace(staging, target)
+        logger.debug(f'Cached parsed ZIP: {target.name}')
+        return target
+
+    def materialize(
+        self,
+        key: str,
+        target_tpmerc_codes: Set[str],
+        output_path: Path,
+        columns: Optional[List[str]] = None,
+    ) -> int:
+        """Filter a cached entry by TPMERC codes and write it to output_path.
+
+        Args:
+            key: Cache key returned by cache_key()
+            target_tpmerc_codes: TPMERC codes to keep
+            output_path: Parquet file to write
+            columns: Optional column projection (default: all columns)
+
+        Returns:
+            Number of records written. If no record matches, nothing is
+            written and 0 is returned.
+        """
+        query = pl.scan_parquet(str(self.cached_path(key))).filter(
+            pl.col('tipo_mercado').is_in(sorted(target_tpmerc_codes))
+        )
+        if columns is not None:
+            query = query.select(columns)
+
+        query.sink_parquet(
+            str(output_path), compression='zstd', compression_level=3
+        )
+
+        records: int = pq.ParquetFile(str(output_path)).metadata.num_rows
+        if records == 0:
+            output_path.unlink()
+
+        return records
+
+    def _zip_digest(self, zip_path: Path) -> str:
+        stat = zip_path.stat()
+        entry_id = str(zip_path)
+
+        with self._index_lock:
+            entry = self._load_index().get(entry_id)
+
+        if (
+            entry
+            and entry.get('size') == stat.st_size
+            and entry.get('mtime_ns') == stat.st_mtime_ns
+        ):
+            return str(entry['sha256'])
+
+        sha256 = hashlib.sha256()
+        with open(zip_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        with self._index_lock:
+            index = self._load_index()
+            index[entry_id] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest,
+            }
+            self._save_index(index)
+
+        return digest
+
+    def _load_index(self) -> Dict[str, Any]:
+        index_path = self.cache_dir / self.INDEX_FILE
+        if not index_path.exists():
+            return {}
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable cache index: {e}')
+            return {}
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        index_path = self.cache_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix('.json.tmp')
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.warning(f'Failed to update cache index: {e}')
+            with contextlib.suppress(Exception):
+                tmp_path.unlink()
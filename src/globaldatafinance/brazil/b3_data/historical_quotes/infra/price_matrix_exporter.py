@@ -0,0 +1,399 @@
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # type: ignore
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None  # type: ignore
+
+from .....core import get_logger, log_execution_time
+
+logger = get_logger(__name__)
+
+
+class PriceMatrixExporterB3:
+    """Exports long-form quotes as dense dates x tickers NumPy matrices.
+
+    The output directory holds aligned ``.npy`` files that can be opened
+    with ``np.load(path, mmap_mode='r')`` for zero-copy slicing:
+
+    - ``dates.npy``: ``datetime64[D]`` row index, sorted ascending
+    - ``tickers.npy``: unicode column index
+    - ``close.npy``: closing prices (``float64``, NaN when not traded)
+    - ``volume.npy``: traded volume (``float64``, NaN when not traded)
+    - ``returns.npy``: log returns between consecutive rows (``float64``)
+
+    Matrices are written through ``np.lib.format.open_memmap``, so the
+    dense result is never materialised in RAM. Re-exporting into an
+    existing directory updates it incrementally: new dates are merged into
+    the row index, known tickers keep their column and new tickers are
+    appended on the right.
+
+    The set of files is replaced as a whole. Every file is first written
+    to a temporary and synced, then a commit marker listing them is put
+    in place with a single os.replace() and the temporaries are moved
+    over the old files. A crash before the marker leaves the previous
+    matrices untouched; after it, the next export finishes the
+    replacement before reading them. Directories left inconsistent by
+    older versions (matrices whose shape disagrees with the dates and
+    tickers) are rebuilt from the source instead of being merged.
+
+    Raises:
+        ImportError: If numpy, polars or pyarrow are not installed
+    """
+
+    DATES_FILE = 'dates.npy'
+    TICKERS_FILE = 'tickers.npy'
+    CLOSE_FILE = 'close.npy'
+    VOLUME_FILE = 'volume.npy'
+    RETURNS_FILE = 'returns.npy'
+    COMMIT_FILE = '.export_commit.json'
+
+    BATCH_SIZE = 500_000
+    ROW_BLOCK = 256
+
+    def __init__(self, batch_size: Optional[int] = None):
+        if np is None or pl is None or pq is None:
+            raise ImportError(
+                'numpy, polars and pyarrow are required for '
+                'PriceMatrixExporterB3. '
+                'Install them with: pip install numpy polars pyarrow'
+            )
+
+        self.batch_size = batch_size or self.BATCH_SIZE
+
+    def export(
+        self,
+        source_path: Path,
+        output_dir: Path,
+        tickers: Optional[List[str]] = None,
+        incremental: bool = True,
+    ) -> Dict[str, Any]:
+        """Export (or update) the price matrices for a quotes file.
+
+        Args:
+            source_path: Extracted quotes Parquet file
+            output_dir: Directory for the ``.npy`` files
+            tickers: Optional subset of tickers to export. If None, every
+                ticker in the source is exported.
+            incremental: If True and the directory already holds matrices,
+                merge the source into them instead of rebuilding.
+
+        Returns:
+            Dictionary with total_dates, total_tickers, new_dates,
+            new_tickers, output_dir and files
+
+        Raises:
+            FileNotFoundError: If source_path does not exist
+            IOError: If the matrices cannot be written
+        """
+        if not source_path.exists():
+            raise FileNotFoundError(f'Quotes file not found: {source_path}')
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_paths = {
+            name: output_dir / f'{Path(name).stem}.tmp.npy'
+            for name in (
+                self.DATES_FILE,
+                self.TICKERS_FILE,
+                self.CLOSE_FILE,
+                self.VOLUME_FILE,
+                self.RETURNS_FILE,
+            )
+        }
+
+        logger.info(
+            'Starting price matrix export',
+            extra={
+                'source': str(source_path),
+                'output_dir': str(output_dir),
+                'incremental': incremental,
+            },
+        )
+
+        try:
+            with log_execution_time(logger, 'Price matrix export'):
+                self._recover(output_dir, tmp_paths)
+                result = self._export(
+                    source_path, output_dir, tickers, incremental, tmp_paths
+                )
+                self._commit(output_dir, tmp_paths)
+
+        except Exception as e:
+            logger.error(f'Price matrix export failed: {e}', exc_info=True)
+            raise IOError(f'Price matrix export failed: {e}')
+
+        finally:
+            # Once committed, the temporaries are needed to finish the
+            # replacement on the next run
+            if not (output_dir / self.COMMIT_FILE).exists():
+                self._discard(tmp_paths)
+
+        result['output_dir'] = str(output_dir)
+        result['files'] = [str(output_dir / name) for name in tmp_paths]
+        logger.info('Price matrix export completed', extra=result)
+        return result
+
+    def _commit(self, output_dir: Path, tmp_paths: Dict[str, Path]) -> None:
+        """Switch to the new set of files as one step."""
+        for tmp in tmp_paths.values():
+            self._fsync(tmp)
+
+        marker = output_dir / self.COMMIT_FILE
+        staging = marker.with_name(f'{marker.name}.tmp')
+        staging.write_text(json.dumps(sorted(tmp_paths)), encoding='utf-8')
+        self._fsync(staging)
+        os.replace(staging, marker)
+
+        self._roll_forward(output_dir, tmp_paths)
+
+    def _recover(self, output_dir: Path, tmp_paths: Dict[str, Path]) -> None:
+        """Finish a committed export, or drop an uncommitted one."""
+        if (output_dir / self.COMMIT_FILE).exists():
+            logger.warning(
+                f'Completing interrupted matrix export in {output_dir}'
+            )
+            self._roll_forward(output_dir, tmp_paths)
+        else:
+            self._discard(tmp_paths)
+
+    def _roll_forward(
+        self, output_dir: Path, tmp_paths: Dict[str, Path]
+    ) -> None:
+        for name, tmp in tmp_paths.items():
+            if tmp.exists():
+                os.replace(tmp, output_dir / name)
+        (output_dir / self.COMMIT_FILE).unlink()
+
+    @staticmethod
+    def _discard(tmp_paths: Dict[str, Path]) -> None:
+        for tmp in tmp_paths.values():
+            if tmp.exists():
+                with contextlib.suppress(Exception):
+                    tmp.unlink()
+
+    @staticmethod
+    def _fsync(path: Path) -> None:
+        with open(path, 'rb+') as f:
+            os.fsync(f.fileno())
+
+    def _export(
+        self,
+        source_path: Path,
+        output_dir: Path,
+        tickers: Optional[List[str]],
+        incremental: bool,
+        tmp_paths: Dict[str, Path],
+    ) -> Dict[str, Any]:
+        source = pl.scan_parquet(str(source_path)).filter(
+            pl.col('data_pregao').is_not_null()
+            & (pl.col('ticker').str.len_chars() > 0)
+        )
+        if tickers is not None:
+            source = source.filter(pl.col('ticker').is_in(list(tickers)))
+
+        source_dates = (
+            source.select(pl.col('data_pregao').unique())
+            .collect()
+            .to_series()
+            .to_numpy()
+            .astype('datetime64[D]')
+        )
+        source_tickers = (
+            source.select(pl.col('ticker').unique()).collect().to_series()
+        )
+
+        old_dates = old_tickers = None
+        if incremental and self._has_matrices(output_dir):
+            old_dates = np.load(output_dir / self.DATES_FILE)
+            old_tickers = np.load(output_dir / self.TICKERS_FILE)
+            if not self._shapes_agree(
+                output_dir, (len(old_dates), len(old_tickers))
+            ):
+                logger.warning(
+                    f'Matrices in {output_dir} do not match their dates '
+                    f'and tickers; rebuilding them from {source_path}'
+                )
+                old_dates = old_tickers = None
+
+        if old_dates is None or old_tickers is None:
+            dates = np.unique(source_dates)
+            ticker_list = sorted(source_tickers.to_list())
+            new_tickers = len(ticker_list)
+        else:
+            dates = np.union1d(old_dates, source_dates)
+            known = set(old_tickers.tolist())
+            added = sorted(
+                t for t in source_tickers.to_list() if t not in known
+            )
+            ticker_list = old_tickers.tolist() + added
+            new_tickers = len(added)
+
+        n_dates, n_tickers = len(dates), len(ticker_list)
+        shape = (n_dates, n_tickers)
+
+        np.save(tmp_paths[self.DATES_FILE], dates.astype('datetime64[D]'))
+        np.save(
+            tmp_paths[self.TICKERS_FILE],
+            np.array(
+                ticker_list,
+                dtype=f'<U{max([1, *map(len, ticker_list)])}',
+            ),
+        )
+
+        close = self._open_matrix(tmp_paths[self.CLOSE_FILE], shape)
+        volume = self._open_matrix(tmp_paths[self.VOLUME_FILE], shape)
+
+        if old_dates is not None:
+            row_map = np.searchsorted(dates, old_dates)
+            self._copy_existing(output_dir / self.CLOSE_FILE, close, row_map)
+            self._copy_existing(output_dir / self.VOLUME_FILE, volume, row_map)
+
+        ticker_index = pl.DataFrame(
+            {
+                'ticker': ticker_list,
+                'column': np.arange(n_tickers, dtype=np.int64),
+            }
+        )
+        self._scatter(
+            source_path,
+            ticker_index.filter(
+                pl.col('ticker').is_in(source_tickers.to_list())
+            ),
+            dates,
+            close,
+            volume,
+        )
+
+        returns = self._open_matrix(tmp_paths[self.RETURNS_FILE], shape)
+        self._fill_returns(close, returns)
+
+        for matrix in (close, volume, returns):
+            matrix.flush()
+        del close, volume, returns
+
+        return {
+            'total_dates': n_dates,
+            'total_tickers': n_tickers,
+            'new_dates': n_dates
+            - (0 if old_dates is None else len(old_dates)),
+            'new_tickers': new_tickers,
+        }
+
+    def _has_matrices(self, output_dir: Path) -> bool:
+        return all(
+            (output_dir / name).exists()
+            for name in (
+                self.DATES_FILE,
+                self.TICKERS_FILE,
+                self.CLOSE_FILE,
+                self.VOLUME_FILE,
+            )
+        )
+
+    def _shapes_agree(self, output_dir: Path, shape: tuple) -> bool:
+        for name in (self.CLOSE_FILE, self.VOLUME_FILE, self.RETURNS_FILE):
+            path = output_dir / name
+            if name == self.RETURNS_FILE and not path.exists():
+                continue
+            try:
+                matrix = np.load(path, mmap_mode='r')
+            except (OSError, ValueError):
+                return False
+            agree = matrix.shape == shape
+            del matrix
+            if not agree:
+                return False
+        return True
+
+    @staticmethod
+    def _open_matrix(path: Path, shape: tuple) -> 'np.memmap':
+        matrix = np.lib.format.open_memmap(
+            path, mode='w+', dtype=np.float64, shape=shape
+        )
+        matrix[:] = np.nan
+        return matrix
+
+    def _copy_existing(
+        self, old_path: Path, matrix: 'np.memmap', row_map: 'np.ndarray'
+    ) -> None:
+        """Copy an existing matrix into the re-indexed one, block by block."""
+        old = np.load(old_path, mmap_mode='r')
+        n_old_tickers = old.shape[1]
+
+        for start in range(0, old.shape[0], self.ROW_BLOCK):
+            stop = start + self.ROW_BLOCK
+            matrix[row_map[start:stop], :n_old_tickers] = old[start:stop]
+
+        del old
+
+    def _scatter(
+        self,
+        source_path: Path,
+        ticker_index: 'pl.DataFrame',
+        dates: 'np.ndarray',
+        close: 'np.memmap',
+        volume: 'np.memmap',
+    ) -> None:
+        """Stream the source and write each quote into its matrix cell."""
+        parquet_file = pq.ParquetFile(str(source_path))
+
+        for batch in parquet_file.iter_batches(
+            batch_size=self.batch_size,
+            columns=[
+                'ticker',
+                'data_pregao',
+                'preco_fechamento',
+                'volume_total',
+            ],
+        ):
+            frame = pl.from_arrow(batch)
+            if not isinstance(frame, pl.DataFrame) or frame.is_empty():
+                continue
+
+            frame = frame.filter(pl.col('data_pregao').is_not_null()).join(
+                ticker_index, on='ticker', how='inner'
+            )
+            if frame.is_empty():
+                continue
+
+            rows = np.searchsorted(
+                dates,
+                frame['data_pregao'].to_numpy().astype('datetime64[D]'),
+            )
+            columns = frame['column'].to_numpy()
+
+            close[rows, columns] = (
+                frame['preco_fechamento'].cast(pl.Float64).to_numpy()
+            )
+            volume[rows, columns] = (
+                frame['volume_total'].cast(pl.Float64).to_numpy()
+            )
+
+    def _fill_returns(self, close: 'np.memmap', returns: 'np.memmap') -> None:
+        """Compute log returns row block by row block from the close matrix."""
+        previous = np.full(close.shape[1], np.nan)
+
+        for start in range(0, close.shape[0], self.ROW_BLOCK):
+            block = np.asarray(close[start : start + self.ROW_BLOCK])
+            shifted = np.vstack([previous[np.newaxis, :], block[:-1]])
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = np.log(block / shifted)
+            values[~((block > 0) & (shifted > 0))] = np.nan
+
+            returns[start : start + len(block)] = values
+            previous = block[-1]
@@ -0,0 +1,351 @@
+import contextlib
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # type: ignore
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None  # type: ignore
+
+from .....core import get_logger, log_execution_time
+
+logger = get_logger(__name__)
+
+
+class QuotesAnalyticsServiceB3:
+    """Computes per-ticker returns and rolling statistics over quote data.
+
+    The source dataset (output of the extraction) is sorted once by
+    ``(ticker, data_pregao)`` with Polars' streaming engine and then read
+    back in batches. Batches are cut on ticker boundaries, so every
+    rolling window is computed in a single vectorized ``over('ticker')``
+    pass without holding the whole dataset in RAM.
+
+    The result is a companion Parquet dataset keyed by
+    ``(ticker, data_pregao)`` with the columns:
+
+    - ``log_return``: ln(close_t / close_t-1) within the ticker
+    - ``market_return``: benchmark return for the session
+    - ``volatility_{w}``: annualized rolling std of ``log_return``
+    - ``adtv_{w}``: rolling average daily traded volume (``volume_total``)
+    - ``beta_{w}``: rolling beta of ``log_return`` against ``market_return``
+
+    The benchmark is the equal-weighted mean return of all tickers in the
+    session, or the returns of ``benchmark_ticker`` when provided.
+
+    Raises:
+        ImportError: If polars or pyarrow are not installed
+    """
+
+    TRADING_DAYS_PER_YEAR = 252
+    BATCH_SIZE = 500_000
+
+    def __init__(self, batch_size: Optional[int] = None):
+        if pl is None or pq is None:
+            raise ImportError(
+                'polars and pyarrow are required for QuotesAnalyticsServiceB3. '
+                'Install them with: pip install polars pyarrow'
+            )
+
+        self.batch_size = batch_size or self.BATCH_SIZE
+
+    def compute(
+        self,
+        source_path: Path,
+        output_path: Path,
+        windows: Sequence[int],
+        benchmark_ticker: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Compute returns and rolling statistics and write them to Parquet.
+
+        Args:
+            source_path: Extracted quotes Parquet file
+            output_path: Destination Parquet file for the analytics
+            windows: Validated rolling window sizes (trading sessions)
+            benchmark_ticker: Optional ticker used as the market proxy
+
+        Returns:
+            Dictionary with total_records, total_tickers, windows and
+            output_file
+
+        Raises:
+            FileNotFoundError: If source_path does not exist
+            IOError: If the analytics dataset cannot be written
+        """
+        if not source_path.exists():
+            raise FileNotFoundError(f'Quotes file not found: {source_path}')
+
+        sorted_tmp = output_path.with_suffix('.sorted_tmp.parquet')
+        returns_tmp = output_path.with_suffix('.returns_tmp.parquet')
+        output_tmp = output_path.with_suffix('.parquet.tmp')
+
+        logger.info(
+            'Starting quotes analytics',
+            extra={
+                'source': str(source_path),
+                'output': str(output_path),
+                'windows': list(windows),
+                'benchmark_ticker': benchmark_ticker,
+            },
+        )
+
+        try:
+            with log_execution_time(logger, 'Quotes analytics'):
+                self._sort_by_ticker(source_path, sorted_tmp)
+
+                market_returns = self._write_returns(
+                    sorted_tmp, returns_tmp, benchmark_ticker
+                )
+                sorted_tmp.unlink()
+
+                total_records, total_tickers = self._write_rolling_stats(
+                    returns_tmp, output_tmp, windows, market_returns
+                )
+
+                output_tmp.replace(output_path)
+
+        except Exception as e:
+            logger.error(f'Quotes analytics failed: {e}', exc_info=True)
+            if isinstance(e, FileNotFoundError):
+                raise
+            raise IOError(f'Quotes analytics failed: {e}')
+
+        finally:
+            for tmp in (sorted_tmp, returns_tmp, output_tmp):
+                if tmp.exists():
+                    with contextlib.suppress(Exception):
+                        tmp.unlink()
+
+        result = {
+            'total_records': total_records,
+            'total_tickers': total_tickers,
+            'windows': list(windows),
+            'output_file': str(output_path),
+        }
+        logger.info('Quotes analytics completed', extra=result)
+        return result
+
+    def _sort_by_ticker(self, source_path: Path, sorted_path: Path) -> None:
+        """Project the needed columns and sort by (ticker, data_pregao)."""
+        (
+            pl.scan_parquet(str(source_path))
+            .select(
+                pl.col('ticker'),
+                pl.col('data_pregao'),
+                pl.col('preco_fechamento').cast(pl.Float64),
+                pl.col('volume_total').cast(pl.Float64),
+            )
+            .filter(
+                pl.col('data_pregao').is_not_null()
+                & (pl.col('ticker').str.len_chars() > 0)
+            )
+            .unique(subset=['ticker', 'data_pregao'], keep='any')
+            .sort(['ticker', 'data_pregao'])
+            .sink_parquet(str(sorted_path))
+        )
+
+    def _write_returns(
+        self,
+        sorted_path: Path,
+        returns_path: Path,
+        benchmark_ticker: Optional[str],
+    ) -> 'pl.DataFrame':
+        """First pass: log returns per ticker plus the per-session benchmark.
+
+        Returns:
+            DataFrame with columns data_pregao and market_return
+        """
+        writer = None
+        per_session: List['pl.DataFrame'] = []
+
+        try:
+            for chunk in self._iter_ticker_chunks(sorted_path):
+                chunk = chunk.with_columns(
+                    self._log_return_expr().alias('log_return')
+                )
+
+                if benchmark_ticker is None:
+                    per_session.append(
+                        chunk.filter(pl.col('log_return').is_not_null())
+                        .group_by('data_pregao')
+                        .agg(
+                            pl.col('log_return').sum().alias('return_sum'),
+                            pl.col('log_return').count().alias('count'),
+                        )
+                    )
+                else:
+                    per_session.append(
+                        chunk.filter(
+                            pl.col('ticker') == benchmark_ticker
+                        ).select(
+                            'data_pregao',
+                            pl.col('log_return').alias('return_sum'),
+                            pl.lit(1, dtype=pl.UInt32).alias('count'),
+                        )
+                    )
+
+                table = chunk.to_arrow()
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        str(returns_path),
+                        table.schema,
+                        compression='zstd',
+                        compression_level=3,
+                    )
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if not per_session:
+            return pl.DataFrame(
+                schema={'data_pregao': pl.Date, 'market_return': pl.Float64}
+            )
+
+        market_returns = (
+            pl.concat(per_session)
+            .group_by('data_pregao')
+            .agg(
+                (pl.col('return_sum').sum() / pl.col('count').sum()).alias(
+                    'market_return'
+                )
+            )
+        )
+
+        if benchmark_ticker is not None and market_returns.is_empty():
+            logger.warning(
+                f'Benchmark ticker {benchmark_ticker!r} not found, '
+                'beta columns will be empty'
+            )
+
+        return market_returns
+
+    def _write_rolling_stats(
+        self,
+        returns_path: Path,
+        output_path: Path,
+        windows: Sequence[int],
+        market_returns: 'pl.DataFrame',
+    ) -> tuple:
+        """Second pass: rolling volatility, ADTV and beta per ticker."""
+        writer = None
+        total_records = 0
+        total_tickers = 0
+        annualization = math.sqrt(self.TRADING_DAYS_PER_YEAR)
+
+        try:
+            for chunk in self._iter_ticker_chunks(returns_path):
+                chunk = chunk.join(
+                    market_returns, on='data_pregao', how='left'
+                ).sort(['ticker', 'data_pregao'])
+
+                stats = []
+                for window in windows:
+                    stats.extend(
+                        [
+                            (
+                                pl.col('log_return')
+                                .rolling_std(window)
+                                .over('ticker')
+                                * annualization
+                            ).alias(f'volatility_{window}'),
+                            pl.col('volume_total')
+                            .rolling_mean(window)
+                            .over('ticker')
+                            .alias(f'adtv_{window}'),
+                            self._beta_expr(window).alias(f'beta_{window}'),
+                        ]
+                    )
+
+                chunk = chunk.select(
+                    'ticker',
+                    'data_pregao',
+                    'log_return',
+                    'market_return',
+                    *stats,
+                )
+
+                table = chunk.to_arrow()
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        str(output_path),
+                        table.schema,
+                        compression='zstd',
+                        compression_level=3,
+                    )
+                writer.write_table(table.cast(writer.schema))
+
+                total_records += chunk.height
+                total_tickers += chunk['ticker'].n_unique()
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            raise ValueError('No valid quotes found in source file')
+
+        return total_records, total_tickers
+
+    def _iter_ticker_chunks(self, path: Path) -> Iterator['pl.DataFrame']:
+        """Yield batches of a ticker-sorted file cut on ticker boundaries.
+
+        The rows of the last ticker in each batch are carried over to the
+        next batch, so every yielded chunk holds complete ticker histories.
+        """
+        pending: Optional['pl.DataFrame'] = None
+
+        for batch in pq.ParquetFile(str(path)).iter_batches(
+            batch_size=self.batch_size
+        ):
+            frame = pl.from_arrow(batch)
+            if not isinstance(frame, pl.DataFrame) or frame.is_empty():
+                continue
+
+            if pending is not None:
+                frame = pl.concat([pending, frame])
+
+            last_ticker = frame['ticker'][-1]
+            is_tail = pl.col('ticker') == last_ticker
+            pending = frame.filter(is_tail)
+            complete = frame.filter(~is_tail)
+
+            if not complete.is_empty():
+                yield complete
+
+        if pending is not None and not pending.is_empty():
+            yield pending
+
+    @staticmethod
+    def _log_return_expr() -> 'pl.Expr':
+        """Log return between consecutive sessions of the same ticker."""
+        close = pl.col('preco_fechamento')
+        previous = close.shift(1).over('ticker')
+        return (
+            pl.when((close > 0) & (previous > 0))
+            .then((close / previous).log())
+            .otherwise(None)
+        )
+
+    @staticmethod
+    def _beta_expr(window: int) -> 'pl.Expr':
+        """Rolling beta as cov(r, m) / var(m) from rolling moments."""
+        r = pl.col('log_return')
+        m = pl.col('market_return')
+
+        mean_r = r.rolling_mean(window).over('ticker')
+        mean_m = m.rolling_mean(window).over('ticker')
+        mean_rm = (r * m).rolling_mean(window).over('ticker')
+        mean_mm = (m * m).rolling_mean(window).over('ticker')
+
+        covariance = mean_rm - mean_r * mean_m
+        variance = mean_mm - mean_m * mean_m
+
+        return (
+            pl.when(variance > 0).then(covariance / variance).otherwise(None)
+        )
@@ -5,6 +5,7 @@ from .fundamental_stocks_data import (
     GetAvailableDocsUseCaseCVM,
     GetAvailableYearsUseCaseCVM,
     ParquetExtractorAdapterCVM,
+    SyncMirrorUseCaseCVM,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     'GetAvailableYearsUseCaseCVM',
     'AsyncDownloadAdapterCVM',
     'ParquetExtractorAdapterCVM',
+    'SyncMirrorUseCaseCVM',
 ]
@@ -6,6 +6,7 @@ from .application import (
     GenerateUrlsUseCaseCVM,
     GetAvailableDocsUseCaseCVM,
     GetAvailableYearsUseCaseCVM,
+    SyncMirrorUseCaseCVM,
     VerifyPathsUseCasesCVM,
 )
 from .domain import (
@@ -24,7 +25,13 @@ from .exceptions import (
     InvalidTypeDoc,
     MissingDownloadUrlError,
 )
-from .infra import AsyncDownloadAdapterCVM, ParquetExtractorAdapterCVM
+from .infra import (
+    AsyncDownloadAdapterCVM,
+    ParquetExtractorAdapterCVM,
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
 
 __all__ = [
     # Domain
@@ -41,10 +48,14 @@ __all__ = [
     'GenerateRangeYearsUseCasesCVM',
     'GetAvailableDocsUseCaseCVM',
     'GetAvailableYearsUseCaseCVM',
+    'SyncMirrorUseCaseCVM',
     'VerifyPathsUseCasesCVM',
     # Infrastructure - adapters
     'ParquetExtractorAdapterCVM',
     'AsyncDownloadAdapterCVM',
+    'RetryConfigCVM',
+    'SchedulingConfigCVM',
+    'TransferConfigCVM',
     # Exceptions - domain specific
     'InvalidFirstYear',
     'InvalidLastYear',
@@ -8,6 +8,7 @@ from .use_cases import (
     GenerateUrlsUseCaseCVM,
     GetAvailableDocsUseCaseCVM,
     GetAvailableYearsUseCaseCVM,
+    SyncMirrorUseCaseCVM,
     VerifyPathsUseCasesCVM,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     'GenerateRangeYearsUseCasesCVM',
     'GetAvailableDocsUseCaseCVM',
     'GetAvailableYearsUseCaseCVM',
+    'SyncMirrorUseCaseCVM',
     'VerifyPathsUseCasesCVM',
 ]
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ...domain import DownloadResultCVM
 
@@ -12,14 +13,42 @@ class DownloadDocsCVMRepositoryCVM(ABC):
     def download_docs(
         self,
         tasks: List[Tuple[str, str, str, str]],
+        keep_zip: Optional[bool] = None,
     ) -> DownloadResultCVM:
         """
         Download CVM documents.
 
         Args:
             tasks: List of tuples (url, doc_name, year, destination_path) representing each download task.
+            keep_zip: Write each ZIP to disk before extracting it, for this
+                call only. None keeps the repository's own setting.
 
         Returns:
             DownloadResultCVM containing aggregated information about the success and error of downloads.
         """
         pass
+
+    async def download_docs_async(
+        self,
+        tasks: List[Tuple[str, str, str, str]],
+        keep_zip: Optional[bool] = None,
+    ) -> DownloadResultCVM:
+        """
+        Download CVM documents from a running event loop.
+
+        Implementations with native async support should override this; by
+        default download_docs() runs in a worker thread.
+
+        Args:
+            tasks: List of tuples (url, doc_name, year, destination_path) representing each download task.
+            keep_zip: Write each ZIP to disk before extracting it, for this
+                call only. None keeps the repository's own setting.
+
+        Returns:
+            DownloadResultCVM containing aggregated information about the success and error of downloads.
+        """
+        if keep_zip is None:
+            return await asyncio.to_thread(self.download_docs, tasks)
+        return await asyncio.to_thread(
+            self.download_docs, tasks, keep_zip=keep_zip
+        )
@@ -1,4 +1,9 @@
+import contextlib
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from typing import IO
 
 
 class FileExtractorRepositoryCVM(ABC):
@@ -18,3 +23,32 @@ class FileExtractorRepositoryCVM(ABC):
             CorruptedZipError: If ZIP file is corrupted or invalid.
         """
         pass
+
+    def extract_from_buffer(
+        self, buffer: IO[bytes], name: str, destination_path: str
+    ) -> None:
+        """Extract an archive held in a file-like object.
+
+        The default implementation copies buffer to a temporary file in
+        destination_path and calls extract(). Extractors that can read the
+        archive directly should override it, so it never touches the disk.
+
+        Args:
+            buffer: Seekable file-like object holding the archive.
+            name: Name of the archive, used in logs and errors.
+            destination_path: Path where the extracted files should be placed.
+
+        Raises:
+            ExtractionError: If extraction fails.
+            DiskFullError: If insufficient disk space is available.
+            CorruptedZipError: If ZIP file is corrupted or invalid.
+        """
+        fd, temp_path = tempfile.mkstemp(suffix='.zip', dir=destination_path)
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                buffer.seek(0)
+                shutil.copyfileobj(buffer, temp_file)
+            self.extract(temp_path, destination_path)
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
@@ -3,6 +3,7 @@ from .generate_range_years_use_cases import GenerateRangeYearsUseCasesCVM
 from .generate_urls_use_case import GenerateUrlsUseCaseCVM
 from .get_available_docs_use_case import GetAvailableDocsUseCaseCVM
 from .get_available_years_use_case import GetAvailableYearsUseCaseCVM
+from .sync_mirror_use_case import SyncMirrorUseCaseCVM
 from .verify_paths_use_cases import VerifyPathsUseCasesCVM
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     'GenerateRangeYearsUseCasesCVM',
     'GetAvailableDocsUseCaseCVM',
     'GetAvailableYearsUseCaseCVM',
+    'SyncMirrorUseCaseCVM',
     'VerifyPathsUseCasesCVM',
 ]
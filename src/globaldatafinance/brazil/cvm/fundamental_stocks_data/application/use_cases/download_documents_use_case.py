@@ -1,3 +1,4 @@
+import time
 from typing import Dict, List, Optional, Tuple
 
 from ......core import get_logger
@@ -40,6 +41,7 @@ class DownloadDocumentsUseCaseCVM:
         list_docs: Optional[List[str]] = None,
         initial_year: Optional[int] = None,
         last_year: Optional[int] = None,
+        keep_zip: Optional[bool] = None,
     ) -> DownloadResultCVM:
         """Execute the download operation.
 
@@ -48,10 +50,68 @@ class DownloadDocumentsUseCaseCVM:
             list_docs: List of document type codes (e.g., ["DFP", "ITR"]).
             initial_year: Starting year for downloads (inclusive).
             last_year: Ending year for downloads (inclusive).
+            keep_zip: Write each ZIP to disk before extracting it. None
+                keeps the repository's own setting.
 
         Returns:
             DownloadResultCVM containing successful downloads and encountered errors.
         """
+        tasks = self.__plan(
+            destination_path, list_docs, initial_year, last_year
+        )
+        start_time = time.time()
+
+        try:
+            result = (
+                self.__repository.download_docs(tasks)
+                if keep_zip is None
+                else self.__repository.download_docs(tasks, keep_zip=keep_zip)
+            )
+            return self.__report(result, start_time)
+
+        except Exception as e:
+            logger.error(f'Download execution failed: {e}', exc_info=True)
+            raise
+
+    async def execute_async(
+        self,
+        destination_path: str,
+        list_docs: Optional[List[str]] = None,
+        initial_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+        keep_zip: Optional[bool] = None,
+    ) -> DownloadResultCVM:
+        """Execute the download operation in the running event loop.
+
+        Same arguments and result as execute().
+        """
+        tasks = self.__plan(
+            destination_path, list_docs, initial_year, last_year
+        )
+        start_time = time.time()
+
+        try:
+            result = await (
+                self.__repository.download_docs_async(tasks)
+                if keep_zip is None
+                else self.__repository.download_docs_async(
+                    tasks, keep_zip=keep_zip
+                )
+            )
+            return self.__report(result, start_time)
+
+        except Exception as e:
+            logger.error(f'Download execution failed: {e}', exc_info=True)
+            raise
+
+    def __plan(
+        self,
+        destination_path: str,
+        list_docs: Optional[List[str]],
+        initial_year: Optional[int],
+        last_year: Optional[int],
+    ) -> List[Tuple[str, str, str, str]]:
+        """Validate the request, create the folders and build the tasks."""
         logger.info(
             f'Starting download orchestration: '
             f'path={destination_path}, '
@@ -77,42 +137,35 @@ class DownloadDocumentsUseCaseCVM:
         )
         docs_paths = verify_paths.execute()
 
-        import time
+        return self.__prepare_download_tasks(dict_urls_zips, docs_paths)
 
-        start_time = time.time()
-
-        try:
-            tasks = self.__prepare_download_tasks(dict_urls_zips, docs_paths)
-            result = self.__repository.download_docs(tasks)
+    def __report(
+        self, result: DownloadResultCVM, start_time: float
+    ) -> DownloadResultCVM:
+        """Record the elapsed time and log the outcome of a download."""
+        result.elapsed_time = time.time() - start_time
 
-            end_time = time.time()
-            result.elapsed_time = end_time - start_time
+        logger.info(
+            f'Download completed in {result.elapsed_time:.2f}s: '
+            f'✓ {result.success_count_downloads} successful, '
+            f'✗ {result.error_count_downloads} errors'
+        )
 
-            logger.info(
-                f'Download completed in {result.elapsed_time:.2f}s: '
-                f'✓ {result.success_count_downloads} successful, '
-                f'✗ {result.error_count_downloads} errors'
+        if result.successful_downloads:
+            logger.debug(
+                f'Successfully downloaded: {", ".join(result.successful_downloads)}'
             )
 
-            if result.successful_downloads:
-                logger.debug(
-                    f'Successfully downloaded: {", ".join(result.successful_downloads)}'
-                )
-
-            if result.failed_downloads:
-                failed_info = '; '.join(
-                    [
-                        f'{doc}: {error}'
-                        for doc, error in result.failed_downloads.items()
-                    ]
-                )
-                logger.warning(f'Failed downloads: {failed_info}')
-
-            return result
+        if result.failed_downloads:
+            failed_info = '; '.join(
+                [
+                    f'{doc}: {error}'
+                    for doc, error in result.failed_downloads.items()
+                ]
+            )
+            logger.warning(f'Failed downloads: {failed_info}')
 
-        except Exception as e:
-            logger.error(f'Download execution failed: {e}', exc_info=True)
-            raise
+        return result
 
     def __prepare_download_tasks(
         self,
@@ -129,9 +182,12 @@ class DownloadDocumentsUseCaseCVM:
 
             for year_int, destination_path in years_dict.items():
                 year_str = str(year_int)
+                # Match the file name only: a mirror's host or path may
+                # contain digits that look like a year
+                suffix = f'_{year_str}.zip'
                 matching_url = None
                 for url in url_list:
-                    if year_str in url:
+                    if url.endswith(suffix):
                         matching_url = url
                         break
 
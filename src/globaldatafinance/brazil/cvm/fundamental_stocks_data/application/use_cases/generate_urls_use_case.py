@@ -9,8 +9,14 @@ logger = get_logger(__name__)
 class GenerateUrlsUseCaseCVM:
     """Use case for generating download URLs."""
 
-    def __init__(self) -> None:
-        self.__dict_generator = DictZipsToDownloadCVM()
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        """Initialize the URL generator.
+
+        Args:
+            base_url: Mirror serving the CVM layout; defaults to the CVM
+                open data portal.
+        """
+        self.__dict_generator = DictZipsToDownloadCVM(base_url)
         logger.debug('GenerateUrlsUseCaseCVM initialized')
 
     def execute(
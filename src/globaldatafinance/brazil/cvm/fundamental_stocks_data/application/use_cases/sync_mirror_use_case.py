@@ -0,0 +1,114 @@
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from ......core import get_logger
+from ...domain import AvailableYearsCVM, DownloadResultCVM
+from ...exceptions import InvalidRepositoryTypeError
+from ..interfaces import DownloadDocsCVMRepositoryCVM
+from .generate_urls_use_case import GenerateUrlsUseCaseCVM
+
+logger = get_logger(__name__)
+
+
+class SyncMirrorUseCaseCVM:
+    """Keep a local mirror of the CVM open data portal up to date.
+
+    Each ZIP is stored under mirror_path at the same path it has on the
+    portal (``dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2023.zip``), so
+    the directory can be used as mirror_url directly or served by any
+    static web server. The repository's download manifests turn repeated
+    runs into conditional requests: files that did not change on the
+    portal are answered with 304 and not transferred again.
+    """
+
+    def __init__(
+        self,
+        repository: DownloadDocsCVMRepositoryCVM,
+        origin_url: Optional[str] = None,
+    ) -> None:
+        """Initialize the use case with a repository.
+
+        Args:
+            repository: Implementation of DownloadDocsCVMRepositoryCVM. It
+                should keep the ZIPs (no automatic extraction) and must not
+                read from the mirror being synchronised.
+            origin_url: Server to mirror; defaults to the CVM portal.
+        """
+        if not isinstance(repository, DownloadDocsCVMRepositoryCVM):
+            raise InvalidRepositoryTypeError(
+                actual_type=type(repository).__name__,
+            )
+
+        self.__repository = repository
+        self.__url_generator = GenerateUrlsUseCaseCVM(origin_url)
+        self.__available_years = AvailableYearsCVM()
+
+    def execute(
+        self,
+        mirror_path: str,
+        list_docs: Optional[List[str]] = None,
+        initial_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+    ) -> DownloadResultCVM:
+        """Download new or changed ZIPs into the mirror directory.
+
+        Args:
+            mirror_path: Root directory of the mirror.
+            list_docs: List of document type codes (e.g., ["DFP", "ITR"]).
+            initial_year: Starting year (inclusive).
+            last_year: Ending year (inclusive).
+
+        Returns:
+            DownloadResultCVM; files unchanged on the portal are reported
+            as skipped.
+        """
+        tasks = self.__plan(mirror_path, list_docs, initial_year, last_year)
+        start_time = time.time()
+
+        result = self.__repository.download_docs(tasks)
+        result.elapsed_time = time.time() - start_time
+
+        logger.info(
+            f'Mirror sync completed in {result.elapsed_time:.2f}s: '
+            f'{result.success_count_downloads} updated, '
+            f'{result.skipped_count_downloads} unchanged, '
+            f'{result.error_count_downloads} errors'
+        )
+        return result
+
+    def __plan(
+        self,
+        mirror_path: str,
+        list_docs: Optional[List[str]],
+        initial_year: Optional[int],
+        last_year: Optional[int],
+    ) -> List[Tuple[str, str, str, str]]:
+        """Map every requested ZIP to its directory inside the mirror."""
+        if not isinstance(mirror_path, str) or not mirror_path.strip():
+            raise ValueError('mirror_path must be a non-empty string')
+
+        dict_urls_zips, _ = self.__url_generator.execute(
+            list_docs=list_docs,
+            initial_year=initial_year,
+            last_year=last_year,
+        )
+
+        root = Path(mirror_path).expanduser().resolve()
+        tasks: List[Tuple[str, str, str, str]] = []
+        for doc_name, urls in dict_urls_zips.items():
+            for url in urls:
+                year = Path(urlsplit(url).path).stem.rsplit('_', 1)[-1]
+                if not self.__available_years.is_year_available_for_doc(
+                    doc_name, int(year)
+                ):
+                    continue
+
+                relative = unquote(urlsplit(url).path).lstrip('/')
+                directory = (root / relative).parent
+                directory.mkdir(parents=True, exist_ok=True)
+                tasks.append((url, doc_name, year, str(directory)))
+
+        logger.info(f'Syncing {len(tasks)} files into mirror {root}')
+        return tasks
@@ -74,18 +74,7 @@ class VerifyPathsUseCasesCVM:
         return docs_paths
 
     def __is_valid_year_for_doc(self, doc: str, year: int) -> bool:
-        doc_upper = doc.upper()
-        min_itr = self.__available_years.get_minimal_itr_year()
-        min_cgvn_vlmo = self.__available_years.get_minimal_cgvn_vlmo_year()
-        min_general = self.__available_years.get_minimal_general_year()
-
-        if doc_upper == 'ITR':
-            return year >= min_itr
-
-        if doc_upper in {'VLMO', 'CGVN'}:
-            return year >= min_cgvn_vlmo
-
-        return year >= min_general
+        return self.__available_years.is_year_available_for_doc(doc, year)
 
     @staticmethod
     def __validate_path_security(path: Path) -> None:
@@ -40,20 +40,37 @@ class AvailableDocsCVM:
 
 
 class UrlDocsCVM:
-    """Generates URLs for CVM document downloads."""
+    """Generates URLs for CVM document downloads.
+
+    The URLs point at the CVM open data portal unless base_url names a
+    mirror that serves the same directory layout (e.g. a directory kept
+    up to date by sync_mirror and exposed through any static web server).
+    """
+
+    ORIGIN_URL = 'https://dados.cvm.gov.br'
+
+    __DOC_PATHS: Dict[str, str] = {
+        'CGVN': '/dados/CIA_ABERTA/DOC/CGVN/DADOS/cgvn_cia_aberta_',
+        'FRE': '/dados/CIA_ABERTA/DOC/FRE/DADOS/fre_cia_aberta_',
+        'FCA': '/dados/CIA_ABERTA/DOC/FCA/DADOS/fca_cia_aberta_',
+        'DFP': '/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_',
+        'ITR': '/dados/CIA_ABERTA/DOC/ITR/DADOS/itr_cia_aberta_',
+        'IPE': '/dados/CIA_ABERTA/DOC/IPE/DADOS/ipe_cia_aberta_',
+        'VLMO': '/dados/CIA_ABERTA/DOC/VLMO/DADOS/vlmo_cia_aberta_',
+    }
+
+    def __init__(self, base_url: Optional[str] = None):
+        """Initializes with the AvailableDocsCVM validator.
 
-    def __init__(self):
-        """Initializes with the AvailableDocsCVM validator."""
+        Args:
+            base_url: Scheme and host (optionally a path prefix) the
+                document paths are appended to. Defaults to ORIGIN_URL.
+        """
         self.__available_docs = AvailableDocsCVM()
+        self.base_url = (base_url or self.ORIGIN_URL).rstrip('/')
 
         self.__dict_url_docs = {
-            'CGVN': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/CGVN/DADOS/cgvn_cia_aberta_',
-            'FRE': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/FRE/DADOS/fre_cia_aberta_',
-            'FCA': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/FCA/DADOS/fca_cia_aberta_',
-            'DFP': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_',
-            'ITR': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/ITR/DADOS/itr_cia_aberta_',
-            'IPE': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/IPE/DADOS/ipe_cia_aberta_',
-            'VLMO': 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/VLMO/DADOS/vlmo_cia_aberta_',
+            doc: self.base_url + path for doc, path in self.__DOC_PATHS.items()
         }
 
     def get_url_docs(
@@ -27,6 +27,18 @@ class AvailableYearsCVM:
         """Returns the minimum supported year for CGVN/VLMO documents."""
         return self.__MIN_CGVN_VLMO_YEAR
 
+    def is_year_available_for_doc(self, doc: str, year: int) -> bool:
+        """Whether the CVM publishes the given document type for year."""
+        doc_upper = doc.upper()
+
+        if doc_upper == 'ITR':
+            return year >= self.__MIN_ITR_YEAR
+
+        if doc_upper in {'VLMO', 'CGVN'}:
+            return year >= self.__MIN_CGVN_VLMO_YEAR
+
+        return year >= self.__MIN_GENERAL_YEAR
+
     def __validate_years(self, initial_year: int, last_year: int) -> None:
         """
         Validates that `initial_year` and `last_year` are integers within the allowed bounds.
@@ -5,8 +5,8 @@ from .available_years import AvailableYearsCVM
 
 
 class DictZipsToDownloadCVM:
-    def __init__(self):
-        self._url_docs = UrlDocsCVM()
+    def __init__(self, base_url: Optional[str] = None):
+        self._url_docs = UrlDocsCVM(base_url)
         self._available_years = AvailableYearsCVM()
 
     def get_dict_zips_to_download(
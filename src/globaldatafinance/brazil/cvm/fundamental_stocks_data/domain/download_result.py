@@ -12,11 +12,29 @@ class DownloadResultCVM:
         failed_downloads: A dictionary that maps document types to error messages.
         success_count_downloads: The number of successful downloads.
         error_count_downloads: The number of failed downloads.
+        skipped_downloads: Files skipped because they did not change since
+            the last run. They are also listed in successful_downloads.
+        unavailable_downloads: Files the server does not list (e.g. years
+            not published yet), so they were not requested. They count
+            neither as successes nor as errors.
+        elapsed_time: Wall-clock time of the whole operation, in seconds.
+        download_time: Cumulative seconds spent downloading and validating
+            ZIPs (concurrent downloads add up).
+        extraction_time: Cumulative seconds spent converting ZIPs to
+            Parquet (concurrent extractions add up).
+        disk_write_time: Cumulative seconds spent writing downloaded bytes
+            to disk on the I/O thread. Part of it overlaps download_time,
+            since the network keeps being read while buffers are written.
     """
 
     successful_downloads: List[str] = field(default_factory=list)
     failed_downloads: Dict[str, str] = field(default_factory=dict)
+    skipped_downloads: List[str] = field(default_factory=list)
+    unavailable_downloads: List[str] = field(default_factory=list)
     elapsed_time: float = 0.0
+    download_time: float = 0.0
+    extraction_time: float = 0.0
+    disk_write_time: float = 0.0
 
     @property
     def success_count_downloads(self) -> int:
@@ -26,6 +44,14 @@ class DownloadResultCVM:
     def error_count_downloads(self) -> int:
         return len(self.failed_downloads)
 
+    @property
+    def skipped_count_downloads(self) -> int:
+        return len(self.skipped_downloads)
+
+    @property
+    def unavailable_count_downloads(self) -> int:
+        return len(self.unavailable_downloads)
+
     def add_success_downloads(self, item: str) -> None:
         if item not in self.successful_downloads:
             self.successful_downloads.append(item)
@@ -33,6 +59,15 @@ class DownloadResultCVM:
     def add_error_downloads(self, item: str, error: str) -> None:
         self.failed_downloads[item] = error
 
+    def add_skipped_downloads(self, item: str) -> None:
+        if item not in self.skipped_downloads:
+            self.skipped_downloads.append(item)
+        self.add_success_downloads(item)
+
+    def add_unavailable_downloads(self, item: str) -> None:
+        if item not in self.unavailable_downloads:
+            self.unavailable_downloads.append(item)
+
     def __str__(self) -> str:
         return (
             f'DownloadResultCVM(success={self.success_count_downloads}, '
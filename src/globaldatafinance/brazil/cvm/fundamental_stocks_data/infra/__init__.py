@@ -1,6 +1,15 @@
-from .adapters import AsyncDownloadAdapterCVM, ParquetExtractorAdapterCVM
+from .adapters import (
+    AsyncDownloadAdapterCVM,
+    ParquetExtractorAdapterCVM,
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
 
 __all__ = [
     'ParquetExtractorAdapterCVM',
     'AsyncDownloadAdapterCVM',
+    'RetryConfigCVM',
+    'SchedulingConfigCVM',
+    'TransferConfigCVM',
 ]
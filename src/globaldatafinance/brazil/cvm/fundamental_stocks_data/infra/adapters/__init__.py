@@ -1,7 +1,15 @@
 from .extractors_docs_adapter import ParquetExtractorAdapterCVM
-from .requests_adapter import AsyncDownloadAdapterCVM
+from .requests_adapter import (
+    AsyncDownloadAdapterCVM,
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
 
 __all__ = [
     'ParquetExtractorAdapterCVM',
     'AsyncDownloadAdapterCVM',
+    'RetryConfigCVM',
+    'SchedulingConfigCVM',
+    'TransferConfigCVM',
 ]
@@ -1,3 +1,4 @@
 from .parquet_extractor import ParquetExtractorAdapterCVM
+from .schema_registry import SchemaRegistryCVM
 
-__all__ = ['ParquetExtractorAdapterCVM']
+__all__ = ['ParquetExtractorAdapterCVM', 'SchemaRegistryCVM']
@@ -1,15 +1,18 @@
+import contextlib
 import zipfile
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, cast
+from typing import IO, Callable, ContextManager, List, Optional, Tuple, cast
 
-from .......core import get_logger
+from .......core import ResourceMonitor, get_logger
 from .......macro_exceptions import (
     CorruptedZipError,
     DiskFullError,
     ExtractionError,
 )
-from .......macro_infra import ExtractorAdapter
+from .......macro_infra import ExtractorAdapter, ReadFilesAdapter
 from ....application import FileExtractorRepositoryCVM
+from .schema_registry import SchemaRegistryCVM
 
 logger = get_logger(__name__)
 
@@ -21,13 +24,18 @@ class ParquetExtractorAdapterCVM(FileExtractorRepositoryCVM):
     - CSV files with semicolon delimiters
     - Latin-1 encoding (common in Brazilian financial data)
     - Large files through chunked processing
+    - Explicit per-family column types from SchemaRegistryCVM
+    - Concurrent conversion of the CSV members of a ZIP
     - Atomic transactions (all-or-nothing extraction)
     - Automatic cleanup on failures
+    - Archives held in memory (extract_from_buffer), never written to disk
 
     Attributes:
         chunk_size: Number of rows per chunk for memory optimization during conversion
         encodings: List of encodings to try (latin-1 first for CVM compatibility)
         max_fallback_size_mb: Maximum file size (MB) for in-memory fallback processing
+        max_workers: Maximum CSV members converted concurrently per ZIP
+            (None = CPU count); further bounded by available memory
 
     Example:
         >>> extractor = ParquetExtractorAdapterCVM(chunk_size=50000)
@@ -37,8 +45,11 @@ class ParquetExtractorAdapterCVM(FileExtractorRepositoryCVM):
 
     MAX_FALLBACK_SIZE_MB = 500
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         self.extractor_adapter = ExtractorAdapter()
+        self.schema_registry = SchemaRegistryCVM()
+        self.resource_monitor = ResourceMonitor()
+        self.max_workers = max_workers
 
     def extract(self, source_path: str, destination_path: str) -> None:
         """Extract ZIP to Parquet files with atomic transaction guarantee.
@@ -89,63 +100,170 @@ class ParquetExtractorAdapterCVM(FileExtractorRepositoryCVM):
                 f'Unexpected extraction error: {type(e).__name__}: {e}',
             )
 
+    def extract_from_buffer(
+        self, buffer: IO[bytes], name: str, destination_path: str
+    ) -> None:
+        """Extract a ZIP held in a file-like object to Parquet files.
+
+        Same conversion and all-or-nothing guarantee as extract(), but the
+        archive is read from buffer (e.g. a SpooledTemporaryFile filled by
+        the download), so it is never written to destination_path. The
+        members share one ZipFile over buffer: zipfile serialises the raw
+        reads, while inflating and parsing still run concurrently.
+
+        Args:
+            buffer: Seekable file-like object holding the ZIP
+            name: Name of the archive, used in logs and errors
+            destination_path: Path where the Parquet files are written
+
+        Raises:
+            ExtractionError: If CSV conversion fails
+            CorruptedZipError: If the ZIP is corrupted or cannot be read
+            DiskFullError: If insufficient disk space is available
+        """
+        try:
+            logger.info(f'Starting Parquet extraction of {name} from memory')
+
+            try:
+                archive = zipfile.ZipFile(buffer, 'r')
+            except zipfile.BadZipFile as e:
+                raise CorruptedZipError(
+                    name, f'Invalid or corrupted ZIP file: {e}'
+                )
+
+            with archive:
+                self.__extract_with_transaction(
+                    name,
+                    destination_path,
+                    lambda: contextlib.nullcontext(archive),
+                )
+
+            logger.info(f'Parquet extraction completed successfully: {name}')
+
+        except (
+            ExtractionError,
+            CorruptedZipError,
+            DiskFullError,
+        ):
+            raise
+
+        except Exception as e:
+            logger.error(f'Unexpected error during extraction of {name}: {e}')
+            raise ExtractionError(
+                name,
+                f'Unexpected extraction error: {type(e).__name__}: {e}',
+            )
+
     def __extract_with_transaction(
-        self, zip_path: str, destination_path: str
+        self,
+        zip_path: str,
+        destination_path: str,
+        open_zip: Optional[
+            Callable[[], ContextManager[zipfile.ZipFile]]
+        ] = None,
     ) -> None:
         """Extract with atomic transaction (all-or-nothing).
 
+        CSV members are converted concurrently in a bounded thread pool.
+        By default each worker opens its own ZipFile handle on zip_path;
+        open_zip overrides how the archive is opened (extract_from_buffer
+        hands out one shared ZipFile). pyarrow releases the GIL while
+        decompressing and parsing, so threads scale with the core count.
+
+        Member CRC-32s are verified while the CSVs are inflated for
+        conversion, so each archive is decompressed once. A CRC mismatch
+        stops the remaining members and is reported as CorruptedZipError.
+
         Args:
-            zip_path: ZIP file path
+            zip_path: ZIP file path (or archive name with open_zip)
             destination_path: Destination directory path
+            open_zip: Returns a context manager yielding the ZipFile
 
         Raises:
             CorruptedZipError: If ZIP is corrupted
             ExtractionError: If extraction fails (triggers rollback)
             DiskFullError: If disk space exhausted (triggers rollback)
         """
-        extracted_count = 0
-        failed_files = []
-        created_files = []  # Track files created in THIS extraction only
+        failed_files: List[Tuple[str, str]] = []
+        created_files: List[Path] = []  # Files created in THIS extraction
+        disk_full: Optional[DiskFullError] = None
+        corrupted: Optional[zipfile.BadZipFile] = None
 
         # Output directory is the destination path
         output_dir = Path(destination_path)
+        opener = open_zip or (lambda: zipfile.ZipFile(zip_path, 'r'))
 
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                csv_files = self.extractor_adapter.list_files_in_zip(
-                    zip_path, '.csv'
-                )
-
-                for csv_filename in csv_files:
-                    parquet_filename = Path(csv_filename).stem + '.parquet'
-                    parquet_path = output_dir / parquet_filename
+            # Validate the archive before starting any worker
+            with opener() as z:
+                csv_files = [
+                    name
+                    for name in z.namelist()
+                    if name.lower().endswith('.csv')
+                ]
+
+            workers = max(
+                1,
+                min(
+                    len(csv_files),
+                    self.resource_monitor.get_safe_worker_count(
+                        self.max_workers
+                    ),
+                ),
+            )
+            logger.debug(
+                f'Converting {len(csv_files)} CSV files with {workers} workers'
+            )
 
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.__convert_member,
+                        opener,
+                        csv_filename,
+                        output_dir,
+                    ): csv_filename
+                    for csv_filename in csv_files
+                }
+
+                for future in as_completed(futures):
+                    csv_filename = futures[future]
                     try:
-                        self.extractor_adapter.extract_csv_from_zip_to_parquet(
-                            z, parquet_path, parquet_filename, csv_filename
-                        )
+                        parquet_path = future.result()
 
                         # Register file ONLY if it exists after extraction
                         if parquet_path.exists():
                             created_files.append(parquet_path)
                             logger.debug(
-                                f'Registered created file: {parquet_filename}'
+                                f'Registered created file: {parquet_path.name}'
                             )
 
-                        extracted_count += 1
-
-                    except DiskFullError:
-                        raise  # Immediate escalation
+                    except CancelledError:
+                        continue
+                    except DiskFullError as e:
+                        # Stop scheduling; running members finish first
+                        disk_full = disk_full or e
+                        for pending in futures:
+                            pending.cancel()
+                    except zipfile.BadZipFile as e:
+                        logger.error(f'CRC check failed for {csv_filename}')
+                        corrupted = corrupted or e
+                        for pending in futures:
+                            pending.cancel()
                     except Exception as e:
                         logger.error(f'Failed to extract {csv_filename}: {e}')
                         failed_files.append((csv_filename, str(e)))
-                        continue
 
-                # Atomic check: if ANY file failed, rollback ALL
-                if failed_files:
-                    self.__rollback_extraction(
-                        created_files, failed_files, zip_path
-                    )
+            if disk_full is not None:
+                raise disk_full
+            if corrupted is not None:
+                raise corrupted
+
+            # Atomic check: if ANY file failed, rollback ALL
+            if failed_files:
+                self.__rollback_extraction(
+                    created_files, failed_files, zip_path
+                )
 
         except zipfile.BadZipFile as e:
             self.__cleanup_files(created_files, 'ZIP corruption')
@@ -168,9 +286,41 @@ class ParquetExtractorAdapterCVM(FileExtractorRepositoryCVM):
             )
 
         logger.info(
-            f'Successfully extracted {extracted_count} CSV files from {zip_path}'
+            f'Successfully extracted {len(csv_files)} CSV files from {zip_path}'
         )
 
+    def __convert_member(
+        self,
+        open_zip: Callable[[], ContextManager[zipfile.ZipFile]],
+        csv_filename: str,
+        output_dir: Path,
+    ) -> Path:
+        """Convert one CSV member to Parquet using the handle of open_zip.
+
+        Returns:
+            Path of the Parquet file (absent if the CSV had no rows)
+        """
+        parquet_filename = Path(csv_filename).stem + '.parquet'
+        parquet_path = output_dir / parquet_filename
+
+        with open_zip() as z:
+            # CVM headers are ASCII, so latin-1 always decodes
+            header = ReadFilesAdapter.read_csv_header(
+                z, csv_filename, 'latin-1'
+            )
+            self.extractor_adapter.extract_csv_from_zip_to_parquet(
+                z,
+                parquet_path,
+                parquet_filename,
+                csv_filename,
+                column_types=self.schema_registry.column_types(
+                    csv_filename, header
+                ),
+                batch_transform=self.schema_registry.normalize,
+            )
+
+        return parquet_path
+
     def __rollback_extraction(
         self,
         created_files: list[Path],
@@ -0,0 +1,156 @@
+import fnmatch
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+except ImportError:
+    pa = None  # type: ignore
+    pc = None  # type: ignore
+
+
+class SchemaRegistryCVM:
+    """Explicit Arrow column types for CVM open-data CSV files.
+
+    Types are resolved per file family, i.e. the CSV name without its year
+    suffix (``dfp_cia_aberta_BPA_con_2023.csv`` ->
+    ``dfp_cia_aberta_BPA_con``), so every year of a dataset is written with
+    the same schema instead of whatever the first block happens to infer:
+
+    - Financial statements (``dfp_*``/``itr_*`` ``_con``/``_ind`` files):
+      dates as ``date32``, ``VL_CONTA`` as ``float64`` and account,
+      company and label codes as dictionary-encoded strings.
+    - Document indexes (``dfp_cia_aberta``, ``itr_cia_aberta``).
+    - Any other family (``fre_*``, ``fca_*``, ...): the common company
+      columns plus ``DT_*`` as ``date32`` and ``VL_*`` as ``float64``.
+
+    Columns not covered by the registry are still inferred.
+    ``ESCALA_MOEDA`` labels are normalised by normalize() ('Mil' -> 'MIL').
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+
+    _YEAR_SUFFIX = re.compile(r'_\d{4}$')
+    NORMALIZED_COLUMNS = ('ESCALA_MOEDA',)
+
+    def __init__(self) -> None:
+        if pa is None or pc is None:
+            raise ImportError(
+                'pyarrow is required for SchemaRegistryCVM. '
+                'Install it with: pip install pyarrow'
+            )
+
+        code = pa.dictionary(pa.int32(), pa.string())
+
+        self._common: Dict[str, 'pa.DataType'] = {
+            'CNPJ_CIA': code,
+            'DENOM_CIA': code,
+            'CD_CVM': code,
+            'DT_REFER': pa.date32(),
+            'VERSAO': pa.int32(),
+        }
+
+        statement = {
+            'GRUPO_DFP': code,
+            'MOEDA': code,
+            'ESCALA_MOEDA': code,
+            'ORDEM_EXERC': code,
+            'DT_INI_EXERC': pa.date32(),
+            'DT_FIM_EXERC': pa.date32(),
+            'CD_CONTA': code,
+            'DS_CONTA': code,
+            'VL_CONTA': pa.float64(),
+            'ST_CONTA_FIXA': code,
+            'COLUNA_DF': code,
+        }
+        document_index = {
+            'CATEG_DOC': code,
+            'ID_DOC': pa.int64(),
+            'DT_RECEB': pa.date32(),
+            'LINK_DOC': pa.string(),
+        }
+
+        self._families: List[Tuple[str, Dict[str, 'pa.DataType']]] = [
+            ('dfp_cia_aberta_*_con', statement),
+            ('dfp_cia_aberta_*_ind', statement),
+            ('itr_cia_aberta_*_con', statement),
+            ('itr_cia_aberta_*_ind', statement),
+            ('dfp_cia_aberta', document_index),
+            ('itr_cia_aberta', document_index),
+        ]
+
+        self._prefixes: List[Tuple[str, 'pa.DataType']] = [
+            ('DT_', pa.date32()),
+            ('VL_', pa.float64()),
+        ]
+
+    def family(self, csv_filename: str) -> str:
+        """Return the file family of a CVM CSV (name without year)."""
+        return self._YEAR_SUFFIX.sub('', Path(csv_filename).stem)
+
+    def column_types(
+        self, csv_filename: str, columns: List[str]
+    ) -> Dict[str, 'pa.DataType']:
+        """Resolve explicit Arrow types for the columns of a CSV file.
+
+        Args:
+            csv_filename: CSV name inside the CVM ZIP
+            columns: Column names from the CSV header
+
+        Returns:
+            Mapping of column name to Arrow type for every column the
+            registry knows; other columns are left out (inferred).
+        """
+        family = self.family(csv_filename)
+        family_types = next(
+            (
+                types
+                for pattern, types in self._families
+                if fnmatch.fnmatchcase(family, pattern)
+            ),
+            {},
+        )
+
+        resolved: Dict[str, 'pa.DataType'] = {}
+        for column in columns:
+            if column in family_types:
+                resolved[column] = family_types[column]
+            elif column in self._common:
+                resolved[column] = self._common[column]
+            else:
+                for prefix, data_type in self._prefixes:
+                    if column.startswith(prefix):
+                        resolved[column] = data_type
+                        break
+
+        return resolved
+
+    def normalize(self, batch: 'pa.RecordBatch') -> 'pa.RecordBatch':
+        """Normalise label columns (trimmed, upper case) in a record batch."""
+        for column in self.NORMALIZED_COLUMNS:
+            index = batch.schema.get_field_index(column)
+            if index == -1:
+                continue
+
+            array = batch.column(index)
+            batch = batch.set_column(
+                index, batch.schema.field(index), self._normalize_label(array)
+            )
+
+        return batch
+
+    @classmethod
+    def _normalize_label(cls, array: 'pa.Array') -> 'pa.Array':
+        if pa.types.is_dictionary(array.type):
+            # Only the (few) dictionary values need normalising
+            return pa.DictionaryArray.from_arrays(
+                array.indices, cls._normalize_label(array.dictionary)
+            )
+
+        if not pa.types.is_string(array.type):
+            return array
+
+        return pc.utf8_upper(pc.utf8_trim_whitespace(array))
@@ -1,5 +1,24 @@
 from .async_download_adapter import AsyncDownloadAdapterCVM
+from .dados_index import DadosIndexCVM, ListedFileCVM
+from .download_config import (
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
+from .download_hedger import DownloadHedgerCVM
+from .download_manifest import DownloadManifestCVM
+from .download_planner import DownloadPlannerCVM
+from .mirror_source import MirrorSourceCVM
 
 __all__ = [
     'AsyncDownloadAdapterCVM',
+    'DadosIndexCVM',
+    'DownloadHedgerCVM',
+    'DownloadManifestCVM',
+    'DownloadPlannerCVM',
+    'ListedFileCVM',
+    'MirrorSourceCVM',
+    'RetryConfigCVM',
+    'SchedulingConfigCVM',
+    'TransferConfigCVM',
 ]
@@ -1,31 +1,83 @@
 import asyncio
+import contextvars
+import os
+import struct
+import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import IO, Dict, List, Optional, Tuple, Union
 
 from .......core import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    HostRateLimiter,
+    RetryBudget,
     RetryStrategy,
     SimpleProgressBar,
     get_logger,
     remove_file,
 )
 from .......macro_exceptions import (
+    CircuitOpenError,
     CorruptedZipError,
     DiskFullError,
     ExtractionError,
 )
-from .......macro_infra import RequestsAdapter
+from .......macro_infra import DownloadInfo, RequestsAdapter
 from ....application import (
     DownloadDocsCVMRepositoryCVM,
     FileExtractorRepositoryCVM,
 )
 from ....domain import DownloadResultCVM
+from .download_config import (
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
+from .download_hedger import DownloadHedgerCVM
+from .download_manifest import DownloadManifestCVM
+from .download_planner import DownloadPlannerCVM
+from .mirror_source import MirrorSourceCVM
 
 logger = get_logger(__name__)
 
+# keep_zip of the download_docs call being run, None for the adapter's own
+_keep_zip_override: contextvars.ContextVar[Optional[bool]] = (
+    contextvars.ContextVar('keep_zip_override', default=None)
+)
+
 
 class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
-    """Asynchronous download adapter using httpx."""
+    """Asynchronous download adapter using httpx.
+
+    Every download run shares one pooled httpx client. Using the adapter
+    as an async context manager (or calling open()/aclose()) keeps that
+    client alive across several download_docs_async() calls.
+
+    A run is planned by a DownloadPlannerCVM (directory discovery and
+    largest-first ordering), files are fetched from a MirrorSourceCVM
+    before their source when mirror_url is set, and slow downloads can be
+    raced by a DownloadHedgerCVM. With conditional_requests enabled, each
+    destination directory keeps a DownloadManifestCVM, so files whose
+    outputs are still in place are revalidated instead of downloaded.
+
+    Concurrency is adaptive by default (see SchedulingConfigCVM), failed
+    attempts are retried with full-jitter backoff within a run-wide retry
+    budget and a per-host circuit breaker (see RetryConfigCVM), and large
+    files can be fetched as concurrent byte ranges (see
+    TransferConfigCVM).
+
+    With automatic_extractor enabled and keep_zip=False, the ZIP is never
+    written to the destination: the response is spooled into a
+    SpooledTemporaryFile and converted to Parquet straight from that
+    buffer. Such downloads are not resumed after a failure.
+    """
+
+    # Local file header: signature, fixed fields, name and extra lengths
+    _ZIP_LOCAL_HEADER = struct.Struct('<4s22xHH')
 
     def __init__(
         self,
@@ -39,6 +91,13 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
         backoff_multiplier: float = 2.0,
         http2: bool = True,
         automatic_extractor: bool = False,
+        conditional_requests: bool = True,
+        keep_zip: bool = True,
+        mirror_url: Optional[str] = None,
+        discover_files: bool = False,
+        retry: Optional[RetryConfigCVM] = None,
+        transfer: Optional[TransferConfigCVM] = None,
+        scheduling: Optional[SchedulingConfigCVM] = None,
     ):
         """
         Initializes the asynchronous download adapter.
@@ -54,24 +113,90 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
             backoff_multiplier: Exponential backoff multiplier.
             http2: Enable HTTP/2.
             automatic_extractor: Enable automatic extraction after download.
+            conditional_requests: Skip files that did not change since the
+                last run, using a manifest in each destination directory.
+            keep_zip: Write each ZIP to disk before extracting it. False
+                extracts from an in-memory spool instead; only used with
+                automatic_extractor.
+            mirror_url: Base URL or local directory of a mirror tried
+                before the source URL of each file.
+            discover_files: Read the directory listings of the source
+                first and only request files that exist and changed.
+            retry: Retry budget and circuit breaker settings.
+            transfer: Connection, segmentation, stall and spool settings.
+            scheduling: Concurrency, pacing, hedging and ordering settings.
         """
+        self.retry = retry or RetryConfigCVM()
+        self.transfer = transfer or TransferConfigCVM()
+        self.scheduling = scheduling or SchedulingConfigCVM()
+
         self.file_extractor_repository = file_extractor_repository
         self.max_concurrent = max_concurrent
         self.chunk_size = chunk_size
         self.max_retries = max_retries
         self.automatic_extractor = automatic_extractor
+        self._extraction_executor: Optional[ThreadPoolExecutor] = None
+        self.conditional_requests = conditional_requests
+        self._download_info: Dict[str, Tuple[str, DownloadInfo]] = {}
+        self._manifests: Dict[str, DownloadManifestCVM] = {}
+        self._manifests_lock = threading.Lock()
+        self._download_slots: Optional[
+            Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]
+        ] = None
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = (
+            AdaptiveConcurrencyLimiter(
+                initial=max(1, max_concurrent),
+                min_limit=min(
+                    max(1, self.scheduling.min_concurrent),
+                    max(1, max_concurrent),
+                ),
+                max_limit=max(1, max_concurrent),
+            )
+            if self.scheduling.adaptive_concurrency
+            else None
+        )
+        self.rate_limiter = HostRateLimiter(
+            self.scheduling.requests_per_second, self.scheduling.burst
+        )
+        self.hedger = DownloadHedgerCVM()
+        self.keep_zip = keep_zip
+        self._buffers: Dict[str, IO[bytes]] = {}
+        self.mirror = MirrorSourceCVM(mirror_url) if mirror_url else None
 
+        pool_size = max(1, max_concurrent)
         self.requests_adapter = RequestsAdapter(
             timeout=timeout,
             http2=http2,
             verify=True,
             max_redirects=20,
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=self.transfer.keepalive_expiry,
+            min_throughput=self.transfer.min_throughput,
+            stall_window=self.transfer.stall_window,
         )
 
         self.retry_strategy = RetryStrategy(
             initial_backoff=initial_backoff,
             max_backoff=max_backoff,
             multiplier=backoff_multiplier,
+            jitter=True,
+        )
+        self.planner = DownloadPlannerCVM(
+            self.requests_adapter,
+            self._manifest_for,
+            discover_files=discover_files,
+            largest_first=self.scheduling.largest_first,
+            prefetch_sizes=self.scheduling.prefetch_sizes,
+            max_head_requests=max_concurrent,
+            index_ttl=self.scheduling.index_ttl,
+        )
+        self.retry_budget = RetryBudget(
+            self.retry.retry_budget_ratio, self.retry.min_retry_budget
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=self.retry.circuit_failure_threshold,
+            reset_timeout=self.retry.circuit_reset_timeout,
         )
 
         logger.debug(
@@ -82,12 +207,14 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
     def download_docs(
         self,
         tasks: List[Tuple[str, str, str, str]],
+        keep_zip: Optional[bool] = None,
     ) -> DownloadResultCVM:
         """
         Asynchronously downloads documents.
 
         Args:
             tasks: List of tuples (url, doc_name, year, destination_path) representing each download task.
+            keep_zip: Overrides the adapter's keep_zip for this call only.
 
         Returns:
             DownloadResultCVM containing aggregated success/error information.
@@ -104,7 +231,11 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
             f'with {self.max_concurrent} concurrent downloads'
         )
 
-        asyncio.run(self._execute_async_downloads(tasks, result))
+        token = _keep_zip_override.set(keep_zip)
+        try:
+            asyncio.run(self._execute_in_session(tasks, result))
+        finally:
+            _keep_zip_override.reset(token)
 
         logger.info(
             f'Download completed: {result.success_count_downloads} successful, '
@@ -113,16 +244,99 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
 
         return result
 
+    async def download_docs_async(
+        self,
+        tasks: List[Tuple[str, str, str, str]],
+        keep_zip: Optional[bool] = None,
+    ) -> DownloadResultCVM:
+        """
+        Downloads documents in the running event loop.
+
+        Reuses the pooled client if the adapter was opened, otherwise one
+        is opened for this call.
+
+        Args:
+            tasks: List of tuples (url, doc_name, year, destination_path) representing each download task.
+            keep_zip: Overrides the adapter's keep_zip for this call only.
+
+        Returns:
+            DownloadResultCVM containing aggregated success/error information.
+        """
+        result = DownloadResultCVM()
+
+        if not tasks:
+            logger.warning('No files to download')
+            return result
+
+        logger.info(
+            f'Starting async download of {len(tasks)} files '
+            f'with {self.max_concurrent} concurrent downloads'
+        )
+
+        token = _keep_zip_override.set(keep_zip)
+        try:
+            await self._execute_in_session(tasks, result)
+        finally:
+            _keep_zip_override.reset(token)
+
+        logger.info(
+            f'Download completed: {result.success_count_downloads} successful, '
+            f'{result.error_count_downloads} errors'
+        )
+
+        return result
+
+    def _spools(self) -> bool:
+        """Whether a download is extracted from a spool, not a ZIP on disk.
+
+        Follows the keep_zip of the running download_docs call, if given.
+        """
+        keep_zip = _keep_zip_override.get()
+        if keep_zip is None:
+            keep_zip = self.keep_zip
+        return self.automatic_extractor and not keep_zip
+
+    async def open(self) -> None:
+        """Open the pooled HTTP client for a longer-lived session."""
+        await self.requests_adapter.open()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.requests_adapter.aclose()
+
+    async def __aenter__(self) -> 'AsyncDownloadAdapterCVM':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _execute_in_session(
+        self,
+        tasks: List[Tuple[str, str, str, str]],
+        result: DownloadResultCVM,
+    ) -> None:
+        """Run the downloads with one pooled client shared by all files."""
+        async with self.requests_adapter.session():
+            await self._execute_async_downloads(tasks, result)
+
     async def _execute_async_downloads(
         self,
         tasks: List[Tuple[str, str, str, str]],
         result: DownloadResultCVM,
     ) -> None:
         """Execute async downloads with concurrency control."""
+        tasks = await self.planner.plan(tasks, result)
+
         progress_bar = SimpleProgressBar(
             total=len(tasks), desc='Downloading (async)'
         )
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        semaphore = self.concurrency_limiter or asyncio.Semaphore(
+            self.max_concurrent
+        )
+        # Segmented downloads borrow idle slots for their extra ranges
+        self._download_slots = semaphore
+        self.retry_budget.reset()
 
         async def download_with_semaphore(task):
             async with semaphore:
@@ -132,11 +346,95 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
                 )
 
         try:
-            download_tasks = [download_with_semaphore(task) for task in tasks]
-            await asyncio.gather(*download_tasks)
+            if self.automatic_extractor:
+                await self._execute_download_extract_pipeline(
+                    tasks, result, progress_bar, semaphore
+                )
+            else:
+                download_tasks = [
+                    download_with_semaphore(task) for task in tasks
+                ]
+                await asyncio.gather(*download_tasks)
         finally:
+            self._download_slots = None
             progress_bar.close()
 
+    async def _execute_download_extract_pipeline(
+        self,
+        tasks: List[Tuple[str, str, str, str]],
+        result: DownloadResultCVM,
+        progress_bar: SimpleProgressBar,
+        semaphore: Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter],
+    ) -> None:
+        """Run downloads and extractions as two overlapping stages.
+
+        Validated ZIPs are handed from the download stage to the extraction
+        stage through a bounded queue. max_concurrent_extractions consumers
+        run the CSV to Parquet conversion in a dedicated thread pool, so the
+        event loop keeps downloading while files are converted. A download
+        slot is held until its ZIP is queued, which bounds the number of
+        ZIPs waiting on disk when extraction is the bottleneck.
+        """
+        extractions = max(1, self.scheduling.max_concurrent_extractions)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=extractions * 2)
+
+        async def download(task):
+            url, doc_name, year, dest_path = task
+            async with semaphore:
+                filepath = await self._download_stage(
+                    url, dest_path, doc_name, year, result
+                )
+                if filepath is None:
+                    progress_bar.update(1)
+                    return
+                await queue.put((filepath, dest_path, doc_name, year))
+
+        async def extract_worker():
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    filepath, dest_path, doc_name, year = item
+                    await self._extract_off_loop(
+                        filepath, dest_path, doc_name, year, result
+                    )
+                    progress_bar.update(1)
+                finally:
+                    queue.task_done()
+
+        self._extraction_executor = ThreadPoolExecutor(
+            max_workers=extractions,
+            thread_name_prefix='cvm-extract',
+        )
+        workers = [
+            asyncio.create_task(extract_worker()) for _ in range(extractions)
+        ]
+
+        completed = False
+        try:
+            await asyncio.gather(*(download(task) for task in tasks))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            completed = True
+        finally:
+            for worker in workers:
+                worker.cancel()
+            executor, self._extraction_executor = (
+                self._extraction_executor,
+                None,
+            )
+            # After a failure or cancellation conversions may still be
+            # running; drop the queued ones instead of blocking the loop
+            executor.shutdown(wait=completed, cancel_futures=not completed)
+
+        logger.info(
+            f'Pipeline finished: {result.download_time:.1f}s downloading '
+            f'({result.disk_write_time:.1f}s of disk writes), '
+            f'{result.extraction_time:.1f}s extracting (cumulative)'
+        )
+
     async def _download_and_extract(
         self,
         url: str,
@@ -147,19 +445,117 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
         progress_bar: SimpleProgressBar,
     ) -> None:
         """Download a file and extract its contents."""
-        filename = url.split('/')[-1].split('?')[0] or 'download'
+        filepath = await self._download_stage(
+            url, dest_path, doc_name, year, result
+        )
+
+        if filepath is not None:
+            if self.automatic_extractor:
+                await self._extract_off_loop(
+                    filepath, dest_path, doc_name, year, result
+                )
+            else:
+                # Automatic extraction disabled
+                self._record_download(filepath, [filepath])
+                result.add_success_downloads(f'{doc_name}_{year}')
+                logger.info(
+                    f'✓ Downloaded {doc_name}_{year} (extraction disabled)'
+                )
+
+        progress_bar.update(1)
+
+    async def _download_stage(
+        self,
+        url: str,
+        dest_path: str,
+        doc_name: str,
+        year: str,
+        result: DownloadResultCVM,
+    ) -> Optional[str]:
+        """Download and validate a file.
+
+        Failures are recorded in result.
+
+        Returns:
+            Path of the validated ZIP, or None if the download failed or
+            the file is unchanged since the last run
+        """
+        filename = DownloadPlannerCVM.filename_of(url) or 'download'
         filepath = str(Path(dest_path) / filename)
+        started = time.perf_counter()
+
+        listed = self.planner.listed(url)
+        manifest = self._manifest_for(dest_path)
+        if (
+            listed is not None
+            and manifest is not None
+            and manifest.matches_listing(
+                url, self.automatic_extractor, listed.signature
+            )
+        ):
+            self._mark_up_to_date(doc_name, year, result, 'same listing')
+            return None
 
-        success, error_msg = await self._download_with_retry(
-            url, filepath, doc_name, year
-        )
+        try:
+            success, error_msg = await self._download_with_retry(
+                url, filepath, doc_name, year
+            )
 
-        if success:
-            # CRITICAL FIX: Get expected size for validation
-            expected_size = await self._get_content_length(url)
+            if not success:
+                result.add_error_downloads(
+                    f'{doc_name}_{year}',
+                    error_msg or 'Unknown download error',
+                )
+                return None
+
+            pending = self._download_info.get(filepath)
+            info = pending[1] if pending is not None else None
+            if info is not None and info.write_time:
+                result.disk_write_time += info.write_time
+
+            if info is not None and info.not_modified:
+                self._download_info.pop(filepath, None)
+                self._release_buffer(filepath)
+                if manifest is not None:
+                    manifest.refresh(url, info, self._listing_of(url))
+                self._mark_up_to_date(doc_name, year, result, '304')
+                return None
+
+            if info is not None and self._is_unchanged(url, dest_path, info):
+                self._download_info.pop(filepath, None)
+                if manifest is not None:
+                    manifest.refresh(url, info, self._listing_of(url))
+                if self.automatic_extractor:
+                    # The Parquet outputs of these exact bytes are in place
+                    self._remove_zip(filepath)
+                self._mark_up_to_date(doc_name, year, result, 'same SHA-256')
+                return None
+
+            # Size check uses what the GET response announced and what was
+            # actually written, so no extra HEAD request is needed
+            if info is not None and not info.is_complete:
+                self._download_info.pop(filepath, None)
+                logger.error(
+                    f'Incomplete download for {doc_name}_{year}: '
+                    f'{info.bytes_written:,} of {info.content_length:,} bytes'
+                )
+                result.add_error_downloads(
+                    f'{doc_name}_{year}',
+                    f'Incomplete download: {info.bytes_written} of '
+                    f'{info.content_length} bytes',
+                )
+                self._remove_zip(filepath)
+                return None
+            expected_size = info.bytes_written if info is not None else None
 
-            # CRITICAL FIX: Validate file integrity before extraction
-            if not self._validate_downloaded_file(filepath, expected_size):
+            # CRITICAL FIX: Validate file integrity before extraction.
+            # Only the ZIP structure is read here; member CRCs are checked
+            # by the extraction pass. Keep the file I/O off-loop.
+            is_valid = await asyncio.get_running_loop().run_in_executor(
+                None, self._validate_downloaded_file, filepath, expected_size
+            )
+            if not is_valid:
+                self._download_info.pop(filepath, None)
                 logger.error(
                     f'Downloaded file validation failed for {doc_name}_{year}: {filepath}'
                 )
@@ -167,104 +563,241 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
                     f'{doc_name}_{year}',
                     'Downloaded file corrupted, incomplete, or invalid ZIP',
                 )
-                remove_file(filepath, log_on_error=True)
-                progress_bar.update(1)
-                return
+                self._remove_zip(filepath)
+                return None
 
-            if self.automatic_extractor:
-                try:
-                    logger.info(f'Starting extraction for {doc_name}_{year}')
-                    self.file_extractor_repository.extract(filepath, dest_path)
+            return filepath
 
-                    # CRITICAL FIX: Verify extraction with recursive glob
-                    parquet_files = list(Path(dest_path).glob('**/*.parquet'))
-                    if not parquet_files:
-                        logger.warning(
-                            f'Extraction completed but no .parquet files found in {dest_path} '
-                            f'(including subdirectories). Keeping source ZIP: {filepath}'
-                        )
-                        result.add_error_downloads(
-                            f'{doc_name}_{year}',
-                            'No parquet files generated after extraction',
-                        )
-                        progress_bar.update(1)
-                        return
-
-                    # CRITICAL: Validate parquet file content
-                    if not self._validate_parquet_files(
-                        parquet_files, doc_name, year
-                    ):
-                        result.add_error_downloads(
-                            f'{doc_name}_{year}',
-                            'Parquet validation failed: corrupted or empty files',
-                        )
-                        progress_bar.update(1)
-                        return
+        finally:
+            result.download_time += time.perf_counter() - started
 
-                    result.add_success_downloads(f'{doc_name}_{year}')
-                    logger.info(
-                        f'✓ Extraction completed for {doc_name}_{year}: '
-                        f'{len(parquet_files)} parquet files created'
-                    )
-                    remove_file(filepath, log_on_error=True)
+    async def _extract_off_loop(
+        self,
+        filepath: str,
+        dest_path: str,
+        doc_name: str,
+        year: str,
+        result: DownloadResultCVM,
+    ) -> None:
+        """Run the extraction in the extraction pool and time it.
 
-                except DiskFullError as disk_err:
-                    logger.error(
-                        f'Disk full during extraction of {doc_name}_{year}: {disk_err}'
-                    )
-                    result.add_error_downloads(
-                        f'{doc_name}_{year}', f'DiskFull: {disk_err}'
-                    )
-                    # Remove ZIP on disk full (non-recoverable)
-                    remove_file(filepath, log_on_error=True)
+        The worker thread only converts and validates the ZIP; result,
+        _buffers and _download_info are updated here, on the event loop.
+        """
+        # The worker owns the spool from now on and closes it
+        buffer = self._buffers.pop(filepath, None)
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            artifacts, error_msg = await loop.run_in_executor(
+                self._extraction_executor,
+                self._extract_and_validate,
+                filepath,
+                dest_path,
+                doc_name,
+                year,
+                buffer,
+            )
+            if error_msg is None:
+                self._record_download(filepath, artifacts)
+                result.add_success_downloads(f'{doc_name}_{year}')
+            else:
+                result.add_error_downloads(f'{doc_name}_{year}', error_msg)
+        finally:
+            result.extraction_time += time.perf_counter() - started
+            # No-op once the download was recorded as complete
+            self._discard_download(filepath)
 
-                except CorruptedZipError as zip_err:
-                    logger.error(
-                        f'Corrupted ZIP detected during extraction of {doc_name}_{year}: {zip_err}'
-                    )
-                    result.add_error_downloads(
-                        f'{doc_name}_{year}', f'CorruptedZIP: {zip_err}'
-                    )
-                    # Remove corrupted ZIP (non-recoverable)
-                    remove_file(filepath, log_on_error=True)
+    def _extract_and_validate(
+        self,
+        filepath: str,
+        dest_path: str,
+        doc_name: str,
+        year: str,
+        buffer: Optional[IO[bytes]],
+    ) -> Tuple[List[str], Optional[str]]:
+        """Extract a downloaded ZIP and validate the Parquet output.
 
-                except ExtractionError as extract_err:
-                    logger.error(
-                        f'Extraction error for {doc_name}_{year}: {extract_err}'
-                    )
-                    result.add_error_downloads(
-                        f'{doc_name}_{year}',
-                        f'ExtractionFailed: {extract_err}',
-                    )
-                    logger.info(
-                        f'Keeping ZIP for manual investigation: {filepath}'
-                    )
+        Runs in a worker thread and touches no shared state; the caller
+        records the outcome.
 
-                except Exception as unexpected_err:
-                    logger.error(
-                        f'Unexpected extraction error for {doc_name}_{year}: '
-                        f'{type(unexpected_err).__name__}: {unexpected_err}',
-                        exc_info=True,
-                    )
-                    result.add_error_downloads(
-                        f'{doc_name}_{year}',
-                        f'UnexpectedError: {type(unexpected_err).__name__}: {unexpected_err}',
-                    )
-                    # Keep ZIP for debugging
-                    logger.info(f'Keeping ZIP for debugging: {filepath}')
+        Args:
+            buffer: Spooled ZIP to extract instead of filepath. It is
+                closed before returning.
 
+        Returns:
+            Tuple of (parquet file paths, error message); the error
+            message is None on success
+        """
+        try:
+            logger.info(f'Starting extraction for {doc_name}_{year}')
+            expected_files = self._expected_parquet_files(
+                filepath if buffer is None else buffer, dest_path
+            )
+            if buffer is None:
+                self.file_extractor_repository.extract(filepath, dest_path)
             else:
-                # Automatic extraction disabled
-                result.add_success_downloads(f'{doc_name}_{year}')
+                buffer.seek(0)
+                self.file_extractor_repository.extract_from_buffer(
+                    buffer, filepath, dest_path
+                )
+
+            # Validate this ZIP's outputs only; other Parquet files in
+            # dest_path may belong to concurrent extractions
+            parquet_files = [p for p in expected_files if p.exists()]
+            if not parquet_files:
+                logger.warning(
+                    f'Extraction completed but none of the expected .parquet '
+                    f'files were found in {dest_path}. '
+                    f'Keeping source ZIP: {filepath}'
+                )
+                return [], 'No parquet files generated after extraction'
+
+            # CRITICAL: Validate parquet file content
+            if not self._validate_parquet_files(parquet_files, doc_name, year):
+                return (
+                    [],
+                    'Parquet validation failed: corrupted or empty files',
+                )
+
+            logger.info(
+                f'✓ Extraction completed for {doc_name}_{year}: '
+                f'{len(parquet_files)} parquet files created'
+            )
+            remove_file(filepath, log_on_error=True)
+            return [str(p) for p in parquet_files], None
+
+        except DiskFullError as disk_err:
+            logger.error(
+                f'Disk full during extraction of {doc_name}_{year}: {disk_err}'
+            )
+            # Remove ZIP on disk full (non-recoverable)
+            remove_file(filepath, log_on_error=True)
+            return [], f'DiskFull: {disk_err}'
+
+        except CorruptedZipError as zip_err:
+            logger.error(
+                f'Corrupted ZIP detected during extraction of {doc_name}_{year}: {zip_err}'
+            )
+            # Remove corrupted ZIP (non-recoverable)
+            remove_file(filepath, log_on_error=True)
+            return [], f'CorruptedZIP: {zip_err}'
+
+        except ExtractionError as extract_err:
+            logger.error(
+                f'Extraction error for {doc_name}_{year}: {extract_err}'
+            )
+            if buffer is None:
                 logger.info(
-                    f'✓ Downloaded {doc_name}_{year} (extraction disabled)'
+                    f'Keeping ZIP for manual investigation: {filepath}'
                 )
-        else:
-            result.add_error_downloads(
-                f'{doc_name}_{year}', error_msg or 'Unknown download error'
+            return [], f'ExtractionFailed: {extract_err}'
+
+        except Exception as unexpected_err:
+            logger.error(
+                f'Unexpected extraction error for {doc_name}_{year}: '
+                f'{type(unexpected_err).__name__}: {unexpected_err}',
+                exc_info=True,
+            )
+            # Keep ZIP for debugging
+            if buffer is None:
+                logger.info(f'Keeping ZIP for debugging: {filepath}')
+            return (
+                [],
+                f'UnexpectedError: {type(unexpected_err).__name__}: {unexpected_err}',
             )
 
-        progress_bar.update(1)
+        finally:
+            # A spooled ZIP cannot be kept for later
+            if buffer is not None:
+                buffer.close()
+
+    def _manifest_for(self, dest_path: str) -> Optional[DownloadManifestCVM]:
+        """Return the download manifest of a destination directory."""
+        if not self.conditional_requests:
+            return None
+
+        key = str(Path(dest_path).resolve())
+        with self._manifests_lock:
+            manifest = self._manifests.get(key)
+            if manifest is None:
+                manifest = DownloadManifestCVM(Path(key))
+                self._manifests[key] = manifest
+            return manifest
+
+    def _is_unchanged(
+        self, url: str, dest_path: str, info: DownloadInfo
+    ) -> bool:
+        """Whether a fresh download has the bytes of the recorded one."""
+        manifest = self._manifest_for(dest_path)
+        return (
+            manifest is not None
+            and manifest.is_current(url, self.automatic_extractor)
+            and manifest.has_same_content(url, info)
+        )
+
+    def _record_download(self, filepath: str, artifacts: List[str]) -> None:
+        """Record a completed download in its destination's manifest."""
+        pending = self._download_info.pop(filepath, None)
+        manifest = self._manifest_for(str(Path(filepath).parent))
+        if pending is None or manifest is None:
+            return
+
+        url, info = pending
+        manifest.record(
+            url,
+            info,
+            artifacts,
+            self.automatic_extractor,
+            self._listing_of(url),
+        )
+
+    def _listing_of(self, url: str) -> Optional[Dict[str, object]]:
+        """Listing signature of url seen by this run's discovery."""
+        listed = self.planner.listed(url)
+        return listed.signature if listed is not None else None
+
+    def _discard_download(self, filepath: str) -> None:
+        """Forget a download whose outputs could not be produced."""
+        pending = self._download_info.pop(filepath, None)
+        manifest = self._manifest_for(str(Path(filepath).parent))
+        if pending is not None and manifest is not None:
+            manifest.forget(pending[0])
+
+    def _release_buffer(self, filepath: str) -> None:
+        """Free the in-memory spool of a download, if it has one."""
+        buffer = self._buffers.pop(filepath, None)
+        if buffer is not None:
+            buffer.close()
+
+    def _remove_zip(self, filepath: str) -> None:
+        """Delete a downloaded ZIP, whether on disk or spooled."""
+        self._release_buffer(filepath)
+        remove_file(filepath, log_on_error=True)
+
+    @staticmethod
+    def _mark_up_to_date(
+        doc_name: str, year: str, result: DownloadResultCVM, reason: str
+    ) -> None:
+        result.add_skipped_downloads(f'{doc_name}_{year}')
+        logger.info(f'✓ {doc_name}_{year} is up to date ({reason}), skipped')
+
+    @staticmethod
+    def _expected_parquet_files(
+        source: Union[str, IO[bytes]], dest_path: str
+    ) -> List[Path]:
+        """Parquet files the extractor writes for the CSVs in a ZIP."""
+        try:
+            with zipfile.ZipFile(source, 'r') as z:
+                names = z.namelist()
+        except (OSError, zipfile.BadZipFile):
+            return []
+
+        return [
+            Path(dest_path) / f'{Path(name).stem}.parquet'
+            for name in names
+            if name.lower().endswith('.csv')
+        ]
 
     async def _download_with_retry(
         self,
@@ -273,8 +806,16 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
         doc_name: str,
         year: str,
     ) -> Tuple[bool, Optional[str]]:
-        """Download a file with retry logic."""
+        """Download a file with retry logic.
+
+        Each attempt is paced by the per-host rate limiter and reported to
+        the concurrency limiter and the circuit breaker. A 429/503 answer is
+        always retried and pauses the host for its Retry-After (capped at
+        max_backoff). Retries are taken from the run's retry budget; an
+        open circuit fails the download without retrying.
+        """
         last_exception: Optional[Exception] = None
+        self.retry_budget.record_request()
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -288,25 +829,69 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
                     )
                     await asyncio.sleep(backoff)
 
+                self.circuit_breaker.before_request(url)
+                await self.rate_limiter.acquire(url)
                 logger.debug(f'Downloading {doc_name}_{year} (async)')
 
-                await self._stream_download(url, filepath)
+                started = time.perf_counter()
+                if self.scheduling.hedge_downloads:
+                    await self.hedger.run(
+                        lambda path: self._stream_download(url, path),
+                        filepath,
+                        self._download_slots,
+                        f'{doc_name}_{year}',
+                        self._discard_copy,
+                        self._promote_copy,
+                    )
+                else:
+                    await self._stream_download(url, filepath)
+                elapsed = time.perf_counter() - started
+                self.hedger.record(elapsed)
+                self._record_latency(filepath, elapsed)
+                self.circuit_breaker.record_success(url)
                 logger.info(f'Successfully downloaded {doc_name}_{year}')
                 return True, None
 
             except Exception as e:
                 last_exception = e
 
-                if (
-                    not self.retry_strategy.is_retryable(e)
-                    or attempt >= self.max_retries
-                ):
+                retry_after = RequestsAdapter.throttle_delay(e)
+                retryable = (
+                    retry_after is not None
+                    or self.retry_strategy.is_retryable(e)
+                )
+                if retry_after is not None:
+                    retry_after = min(
+                        retry_after, self.retry_strategy.max_backoff
+                    )
+                    self.rate_limiter.pause(url, retry_after)
+                    logger.warning(
+                        f'Server throttled {doc_name}_{year}; pausing '
+                        f'requests to the host for {retry_after:.1f}s'
+                    )
+                if retryable and self.concurrency_limiter is not None:
+                    self.concurrency_limiter.record_congestion()
+                if retryable and retry_after is None:
+                    self.circuit_breaker.record_failure(url)
+                elif not isinstance(e, CircuitOpenError):
+                    # The host answered; the error is not its fault
+                    self.circuit_breaker.record_success(url)
+
+                if not retryable or attempt >= self.max_retries:
                     logger.error(
                         f'Download failed for {doc_name}_{year}: '
                         f'{type(e).__name__}: {e}'
                     )
                     break
 
+                if not self.retry_budget.try_spend():
+                    logger.error(
+                        f'Download failed for {doc_name}_{year}: retry '
+                        f'budget of the run exhausted after '
+                        f'{type(e).__name__}: {e}'
+                    )
+                    break
+
                 logger.warning(
                     f'Download error for {doc_name}_{year} '
                     f'(attempt {attempt + 1}/{self.max_retries + 1}): {e}'
@@ -321,44 +906,192 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
         )
         return False, error_msg
 
+    def _record_latency(self, filepath: str, elapsed: float) -> None:
+        """Feed the time to first byte of a download to the limiter."""
+        if self.concurrency_limiter is None:
+            return
+
+        pending = self._download_info.get(filepath)
+        info = pending[1] if pending is not None else None
+        latency = (
+            info.response_time
+            if info is not None and info.response_time is not None
+            else elapsed
+        )
+        self.concurrency_limiter.record_success(latency)
+
+    def _discard_copy(self, filepath: str) -> None:
+        """Remove a download, its resumable part and its metadata."""
+        self._download_info.pop(filepath, None)
+        self._release_buffer(filepath)
+        for suffix in (
+            '',
+            RequestsAdapter.PART_SUFFIX,
+            RequestsAdapter.SIDECAR_SUFFIX,
+        ):
+            remove_file(f'{filepath}{suffix}', log_on_error=False)
+
+    def _promote_copy(self, source: str, filepath: str) -> None:
+        """Move a completed copy of a download into filepath."""
+        self._discard_copy(filepath)
+        buffer = self._buffers.pop(source, None)
+        if buffer is not None:
+            self._buffers[filepath] = buffer
+        else:
+            os.replace(source, filepath)
+        copied = self._download_info.pop(source, None)
+        if copied is not None:
+            self._download_info[filepath] = copied
+
     async def _stream_download(self, url: str, filepath: str) -> None:
-        """Perform asynchronous streaming download."""
+        """Download url to filepath, from the mirror when it has the file.
+
+        A file missing from the mirror (403/404/410 or no such local file)
+        or a mirror that cannot be reached is downloaded from url instead.
+        Other errors, e.g. a stalled transfer, are raised as usual.
+        """
+        if self.mirror is None:
+            await self._fetch(url, url, filepath)
+            return
+
+        source = self.mirror.locate(url)
         try:
-            await self.requests_adapter.async_download_file(
-                url=url,
-                output_path=filepath,
-                chunk_size=self.chunk_size,
-            )
+            if self.mirror.remote:
+                await self._fetch(url, source, filepath)
+            else:
+                await self._copy_from_mirror(url, source, filepath)
+            logger.debug(f'{Path(filepath).name} served by the mirror')
+            return
         except Exception as e:
-            remove_file(filepath, log_on_error=False)
-            raise e
+            if not self.mirror.is_miss(e):
+                raise
+            logger.info(
+                f'{Path(filepath).name} unavailable on the mirror '
+                f'({type(e).__name__}: {e}); falling back to {url}'
+            )
 
-    async def _get_content_length(self, url: str) -> Optional[int]:
-        """Get Content-Length from HTTP headers before downloading.
+        await self._fetch(url, url, filepath)
 
-        Args:
-            url: URL to check
+    async def _copy_from_mirror(
+        self, url: str, source: str, filepath: str
+    ) -> None:
+        """Copy a file from a local mirror directory off the event loop.
 
-        Returns:
-            Expected file size in bytes, or None if not available
+        Stands in for the HTTP download: the mirror file's modification
+        time is its Last-Modified, so an If-Modified-Since from the
+        manifest can still skip an unchanged file.
         """
+        manifest = self._manifest_for(str(Path(filepath).parent))
+        headers = (
+            manifest.conditional_headers(url, self.automatic_extractor)
+            if manifest is not None
+            else {}
+        )
+        buffer: Optional[IO[bytes]] = (
+            tempfile.SpooledTemporaryFile(
+                max_size=self.transfer.spool_max_memory
+            )
+            if self._spools()
+            else None
+        )
+
         try:
-            response = await self.requests_adapter.async_head(url)
-            content_length = response.headers.get('content-length')
+            info = await asyncio.get_running_loop().run_in_executor(
+                None,
+                MirrorSourceCVM.copy,
+                source,
+                buffer if buffer is not None else filepath,
+                headers.get('If-Modified-Since'),
+            )
+        except Exception:
+            if buffer is not None:
+                buffer.close()
+            remove_file(filepath, log_on_error=False)
+            raise
+
+        self._download_info[filepath] = (url, info)
+        if buffer is not None:
+            self._release_buffer(filepath)
+            self._buffers[filepath] = buffer
+
+    async def _fetch(self, url: str, source: str, filepath: str) -> None:
+        """Perform asynchronous streaming download of source.
+
+        The body is written to ``<filepath>.part``, which survives failures
+        so retries and later runs resume it with an HTTP Range request.
+        Files above segmented_download_threshold are fetched as concurrent
+        ranges instead, unless a resumable ``.part`` is already there. With
+        keep_zip=False (and automatic extraction) the body is spooled into
+        _buffers instead and nothing is written under filepath. The
+        response metadata (Content-Length, ETag, bytes written) is kept in
+        _download_info under url, the source the manifest knows the file
+        by, for the validation step.
+        """
+        manifest = self._manifest_for(str(Path(filepath).parent))
+        headers = (
+            manifest.conditional_headers(url, self.automatic_extractor)
+            if manifest is not None
+            else {}
+        )
 
-            if content_length:
-                size_bytes = int(content_length)
-                logger.debug(
-                    f'Content-Length for {url}: {size_bytes / 1024 / 1024:.2f} MB'
+        # Smallest file fetched as ranges; None streams it in one request
+        segments = max(1, self.transfer.download_segments)
+        segment_min_size = (
+            self.transfer.segmented_download_threshold
+            if segments > 1
+            and not os.path.exists(f'{filepath}{RequestsAdapter.PART_SUFFIX}')
+            else None
+        )
+        buffer: Optional[IO[bytes]] = (
+            tempfile.SpooledTemporaryFile(
+                max_size=self.transfer.spool_max_memory
+            )
+            if self._spools()
+            else None
+        )
+
+        try:
+            if buffer is not None:
+                info = await self.requests_adapter.async_download_to_buffer(
+                    url=source,
+                    buffer=buffer,
+                    chunk_size=self.chunk_size,
+                    headers=headers or None,
+                    digest_algorithm='sha256',
+                )
+            elif segment_min_size is not None:
+                info = await self.requests_adapter.async_download_segmented(
+                    url=source,
+                    output_path=filepath,
+                    segments=segments,
+                    min_size=segment_min_size,
+                    chunk_size=self.chunk_size,
+                    headers=headers or None,
+                    digest_algorithm='sha256',
+                    slots=self._download_slots,
+                    join_late=True,
                 )
-                return size_bytes
             else:
-                logger.debug(f'No Content-Length header for {url}')
-                return None
-
+                info = await self.requests_adapter.async_download_file(
+                    url=source,
+                    output_path=filepath,
+                    chunk_size=self.chunk_size,
+                    headers=headers or None,
+                    digest_algorithm='sha256',
+                    resume=True,
+                )
         except Exception as e:
-            logger.warning(f'Failed to get Content-Length for {url}: {e}')
-            return None
+            if buffer is not None:
+                buffer.close()
+            self._download_info.pop(filepath, None)
+            remove_file(filepath, log_on_error=False)
+            raise e
+
+        if isinstance(info, DownloadInfo):
+            self._download_info[filepath] = (url, info)
+        if buffer is not None:
+            self._release_buffer(filepath)
+            self._buffers[filepath] = buffer
 
     def _validate_downloaded_file(
         self, filepath: str, expected_size: Optional[int] = None
@@ -374,16 +1107,21 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
         """
         try:
             path = Path(filepath)
-
-            # Check 1: File exists
-            if not path.exists():
+            buffer = self._buffers.get(filepath)
+
+            # Check 1: File exists (or was spooled)
+            if buffer is not None:
+                source: Union[str, IO[bytes]] = buffer
+                actual_size = buffer.seek(0, os.SEEK_END)
+            elif path.exists():
+                source = filepath
+                actual_size = path.stat().st_size
+            else:
                 logger.error(f'Downloaded file does not exist: {filepath}')
                 return False
 
             # Check 2: File size validation (if expected_size available)
             if expected_size is not None:
-                actual_size = path.stat().st_size
-
                 # Allow 5% tolerance for compression/headers
                 size_diff = abs(actual_size - expected_size)
                 size_diff_pct = (
@@ -406,11 +1144,12 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
                     f'(expected {expected_size:,}, diff {size_diff_pct:.2f}%)'
                 )
 
-            # Check 3: ZIP validity and completeness
+            # Check 3: ZIP validity and completeness. The central directory
+            # and local headers are checked without inflating any member;
+            # CRCs are verified by the extractor, which inflates them anyway.
             try:
-                with zipfile.ZipFile(filepath, 'r') as z:
-                    # Test ZIP integrity of ALL files
-                    bad_file = z.testzip()
+                with zipfile.ZipFile(source, 'r') as z:
+                    bad_file = self._check_zip_structure(z, actual_size)
                     if bad_file:
                         logger.error(
                             f'Corrupted file in ZIP: {bad_file} ({filepath})'
@@ -445,6 +1184,47 @@ class AsyncDownloadAdapterCVM(DownloadDocsCVMRepositoryCVM):
             logger.error(f'Error validating file {filepath}: {e}')
             return False
 
+    @staticmethod
+    def _check_zip_structure(
+        z: zipfile.ZipFile, file_size: int
+    ) -> Optional[str]:
+        """Check the layout of a ZIP without decompressing it.
+
+        Every member listed in the central directory must start with a
+        local file header at its recorded offset, and its compressed data
+        must end inside the file. This catches truncated or spliced
+        archives at the cost of one small read per member.
+
+        Returns:
+            Name of the first inconsistent member, or None
+        """
+        fp = z.fp
+        if fp is None:
+            return None
+
+        header_format = AsyncDownloadAdapterCVM._ZIP_LOCAL_HEADER
+        for info in z.infolist():
+            fp.seek(info.header_offset)
+            header = fp.read(header_format.size)
+            if len(header) != header_format.size:
+                return info.filename
+
+            signature, name_length, extra_length = header_format.unpack(header)
+            if signature != b'PK\x03\x04':
+                return info.filename
+
+            data_end = (
+                info.header_offset
+                + header_format.size
+                + name_length
+                + extra_length
+                + info.compress_size
+            )
+            if data_end > file_size:
+                return info.filename
+
+        return None
+
     def _validate_parquet_files(
         self, parquet_files: List[Path], doc_name: str, year: str
     ) -> bool:
@@ -0,0 +1,204 @@
+import html
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+import httpx
+
+from .......core import get_logger
+from .......macro_infra import RequestsAdapter
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ListedFileCVM:
+    """A file as it appears in a directory listing of the CVM portal.
+
+    Attributes:
+        name: File name.
+        url: Absolute URL of the file.
+        modified: Modification time shown by the listing, normalised to
+            ``YYYY-MM-DDTHH:MM`` (server local time, minute precision).
+        size: Size shown by the listing in bytes. Listings round sizes
+            such as "16M", so it is only an approximation.
+    """
+
+    name: str
+    url: str
+    modified: Optional[str] = None
+    size: Optional[int] = None
+
+    @property
+    def signature(self) -> Dict[str, Optional[object]]:
+        """What the listing says about the file; changes when it does."""
+        return {'modified': self.modified, 'size': self.size}
+
+
+@dataclass
+class _CachedListing:
+    fetched_at: float
+    etag: Optional[str]
+    files: Dict[str, ListedFileCVM]
+
+
+class DadosIndexCVM:
+    """Cached directory listings of the CVM ``DADOS/`` folders.
+
+    The portal serves an auto-generated index page for every folder.
+    list_directory() downloads it once, parses the file names, dates and
+    sizes, and keeps the result for ttl seconds. An expired listing is
+    revalidated with If-None-Match when the server sent an ETag. If the
+    listing cannot be fetched, the last known one is returned, or None
+    when there is none, so callers can fall back to blind enumeration.
+
+    Both the Apache (``2024-10-12 06:01  16M``) and the nginx
+    (``12-Oct-2024 06:01  16777216``) listing formats are understood.
+
+    Args:
+        requests_adapter: Adapter used to fetch the index pages
+        ttl: Seconds a listing is reused without asking the server
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    _HREF = re.compile(r'<a\s[^>]*href="([^"]+)"', re.IGNORECASE)
+    _LINK_END = re.compile(r'</a\s*>', re.IGNORECASE)
+    _TAG = re.compile(r'<[^>]+>')
+    _ISO_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})')
+    _NGINX_DATE = re.compile(r'(\d{2}-[A-Za-z]{3}-\d{4})\s+(\d{2}:\d{2})')
+    _SIZE = re.compile(r'(?:^|\s)(\d+(?:\.\d+)?)([KMGT]?)\s*$', re.IGNORECASE)
+    _UNITS = {'': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
+
+    def __init__(
+        self,
+        requests_adapter: RequestsAdapter,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._requests = requests_adapter
+        self.ttl = ttl
+        self._clock = clock
+        self._cache: Dict[str, _CachedListing] = {}
+
+    async def list_directory(
+        self, directory_url: str
+    ) -> Optional[Dict[str, ListedFileCVM]]:
+        """Return the files of a directory keyed by name.
+
+        Args:
+            directory_url: URL of the directory (with trailing slash)
+
+        Returns:
+            Files listed in the directory, or None if no listing could be
+            obtained.
+        """
+        cached = self._cache.get(directory_url)
+        now = self._clock()
+        if cached is not None and now - cached.fetched_at < self.ttl:
+            return cached.files
+
+        headers = (
+            {'If-None-Match': cached.etag}
+            if cached is not None and cached.etag
+            else None
+        )
+        try:
+            response = await self._requests.async_get(
+                directory_url, headers=headers
+            )
+            if (
+                cached is not None
+                and response.status_code == httpx.codes.NOT_MODIFIED
+            ):
+                cached.fetched_at = now
+                return cached.files
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(
+                f'Could not list {directory_url} ({type(e).__name__}: {e}); '
+                f'{"using the cached listing" if cached else "not filtering"}'
+            )
+            return cached.files if cached is not None else None
+
+        files = self.parse(response.text, directory_url)
+        self._cache[directory_url] = _CachedListing(
+            now, response.headers.get('ETag'), files
+        )
+        logger.debug(f'Listed {len(files)} files in {directory_url}')
+        return files
+
+    def invalidate(self, directory_url: Optional[str] = None) -> None:
+        """Drop one cached listing, or all of them."""
+        if directory_url is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(directory_url, None)
+
+    @classmethod
+    def parse(cls, page: str, directory_url: str) -> Dict[str, ListedFileCVM]:
+        """Extract the files of an index page.
+
+        Parent links, sort links and subdirectories are ignored.
+        """
+        files: Dict[str, ListedFileCVM] = {}
+        base = urlsplit(directory_url)
+
+        for line in page.splitlines():
+            match = cls._HREF.search(line)
+            if match is None:
+                continue
+
+            href = html.unescape(match.group(1))
+            url = urljoin(directory_url, href)
+            parts = urlsplit(url)
+            if (
+                href.startswith(('?', '#'))
+                or parts.path.endswith('/')
+                or parts.netloc != base.netloc
+                or not parts.path.startswith(base.path)
+            ):
+                continue
+
+            name = unquote(parts.path.rsplit('/', 1)[-1])
+            # Date and size follow the link; its text may be truncated
+            tail = line[match.end() :]
+            link_end = cls._LINK_END.search(tail)
+            if link_end is not None:
+                tail = tail[link_end.end() :]
+            rest = html.unescape(cls._TAG.sub(' ', tail))
+            files[name] = ListedFileCVM(
+                name=name,
+                url=url,
+                modified=cls._parse_modified(rest),
+                size=cls._parse_size(rest),
+            )
+
+        return files
+
+    @classmethod
+    def _parse_modified(cls, text: str) -> Optional[str]:
+        match = cls._ISO_DATE.search(text)
+        if match is not None:
+            return f'{match.group(1)}T{match.group(2)}'
+
+        match = cls._NGINX_DATE.search(text)
+        if match is not None:
+            try:
+                day = datetime.strptime(match.group(1), '%d-%b-%Y')
+            except ValueError:
+                return None
+            return f'{day:%Y-%m-%d}T{match.group(2)}'
+
+        return None
+
+    @classmethod
+    def _parse_size(cls, text: str) -> Optional[int]:
+        match = cls._SIZE.search(text.strip())
+        if match is None:
+            return None
+
+        value, unit = match.groups()
+        return int(float(value) * cls._UNITS[unit.upper()])
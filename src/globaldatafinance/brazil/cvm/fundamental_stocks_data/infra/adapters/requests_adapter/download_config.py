@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RetryConfigCVM:
+    """Limits on retrying failed downloads, on top of max_retries.
+
+    Attributes:
+        retry_budget_ratio: Retries allowed per file in a run, on top of
+            min_retry_budget.
+        min_retry_budget: Retries always allowed in a run.
+        circuit_failure_threshold: Consecutive failures (timeouts,
+            dropped connections, 5xx) that make requests to a host fail
+            fast.
+        circuit_reset_timeout: Seconds before a failing host is tried
+            again.
+    """
+
+    retry_budget_ratio: float = 0.2
+    min_retry_budget: int = 10
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+
+
+@dataclass(frozen=True)
+class TransferConfigCVM:
+    """How the bytes of a single file are transferred.
+
+    Attributes:
+        keepalive_expiry: Seconds an idle pooled connection is kept alive
+            for reuse.
+        segmented_download_threshold: Size in bytes from which a file is
+            downloaded as concurrent byte ranges. None always uses a
+            single stream.
+        download_segments: Maximum number of ranges per segmented
+            download.
+        min_throughput: Bytes per second below which a transfer is
+            considered stalled and retried. None disables the check.
+        stall_window: Seconds over which min_throughput is averaged.
+        spool_max_memory: Bytes of a spooled ZIP kept in memory before it
+            overflows to an anonymous temporary file.
+    """
+
+    keepalive_expiry: float = 30.0
+    segmented_download_threshold: Optional[int] = None
+    download_segments: int = 4
+    min_throughput: Optional[float] = 16 * 1024
+    stall_window: float = 30.0
+    spool_max_memory: int = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SchedulingConfigCVM:
+    """When files are downloaded and how many at the same time.
+
+    Attributes:
+        max_concurrent_extractions: Maximum number of ZIPs extracted at
+            the same time, in a thread pool of their own.
+        adaptive_concurrency: Adjust the number of concurrent downloads
+            between min_concurrent and max_concurrent from observed
+            latency, errors and throttling. False keeps it fixed at
+            max_concurrent.
+        min_concurrent: Lower bound for adaptive concurrency.
+        requests_per_second: Download attempts allowed per second and
+            host. None does not pace requests.
+        burst: Attempts allowed in a burst per host (defaults to
+            requests_per_second).
+        hedge_downloads: Race a second request for files slower than the
+            95th percentile of the recent downloads.
+        largest_first: Start the files with the largest expected size
+            first. False keeps the order of the tasks.
+        prefetch_sizes: Ask the server for the size (HEAD) of files
+            neither the listing nor the manifest knows.
+        index_ttl: Seconds a directory listing read by discover_files is
+            reused.
+    """
+
+    max_concurrent_extractions: int = 2
+    adaptive_concurrency: bool = True
+    min_concurrent: int = 1
+    requests_per_second: Optional[float] = None
+    burst: Optional[int] = None
+    hedge_downloads: bool = False
+    largest_first: bool = True
+    prefetch_sizes: bool = False
+    index_ttl: float = 3600.0
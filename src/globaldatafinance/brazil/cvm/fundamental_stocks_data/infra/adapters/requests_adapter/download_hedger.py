@@ -0,0 +1,121 @@
+import asyncio
+import math
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional
+
+from .......core import get_logger
+from .......macro_infra import ConcurrencySlots
+
+logger = get_logger(__name__)
+
+
+class DownloadHedgerCVM:
+    """Races a second copy of downloads that take unusually long.
+
+    Keeps the durations of the recent downloads. Once a download has run
+    for their 95th percentile, run() requests a second copy through an
+    idle download slot; whichever copy completes first is kept and the
+    other one is cancelled. Without enough samples, or without a free
+    slot, the download simply runs alone.
+    """
+
+    SUFFIX = '.hedge'
+    # Completed downloads needed before the p95 is trusted
+    MIN_SAMPLES = 5
+
+    def __init__(self, history: int = 100):
+        self._durations: Deque[float] = deque(maxlen=history)
+
+    def record(self, elapsed: float) -> None:
+        """Add the duration of a completed download."""
+        self._durations.append(elapsed)
+
+    def delay(self) -> Optional[float]:
+        """95th percentile of the recent download times, if known."""
+        if len(self._durations) < self.MIN_SAMPLES:
+            return None
+
+        durations = sorted(self._durations)
+        return durations[math.ceil(0.95 * len(durations)) - 1]
+
+    async def run(
+        self,
+        download: Callable[[str], Awaitable[None]],
+        filepath: str,
+        slots: Optional[ConcurrencySlots],
+        label: str,
+        discard: Callable[[str], None],
+        promote: Callable[[str, str], None],
+    ) -> None:
+        """Download to filepath, racing a second copy if it takes too long.
+
+        Args:
+            download: Downloads the file to the path it is given.
+            filepath: Where the file must end up.
+            slots: Download slots of the run; the second copy needs a free
+                one.
+            label: Name of the file in log messages.
+            discard: Removes a copy that lost or failed.
+            promote: Moves the second copy (first argument) into filepath
+                (second argument) when it wins.
+
+        Raises:
+            Exception: The error of the original request, if both copies
+                fail.
+        """
+        delay = self.delay()
+        primary = asyncio.ensure_future(download(filepath))
+        if delay is None:
+            await primary
+            return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(primary), delay)
+            return
+        except asyncio.TimeoutError:
+            pass
+        except BaseException:
+            primary.cancel()
+            raise
+
+        if slots is None or slots.locked():
+            await primary
+            return
+
+        await slots.acquire()
+        logger.info(
+            f'{label} slower than p95 ({delay:.1f}s); '
+            f'requesting a second copy'
+        )
+        hedge_path = f'{filepath}{self.SUFFIX}'
+        hedge = asyncio.ensure_future(download(hedge_path))
+        pending = {primary, hedge}
+        winner = None
+        try:
+            while winner is None and pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        winner = task
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            slots.release()
+
+        if winner is None:
+            discard(hedge_path)
+            error = primary.exception() or hedge.exception()
+            if error is None:
+                raise IOError(f'No copy of {label} completed')
+            raise error
+
+        if winner is primary:
+            discard(hedge_path)
+            return
+
+        logger.info(f'Second copy of {label} finished first')
+        promote(hedge_path, filepath)
@@ -0,0 +1,203 @@
+import contextlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NotRequired, Optional, TypedDict
+
+from .......core import get_logger
+from .......macro_infra import DownloadInfo
+
+logger = get_logger(__name__)
+
+
+class ManifestEntryCVM(TypedDict):
+    """One downloaded file in a DownloadManifestCVM."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+    sha256: Optional[str]
+    extracted: bool
+    artifacts: List[str]
+    listing: NotRequired[Dict[str, Any]]
+
+
+class DownloadManifestCVM:
+    """Per-destination record of the CVM files already downloaded.
+
+    The manifest lives in a destination directory as
+    ``.download_manifest.json`` and is keyed by URL. Each entry stores the
+    ETag, Last-Modified, size and SHA-256 of the ZIP plus the local
+    artifacts it produced: the ZIP itself, or the Parquet files it was
+    extracted to.
+
+    Conditional request headers are only offered for entries whose
+    artifacts still exist in the requested form (ZIP or Parquet), so
+    deleting the outputs or switching extraction on forces a fresh
+    download.
+
+    Entries may also keep the signature (date and size) the portal's
+    directory listing showed for the file, which lets an unchanged file
+    be skipped without any request.
+    """
+
+    FILENAME = '.download_manifest.json'
+    VERSION = 1
+
+    def __init__(self, directory: Path):
+        self.path = Path(directory) / self.FILENAME
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ManifestEntryCVM] = self._load()
+
+    def get(self, url: str) -> Optional[ManifestEntryCVM]:
+        with self._lock:
+            entry = self._entries.get(url)
+            return entry.copy() if entry is not None else None
+
+    def is_current(self, url: str, extracted: bool) -> bool:
+        """Whether the artifacts recorded for url are still in place.
+
+        Args:
+            url: Source URL
+            extracted: True if the caller wants Parquet output, False if
+                it wants the ZIP file
+        """
+        entry = self.get(url)
+        if entry is None or bool(entry.get('extracted')) != extracted:
+            return False
+
+        artifacts = entry.get('artifacts') or []
+        if not artifacts or not all(Path(a).exists() for a in artifacts):
+            return False
+
+        if not extracted:
+            return Path(artifacts[0]).stat().st_size == entry.get('size')
+
+        return True
+
+    def conditional_headers(self, url: str, extracted: bool) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for url.
+
+        Returns:
+            Headers for a conditional GET, or an empty dict if the file has
+            to be downloaded unconditionally.
+        """
+        if not self.is_current(url, extracted):
+            return {}
+
+        entry = self.get(url)
+        if entry is None:
+            return {}
+
+        headers: Dict[str, str] = {}
+        etag = entry.get('etag')
+        if etag:
+            headers['If-None-Match'] = etag
+        last_modified = entry.get('last_modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def matches_listing(
+        self, url: str, extracted: bool, listing: Dict[str, Any]
+    ) -> bool:
+        """Whether url is in place and the listing still shows it alike."""
+        entry = self.get(url)
+        return (
+            entry is not None
+            and entry.get('listing') == listing
+            and self.is_current(url, extracted)
+        )
+
+    def has_same_content(self, url: str, info: DownloadInfo) -> bool:
+        """Whether a fresh download matches the recorded content hash."""
+        entry = self.get(url)
+        return (
+            entry is not None
+            and info.digest is not None
+            and entry.get('sha256') == info.digest
+            and entry.get('size') == info.bytes_written
+        )
+
+    def record(
+        self,
+        url: str,
+        info: DownloadInfo,
+        artifacts: List[str],
+        extracted: bool,
+        listing: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a completed download and persist the manifest atomically."""
+        entry: ManifestEntryCVM = {
+            'etag': info.etag,
+            'last_modified': info.last_modified,
+            'size': info.bytes_written,
+            'sha256': info.digest,
+            'extracted': extracted,
+            'artifacts': sorted(str(a) for a in artifacts),
+        }
+        if listing is not None:
+            entry['listing'] = listing
+
+        with self._lock:
+            self._entries[url] = entry
+            self._save()
+
+    def refresh(
+        self,
+        url: str,
+        info: DownloadInfo,
+        listing: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Update the validators of an entry found to be unchanged."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            if info.etag:
+                entry['etag'] = info.etag
+            if info.last_modified:
+                entry['last_modified'] = info.last_modified
+            if listing is not None:
+                entry['listing'] = listing
+            self._save()
+
+    def forget(self, url: str) -> None:
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._save()
+
+    def _load(self) -> Dict[str, ManifestEntryCVM]:
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable download manifest: {e}')
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            logger.warning(
+                'Ignoring download manifest with unknown version',
+                extra={'manifest': str(self.path)},
+            )
+            return {}
+
+        entries = data.get('entries', {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_suffix('.json.tmp')
+        data = {'version': self.VERSION, 'entries': self._entries}
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f'Failed to write download manifest: {e}')
+            with contextlib.suppress(Exception):
+                tmp_path.unlink()
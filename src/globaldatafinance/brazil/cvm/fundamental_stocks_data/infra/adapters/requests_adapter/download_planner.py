@@ -0,0 +1,186 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .......core import get_logger
+from .......macro_infra import RequestsAdapter
+from ....domain import DownloadResultCVM
+from .dados_index import DadosIndexCVM, ListedFileCVM
+from .download_manifest import DownloadManifestCVM
+
+logger = get_logger(__name__)
+
+
+class DownloadPlannerCVM:
+    """Chooses which files a download run requests, and in which order.
+
+    With discover_files enabled, the directory listing of every folder in
+    the run is read first through a DadosIndexCVM. Files the listing does
+    not show are reported as unavailable instead of costing a 404 and its
+    retries; the listed ones are kept in listings for the run, so a file
+    whose listed date and size match its manifest entry can be skipped.
+
+    With largest_first enabled, files start in decreasing order of their
+    expected size, taken from the listing, the size recorded in the
+    manifest, or a HEAD request when prefetch_sizes is enabled; files of
+    unknown size go first.
+    """
+
+    def __init__(
+        self,
+        requests_adapter: RequestsAdapter,
+        manifest_for: Callable[[str], Optional[DownloadManifestCVM]],
+        discover_files: bool = False,
+        largest_first: bool = True,
+        prefetch_sizes: bool = False,
+        max_head_requests: int = 10,
+        index_ttl: float = 3600.0,
+    ):
+        """
+        Initializes the planner.
+
+        Args:
+            requests_adapter: Adapter used for listings and HEAD requests.
+            manifest_for: Returns the manifest of a destination directory,
+                or None when conditional requests are disabled.
+            discover_files: Drop the files missing from their listing.
+            largest_first: Order the files by decreasing expected size.
+            prefetch_sizes: HEAD the files of unknown size.
+            max_head_requests: HEAD requests running at the same time.
+            index_ttl: Seconds a directory listing is reused.
+        """
+        self.requests_adapter = requests_adapter
+        self.manifest_for = manifest_for
+        self.discover_files = discover_files
+        self.largest_first = largest_first
+        self.prefetch_sizes = prefetch_sizes
+        self.max_head_requests = max(1, max_head_requests)
+        self.remote_index = DadosIndexCVM(requests_adapter, index_ttl)
+        self.listings: Dict[str, ListedFileCVM] = {}
+
+    async def plan(
+        self, tasks: List[Tuple[str, str, str, str]], result: DownloadResultCVM
+    ) -> List[Tuple[str, str, str, str]]:
+        """Return the tasks to run, in the order they should start.
+
+        Files dropped by discovery are recorded in result as unavailable.
+        """
+        self.listings = {}
+        if self.discover_files:
+            tasks = await self._discover(tasks, result)
+        if self.largest_first:
+            tasks = await self._order_largest_first(tasks)
+        return tasks
+
+    def listed(self, url: str) -> Optional[ListedFileCVM]:
+        """How the run's discovery saw url, if it listed it."""
+        return self.listings.get(url)
+
+    @staticmethod
+    def filename_of(url: str) -> str:
+        return url.split('/')[-1].split('?')[0]
+
+    @classmethod
+    def directory_of(cls, url: str) -> str:
+        return url.split('?')[0][: -len(cls.filename_of(url)) or None]
+
+    async def _discover(
+        self, tasks: List[Tuple[str, str, str, str]], result: DownloadResultCVM
+    ) -> List[Tuple[str, str, str, str]]:
+        """Drop the tasks whose file is missing from its directory listing.
+
+        Directories that cannot be listed are left unfiltered.
+        """
+        directories = sorted({self.directory_of(task[0]) for task in tasks})
+        listings = dict(
+            zip(
+                directories,
+                await asyncio.gather(
+                    *(self.remote_index.list_directory(d) for d in directories)
+                ),
+            )
+        )
+
+        scheduled = []
+        for task in tasks:
+            url, doc_name, year, _ = task
+            listing = listings[self.directory_of(url)]
+            if listing is None:
+                scheduled.append(task)
+                continue
+
+            listed = listing.get(self.filename_of(url))
+            if listed is None:
+                result.add_unavailable_downloads(f'{doc_name}_{year}')
+                logger.info(
+                    f'{doc_name}_{year} is not listed on the server, skipped'
+                )
+                continue
+
+            self.listings[url] = listed
+            scheduled.append(task)
+
+        logger.info(
+            f'Discovery: {len(scheduled)} of {len(tasks)} files are listed '
+            f'in {len(directories)} directories'
+        )
+        return scheduled
+
+    async def _order_largest_first(
+        self, tasks: List[Tuple[str, str, str, str]]
+    ) -> List[Tuple[str, str, str, str]]:
+        """Order tasks by decreasing expected size, unknown sizes first.
+
+        Slots are handed out in request order, so this is also the order
+        in which the downloads start.
+        """
+        sizes = [self._known_size(url, dest) for url, _, _, dest in tasks]
+
+        unknown = [i for i, size in enumerate(sizes) if size is None]
+        if self.prefetch_sizes and unknown:
+            limit = asyncio.Semaphore(self.max_head_requests)
+
+            async def head(url: str) -> Optional[int]:
+                async with limit:
+                    return await self._remote_size(url)
+
+            fetched = await asyncio.gather(
+                *(head(tasks[i][0]) for i in unknown)
+            )
+            for i, size in zip(unknown, fetched):
+                sizes[i] = size
+
+        known = sum(size is not None for size in sizes)
+        logger.info(
+            f'Scheduling {len(tasks)} files largest first '
+            f'({known} with a known size)'
+        )
+        # Files of unknown size are scheduled first, since any of them may
+        # be the largest; known sizes follow, largest first
+        order = sorted(
+            range(len(tasks)),
+            key=lambda i: (sizes[i] is not None, -(sizes[i] or 0)),
+        )
+        return [tasks[i] for i in order]
+
+    def _known_size(self, url: str, dest_path: str) -> Optional[int]:
+        """Size of url from the listing or the last download, if known."""
+        listed = self.listings.get(url)
+        if listed is not None and listed.size is not None:
+            return listed.size
+
+        manifest = self.manifest_for(dest_path)
+        entry = manifest.get(url) if manifest is not None else None
+        size = entry.get('size') if entry is not None else None
+        return size if isinstance(size, int) else None
+
+    async def _remote_size(self, url: str) -> Optional[int]:
+        """Content-Length of a HEAD response, None if unavailable."""
+        try:
+            response = await self.requests_adapter.async_head(url)
+            response.raise_for_status()
+            return int(response.headers['Content-Length'])
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.debug(f'No size for {url}: {type(e).__name__}: {e}')
+            return None
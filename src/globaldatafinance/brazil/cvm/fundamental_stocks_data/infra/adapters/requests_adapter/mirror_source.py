@@ -0,0 +1,110 @@
+import contextlib
+import hashlib
+import os
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import IO, Optional, Union
+from urllib.parse import unquote, urlsplit
+
+import httpx
+
+from .......macro_infra import DownloadInfo
+
+
+class MirrorSourceCVM:
+    """A mirror of the CVM portal tried before the source URL of a file.
+
+    The mirror is another HTTP server, or a local directory (plain path or
+    file:// URL) such as one maintained by SyncMirrorUseCaseCVM. Files keep
+    the path they have on their source URL. Errors that only mean the
+    mirror does not have a file (yet) are told apart from real failures by
+    is_miss(), so the caller can fall back to the source.
+    """
+
+    # Mirror answers that mean the file is not mirrored (yet)
+    MISS_STATUSES = (
+        httpx.codes.FORBIDDEN,
+        httpx.codes.NOT_FOUND,
+        httpx.codes.GONE,
+    )
+    _COPY_CHUNK = 1024 * 1024
+
+    def __init__(self, url: str):
+        self.url = url
+
+    @property
+    def remote(self) -> bool:
+        """Whether the mirror is an HTTP server, not a local directory."""
+        return urlsplit(self.url).scheme in ('http', 'https')
+
+    def locate(self, url: str) -> str:
+        """Location of url on the mirror: a URL or a local file path."""
+        path = urlsplit(url).path
+        if self.remote:
+            return self.url.rstrip('/') + path
+
+        mirror = urlsplit(self.url)
+        root = unquote(mirror.path) if mirror.scheme == 'file' else self.url
+        return str(Path(root) / unquote(path).lstrip('/'))
+
+    @classmethod
+    def is_miss(cls, error: Exception) -> bool:
+        """Whether a mirror error should be retried on the origin."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in cls.MISS_STATUSES
+        return isinstance(
+            error,
+            (FileNotFoundError, NotADirectoryError, httpx.TransportError),
+        )
+
+    @classmethod
+    def copy(
+        cls,
+        source: str,
+        target: Union[str, IO[bytes]],
+        if_modified_since: Optional[str] = None,
+    ) -> DownloadInfo:
+        """Copy a local mirror file to a path or file object.
+
+        Stands in for an HTTP download: the file's modification time is
+        its Last-Modified, so an If-Modified-Since still skips an
+        unchanged file, and the copy is hashed on the way.
+        """
+        started = time.perf_counter()
+        stat = os.stat(source)
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and int(stat.st_mtime) <= since:
+                return DownloadInfo(
+                    bytes_written=0,
+                    last_modified=last_modified,
+                    not_modified=True,
+                )
+
+        hasher = hashlib.sha256()
+        written = 0
+        with open(source, 'rb') as src:
+            out = (
+                open(target, 'wb')
+                if isinstance(target, str)
+                else contextlib.nullcontext(target)
+            )
+            with out as dst:
+                while chunk := src.read(cls._COPY_CHUNK):
+                    dst.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+
+        return DownloadInfo(
+            bytes_written=written,
+            content_length=stat.st_size,
+            last_modified=last_modified,
+            digest=hasher.hexdigest(),
+            transfer_time=time.perf_counter() - started,
+        )
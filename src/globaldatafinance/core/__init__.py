@@ -7,9 +7,13 @@ from .logging_config import (
     setup_logging,
 )
 from .utils import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    HostRateLimiter,
     ResourceLimits,
     ResourceMonitor,
     ResourceState,
+    RetryBudget,
     RetryStrategy,
     SimpleProgressBar,
 )
@@ -25,6 +29,10 @@ __all__ = [
     'remove_file',
     # Utilities
     'RetryStrategy',
+    'RetryBudget',
+    'CircuitBreaker',
+    'AdaptiveConcurrencyLimiter',
+    'HostRateLimiter',
     'SimpleProgressBar',
     'ResourceLimits',
     'ResourceMonitor',
@@ -1,6 +1,9 @@
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker
 from .progress import SimpleProgressBar
+from .rate_limiter import HostRateLimiter, TokenBucket
 from .resource_monitor import ResourceLimits, ResourceMonitor, ResourceState
-from .retry_strategy import RetryStrategy
+from .retry_strategy import RetryBudget, RetryStrategy
 
 __all__ = [
     'SimpleProgressBar',
@@ -8,4 +11,9 @@ __all__ = [
     'ResourceMonitor',
     'ResourceState',
     'RetryStrategy',
+    'RetryBudget',
+    'CircuitBreaker',
+    'AdaptiveConcurrencyLimiter',
+    'HostRateLimiter',
+    'TokenBucket',
 ]
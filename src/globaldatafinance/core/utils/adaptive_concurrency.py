@@ -0,0 +1,165 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """Semaphore sized by an AIMD controller.
+
+    The limit follows additive increase, multiplicative decrease. It
+    offers the same acquire()/release()/locked()/``async with`` interface
+    as asyncio.Semaphore, so it can replace a fixed one:
+
+    - record_success(latency): once limit requests in a row succeeded
+      within latency_tolerance times the best smoothed latency seen, the
+      limit grows by one (about one step per round of requests).
+    - record_congestion(): timeouts, dropped connections and throttling
+      answers (429/503) multiply the limit by decrease_factor. A slow
+      success counts as congestion too. Decreases are applied at most once
+      per cooldown seconds, since the failures of one round usually arrive
+      together.
+
+    The limit stays within [min_limit, max_limit]. Permits already handed
+    out are never revoked; after a decrease, new acquirers wait until the
+    requests in flight drop below the new limit.
+
+    Unlike asyncio.Semaphore it is not bound to an event loop, so one
+    limiter (and what it learned) can be reused across asyncio.run() calls.
+
+    Args:
+        initial: Starting limit
+        min_limit: Lower bound of the limit
+        max_limit: Upper bound of the limit (defaults to initial)
+        decrease_factor: Multiplier applied on congestion
+        latency_tolerance: Latency, relative to the best smoothed latency,
+            above which a success is treated as congestion
+        cooldown: Minimum seconds between two decreases
+        smoothing: Weight of a new sample in the latency moving average
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        smoothing: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit or initial)
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor must be between 0 and 1')
+
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self._clock = clock
+
+        self._limit = min(self.max_limit, max(self.min_limit, initial))
+        self._in_flight = 0
+        self._successes = 0
+        self._latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._last_decrease: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def locked(self) -> bool:
+        """Whether acquire() would have to wait."""
+        return self._in_flight >= self._limit or any(
+            not waiter.done() for waiter in self._waiters
+        )
+
+    async def acquire(self) -> bool:
+        if not self.locked():
+            self._in_flight += 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The permit was handed over just before the cancellation
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+        return True
+
+    def release(self) -> None:
+        if self._in_flight <= 0:
+            raise ValueError('AdaptiveConcurrencyLimiter released too often')
+
+        self._in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """Feed back a successful request and its latency in seconds."""
+        if latency is not None:
+            self._latency = (
+                latency
+                if self._latency is None
+                else self.smoothing * latency
+                + (1 - self.smoothing) * self._latency
+            )
+            if (
+                self._best_latency is None
+                or self._latency < self._best_latency
+            ):
+                self._best_latency = self._latency
+            elif self._latency > self._best_latency * self.latency_tolerance:
+                self.record_congestion()
+                # Let the baseline follow a lasting change in latency
+                self._best_latency = self._latency / self.latency_tolerance
+                return
+
+        self._successes += 1
+        if self._successes >= self._limit and self._limit < self.max_limit:
+            self._limit += 1
+            self._successes = 0
+            self._wake()
+
+    def record_congestion(self) -> None:
+        """Feed back a timeout, dropped connection or throttling answer."""
+        self._successes = 0
+        now = self._clock()
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < self.cooldown
+        ):
+            return
+
+        self._last_decrease = now
+        self._limit = max(
+            self.min_limit, int(self._limit * self.decrease_factor)
+        )
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(True)
@@ -0,0 +1,84 @@
+import time
+from typing import Callable, Dict, Optional
+
+from ...macro_exceptions import CircuitOpenError
+from .rate_limiter import host_of
+
+
+class _HostCircuit:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker for download requests.
+
+    After failure_threshold consecutive failures to a host, its circuit
+    opens and before_request() raises CircuitOpenError for reset_timeout
+    seconds, so a server that is down costs one error per file instead of
+    max_retries attempts. Once reset_timeout has passed, the circuit is
+    half-open: a single request is let through as a probe and the others
+    keep failing fast. The circuit closes if the probe succeeds and opens
+    again if it fails; a probe that never reports back (e.g. cancelled)
+    is replaced by a new one after another reset_timeout.
+
+    Only failures that point at the host (timeouts, dropped connections,
+    5xx answers) should be recorded with record_failure(); any other
+    outcome means the host answered and is recorded with
+    record_success().
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a probe
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._circuits: Dict[str, _HostCircuit] = {}
+
+    def is_open(self, url: str) -> bool:
+        """Whether requests to the host of url currently fail fast."""
+        circuit = self._circuits.get(host_of(url))
+        return circuit is not None and circuit.opened_at is not None
+
+    def before_request(self, url: str) -> None:
+        """Check that a request to the host of url may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open, or
+                half-open with its probe still running
+        """
+        host = host_of(url)
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.opened_at is None:
+            return
+
+        now = self._clock()
+        retry_in = circuit.opened_at + self.reset_timeout - now
+        if retry_in > 0:
+            raise CircuitOpenError(host, retry_in)
+        # This request is the probe; the others wait for its outcome
+        circuit.opened_at = now
+
+    def record_success(self, url: str) -> None:
+        """The host of url answered; close its circuit."""
+        circuit = self._circuits.get(host_of(url))
+        if circuit is not None:
+            circuit.failures = 0
+            circuit.opened_at = None
+
+    def record_failure(self, url: str) -> None:
+        """A request to the host of url failed because of the host."""
+        circuit = self._circuits.setdefault(host_of(url), _HostCircuit())
+        circuit.failures += 1
+        if circuit.failures >= self.failure_threshold:
+            circuit.opened_at = self._clock()
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    """Scheme, host and port of url, the key of per-host state."""
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc.lower()}'
+
+
+class TokenBucket:
+    """Token bucket pacing requests to a single host.
+
+    Tokens are refilled at rate per second up to burst. Each acquire()
+    reserves one token, so concurrent callers are spaced out in the order
+    they arrived instead of all waking at the same moment. pause() blocks
+    the bucket for a while, e.g. for the Retry-After of a 429 response.
+
+    Args:
+        rate: Requests per second, or None to only honour pause()
+        burst: Maximum number of tokens (defaults to max(1, rate))
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.rate = rate
+        self.capacity = float(burst or max(1.0, rate or 1.0))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = self._clock()
+        wait = max(0.0, self._paused_until - now)
+
+        if self.rate is not None:
+            elapsed = now - self._updated
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate
+            )
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+
+        self._updated = now
+        return wait
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for seconds from now."""
+        self._paused_until = max(
+            self._paused_until, self._clock() + max(0.0, seconds)
+        )
+
+
+class HostRateLimiter:
+    """One TokenBucket per host (scheme and port included).
+
+    Args:
+        rate: Requests per second allowed per host, or None for no limit
+            other than the pauses requested by the server
+        burst: Bucket size per host
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = host_of(url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.burst, self._clock)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the host of url is allowed."""
+        await self.bucket(url).acquire()
+
+    def pause(self, url: str, seconds: float) -> None:
+        """Hold all requests to the host of url for seconds."""
+        self.bucket(url).pause(seconds)
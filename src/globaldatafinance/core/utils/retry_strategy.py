@@ -1,4 +1,11 @@
+import builtins
+import random
+from typing import Callable
+
+import httpx
+
 from ...macro_exceptions import (
+    CircuitOpenError,
     DiskFullError,
     NetworkError,
     PathPermissionError,
@@ -9,9 +16,14 @@ from ...macro_exceptions import (
 class RetryStrategy:
     """Handles retry logic and backoff calculations.
 
-    This class determines which exceptions warrant a retry based on their type
-    and error message patterns. It uses the application's standard exception
-    hierarchy (macro_exceptions) to avoid dependencies on external libraries.
+    This class determines which exceptions warrant a retry based on their
+    type: the application's exception hierarchy (macro_exceptions), httpx
+    transport errors and the HTTP status of httpx.HTTPStatusError. Other
+    exceptions fall back to matching known patterns in their message.
+
+    With jitter enabled, calculate_backoff() draws a random delay between
+    zero and the exponential backoff ("full jitter"), so requests that
+    failed together do not all retry at the same instant.
     """
 
     _RETRYABLE_KEYWORDS = [
@@ -24,21 +36,42 @@ class RetryStrategy:
         'try again',
     ]
 
+    RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    # Transport errors that are caused by the request itself
+    _PERMANENT_TRANSPORT_ERRORS = (
+        httpx.LocalProtocolError,
+        httpx.UnsupportedProtocol,
+    )
+
     def __init__(
-        self, initial_backoff: float, max_backoff: float, multiplier: float
+        self,
+        initial_backoff: float,
+        max_backoff: float,
+        multiplier: float,
+        jitter: bool = False,
+        random_source: Callable[[], float] = random.random,
     ):
         self.initial_backoff = initial_backoff
         self.max_backoff = max_backoff
         self.multiplier = multiplier
+        self.jitter = jitter
+        self._random = random_source
 
     def is_retryable(self, exception: Exception) -> bool:
         """Determines if an exception warrants a retry.
 
         An exception is retryable if:
         - It is a NetworkError or TimeoutError (transient network issues)
-        - Its error message contains retryable keywords
+        - It is an httpx.HTTPStatusError with a status in
+          RETRYABLE_STATUS_CODES (timeouts, throttling, 5xx gateway errors)
+        - It is an httpx transport error (connect, read, timeout, remote
+          protocol) or a builtin connection/timeout error
+        - Otherwise, its error message contains retryable keywords
 
-        Non-retryable exceptions: PathPermissionError, DiskFullError, ValueError
+        Non-retryable exceptions: PathPermissionError, DiskFullError,
+        ValueError, CircuitOpenError, other HTTP statuses and other httpx
+        errors (invalid URL, too many redirects, decoding)
 
         Args:
             exception: The exception to evaluate
@@ -47,18 +80,87 @@ class RetryStrategy:
             True if the exception should trigger a retry, False otherwise
         """
         if isinstance(
-            exception, (PathPermissionError, DiskFullError, ValueError)
+            exception,
+            (PathPermissionError, DiskFullError, ValueError, CircuitOpenError),
         ):
             return False
 
         if isinstance(exception, (NetworkError, TimeoutError)):
             return True
 
+        if isinstance(exception, httpx.HTTPStatusError):
+            return (
+                exception.response.status_code in self.RETRYABLE_STATUS_CODES
+            )
+
+        if isinstance(exception, httpx.TransportError):
+            return not isinstance(exception, self._PERMANENT_TRANSPORT_ERRORS)
+
+        if isinstance(
+            exception, (httpx.HTTPError, httpx.InvalidURL, httpx.StreamError)
+        ):
+            return False
+
+        if isinstance(exception, (ConnectionError, builtins.TimeoutError)):
+            return True
+
         # Fallback: check error message for known retryable keywords
         error_msg = str(exception).lower()
         return any(kw in error_msg for kw in self._RETRYABLE_KEYWORDS)
 
     def calculate_backoff(self, retry_count: int) -> float:
-        """Calculates the exponential backoff duration."""
+        """Calculates the exponential backoff duration.
+
+        With jitter, a uniformly random duration between zero and the
+        exponential backoff is returned instead.
+        """
         backoff = self.initial_backoff * (self.multiplier**retry_count)
-        return min(backoff, self.max_backoff)
+        backoff = min(backoff, self.max_backoff)
+        if self.jitter:
+            backoff *= self._random()
+        return backoff
+
+
+class RetryBudget:
+    """Caps the retries of a run relative to its requests.
+
+    Every first attempt deposits ratio retries into the budget; each
+    retry withdraws one. min_retries are always available, so small runs
+    still retry, while a failing server can at most receive
+    (1 + ratio) times the requests of a run plus min_retries, instead of
+    max_retries + 1 times every file.
+
+    Args:
+        ratio: Retries allowed per first attempt
+        min_retries: Retries allowed regardless of the number of requests
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        if ratio < 0:
+            raise ValueError('ratio must not be negative')
+
+        self.ratio = ratio
+        self.min_retries = max(0, min_retries)
+        self.reset()
+
+    @property
+    def available(self) -> float:
+        """Retries that may still be spent."""
+        return self.min_retries + self.ratio * self.requests - self.retries
+
+    def reset(self) -> None:
+        """Start a new run with an empty budget."""
+        self.requests = 0
+        self.retries = 0
+
+    def record_request(self) -> None:
+        """Account for the first attempt of a request."""
+        self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, if any is left."""
+        if self.available < 1:
+            return False
+
+        self.retries += 1
+        return True
@@ -1,4 +1,5 @@
 from .macro_exceptions import (
+    CircuitOpenError,
     CorruptedZipError,
     DiskFullError,
     EmptyDirectoryError,
@@ -8,6 +9,7 @@ from .macro_exceptions import (
     PathIsNotDirectoryError,
     PathPermissionError,
     SecurityError,
+    StalledTransferError,
     TimeoutError,
 )
 
@@ -17,9 +19,11 @@ __all__ = [
     'PathIsNotDirectoryError',
     'PathPermissionError',
     'NetworkError',
+    'StalledTransferError',
     'TimeoutError',
     'DiskFullError',
     'ExtractionError',
     'CorruptedZipError',
     'SecurityError',
+    'CircuitOpenError',
 ]
@@ -32,6 +32,27 @@ class NetworkError(Exception):
         )
 
 
+class StalledTransferError(NetworkError):
+    def __init__(self, doc_name: str, rate: float, min_rate: float):
+        super().__init__(
+            doc_name,
+            f'Transfer stalled at {rate:,.0f} B/s '
+            f'(minimum {min_rate:,.0f} B/s).',
+        )
+        self.rate = rate
+        self.min_rate = min_rate
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"Circuit open for '{host}' after repeated failures; "
+            f'requests fail fast for another {retry_in:.1f}s.'
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
 class TimeoutError(Exception):
     def __init__(self, doc_name: str, timeout: Optional[float] = None):
         msg = f"Timeout while downloading '{doc_name}'."
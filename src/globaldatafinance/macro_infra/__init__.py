@@ -1,5 +1,11 @@
 from .extractor_file import ExtractorAdapter
 from .read_files import ReadFilesAdapter
-from .requests_adapter import RequestsAdapter
+from .requests_adapter import ConcurrencySlots, DownloadInfo, RequestsAdapter
 
-__all__ = ['ExtractorAdapter', 'RequestsAdapter', 'ReadFilesAdapter']
+__all__ = [
+    'ConcurrencySlots',
+    'DownloadInfo',
+    'ExtractorAdapter',
+    'RequestsAdapter',
+    'ReadFilesAdapter',
+]
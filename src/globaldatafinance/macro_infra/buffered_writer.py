@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Tuple
+
+
+class BufferedFileWriter:
+    """Coalesce downloaded chunks and write them on an I/O thread.
+
+    write() appends chunks to an in-memory buffer on the event loop. Once
+    the buffer reaches its target size it is handed to executor, where
+    sink writes it, so slow or network disks never block the loop. At most
+    max_pending buffers are queued per writer; beyond that write() waits
+    for the disk (backpressure) instead of growing memory.
+
+    The target size follows the observed throughput, aiming at one flush
+    every flush_interval seconds within [min_buffer, max_buffer]: slow
+    downloads flush small buffers often, fast ones issue a few large
+    writes instead of one per network chunk.
+
+    sink(data, position) receives each buffer with the file position it
+    starts at, so the same writer serves sequential file objects and
+    positional (pwrite) writes. With a single-thread executor, buffers are
+    written in the order they were submitted.
+
+    Attributes:
+        bytes_written: Bytes written by sink so far
+        write_time: Seconds spent in sink on the I/O thread
+        wait_time: Seconds write()/close() waited for queued buffers
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[bytearray, int], Any],
+        executor: Executor,
+        start: int = 0,
+        name: str = 'file',
+        min_buffer: int = 256 * 1024,
+        max_buffer: int = 4 * 1024 * 1024,
+        max_pending: int = 2,
+        flush_interval: float = 0.25,
+    ):
+        self._sink = sink
+        self._executor = executor
+        self.name = name
+        self.min_buffer = max(1, min_buffer)
+        self.max_buffer = max(self.min_buffer, max_buffer)
+        self.max_pending = max(1, max_pending)
+        self.flush_interval = flush_interval
+
+        self._buffer = bytearray()
+        self._position = start
+        self._pending: Deque[asyncio.Future] = deque()
+        self._target = self.min_buffer
+        self._received = 0
+        self._started = time.perf_counter()
+
+        self.bytes_written = 0
+        self.write_time = 0.0
+        self.wait_time = 0.0
+
+    @property
+    def buffer_size(self) -> int:
+        """Current flush threshold in bytes."""
+        return self._target
+
+    async def write(self, data: bytes) -> None:
+        """Buffer data, flushing to the I/O thread when the buffer is full.
+
+        Raises:
+            OSError: If an earlier buffer failed to be written
+        """
+        self._buffer += data
+        self._received += len(data)
+        if len(self._buffer) >= self._target:
+            await self._flush()
+
+    async def close(self) -> None:
+        """Write the remaining buffer and wait for every queued write.
+
+        Raises:
+            OSError: If a buffer failed to be written
+        """
+        await self._flush()
+        while self._pending:
+            await self._collect()
+
+    async def abort(self) -> None:
+        """Drop the buffer and wait for queued writes, ignoring errors.
+
+        Call this before closing the underlying file after a failure, so
+        no write is still running against it.
+        """
+        self._buffer = bytearray()
+        while self._pending:
+            with contextlib.suppress(Exception):
+                await self._collect()
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        data, self._buffer = self._buffer, bytearray()
+        position = self._position
+        self._position += len(data)
+        self._pending.append(
+            asyncio.get_running_loop().run_in_executor(
+                self._executor, self._write, data, position
+            )
+        )
+        self._adapt()
+
+        while len(self._pending) > self.max_pending or (
+            self._pending and self._pending[0].done()
+        ):
+            await self._collect()
+
+    async def _collect(self) -> None:
+        future = self._pending[0]
+        waited = time.perf_counter()
+        try:
+            # Shielded: a cancelled download leaves the write queued, so
+            # abort() still waits for the thread before the file is closed
+            written, elapsed = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            self._pending.popleft()
+            raise
+        finally:
+            self.wait_time += time.perf_counter() - waited
+
+        self._pending.popleft()
+        self.bytes_written += written
+        self.write_time += elapsed
+
+    def _write(self, data: bytearray, position: int) -> Tuple[int, float]:
+        """Runs on the I/O thread."""
+        started = time.perf_counter()
+        try:
+            self._sink(data, position)
+        except OSError as e:
+            raise OSError(f'Failed to write chunk to {self.name}: {e}') from e
+        return len(data), time.perf_counter() - started
+
+    def _adapt(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        if elapsed <= 0:
+            return
+
+        rate = self._received / elapsed
+        self._target = int(
+            min(
+                self.max_buffer,
+                max(self.min_buffer, rate * self.flush_interval),
+            )
+        )
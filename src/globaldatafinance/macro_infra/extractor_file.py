@@ -1,9 +1,8 @@
 import asyncio
-import io
 import time
 import zipfile
 from pathlib import Path
-from typing import IO, AsyncIterator
+from typing import IO, AsyncIterator, Callable, Dict, Optional
 
 import pyarrow as pa  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
@@ -29,7 +28,7 @@ class ExtractorAdapter:
     """
 
     CHUNK_SIZE_TXT = 8192
-    CHUNK_SIZE_PARQUET = 50000
+    CSV_BLOCK_SIZE = 1024 * 1024
 
     @staticmethod
     def list_files_in_zip(zip_path: str, extension: str) -> list[str]:
@@ -191,47 +190,83 @@ class ExtractorAdapter:
         parquet_path: Path,
         parquet_filename: str,
         csv_filename: str,
+        column_types: Optional[Dict[str, 'pa.DataType']] = None,
+        batch_transform: Optional[
+            Callable[['pa.RecordBatch'], 'pa.RecordBatch']
+        ] = None,
     ) -> None:
         """Extract single CSV from ZIP and convert to Parquet.
 
-        Uses streaming processing to avoid loading entire CSV into memory.
-        Falls back to in-memory processing if streaming fails.
+        The CSV is streamed through pyarrow's multithreaded CSV reader and
+        each record batch is written straight to the Parquet file, so no
+        pandas objects are built and memory stays bounded by the block
+        size. If the streaming read fails (e.g. a column whose inferred type
+        does not hold for later blocks), the file is converted again with
+        every column read as text.
+
+        The member's CRC-32 is checked by zipfile as the stream reaches its
+        end, so the archive needs no separate testzip() pass; a mismatch is
+        raised as zipfile.BadZipFile without the text-column retry.
 
         Args:
             zip_file: Open ZipFile object
             parquet_path: Full path for Parquet file
             parquet_filename: Parquet filename
             csv_filename: Name of CSV file inside ZIP
+            column_types: Optional explicit Arrow types by column name.
+                Listed columns skip type inference; others are inferred.
+            batch_transform: Optional function applied to every record
+                batch before it is written (e.g. value normalisation)
 
         Raises:
             ExtractionError: If CSV can't be read or converted
             DiskFullError: If insufficient disk space
+            zipfile.BadZipFile: If the member fails its CRC-32 check
         """
         logger.debug(
-            f'Processing {csv_filename} with chunk size {self.CHUNK_SIZE_PARQUET}'
+            f'Processing {csv_filename} with block size {self.CSV_BLOCK_SIZE}'
         )
 
         try:
-            # Detect encoding first
-            encoding = ReadFilesAdapter.read_csv_test_encoding(
-                zip_file, csv_filename
-            )
+            encoding = ReadFilesAdapter.detect_encoding(zip_file, csv_filename)
 
-            # Try streaming conversion
             try:
                 self.__stream_csv_to_parquet(
-                    zip_file, csv_filename, parquet_path, encoding
+                    zip_file,
+                    csv_filename,
+                    parquet_path,
+                    encoding,
+                    column_types=column_types,
+                    batch_transform=batch_transform,
                 )
+            except (DiskFullError, zipfile.BadZipFile):
+                raise
             except Exception as stream_error:
                 logger.warning(
                     f'Streaming failed for {csv_filename}, '
-                    f'attempting fallback: {stream_error}'
+                    f'retrying with text columns: {stream_error}'
                 )
 
                 # Clean up partial file before fallback
                 self.__safe_delete_file(parquet_path, max_attempts=3)
 
-        except DiskFullError:
+                if encoding == 'utf-8' and 'utf8' in str(stream_error).lower():
+                    # Non-UTF-8 bytes after the sniffed sample
+                    encoding = 'latin-1'
+
+                header = ReadFilesAdapter.read_csv_header(
+                    zip_file, csv_filename, encoding
+                )
+                self.__stream_csv_to_parquet(
+                    zip_file,
+                    csv_filename,
+                    parquet_path,
+                    encoding,
+                    column_types={name: pa.string() for name in header},
+                    batch_transform=batch_transform,
+                )
+
+        except (DiskFullError, zipfile.BadZipFile):
             self.__safe_delete_file(parquet_path)
             raise
 
@@ -248,14 +283,20 @@ class ExtractorAdapter:
         csv_filename: str,
         parquet_path: Path,
         encoding: str,
+        column_types: Optional[Dict[str, 'pa.DataType']] = None,
+        batch_transform: Optional[
+            Callable[['pa.RecordBatch'], 'pa.RecordBatch']
+        ] = None,
     ) -> None:
-        """Stream CSV to Parquet using chunked processing.
+        """Stream CSV record batches into a Parquet file.
 
         Args:
             zip_file: Open ZipFile object
             csv_filename: CSV filename
             parquet_path: Output Parquet path
             encoding: CSV encoding
+            column_types: Optional explicit column types
+            batch_transform: Optional per-batch transformation
 
         Raises:
             DiskFullError: If disk space exhausted
@@ -266,42 +307,61 @@ class ExtractorAdapter:
         total_rows = 0
 
         try:
+            # The reader must be closed before the ZIP member it reads from
             with zip_file.open(csv_filename) as csv_file:
-                text_wrapper = io.TextIOWrapper(
-                    csv_file, encoding=encoding, newline=''
-                )
+                with ReadFilesAdapter.open_csv_stream(
+                    csv_file,
+                    encoding,
+                    self.CSV_BLOCK_SIZE,
+                    column_types=column_types,
+                ) as reader:
+                    binary = [
+                        field.name
+                        for field in reader.schema
+                        if pa.types.is_binary(field.type)
+                    ]
+                    if binary:
+                        # Arrow infers undecodable text as binary
+                        raise ValueError(
+                            f'invalid UTF8 data in columns {binary}'
+                        )
 
-                csv_reader = ReadFilesAdapter.read_csv_chunk_size(
-                    text_wrapper, chunk_size=self.CHUNK_SIZE_PARQUET
-                )
+                    schema = self.__storage_schema(
+                        reader.schema, column_types or {}
+                    )
+
+                    for batch in reader:
+                        if batch.num_rows == 0:
+                            continue
 
-                for chunk_df in csv_reader:
-                    if len(chunk_df) > 0:
-                        table = pa.Table.from_pandas(chunk_df)
+                        if schema is not reader.schema:
+                            batch = batch.cast(schema)
+                        if batch_transform is not None:
+                            batch = batch_transform(batch)
 
                         if writer is None:
                             writer = pq.ParquetWriter(
                                 parquet_path,
-                                table.schema,
+                                batch.schema,
                                 compression='zstd',
                                 compression_level=3,
                             )
                             logger.debug(f'Created {parquet_path.name}')
 
                         try:
-                            writer.write_table(table)
-                            total_rows += len(chunk_df)
+                            writer.write_batch(batch)
+                            total_rows += batch.num_rows
                         except OSError as e:
                             if 'No space left on device' in str(e):
                                 raise DiskFullError(str(parquet_path))
                             raise
 
-                if writer is not None:
-                    writer.close()
-                    writer_closed = True
-                    logger.debug(
-                        f'Completed {csv_filename}: {total_rows} rows written'
-                    )
+            if writer is not None:
+                writer.close()
+                writer_closed = True
+                logger.debug(
+                    f'Completed {csv_filename}: {total_rows} rows written'
+                )
 
         except Exception:
             if writer is not None and not writer_closed:
@@ -311,6 +371,32 @@ class ExtractorAdapter:
                     logger.error(f'Failed to close writer: {close_err}')
             raise
 
+    @staticmethod
+    def __storage_schema(
+        schema: 'pa.Schema', column_types: Dict[str, 'pa.DataType']
+    ) -> 'pa.Schema':
+        """Keep inferred date and time columns as text, as in the CSV.
+
+        Columns with an explicit type are left as requested.
+        """
+
+        def inferred_temporal(field: 'pa.Field') -> bool:
+            return field.name not in column_types and pa.types.is_temporal(
+                field.type
+            )
+
+        if not any(inferred_temporal(field) for field in schema):
+            return schema
+
+        return pa.schema(
+            [
+                field.with_type(pa.string())
+                if inferred_temporal(field)
+                else field
+                for field in schema
+            ]
+        )
+
     def __safe_delete_file(
         self, file_path: Path, max_attempts: int = 3
     ) -> None:
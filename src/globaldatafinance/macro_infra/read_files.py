@@ -1,7 +1,12 @@
+import codecs
+import csv
 import zipfile
 from io import BytesIO
+from typing import IO, Dict, List, Optional
 
 import pandas as pd  # type: ignore
+import pyarrow as pa  # type: ignore
+import pyarrow.csv as pa_csv  # type: ignore
 
 from ..core import get_logger
 from ..macro_exceptions import ExtractionError
@@ -10,6 +15,104 @@ logger = get_logger(__name__)
 
 
 class ReadFilesAdapter:
+    ENCODING_SAMPLE_SIZE = 64 * 1024
+    CSV_DELIMITER = ';'
+
+    @staticmethod
+    def detect_encoding(
+        zip_file: zipfile.ZipFile,
+        csv_filename: str,
+        sample_size: int = ENCODING_SAMPLE_SIZE,
+    ) -> str:
+        """Sniff the encoding of a CSV file from a single sample read.
+
+        Returns 'utf-8' if the sample has a UTF-8 BOM or decodes cleanly as
+        UTF-8 (which includes plain ASCII), otherwise 'latin-1', the
+        encoding used by CVM and one that can decode any byte sequence.
+
+        Args:
+            zip_file: Open ZipFile object
+            csv_filename: CSV filename
+            sample_size: Number of bytes to inspect
+
+        Returns:
+            Encoding string
+        """
+        with zip_file.open(csv_filename) as csv_file:
+            sample = csv_file.read(sample_size)
+
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8'
+
+        try:
+            # final=False tolerates a character cut at the end of the sample
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            encoding = 'latin-1'
+
+        logger.debug(f'Detected encoding {encoding} for {csv_filename}')
+        return encoding
+
+    @staticmethod
+    def read_csv_header(
+        zip_file: zipfile.ZipFile, csv_filename: str, encoding: str
+    ) -> List[str]:
+        """Read the column names from the first line of a CSV file."""
+        with zip_file.open(csv_filename) as csv_file:
+            first_line = csv_file.readline()
+
+        if first_line.startswith(codecs.BOM_UTF8):
+            first_line = first_line[len(codecs.BOM_UTF8) :]
+
+        text = first_line.decode(encoding).rstrip('\r\n')
+        return next(
+            csv.reader([text], delimiter=ReadFilesAdapter.CSV_DELIMITER),
+            [],
+        )
+
+    @staticmethod
+    def open_csv_stream(
+        csv_file: IO[bytes],
+        encoding: str,
+        block_size: int,
+        column_types: Optional[Dict[str, 'pa.DataType']] = None,
+    ) -> 'pa_csv.CSVStreamingReader':
+        """Open a multithreaded streaming CSV reader over a binary file.
+
+        Blocks of block_size bytes are parsed and converted in parallel and
+        yielded as Arrow record batches. Malformed rows are skipped, like
+        pandas' on_bad_lines='skip'. The caller must close the reader
+        (e.g. with a ``with`` block) before closing csv_file.
+
+        Args:
+            csv_file: Binary file object positioned at the start of the CSV
+            encoding: Encoding returned by detect_encoding()
+            block_size: Bytes per parsing block
+            column_types: Optional explicit column types; columns not
+                listed are inferred from the first block
+
+        Returns:
+            Streaming reader yielding ``pyarrow.RecordBatch`` objects
+        """
+        return pa_csv.open_csv(
+            csv_file,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True,
+                block_size=block_size,
+                encoding=encoding,
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=ReadFilesAdapter.CSV_DELIMITER,
+                newlines_in_values=True,
+                invalid_row_handler=lambda row: 'skip',
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=True,
+            ),
+        )
+
     @staticmethod
     def read_csv_test_encoding(
         zip_file: zipfile.ZipFile, csv_filename: str
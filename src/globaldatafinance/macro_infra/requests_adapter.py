@@ -1,8 +1,88 @@
+import asyncio
 import contextlib
-from typing import Dict, Optional
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 import httpx
 
+from .buffered_writer import BufferedFileWriter
+from .throughput_monitor import ThroughputMonitor
+
+
+class ConcurrencySlots(Protocol):
+    """Permits bounding concurrent connections.
+
+    Satisfied by asyncio.Semaphore and by AdaptiveConcurrencyLimiter.
+    """
+
+    def locked(self) -> bool: ...
+
+    async def acquire(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class DownloadInfo:
+    """Metadata of a completed download, taken from the GET response.
+
+    Attributes:
+        bytes_written: Number of bytes written to disk.
+        content_length: Content-Length announced by the server, if any.
+            None when the body was sent with a Content-Encoding, since the
+            header then describes the encoded size.
+        etag: ETag response header, if any.
+        last_modified: Last-Modified response header, if any.
+        digest: Hex digest of the written bytes, if requested.
+        not_modified: True if the server answered a conditional request
+            with 304 Not Modified; nothing was written.
+        resumed_from: Byte offset a resumed download continued from (0 for
+            a full download).
+        response_time: Seconds from sending the request to receiving the
+            response headers (time to first byte).
+        transfer_time: Seconds from the response headers to the last byte
+            being on disk.
+        write_time: Seconds spent writing to disk on the I/O thread. It
+            overlaps transfer_time, since the network is read meanwhile.
+    """
+
+    bytes_written: int
+    content_length: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: Optional[str] = None
+    not_modified: bool = False
+    resumed_from: int = 0
+    response_time: Optional[float] = None
+    transfer_time: Optional[float] = None
+    write_time: Optional[float] = None
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every announced byte was written."""
+        return (
+            self.content_length is None
+            or self.bytes_written == self.content_length
+        )
+
 
 class RequestsAdapter:
     """
@@ -10,14 +90,46 @@ class RequestsAdapter:
 
     Provides methods for making asynchronous HTTP HEAD requests and file downloads
     with streaming support.
+
+    By default every request uses a short-lived client. Between open() and
+    aclose() (or inside ``async with adapter:`` / ``adapter.session()``) all
+    requests share one pooled client, so connections, TLS sessions and
+    HTTP/2 multiplexing are reused. The pooled client is bound to the event
+    loop it was opened in.
+
+    Downloaded bytes are coalesced by a BufferedFileWriter and written on
+    a dedicated I/O thread, so disk writes never block the event loop.
+
+    With min_throughput set, a body arriving slower than that over
+    stall_window seconds raises StalledTransferError instead of holding
+    the connection until the read timeout. A resumable download keeps
+    what it received, so the retry continues on a fresh connection.
     """
 
+    PART_SUFFIX = '.part'
+    SIDECAR_SUFFIX = '.part.json'
+    THROTTLE_STATUSES = (
+        httpx.codes.TOO_MANY_REQUESTS,
+        httpx.codes.SERVICE_UNAVAILABLE,
+    )
+    _CONTENT_RANGE = re.compile(r'bytes (\d+)-\d+/(\d+|\*)')
+    # Seconds between checks for a permit freed during a segmented download
+    _JOIN_INTERVAL = 0.05
+
     def __init__(
         self,
         timeout: float = 30.0,
         max_redirects: int = 20,
         verify: bool = True,
         http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        min_write_buffer: int = 256 * 1024,
+        max_write_buffer: int = 4 * 1024 * 1024,
+        max_pending_writes: int = 2,
+        min_throughput: Optional[float] = None,
+        stall_window: float = 30.0,
     ):
         """
         Initialize the httpx adapter.
@@ -27,11 +139,180 @@ class RequestsAdapter:
             max_redirects: Maximum number of redirects
             verify: Verify SSL certificates
             http2: Enable HTTP/2
+            max_connections: Maximum number of open connections
+            max_keepalive_connections: Maximum number of idle connections
+                kept alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            min_write_buffer: Smallest buffer handed to the I/O thread
+            max_write_buffer: Largest buffer handed to the I/O thread; the
+                size in between follows the download throughput
+            max_pending_writes: Buffers queued per download before reading
+                from the network waits for the disk
+            min_throughput: Minimum bytes per second a response body must
+                average over stall_window. None (default) disables the
+                check
+            stall_window: Length in seconds of the throughput window
         """
         self.timeout = timeout
         self.max_redirects = max_redirects
         self.verify = verify
         self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._pooled_client: Optional[httpx.AsyncClient] = None
+        self.min_write_buffer = min_write_buffer
+        self.max_write_buffer = max_write_buffer
+        self.max_pending_writes = max_pending_writes
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self.min_throughput = min_throughput
+        self.stall_window = stall_window
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a pooled client is open."""
+        return self._pooled_client is not None
+
+    async def open(self) -> None:
+        """Open the pooled client (no-op if it is already open)."""
+        if self._pooled_client is None:
+            self._pooled_client = self._build_client(self.timeout)
+
+    async def aclose(self) -> None:
+        """Close the pooled client and its connections."""
+        client, self._pooled_client = self._pooled_client, None
+        if client is not None:
+            await client.aclose()
+
+        executor, self._io_executor = self._io_executor, None
+        if executor is not None:
+            # Queued writes still complete; a new thread starts on demand
+            executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'RequestsAdapter':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator['RequestsAdapter']:
+        """Share one pooled client for the duration of the block.
+
+        If a pooled client is already open it is reused and left open, so
+        sessions can be nested inside a longer-lived ``async with``.
+        """
+        if self.is_open:
+            yield self
+            return
+
+        await self.open()
+        try:
+            yield self
+        finally:
+            await self.aclose()
+
+    def _build_client(self, timeout: float) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            max_redirects=self.max_redirects,
+            verify=self.verify,
+            http2=self.http2,
+            limits=self.limits,
+        )
+
+    @contextlib.asynccontextmanager
+    async def _client(
+        self, timeout: Optional[float]
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client, or a short-lived one if none is open."""
+        if self._pooled_client is not None:
+            yield self._pooled_client
+            return
+
+        async with self._build_client(timeout or self.timeout) as client:
+            yield client
+
+    def _writer(
+        self, sink: Any, name: str, start: int = 0
+    ) -> BufferedFileWriter:
+        """Buffered writer feeding sink(data, position) on the I/O thread.
+
+        One thread serves every download of the adapter, so the buffers of
+        a sequential file are written in order.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='download-io'
+            )
+        return BufferedFileWriter(
+            sink,
+            self._io_executor,
+            start=start,
+            name=name,
+            min_buffer=self.min_write_buffer,
+            max_buffer=self.max_write_buffer,
+            max_pending=self.max_pending_writes,
+        )
+
+    def _monitor(self, name: str) -> Optional[ThroughputMonitor]:
+        if self.min_throughput is None:
+            return None
+        return ThroughputMonitor(self.min_throughput, self.stall_window, name)
+
+    @staticmethod
+    async def _pump(
+        response: httpx.Response,
+        writer: BufferedFileWriter,
+        chunk_size: int,
+        hasher: Any = None,
+        limit: Optional[int] = None,
+        monitor: Optional[ThroughputMonitor] = None,
+    ) -> int:
+        """Feed the response body to writer, stopping after limit bytes.
+
+        Returns:
+            Number of bytes handed to writer
+
+        Raises:
+            StalledTransferError: If monitor finds the body too slow
+        """
+        received = 0
+        chunks = response.aiter_bytes(chunk_size=chunk_size)
+        while True:
+            try:
+                if monitor is None:
+                    chunk = await chunks.__anext__()
+                else:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), monitor.window
+                        )
+                    except asyncio.TimeoutError:
+                        raise monitor.idle() from None
+            except StopAsyncIteration:
+                break
+
+            if monitor is not None:
+                monitor.record(len(chunk))
+            if limit is not None:
+                chunk = chunk[: limit - received]
+            if chunk:
+                await writer.write(chunk)
+                received += len(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+            if limit is not None and received >= limit:
+                break
+        return received
+
+    @staticmethod
+    def _request_timeout(timeout: Optional[float]):
+        return httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
 
     async def async_head(
         self,
@@ -54,15 +335,36 @@ class RequestsAdapter:
         Returns:
             httpx.Response: Request response (no body, only headers)
         """
-        async with httpx.AsyncClient(
-            timeout=timeout or self.timeout,
-            follow_redirects=True,
-            max_redirects=self.max_redirects,
-            verify=self.verify,
-            http2=self.http2,
-        ) as client:
+        kwargs.setdefault('timeout', self._request_timeout(timeout))
+        async with self._client(timeout) as client:
             return await client.head(url, headers=headers, **kwargs)
 
+    async def async_get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Asynchronous GET request with the whole body read into memory.
+
+        Meant for small documents such as directory listings; use the
+        download methods for files.
+
+        Args:
+            url: Request URL
+            headers: Custom headers
+            timeout: Specific timeout for this request
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            httpx.Response: Request response with its body loaded
+        """
+        kwargs.setdefault('timeout', self._request_timeout(timeout))
+        async with self._client(timeout) as client:
+            return await client.get(url, headers=headers, **kwargs)
+
     async def async_download_file(
         self,
         url: str,
@@ -70,57 +372,115 @@ class RequestsAdapter:
         chunk_size: int = 8192,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-    ) -> None:
+        digest_algorithm: Optional[str] = None,
+        resume: bool = False,
+    ) -> DownloadInfo:
         """
         Asynchronous file download with streaming.
 
+        Content-Length, ETag and Last-Modified are read from the GET
+        response itself, so no separate HEAD request is needed to validate
+        the download. A 304 answer to a conditional request (If-None-Match /
+        If-Modified-Since in headers) leaves output_path untouched.
+
         Args:
             url: File URL
             output_path: Path to save the file
             chunk_size: Chunk size for streaming
             headers: Custom headers
             timeout: Specific timeout for this request
+            digest_algorithm: Optional hashlib algorithm (e.g. 'sha256')
+                used to hash the body while it is written
+            resume: Write to ``<output_path>.part`` and keep it on failure,
+                with a ``.part.json`` sidecar holding the ETag /
+                Last-Modified. The next call resumes it with ``Range`` and
+                ``If-Range``; if the file changed on the server, it is
+                downloaded again from the start.
+
+        Returns:
+            DownloadInfo with the response headers and bytes written
 
         Raises:
             httpx.HTTPStatusError: If HTTP status indicates error
             httpx.RequestError: If network error occurs
             OSError: If disk write fails
+            StalledTransferError: If the body arrives slower than
+                min_throughput
         """
+        if resume:
+            return await self._download_resumable(
+                url,
+                output_path,
+                chunk_size,
+                headers,
+                timeout,
+                digest_algorithm,
+            )
+
         file_handle = None
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout or self.timeout,
-                follow_redirects=True,
-                max_redirects=self.max_redirects,
-                verify=self.verify,
-                http2=self.http2,
-            ) as client:
+            async with self._client(timeout) as client:
+                started = time.perf_counter()
                 async with client.stream(
-                    'GET', url, headers=headers
+                    'GET',
+                    url,
+                    headers=headers,
+                    timeout=self._request_timeout(timeout),
                 ) as response:
+                    response_time = time.perf_counter() - started
+                    if response.status_code == httpx.codes.NOT_MODIFIED:
+                        return self._download_info(
+                            response,
+                            0,
+                            not_modified=True,
+                            response_time=response_time,
+                        )
+
                     response.raise_for_status()
+                    hasher = (
+                        hashlib.new(digest_algorithm)
+                        if digest_algorithm
+                        else None
+                    )
 
                     # Open file for writing
                     file_handle = open(output_path, 'wb')
+                    handle = file_handle
+                    writer = self._writer(
+                        lambda data, _: handle.write(data), output_path
+                    )
 
                     try:
-                        async for chunk in response.aiter_bytes(
-                            chunk_size=chunk_size
-                        ):
-                            if chunk:
-                                try:
-                                    file_handle.write(chunk)
-                                except OSError as write_err:
-                                    # Critical: disk full, permission error, etc
-                                    raise OSError(
-                                        f'Failed to write chunk to {output_path}: {write_err}'
-                                    ) from write_err
+                        await self._pump(
+                            response,
+                            writer,
+                            chunk_size,
+                            hasher=hasher,
+                            monitor=self._monitor(output_path),
+                        )
+                        # Critical: disk full, permission error, etc.
+                        # surface here as OSError
+                        await writer.close()
+                    except BaseException:
+                        await writer.abort()
+                        raise
                     finally:
                         # Ensure file is closed even on error
                         if file_handle is not None:
                             file_handle.close()
                             file_handle = None
 
+                    return self._download_info(
+                        response,
+                        writer.bytes_written,
+                        hasher.hexdigest() if hasher is not None else None,
+                        response_time=response_time,
+                        transfer_time=(
+                            time.perf_counter() - started - response_time
+                        ),
+                        write_time=writer.write_time,
+                    )
+
         except Exception:
             # Clean up partial file on any error
             if file_handle is not None:
@@ -136,3 +496,733 @@ class RequestsAdapter:
 
             # Re-raise original error
             raise
+
+    async def async_download_to_buffer(
+        self,
+        url: str,
+        buffer: IO[bytes],
+        chunk_size: int = 8192,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        digest_algorithm: Optional[str] = None,
+    ) -> DownloadInfo:
+        """
+        Asynchronous streaming download into a file-like object.
+
+        Like async_download_file(), but the body is written to buffer
+        (e.g. a BytesIO or SpooledTemporaryFile) at its current position
+        instead of a file, so the caller decides whether it ever reaches
+        the disk. A 304 answer writes nothing. On failure buffer may hold
+        part of the body; it is not resumed.
+
+        Args:
+            url: File URL
+            buffer: Writable file-like object receiving the body
+            chunk_size: Chunk size for streaming
+            headers: Custom headers
+            timeout: Specific timeout for this request
+            digest_algorithm: Optional hashlib algorithm (e.g. 'sha256')
+                used to hash the body while it is written
+
+        Returns:
+            DownloadInfo with the response headers and bytes written
+
+        Raises:
+            httpx.HTTPStatusError: If HTTP status indicates error
+            httpx.RequestError: If network error occurs
+            OSError: If writing to buffer fails
+            StalledTransferError: If the body arrives slower than
+                min_throughput
+        """
+        async with self._client(timeout) as client:
+            started = time.perf_counter()
+            async with client.stream(
+                'GET',
+                url,
+                headers=headers,
+                timeout=self._request_timeout(timeout),
+            ) as response:
+                response_time = time.perf_counter() - started
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return self._download_info(
+                        response,
+                        0,
+                        not_modified=True,
+                        response_time=response_time,
+                    )
+
+                response.raise_for_status()
+                hasher = (
+                    hashlib.new(digest_algorithm) if digest_algorithm else None
+                )
+                writer = self._writer(lambda data, _: buffer.write(data), url)
+                try:
+                    await self._pump(
+                        response,
+                        writer,
+                        chunk_size,
+                        hasher=hasher,
+                        monitor=self._monitor(url),
+                    )
+                    await writer.close()
+                except BaseException:
+                    await writer.abort()
+                    raise
+
+                return self._download_info(
+                    response,
+                    writer.bytes_written,
+                    hasher.hexdigest() if hasher is not None else None,
+                    response_time=response_time,
+                    transfer_time=(
+                        time.perf_counter() - started - response_time
+                    ),
+                    write_time=writer.write_time,
+                )
+
+    async def async_download_segmented(
+        self,
+        url: str,
+        output_path: str,
+        segments: int = 4,
+        min_size: int = 64 * 1024 * 1024,
+        chunk_size: int = 65536,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        digest_algorithm: Optional[str] = None,
+        slots: Optional[ConcurrencySlots] = None,
+        join_late: bool = False,
+    ) -> DownloadInfo:
+        """
+        Download a large file as concurrent byte ranges.
+
+        The first request asks for ``bytes=0-``, so its Content-Range tells
+        the file size without a HEAD request. Files smaller than min_size,
+        and servers that answer with a full 200 body, are streamed from that
+        response. Larger files are preallocated and split into segments
+        equal ranges: the first response is read up to the end of the first
+        range while the other ranges are fetched concurrently through the
+        same client and written in place with positional writes. Range
+        requests carry If-Match with the ETag of the first response, so a
+        file replaced on the server mid-download fails with 412 instead of
+        mixing two versions.
+
+        Each extra range worker takes a permit from slots without waiting
+        for one; ranges no worker picked up are fetched one after another by
+        the workers already running. The download thus never uses more
+        connections than the caller's own plus the free permits, and
+        callers queued on slots keep priority over extra ranges. With
+        join_late, permits that become free while the download runs are
+        taken as well, so a large file started while every slot was busy
+        still spreads its remaining ranges over the connections other
+        downloads leave idle.
+
+        The body is written to ``<output_path>.part`` and moved into place
+        once every range is complete. Unlike resume=True in
+        async_download_file(), a failed segmented download is not kept.
+
+        Args:
+            url: File URL
+            output_path: Path to save the file
+            segments: Maximum number of ranges (and connections) per file
+            min_size: Files smaller than this are downloaded in one stream
+            chunk_size: Chunk size for streaming
+            headers: Custom headers, e.g. If-None-Match for a conditional
+                request (a 304 leaves output_path untouched)
+            timeout: Specific timeout for this request
+            digest_algorithm: Optional hashlib algorithm (e.g. 'sha256');
+                the digest is computed from the assembled file
+            slots: Permits bounding the extra range connections, such as
+                an asyncio.Semaphore
+            join_late: Keep recruiting free permits until every range
+                has been started
+
+        Returns:
+            DownloadInfo with the response headers and bytes written.
+            content_length is the size of the whole file.
+
+        Raises:
+            httpx.HTTPStatusError: If HTTP status indicates error
+            httpx.RequestError: If network error occurs
+            IOError: If a range response does not match the request
+            OSError: If disk write fails
+            StalledTransferError: If the body arrives slower than
+                min_throughput
+        """
+        part_path = f'{output_path}{self.PART_SUFFIX}'
+        request_headers = {
+            'Accept-Encoding': 'identity',
+            **(headers or {}),
+            'Range': 'bytes=0-',
+        }
+        flags = (
+            os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        )
+
+        fd: Optional[int] = None
+        workers: List[asyncio.Task] = []
+        recruiter: Optional[asyncio.Task] = None
+
+        async with self._client(timeout) as client:
+            try:
+                started = time.perf_counter()
+                async with client.stream(
+                    'GET',
+                    url,
+                    headers=request_headers,
+                    timeout=self._request_timeout(timeout),
+                ) as response:
+                    response_time = time.perf_counter() - started
+                    if response.status_code == httpx.codes.NOT_MODIFIED:
+                        return self._download_info(
+                            response,
+                            0,
+                            not_modified=True,
+                            response_time=response_time,
+                        )
+
+                    response.raise_for_status()
+                    if self._range_start(response) != 0:
+                        raise IOError(
+                            f'Unexpected Content-Range for {url}: '
+                            f'{response.headers.get("content-range")!r}'
+                        )
+
+                    info = self._download_info(
+                        response, 0, response_time=response_time
+                    )
+                    # Only a 206 tells the size of the whole file
+                    total = (
+                        info.content_length
+                        if response.status_code == httpx.codes.PARTIAL_CONTENT
+                        else None
+                    )
+                    total_size = total if total is not None else 0
+                    ranges = (
+                        self._split_ranges(total_size, segments)
+                        if total is not None and total_size >= min_size
+                        else []
+                    )
+
+                    part_fd = os.open(part_path, flags, 0o644)
+                    fd = part_fd
+                    if len(ranges) < 2:
+                        bytes_written, write_time = await self._write_range(
+                            response, part_fd, 0, None, chunk_size, part_path
+                        )
+                    else:
+                        self._preallocate(part_fd, total_size)
+                        pending = deque(ranges[1:])
+                        write_times: List[float] = []
+                        range_headers = {'Accept-Encoding': 'identity'}
+                        if info.etag and not info.etag.startswith('W/'):
+                            range_headers['If-Match'] = info.etag
+
+                        async def fetch_pending() -> None:
+                            while pending:
+                                start, end = pending.popleft()
+                                try:
+                                    write_times.append(
+                                        await self._fetch_range(
+                                            client,
+                                            url,
+                                            part_fd,
+                                            start,
+                                            end,
+                                            chunk_size,
+                                            range_headers,
+                                            timeout,
+                                            part_path,
+                                        )
+                                    )
+                                except BaseException:
+                                    # Stop the other workers picking up
+                                    # ranges of a download that failed
+                                    pending.clear()
+                                    raise
+
+                        # Without slots every extra range gets a worker
+                        permits: ConcurrencySlots = (
+                            slots
+                            if slots is not None
+                            else asyncio.Semaphore(len(ranges) - 1)
+                        )
+
+                        async def extra_worker() -> None:
+                            try:
+                                await fetch_pending()
+                            finally:
+                                permits.release()
+
+                        for _ in range(len(ranges) - 1):
+                            if permits.locked():
+                                break
+                            await permits.acquire()
+                            workers.append(asyncio.create_task(extra_worker()))
+
+                        async def join_idle_slots() -> None:
+                            while pending and len(workers) < len(ranges) - 1:
+                                if permits.locked():
+                                    await asyncio.sleep(self._JOIN_INTERVAL)
+                                    continue
+                                await permits.acquire()
+                                if not pending:
+                                    permits.release()
+                                    return
+                                workers.append(
+                                    asyncio.create_task(extra_worker())
+                                )
+
+                        if join_late and slots is not None and pending:
+                            recruiter = asyncio.create_task(join_idle_slots())
+
+                        first_start, first_end = ranges[0]
+                        _, first_write_time = await self._write_range(
+                            response,
+                            part_fd,
+                            first_start,
+                            first_end,
+                            chunk_size,
+                            part_path,
+                        )
+                        write_times.append(first_write_time)
+
+                if len(ranges) >= 2:
+                    # The first response is closed, so its connection
+                    # takes the next range
+                    await fetch_pending()
+                    if recruiter is not None:
+                        recruiter.cancel()
+                        await asyncio.gather(recruiter, return_exceptions=True)
+                    await asyncio.gather(*workers)
+                    bytes_written = total_size
+                    write_time = sum(write_times)
+
+            except BaseException:
+                if recruiter is not None:
+                    recruiter.cancel()
+                    await asyncio.gather(recruiter, return_exceptions=True)
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                if fd is not None:
+                    os.close(fd)
+                    fd = None
+                    with contextlib.suppress(OSError):
+                        os.remove(part_path)
+                raise
+
+        os.close(fd)
+        os.replace(part_path, output_path)
+        with contextlib.suppress(OSError):
+            os.remove(f'{output_path}{self.SIDECAR_SUFFIX}')
+
+        digest = (
+            await asyncio.to_thread(
+                self._file_digest, output_path, digest_algorithm
+            )
+            if digest_algorithm
+            else None
+        )
+        return dataclasses.replace(
+            info,
+            bytes_written=bytes_written,
+            digest=digest,
+            transfer_time=time.perf_counter() - started - response_time,
+            write_time=write_time,
+        )
+
+    async def _fetch_range(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        chunk_size: int,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        name: str,
+    ) -> float:
+        """Fetch bytes start-end (inclusive) of url into fd.
+
+        Returns:
+            Seconds spent writing the range to disk
+        """
+        async with client.stream(
+            'GET',
+            url,
+            headers={**headers, 'Range': f'bytes={start}-{end}'},
+            timeout=self._request_timeout(timeout),
+        ) as response:
+            response.raise_for_status()
+            if (
+                response.status_code != httpx.codes.PARTIAL_CONTENT
+                or self._range_start(response) != start
+            ):
+                raise IOError(
+                    f'Server did not honour range {start}-{end} for {url}'
+                )
+            _, write_time = await self._write_range(
+                response, fd, start, end, chunk_size, name
+            )
+            return write_time
+
+    async def _write_range(
+        self,
+        response: httpx.Response,
+        fd: int,
+        start: int,
+        end: Optional[int],
+        chunk_size: int,
+        name: str,
+    ) -> Tuple[int, float]:
+        """Write the body of response at offset start, up to end.
+
+        Returns:
+            Number of bytes written and seconds spent writing them
+
+        Raises:
+            IOError: If the body ends before end
+        """
+        writer = self._writer(
+            lambda data, position: self._write_at(fd, data, position),
+            name,
+            start=start,
+        )
+        limit = None if end is None else end - start + 1
+
+        try:
+            received = await self._pump(
+                response,
+                writer,
+                chunk_size,
+                limit=limit,
+                monitor=self._monitor(name),
+            )
+            await writer.close()
+        except BaseException:
+            await writer.abort()
+            raise
+
+        if limit is not None and received < limit:
+            raise IOError(
+                f'Incomplete range {start}-{end}: {received} of {limit} bytes'
+            )
+        return received, writer.write_time
+
+    @staticmethod
+    def _write_at(fd: int, data: bytes, offset: int) -> None:
+        """Positional write of data at offset (pwrite where available)."""
+        view = memoryview(data)
+        while view:
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(fd, view, offset)
+            else:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, view)
+            view = view[written:]
+            offset += written
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        if hasattr(os, 'posix_fallocate'):
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(fd, 0, size)
+                return
+        os.ftruncate(fd, size)
+
+    @staticmethod
+    def _split_ranges(total: int, segments: int) -> List[Tuple[int, int]]:
+        """Split total bytes into at most segments inclusive ranges."""
+        if total <= 0:
+            return []
+
+        size = -(-total // max(1, segments))
+        return [
+            (start, min(start + size, total) - 1)
+            for start in range(0, total, size)
+        ]
+
+    @staticmethod
+    def _file_digest(path: str, algorithm: str) -> str:
+        hasher = hashlib.new(algorithm)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    async def _download_resumable(
+        self,
+        url: str,
+        output_path: str,
+        chunk_size: int,
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        digest_algorithm: Optional[str],
+    ) -> DownloadInfo:
+        part_path = f'{output_path}{self.PART_SUFFIX}'
+        sidecar_path = f'{output_path}{self.SIDECAR_SUFFIX}'
+        offset, validator = self._resume_point(url, part_path, sidecar_path)
+
+        # Byte offsets only make sense on the unencoded representation
+        request_headers = {'Accept-Encoding': 'identity', **(headers or {})}
+        if offset and validator:
+            request_headers['Range'] = f'bytes={offset}-'
+            request_headers['If-Range'] = validator
+
+        async with self._client(timeout) as client:
+            started = time.perf_counter()
+            async with client.stream(
+                'GET',
+                url,
+                headers=request_headers,
+                timeout=self._request_timeout(timeout),
+            ) as response:
+                response_time = time.perf_counter() - started
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    self._discard_part(part_path, sidecar_path)
+                    return self._download_info(
+                        response,
+                        0,
+                        not_modified=True,
+                        response_time=response_time,
+                    )
+
+                if (
+                    offset
+                    and response.status_code
+                    == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+                ):
+                    restart = True
+                else:
+                    restart = False
+                    response.raise_for_status()
+
+                    start = self._range_start(response)
+                    if start == 0:
+                        # Full body: no range support or the file changed
+                        offset = 0
+                    elif start != offset:
+                        self._discard_part(part_path, sidecar_path)
+                        raise IOError(
+                            f'Unexpected Content-Range for {url}: '
+                            f'{response.headers.get("content-range")!r}'
+                        )
+
+                    info = await self._write_part(
+                        response,
+                        url,
+                        part_path,
+                        sidecar_path,
+                        offset,
+                        chunk_size,
+                        digest_algorithm,
+                        response_time,
+                    )
+
+        if restart:
+            self._discard_part(part_path, sidecar_path)
+            return await self._download_resumable(
+                url,
+                output_path,
+                chunk_size,
+                headers,
+                timeout,
+                digest_algorithm,
+            )
+
+        os.replace(part_path, output_path)
+        with contextlib.suppress(OSError):
+            os.remove(sidecar_path)
+        return info
+
+    async def _write_part(
+        self,
+        response: httpx.Response,
+        url: str,
+        part_path: str,
+        sidecar_path: str,
+        offset: int,
+        chunk_size: int,
+        digest_algorithm: Optional[str],
+        response_time: Optional[float] = None,
+    ) -> DownloadInfo:
+        """Stream a (partial) response body into the .part file."""
+        hasher = hashlib.new(digest_algorithm) if digest_algorithm else None
+        if hasher is not None and offset:
+            with open(part_path, 'rb') as existing:
+                for block in iter(lambda: existing.read(1024 * 1024), b''):
+                    hasher.update(block)
+
+        validator = self._write_sidecar(sidecar_path, url, response)
+        started = time.perf_counter()
+
+        try:
+            with open(part_path, 'ab' if offset else 'wb') as part:
+                writer = self._writer(
+                    lambda data, _: part.write(data), part_path, start=offset
+                )
+                try:
+                    await self._pump(
+                        response,
+                        writer,
+                        chunk_size,
+                        hasher=hasher,
+                        monitor=self._monitor(part_path),
+                    )
+                    await writer.close()
+                except BaseException:
+                    # Keep what was received so the next call resumes from
+                    # it; nothing may still be writing when the file closes
+                    with contextlib.suppress(Exception):
+                        await writer.close()
+                    await writer.abort()
+                    raise
+        except Exception:
+            if validator is None:
+                # Without a validator the partial body cannot be resumed
+                self._discard_part(part_path, sidecar_path)
+            raise
+
+        return self._download_info(
+            response,
+            offset + writer.bytes_written,
+            hasher.hexdigest() if hasher is not None else None,
+            resumed_from=offset,
+            response_time=response_time,
+            transfer_time=time.perf_counter() - started,
+            write_time=writer.write_time,
+        )
+
+    @staticmethod
+    def _resume_point(
+        url: str, part_path: str, sidecar_path: str
+    ) -> Tuple[int, Optional[str]]:
+        """Return the offset and If-Range validator of a kept .part file."""
+        if not os.path.exists(part_path):
+            return 0, None
+
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            size = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            sidecar, size = {}, 0
+
+        if not isinstance(sidecar, dict):
+            sidecar = {}
+
+        validator = sidecar.get('validator')
+        if sidecar.get('url') != url or not validator or size == 0:
+            RequestsAdapter._discard_part(part_path, sidecar_path)
+            return 0, None
+
+        return size, validator
+
+    @staticmethod
+    def _write_sidecar(
+        sidecar_path: str, url: str, response: httpx.Response
+    ) -> Optional[str]:
+        """Persist the If-Range validator of the response being written.
+
+        A weak ETag cannot be used with If-Range, so Last-Modified is used
+        instead when that is all the server offers.
+        """
+        etag = response.headers.get('etag')
+        validator: Optional[str] = (
+            etag
+            if etag and not etag.startswith('W/')
+            else response.headers.get('last-modified')
+        )
+        if validator is None:
+            with contextlib.suppress(OSError):
+                os.remove(sidecar_path)
+            return None
+
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'validator': validator}, f)
+        return validator
+
+    @staticmethod
+    def _discard_part(part_path: str, sidecar_path: str) -> None:
+        for path in (part_path, sidecar_path):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    @classmethod
+    def _range_start(cls, response: httpx.Response) -> int:
+        """First byte of a 206 response (0 for a full response)."""
+        if response.status_code != httpx.codes.PARTIAL_CONTENT:
+            return 0
+
+        match = cls._CONTENT_RANGE.match(
+            response.headers.get('content-range', '')
+        )
+        return int(match.group(1)) if match else -1
+
+    @classmethod
+    def _download_info(
+        cls,
+        response: httpx.Response,
+        bytes_written: int,
+        digest: Optional[str] = None,
+        not_modified: bool = False,
+        resumed_from: int = 0,
+        response_time: Optional[float] = None,
+        transfer_time: Optional[float] = None,
+        write_time: Optional[float] = None,
+    ) -> DownloadInfo:
+        headers = response.headers
+        content_length = None
+
+        if response.status_code == httpx.codes.PARTIAL_CONTENT:
+            # Size of the whole file, not of the returned range
+            match = cls._CONTENT_RANGE.match(headers.get('content-range', ''))
+            if match and match.group(2) != '*':
+                content_length = int(match.group(2))
+        elif not not_modified and not headers.get('content-encoding'):
+            with contextlib.suppress(TypeError, ValueError):
+                content_length = int(headers.get('content-length'))
+
+        return DownloadInfo(
+            bytes_written=bytes_written,
+            content_length=content_length,
+            etag=headers.get('etag'),
+            last_modified=headers.get('last-modified'),
+            digest=digest,
+            not_modified=not_modified,
+            resumed_from=resumed_from,
+            response_time=response_time,
+            transfer_time=transfer_time,
+            write_time=write_time,
+        )
+
+    @classmethod
+    def throttle_delay(cls, exception: BaseException) -> Optional[float]:
+        """Retry-After of a 429/503 error, if exception is one.
+
+        Args:
+            exception: Exception raised by a request
+
+        Returns:
+            Seconds to wait as announced by Retry-After (0.0 if the header
+            is missing or invalid), or None if exception is not a
+            throttling response
+        """
+        if not isinstance(exception, httpx.HTTPStatusError):
+            return None
+        if exception.response.status_code not in cls.THROTTLE_STATUSES:
+            return None
+
+        value = str(exception.response.headers.get('retry-after', '')).strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        if retry_at.tzinfo is None:
+            return 0.0
+        return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,81 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from ..macro_exceptions import StalledTransferError
+
+
+class ThroughputMonitor:
+    """Minimum-throughput floor for one transfer over a sliding window.
+
+    record() is called with every chunk received. Once the transfer has
+    run for a whole window, the bytes received during the last window
+    seconds must average at least min_rate bytes per second, otherwise
+    StalledTransferError is raised so the caller can drop the connection
+    and retry instead of waiting for the read timeout. A transfer that
+    receives nothing at all for a window is reported with idle().
+
+    Args:
+        min_rate: Minimum average throughput in bytes per second
+        window: Length of the sliding window in seconds
+        name: Name of the transfer used in error messages
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        min_rate: float,
+        window: float,
+        name: str = 'transfer',
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if min_rate <= 0:
+            raise ValueError('min_rate must be positive')
+        if window <= 0:
+            raise ValueError('window must be positive')
+
+        self.min_rate = min_rate
+        self.window = window
+        self.name = name
+        self._clock = clock
+        self._started = clock()
+        self._received = 0
+        # (time, bytes received so far); the first sample is the newest
+        # one at least a window old
+        self._samples: Deque[Tuple[float, int]] = deque([(self._started, 0)])
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Bytes per second over the last window, None before a window."""
+        return self._window_rate(self._clock())
+
+    def record(self, nbytes: int) -> None:
+        """Account for nbytes received now.
+
+        Raises:
+            StalledTransferError: If the window throughput is below
+                min_rate
+        """
+        now = self._clock()
+        self._received += nbytes
+        self._samples.append((now, self._received))
+
+        rate = self._window_rate(now)
+        if rate is not None and rate < self.min_rate:
+            raise StalledTransferError(self.name, rate, self.min_rate)
+
+    def idle(self) -> StalledTransferError:
+        """Error for a transfer that received nothing for a window."""
+        return StalledTransferError(self.name, 0.0, self.min_rate)
+
+    def _window_rate(self, now: float) -> Optional[float]:
+        if now - self._started < self.window:
+            return None
+
+        while len(self._samples) > 1 and (
+            self._samples[1][0] <= now - self.window
+        ):
+            self._samples.popleft()
+
+        since, received = self._samples[0]
+        return (self._received - received) / max(now - since, 1e-9)
@@ -1,6 +1,11 @@
 from unittest.mock import Mock, patch
 
+import pytest
+
 from globaldatafinance.application.b3_docs import HistoricalQuotesB3
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    InvalidAssetsName,
+)
 
 
 class TestHistoricalQuotes:
@@ -143,3 +148,159 @@ class TestHistoricalQuotes:
         assert result['success'] is False
         assert result['error_count'] == 1
         assert 'errors' in result
+
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.DownloadCotahistUseCaseB3'
+    )
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.CreateDocsToExtractUseCaseB3'
+    )
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.ExtractHistoricalQuotesUseCaseB3'
+    )
+    def test_extract_downloads_missing_files_first(
+        self,
+        mock_extract_use_case,
+        mock_create_docs_use_case,
+        mock_download_use_case,
+    ):
+        calls = []
+        downloads = {
+            'downloaded': ['/data/cotahist/COTAHIST_A2023.ZIP'],
+            'not_modified': [],
+            'unavailable': [],
+            'errors': {},
+        }
+        mock_download_use_case.return_value.execute_sync.side_effect = (
+            lambda *args: calls.append('download') or downloads
+        )
+        mock_create_docs_use_case.return_value.validate.side_effect = lambda: (
+            calls.append('validate')
+        )
+        mock_create_docs_use_case.return_value.execute.side_effect = lambda: (
+            calls.append('find') or Mock(set_documents_to_download={})
+        )
+        mock_extract_use_case.return_value.execute_sync.return_value = {
+            'total_files': 1,
+            'success_count': 1,
+            'error_count': 0,
+            'total_records': 10,
+            'output_file': '/data/cotahist/cotahist_extracted.parquet',
+        }
+
+        b3 = HistoricalQuotesB3()
+        result = b3.extract(
+            path_of_docs='/data/cotahist',
+            assets_list=['ações'],
+            initial_year=2022,
+            last_year=2023,
+            download_missing=True,
+        )
+
+        mock_download_use_case.return_value.execute_sync.assert_called_once_with(
+            2022, 2023, '/data/cotahist'
+        )
+        assert calls == ['validate', 'download', 'find']
+        assert result['downloads'] == downloads
+
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.DownloadCotahistUseCaseB3'
+    )
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.CreateDocsToExtractUseCaseB3'
+    )
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.ExtractHistoricalQuotesUseCaseB3'
+    )
+    def test_extract_does_not_download_by_default(
+        self,
+        mock_extract_use_case,
+        mock_create_docs_use_case,
+        mock_download_use_case,
+    ):
+        mock_create_docs_use_case.return_value.execute.return_value = Mock(
+            set_documents_to_download={'file1.zip'}
+        )
+        mock_extract_use_case.return_value.execute_sync.return_value = {
+            'total_files': 1,
+            'success_count': 1,
+            'error_count': 0,
+            'total_records': 10,
+            'output_file': '/data/cotahist/cotahist_extracted.parquet',
+        }
+
+        b3 = HistoricalQuotesB3()
+        result = b3.extract(
+            path_of_docs='/data/cotahist',
+            assets_list=['ações'],
+            initial_year=2023,
+        )
+
+        mock_download_use_case.assert_not_called()
+        assert 'downloads' not in result
+
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.DownloadCotahistUseCaseB3'
+    )
+    def test_extract_validates_assets_before_downloading(
+        self, mock_download_use_case, tmp_path
+    ):
+        b3 = HistoricalQuotesB3()
+        with pytest.raises(InvalidAssetsName):
+            b3.extract(
+                path_of_docs=str(tmp_path),
+                assets_list=['not_an_asset'],
+                initial_year=2023,
+                last_year=2023,
+                download_missing=True,
+            )
+
+        mock_download_use_case.assert_not_called()
+
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.ComputeQuotesAnalyticsUseCaseB3'
+    )
+    def test_compute_analytics_delegates_to_use_case(
+        self, mock_analytics_use_case
+    ):
+        mock_analytics_use_case.return_value.execute.return_value = {
+            'total_records': 10
+        }
+
+        b3 = HistoricalQuotesB3()
+        result = b3.compute_analytics(
+            source_file='/output/quotes.parquet',
+            windows=[21],
+            benchmark_ticker='BOVA11',
+        )
+
+        assert result == {'total_records': 10}
+        mock_analytics_use_case.return_value.execute.assert_called_once_with(
+            source_file='/output/quotes.parquet',
+            windows=[21],
+            destination_path=None,
+            output_filename=None,
+            benchmark_ticker='BOVA11',
+        )
+
+    @patch(
+        'globaldatafinance.application.b3_docs.historical_quotes.ExportPriceMatricesUseCaseB3'
+    )
+    def test_export_matrices_delegates_to_use_case(self, mock_export_use_case):
+        mock_export_use_case.return_value.execute.return_value = {
+            'total_dates': 5
+        }
+
+        b3 = HistoricalQuotesB3()
+        result = b3.export_matrices(
+            source_file='/output/quotes.parquet',
+            destination_path='/output/matrices',
+        )
+
+        assert result == {'total_dates': 5}
+        mock_export_use_case.return_value.execute.assert_called_once_with(
+            source_file='/output/quotes.parquet',
+            destination_path='/output/matrices',
+            tickers=None,
+            incremental=True,
+        )
@@ -107,3 +107,36 @@ class TestAsyncDownloadAdapterCVMFileValidation:
         result = adapter._validate_downloaded_file(str(test_file))
 
         assert result is False
+
+    def test_scenario_error_truncated_member(self, adapter, tmp_path):
+        test_file = tmp_path / 'spliced.zip'
+
+        with zipfile.ZipFile(test_file, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('a.csv', 'x' * 1000)
+            zf.writestr('b.csv', 'y' * 1000)
+
+        # Drop bytes from the first member: the central directory is still
+        # readable but points past the shifted local headers
+        data = test_file.read_bytes()
+        test_file.write_bytes(data[:100] + data[400:])
+
+        result = adapter._validate_downloaded_file(str(test_file))
+
+        assert result is False
+
+    def test_scenario_member_crc_is_left_to_extraction(
+        self, adapter, tmp_path
+    ):
+        test_file = tmp_path / 'bad_crc.zip'
+
+        with zipfile.ZipFile(test_file, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('data.csv', 'a;b\n1;2\n')
+
+        data = bytearray(test_file.read_bytes())
+        data[30 + len('data.csv')] ^= 0x01
+        test_file.write_bytes(bytes(data))
+
+        # No member is decompressed here; the extractor checks CRC-32
+        result = adapter._validate_downloaded_file(str(test_file))
+
+        assert result is True
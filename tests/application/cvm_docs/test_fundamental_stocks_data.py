@@ -1,4 +1,6 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 
 from globaldatafinance.application import FundamentalStocksDataCVM
 
@@ -98,6 +100,33 @@ class TestFundamentalStocksData:
 
         assert cvm.download_adapter.automatic_extractor is True
 
+    @patch(
+        'globaldatafinance.application.cvm_docs.fundamental_stocks_data.DownloadDocumentsUseCaseCVM'
+    )
+    def test_download_passes_keep_zip_per_call(self, mock_download_use_case):
+        mock_result = Mock()
+        mock_result.success_count_downloads = 1
+        mock_result.error_count_downloads = 0
+        mock_result.successful_downloads = []
+        mock_result.failed_downloads = {}
+        mock_result.elapsed_time = 0.5
+        mock_download_use_case.return_value.execute.return_value = mock_result
+
+        cvm = FundamentalStocksDataCVM()
+
+        cvm.download(
+            destination_path='/data/cvm',
+            automatic_extractor=True,
+            keep_zip=False,
+        )
+
+        execute = mock_download_use_case.return_value.execute
+        assert execute.call_args.kwargs['keep_zip'] is False
+        assert cvm.download_adapter.keep_zip is True
+
+        with pytest.raises(TypeError):
+            cvm.download(destination_path='/data/cvm', keep_zip='no')
+
     @patch(
         'globaldatafinance.application.cvm_docs.fundamental_stocks_data.DownloadDocumentsUseCaseCVM'
     )
@@ -289,3 +318,94 @@ class TestFundamentalStocksData:
         result = cvm.download(destination_path='/data/cvm')
         assert result is not None
         assert result == mock_result
+
+
+class TestFundamentalStocksDataMirror:
+    def test_mirror_url_is_passed_to_adapter(self):
+        cvm = FundamentalStocksDataCVM(mirror_url='http://mirror.lan:8000')
+
+        assert cvm.download_adapter.mirror.url == 'http://mirror.lan:8000'
+        assert FundamentalStocksDataCVM().download_adapter.mirror is None
+
+    def test_invalid_mirror_url_raises_type_error(self):
+        with pytest.raises(TypeError):
+            FundamentalStocksDataCVM(mirror_url=8000)
+
+    @patch(
+        'globaldatafinance.application.cvm_docs.fundamental_stocks_data.SyncMirrorUseCaseCVM'
+    )
+    def test_sync_mirror_fetches_from_the_portal(self, mock_sync_use_case):
+        mock_result = Mock()
+        mock_result.success_count_downloads = 2
+        mock_result.error_count_downloads = 0
+        mock_sync_use_case.return_value.execute.return_value = mock_result
+
+        cvm = FundamentalStocksDataCVM(mirror_url='/srv/cvm-mirror')
+        with patch.object(cvm, '_FundamentalStocksDataCVM__result_formatter'):
+            result = cvm.sync_mirror(
+                '/srv/cvm-mirror', list_docs=['DFP'], initial_year=2022
+            )
+
+        assert result is mock_result
+        adapter = mock_sync_use_case.call_args.args[0]
+        assert adapter is not cvm.download_adapter
+        assert adapter.mirror is None
+        assert adapter.automatic_extractor is False
+        mock_sync_use_case.return_value.execute.assert_called_once_with(
+            mirror_path='/srv/cvm-mirror',
+            list_docs=['DFP'],
+            initial_year=2022,
+            last_year=None,
+        )
+
+
+class TestFundamentalStocksDataAsync:
+    @pytest.mark.asyncio
+    async def test_context_manager_opens_shared_client(self):
+        cvm = FundamentalStocksDataCVM()
+        requests_adapter = cvm.download_adapter.requests_adapter
+
+        async with cvm as client:
+            assert client is cvm
+            assert requests_adapter.is_open
+
+        assert not requests_adapter.is_open
+
+    @pytest.mark.asyncio
+    @patch(
+        'globaldatafinance.application.cvm_docs.fundamental_stocks_data.DownloadDocumentsUseCaseCVM'
+    )
+    async def test_download_async_calls_execute_async(
+        self, mock_download_use_case
+    ):
+        mock_result = Mock()
+        mock_result.success_count_downloads = 1
+        mock_result.error_count_downloads = 0
+        mock_result.successful_downloads = ['DFP_2023']
+        mock_result.failed_downloads = {}
+        mock_result.elapsed_time = 0.5
+        mock_download_instance = Mock()
+        mock_download_instance.execute_async = AsyncMock(
+            return_value=mock_result
+        )
+        mock_download_use_case.return_value = mock_download_instance
+
+        cvm = FundamentalStocksDataCVM()
+        result = await cvm.download_async(
+            destination_path='/data/cvm',
+            list_docs=['DFP'],
+            automatic_extractor=True,
+        )
+
+        assert result is mock_result
+        assert cvm.download_adapter.automatic_extractor is True
+        mock_download_instance.execute.assert_not_called()
+        call_args = mock_download_instance.execute_async.call_args
+        assert call_args[1]['list_docs'] == ['DFP']
+
+    @pytest.mark.asyncio
+    async def test_download_async_rejects_non_bool_extractor(self):
+        cvm = FundamentalStocksDataCVM()
+
+        with pytest.raises(TypeError):
+            await cvm.download_async('/data', automatic_extractor='yes')
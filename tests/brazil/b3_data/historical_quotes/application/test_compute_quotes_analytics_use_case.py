@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.application.use_cases import (
+    ComputeQuotesAnalyticsUseCaseB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    InvalidAnalyticsWindows,
+)
+
+
+class TestComputeQuotesAnalyticsUseCase:
+    def _use_case(self):
+        use_case = ComputeQuotesAnalyticsUseCaseB3()
+        use_case.analytics_service = Mock()
+        use_case.analytics_service.compute.return_value = {'ok': True}
+        return use_case
+
+    def test_default_output_next_to_source(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        use_case = self._use_case()
+
+        result = use_case.execute(str(source))
+
+        assert result == {'ok': True}
+        kwargs = use_case.analytics_service.compute.call_args.kwargs
+        assert kwargs['output_path'] == tmp_path / 'quotes_analytics.parquet'
+        assert kwargs['windows'] == [21, 63, 252]
+        assert kwargs['benchmark_ticker'] is None
+
+    def test_custom_destination_and_filename(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        destination = tmp_path / 'out'
+        use_case = self._use_case()
+
+        use_case.execute(
+            str(source),
+            windows=[5],
+            destination_path=str(destination),
+            output_filename='stats',
+            benchmark_ticker='BOVA11',
+        )
+
+        kwargs = use_case.analytics_service.compute.call_args.kwargs
+        assert kwargs['output_path'] == destination / 'stats.parquet'
+        assert kwargs['windows'] == [5]
+        assert kwargs['benchmark_ticker'] == 'BOVA11'
+        assert destination.is_dir()
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            self._use_case().execute(str(tmp_path / 'missing.parquet'))
+
+    def test_invalid_windows_raise(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        with pytest.raises(InvalidAnalyticsWindows):
+            self._use_case().execute(str(source), windows=[1])
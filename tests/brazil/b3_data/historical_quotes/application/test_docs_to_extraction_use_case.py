@@ -435,3 +435,38 @@ class TestCreateDocsToExtractUseCaseExecute:
         )
         result = use_case.execute()
         assert len(result.set_assets) == 7
+
+
+class TestCreateDocsToExtractUseCaseValidate:
+    @patch(
+        'globaldatafinance.brazil.b3_data.historical_quotes.application.use_cases.docs_to_extraction_use_case.CreateSetToDownloadUseCaseB3'
+    )
+    def test_validate_does_not_read_path_of_docs(
+        self, mock_set_download, tmp_path
+    ):
+        destination = tmp_path / 'output'
+        use_case = CreateDocsToExtractUseCaseB3(
+            path_of_docs=str(tmp_path / 'missing'),
+            assets_list=['ações'],
+            initial_year=2020,
+            last_year=2021,
+            destination_path=str(destination),
+        )
+
+        set_assets, range_years = use_case.validate()
+
+        assert set_assets == {'ações'}
+        assert range_years == range(2020, 2022)
+        assert destination.is_dir()
+        mock_set_download.execute.assert_not_called()
+
+    def test_validate_raises_invalid_assets_name(self, tmp_path):
+        use_case = CreateDocsToExtractUseCaseB3(
+            path_of_docs=str(tmp_path),
+            assets_list=['not_an_asset'],
+            initial_year=2020,
+            last_year=2021,
+        )
+
+        with pytest.raises(InvalidAssetsName):
+            use_case.validate()
@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.application.use_cases import (
+    DownloadCotahistUseCaseB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    InvalidFirstYear,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    CotahistDownloadAdapterB3,
+)
+
+CURRENT_YEAR_PATH = (
+    'globaldatafinance.brazil.b3_data.historical_quotes.application.'
+    'use_cases.download_cotahist_use_case.YearValidationServiceB3.'
+    'get_current_year'
+)
+
+
+def make_use_case():
+    adapter = CotahistDownloadAdapterB3()
+    adapter.download_files = AsyncMock(  # type: ignore
+        return_value={
+            'downloaded': [],
+            'not_modified': [],
+            'unavailable': [],
+            'errors': {},
+        }
+    )
+    return DownloadCotahistUseCaseB3(adapter), adapter
+
+
+class TestDownloadCotahistUseCaseB3:
+    @patch(CURRENT_YEAR_PATH, return_value=2024)
+    def test_fetches_only_years_without_files(self, _current, tmp_path):
+        (tmp_path / 'COTAHIST_A2020.ZIP').write_bytes(b'')
+        for month in range(1, 13):
+            (tmp_path / f'COTAHIST_M{month:02d}2022.ZIP').write_bytes(b'')
+        # A single trading day does not cover its year
+        (tmp_path / 'COTAHIST_D02012023.ZIP').write_bytes(b'')
+        use_case, adapter = make_use_case()
+
+        result = use_case.execute_sync(2020, 2023, str(tmp_path))
+
+        adapter.download_files.assert_awaited_once_with(
+            ['COTAHIST_A2021.ZIP', 'COTAHIST_A2023.ZIP'],
+            str(tmp_path.resolve()),
+        )
+        assert result['errors'] == {}
+
+    @patch(CURRENT_YEAR_PATH, return_value=2024)
+    def test_revalidates_current_year_file(self, _current, tmp_path):
+        (tmp_path / 'COTAHIST_A2023.ZIP').write_bytes(b'')
+        (tmp_path / 'COTAHIST_A2024.ZIP').write_bytes(b'')
+        use_case, adapter = make_use_case()
+
+        use_case.execute_sync(2023, 2024, str(tmp_path))
+
+        assert adapter.download_files.await_args.args[0] == [
+            'COTAHIST_A2024.ZIP'
+        ]
+
+    @patch(CURRENT_YEAR_PATH, return_value=2024)
+    def test_creates_missing_directory(self, _current, tmp_path):
+        destination = tmp_path / 'new' / 'cotahist'
+        use_case, adapter = make_use_case()
+
+        use_case.execute_sync(2024, 2024, str(destination))
+
+        assert destination.is_dir()
+        assert adapter.download_files.await_args.args[0] == [
+            'COTAHIST_A2024.ZIP'
+        ]
+
+    def test_invalid_year_raises_before_downloading(self, tmp_path):
+        use_case, adapter = make_use_case()
+
+        with pytest.raises(InvalidFirstYear):
+            use_case.execute_sync(1900, 2000, str(tmp_path))
+
+        adapter.download_files.assert_not_awaited()
@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.application.use_cases import (
+    ExportPriceMatricesUseCaseB3,
+)
+
+
+class TestExportPriceMatricesUseCase:
+    def _use_case(self):
+        use_case = ExportPriceMatricesUseCaseB3()
+        use_case.exporter = Mock()
+        use_case.exporter.export.return_value = {'ok': True}
+        return use_case
+
+    def test_default_destination_next_to_source(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        use_case = self._use_case()
+
+        assert use_case.execute(str(source)) == {'ok': True}
+
+        kwargs = use_case.exporter.export.call_args.kwargs
+        assert kwargs['output_dir'] == tmp_path / 'quotes_matrices'
+        assert kwargs['incremental'] is True
+        assert kwargs['tickers'] is None
+        assert (tmp_path / 'quotes_matrices').is_dir()
+
+    def test_forwards_options(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        use_case = self._use_case()
+
+        use_case.execute(
+            str(source),
+            destination_path=str(tmp_path / 'out'),
+            tickers=['PETR4'],
+            incremental=False,
+        )
+
+        kwargs = use_case.exporter.export.call_args.kwargs
+        assert kwargs['output_dir'] == tmp_path / 'out'
+        assert kwargs['tickers'] == ['PETR4']
+        assert kwargs['incremental'] is False
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            self._use_case().execute(str(tmp_path / 'missing.parquet'))
+
+    def test_empty_tickers_raise(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        source.write_bytes(b'')
+        with pytest.raises(ValueError):
+            self._use_case().execute(str(source), tickers=[])
@@ -1,8 +1,11 @@
 import pytest
 
 from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    DuplicateQuotesError,
     EmptyAssetListError,
+    InvalidAnalyticsWindows,
     InvalidAssetsName,
+    InvalidConflictPolicy,
     InvalidFirstYear,
     InvalidLastYear,
 )
@@ -173,3 +176,29 @@ class TestEmptyAssetListError:
         exception = EmptyAssetListError(multiline_message)
         assert multiline_message in str(exception)
         assert '\n' in str(exception)
+
+
+class TestInvalidAnalyticsWindows:
+    def test_exception_message_contains_windows(self):
+        exception = InvalidAnalyticsWindows([0, 21])
+        assert '[0, 21]' in str(exception)
+        assert 'greater than or equal to 2' in str(exception)
+
+    def test_exception_is_exception_type(self):
+        assert isinstance(InvalidAnalyticsWindows([]), Exception)
+
+
+class TestInvalidConflictPolicy:
+    def test_exception_message_lists_valid_policies(self):
+        exception = InvalidConflictPolicy('merge', ['replace', 'skip'])
+        assert 'merge' in str(exception)
+        assert 'replace' in str(exception)
+        assert 'skip' in str(exception)
+
+
+class TestDuplicateQuotesError:
+    def test_exception_message_contains_count_and_path(self):
+        exception = DuplicateQuotesError(3, '/data/out.parquet')
+        assert '3' in str(exception)
+        assert '/data/out.parquet' in str(exception)
+        assert isinstance(exception, Exception)
@@ -0,0 +1,30 @@
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain.services import (
+    AnalyticsConfigServiceB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    InvalidAnalyticsWindows,
+)
+
+
+class TestAnalyticsConfigService:
+    def test_returns_default_windows_when_none(self):
+        result = AnalyticsConfigServiceB3.validate_windows(None)
+        assert result == [21, 63, 252]
+
+    def test_returns_sorted_unique_windows(self):
+        result = AnalyticsConfigServiceB3.validate_windows([63, 5, 21, 5])
+        assert result == [5, 21, 63]
+
+    def test_accepts_tuple(self):
+        result = AnalyticsConfigServiceB3.validate_windows((10, 2))
+        assert result == [2, 10]
+
+    @pytest.mark.parametrize(
+        'windows',
+        [[], [1], [0], [-5], [2.5], ['21'], [True], '21', 21],
+    )
+    def test_rejects_invalid_windows(self, windows):
+        with pytest.raises(InvalidAnalyticsWindows):
+            AnalyticsConfigServiceB3.validate_windows(windows)
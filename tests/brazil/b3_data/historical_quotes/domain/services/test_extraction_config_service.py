@@ -0,0 +1,29 @@
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain.services import (
+    ExtractionConfigServiceB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    InvalidConflictPolicy,
+)
+
+
+class TestValidateConflictPolicy:
+    def test_none_keeps_overwrite_behaviour(self):
+        assert ExtractionConfigServiceB3.validate_conflict_policy(None) is None
+
+    @pytest.mark.parametrize(
+        'policy, expected',
+        [('replace', 'replace'), ('SKIP', 'skip'), ('Error', 'error')],
+    )
+    def test_accepts_valid_policies(self, policy, expected):
+        result = ExtractionConfigServiceB3.validate_conflict_policy(policy)
+        assert result == expected
+
+    def test_rejects_unknown_policy(self):
+        with pytest.raises(InvalidConflictPolicy):
+            ExtractionConfigServiceB3.validate_conflict_policy('merge')
+
+    def test_rejects_non_string(self):
+        with pytest.raises(TypeError):
+            ExtractionConfigServiceB3.validate_conflict_policy(1)
@@ -0,0 +1,19 @@
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain.value_objects import (
+    ConflictPolicyEnumB3,
+)
+
+
+class TestConflictPolicyEnumB3:
+    def test_values(self):
+        assert ConflictPolicyEnumB3.REPLACE == 'replace'
+        assert ConflictPolicyEnumB3.SKIP == 'skip'
+        assert ConflictPolicyEnumB3.ERROR == 'error'
+
+    def test_lookup_by_value(self):
+        assert ConflictPolicyEnumB3('skip') is ConflictPolicyEnumB3.SKIP
+
+    def test_invalid_value_raises(self):
+        with pytest.raises(ValueError):
+            ConflictPolicyEnumB3('merge')
@@ -0,0 +1,252 @@
+import functools
+import json
+import os
+import threading
+import zipfile
+from datetime import date
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    CotahistDownloadAdapterB3,
+)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    failures: dict = {}
+    requests: list = []
+
+    def do_GET(self):
+        type(self).requests.append(
+            (self.path, self.headers.get('If-Modified-Since'))
+        )
+        remaining = type(self).failures.get(self.path, 0)
+        if remaining:
+            type(self).failures[self.path] = remaining - 1
+            self.send_response(503)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def b3_server(tmp_path):
+    """Local stand-in for the B3 portal serving tmp_path/portal."""
+    portal = tmp_path / 'portal'
+    portal.mkdir()
+    QuietHandler.failures = {}
+    QuietHandler.requests = []
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0),
+        functools.partial(QuietHandler, directory=str(portal)),
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield portal, f'http://127.0.0.1:{server.server_address[1]}/SerHist'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def publish(portal: Path, name: str, content: bytes = b'quotes') -> Path:
+    folder = portal / 'SerHist'
+    folder.mkdir(exist_ok=True)
+    path = folder / name
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr(name.replace('.ZIP', '.TXT'), content)
+    return path
+
+
+def make_adapter(base_url: str) -> CotahistDownloadAdapterB3:
+    return CotahistDownloadAdapterB3(
+        base_url=base_url, http2=False, initial_backoff=0.0
+    )
+
+
+def test_file_names():
+    assert (
+        CotahistDownloadAdapterB3.annual_file_name(2024)
+        == 'COTAHIST_A2024.ZIP'
+    )
+    assert (
+        CotahistDownloadAdapterB3.monthly_file_name(2024, 3)
+        == 'COTAHIST_M032024.ZIP'
+    )
+    assert (
+        CotahistDownloadAdapterB3.daily_file_name(date(2024, 1, 2))
+        == 'COTAHIST_D02012024.ZIP'
+    )
+    with pytest.raises(ValueError):
+        CotahistDownloadAdapterB3.monthly_file_name(2024, 13)
+
+
+def test_default_base_url_is_b3_portal():
+    adapter = CotahistDownloadAdapterB3()
+    assert adapter.url_for('COTAHIST_A2024.ZIP') == (
+        'https://bvmf.bmfbovespa.com.br/InstDados/SerHist/COTAHIST_A2024.ZIP'
+    )
+
+
+def test_missing_years(tmp_path):
+    (tmp_path / 'COTAHIST_A2020.ZIP').write_bytes(b'')
+    (tmp_path / 'cotahist_a2021.zip').write_bytes(b'')
+    for month in range(1, 13):
+        (tmp_path / f'COTAHIST_M{month:02d}2022.ZIP').write_bytes(b'')
+
+    assert CotahistDownloadAdapterB3.missing_years(
+        tmp_path, range(2020, 2024)
+    ) == [2023]
+    assert CotahistDownloadAdapterB3.missing_years(
+        tmp_path / 'absent', range(2020, 2022)
+    ) == [2020, 2021]
+
+
+def test_missing_years_ignores_partial_coverage(tmp_path):
+    # '02012024' contains '2012' and a single day does not cover 2024
+    (tmp_path / 'COTAHIST_D02012024.ZIP').write_bytes(b'')
+    (tmp_path / 'COTAHIST_M012020.ZIP').write_bytes(b'')
+    (tmp_path / 'quotes_2021.zip').write_bytes(b'')
+
+    assert CotahistDownloadAdapterB3.missing_years(
+        tmp_path, [2012, 2020, 2021, 2024]
+    ) == [2012, 2020, 2021, 2024]
+
+
+def test_parse_file_name():
+    parse = CotahistDownloadAdapterB3.parse_file_name
+
+    assert parse('COTAHIST_A2024.ZIP') == ('A', date(2024, 1, 1))
+    assert parse('COTAHIST_M032024.ZIP') == ('M', date(2024, 3, 1))
+    assert parse('cotahist_d02012024.zip') == ('D', date(2024, 1, 2))
+    assert parse('COTAHIST_M132024.ZIP') is None
+    assert parse('COTAHIST_2024.ZIP') is None
+
+
+@pytest.mark.asyncio
+async def test_downloads_annual_monthly_and_daily_files(b3_server, tmp_path):
+    portal, base_url = b3_server
+    names = [
+        'COTAHIST_A2023.ZIP',
+        'COTAHIST_M012024.ZIP',
+        'COTAHIST_D02012024.ZIP',
+    ]
+    for name in names:
+        publish(portal, name)
+    destination = tmp_path / 'docs'
+    destination.mkdir()
+
+    result = await make_adapter(base_url).download_files(
+        names + ['COTAHIST_A1985.ZIP'], str(destination)
+    )
+
+    assert sorted(result['downloaded']) == sorted(
+        str(destination / name) for name in names
+    )
+    assert result['unavailable'] == ['COTAHIST_A1985.ZIP']
+    assert result['errors'] == {}
+    for name in names:
+        assert zipfile.is_zipfile(destination / name)
+    assert not list(destination.glob('*.download'))
+
+    manifest = json.loads(
+        (destination / CotahistDownloadAdapterB3.MANIFEST_NAME).read_text()
+    )
+    assert set(manifest) == set(names)
+    assert manifest['COTAHIST_A2023.ZIP']['last_modified']
+
+
+@pytest.mark.asyncio
+async def test_unchanged_file_is_not_downloaded_again(b3_server, tmp_path):
+    portal, base_url = b3_server
+    source = publish(portal, 'COTAHIST_A2024.ZIP')
+    adapter = make_adapter(base_url)
+
+    first = await adapter.download_files(['COTAHIST_A2024.ZIP'], str(tmp_path))
+    second = await adapter.download_files(
+        ['COTAHIST_A2024.ZIP'], str(tmp_path)
+    )
+
+    assert len(first['downloaded']) == 1
+    assert second['downloaded'] == []
+    assert second['not_modified'] == [str(tmp_path / 'COTAHIST_A2024.ZIP')]
+    assert QuietHandler.requests[-1][1] is not None
+
+    # The portal publishes a new version of the current year
+    publish(portal, 'COTAHIST_A2024.ZIP', b'quotes and more quotes')
+    later = source.stat().st_mtime + 3600
+    os.utime(source, (later, later))
+
+    third = await adapter.download_files(['COTAHIST_A2024.ZIP'], str(tmp_path))
+
+    assert third['downloaded'] == [str(tmp_path / 'COTAHIST_A2024.ZIP')]
+    with zipfile.ZipFile(tmp_path / 'COTAHIST_A2024.ZIP') as zf:
+        assert zf.read('COTAHIST_A2024.TXT') == b'quotes and more quotes'
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(b3_server, tmp_path):
+    portal, base_url = b3_server
+    publish(portal, 'COTAHIST_A2022.ZIP')
+    QuietHandler.failures['/SerHist/COTAHIST_A2022.ZIP'] = 2
+
+    result = await make_adapter(base_url).download_files(
+        ['COTAHIST_A2022.ZIP'], str(tmp_path)
+    )
+
+    assert result['downloaded'] == [str(tmp_path / 'COTAHIST_A2022.ZIP')]
+    assert len(QuietHandler.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(b3_server, tmp_path):
+    portal, base_url = b3_server
+    publish(portal, 'COTAHIST_A2022.ZIP')
+    QuietHandler.failures['/SerHist/COTAHIST_A2022.ZIP'] = 10
+    adapter = make_adapter(base_url)
+    adapter.max_retries = 1
+
+    result = await adapter.download_files(
+        ['COTAHIST_A2022.ZIP'], str(tmp_path)
+    )
+
+    assert result['downloaded'] == []
+    assert 'COTAHIST_A2022.ZIP' in result['errors']
+    assert len(QuietHandler.requests) == 2
+    assert not (tmp_path / 'COTAHIST_A2022.ZIP').exists()
+    assert not (tmp_path / 'COTAHIST_A2022.ZIP.download').exists()
+
+
+@pytest.mark.asyncio
+async def test_error_page_instead_of_zip_is_unavailable(b3_server, tmp_path):
+    portal, base_url = b3_server
+    folder = portal / 'SerHist'
+    folder.mkdir()
+    (folder / 'COTAHIST_D01012024.ZIP').write_text('<html>Not found</html>')
+    destination = tmp_path / 'docs'
+    destination.mkdir()
+
+    result = await make_adapter(base_url).download_files(
+        ['COTAHIST_D01012024.ZIP'], str(destination)
+    )
+
+    assert result['unavailable'] == ['COTAHIST_D01012024.ZIP']
+    assert list(destination.iterdir()) == []
+
+
+def test_download_files_sync(b3_server, tmp_path):
+    portal, base_url = b3_server
+    publish(portal, 'COTAHIST_A2021.ZIP')
+
+    result = make_adapter(base_url).download_files_sync(
+        ['COTAHIST_A2021.ZIP', 'COTAHIST_A2021.ZIP'], str(tmp_path)
+    )
+
+    assert result['downloaded'] == [str(tmp_path / 'COTAHIST_A2021.ZIP')]
@@ -71,6 +71,24 @@ class TestCotahistParserB3:
         assert result_020 is not None
         assert result_030 is None
 
+    def test_parse_line_without_filter_returns_all_codes(self, parser):
+        line_030 = '01' + '20230615' + '02' + 'BBAS3       ' + '030'
+        line_030 = line_030 + ' ' * (245 - len(line_030))
+
+        result = parser.parse_line(line_030, None)
+
+        assert result is not None
+        assert result['tipo_mercado'] == '030'
+
+    def test_parse_line_extracts_prazo_termo(self, parser):
+        line = '01' + '20230615' + '02' + 'PETR4T      ' + '030'
+        line = line + 'PETROBRAS   ' + 'PN        ' + '060'
+        line = line + ' ' * (245 - len(line))
+
+        result = parser.parse_line(line, {'030'})
+
+        assert result['prazo_termo'] == '060'
+
     def test_parse_short_line(self, parser, target_codes):
         short_line = '0120230615'
         result = parser.parse_line(short_line, target_codes)
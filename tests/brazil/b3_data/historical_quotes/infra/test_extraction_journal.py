@@ -0,0 +1,297 @@
+import zipfile
+
+import polars as pl
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain import (
+    ConflictPolicyEnumB3,
+    ProcessingModeEnumB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    CotahistParserB3,
+    ExtractionJournalB3,
+    ExtractionServiceB3,
+    ParquetWriterB3,
+    ZipFileReaderB3,
+)
+
+
+def build_cotahist_line(ticker: str) -> str:
+    line = [' '] * 245
+    line[0:2] = list('01')
+    line[2:10] = list('20240102')
+    line[10:12] = list('02')
+    line[12:24] = list(ticker.ljust(12))
+    line[24:27] = list('010')
+    return ''.join(line)
+
+
+def write_zip(path, tickers):
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr(
+            'COTAHIST.TXT',
+            '\n'.join(build_cotahist_line(t) for t in tickers) + '\n',
+        )
+
+
+class FlakyZipReader(ZipFileReaderB3):
+    def __init__(self, failing: set[str] | None = None):
+        self.failing = failing or set()
+        self.calls: list[str] = []
+
+    async def read_lines_from_zip(self, zip_path: str):
+        self.calls.append(zip_path)
+        if zip_path in self.failing:
+            raise OSError('simulated crash')
+        async for line in super().read_lines_from_zip(zip_path):
+            yield line
+
+
+def build_service(zip_reader):
+    return ExtractionServiceB3(
+        zip_reader=zip_reader,
+        parser=CotahistParserB3(),
+        data_writer=ParquetWriterB3(),
+        processing_mode=ProcessingModeEnumB3.SLOW,
+    )
+
+
+class TestExtractionJournal:
+    def test_checkpoint_roundtrip(self, tmp_path):
+        temp_file = tmp_path / 'temp.parquet'
+        pl.DataFrame({'a': [1, 2]}).write_parquet(temp_file)
+        output = tmp_path / 'out.parquet'
+
+        journal = ExtractionJournalB3(output, {'010'})
+        journal.mark_completed('a.zip', str(temp_file), 2)
+
+        reloaded = ExtractionJournalB3(output, {'010'})
+        reloaded.load()
+
+        assert reloaded.get_checkpoint('a.zip') == {
+            'records': 2,
+            'temp_file': str(temp_file),
+        }
+        assert journal.path.name == 'out.parquet.journal.json'
+
+    def test_row_count_mismatch_invalidates_checkpoint(self, tmp_path):
+        temp_file = tmp_path / 'temp.parquet'
+        pl.DataFrame({'a': [1]}).write_parquet(temp_file)
+        journal = ExtractionJournalB3(tmp_path / 'out.parquet', {'010'})
+        journal.mark_completed('a.zip', str(temp_file), 5)
+
+        assert journal.get_checkpoint('a.zip') is None
+
+    def test_truncated_temp_file_invalidates_checkpoint(self, tmp_path):
+        temp_file = tmp_path / 'temp.parquet'
+        pl.DataFrame({'a': list(range(100))}).write_parquet(temp_file)
+        temp_file.write_bytes(temp_file.read_bytes()[:-20])
+        journal = ExtractionJournalB3(tmp_path / 'out.parquet', {'010'})
+        journal.mark_completed('a.zip', str(temp_file), 100)
+
+        assert journal.get_checkpoint('a.zip') is None
+
+    def test_replaced_zip_invalidates_checkpoint(self, tmp_path):
+        zip_file = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(zip_file, ['PETR4'])
+        temp_file = tmp_path / 'temp.parquet'
+        pl.DataFrame({'a': [1]}).write_parquet(temp_file)
+        output = tmp_path / 'out.parquet'
+        ExtractionJournalB3(output, {'010'}).mark_completed(
+            str(zip_file), str(temp_file), 1
+        )
+
+        # Re-downloaded with more trading days
+        write_zip(zip_file, ['PETR4', 'VALE3'])
+        journal = ExtractionJournalB3(output, {'010'})
+        journal.load()
+
+        assert journal.get_checkpoint(str(zip_file)) is None
+
+    def test_journal_for_other_codes_is_ignored(self, tmp_path):
+        temp_file = tmp_path / 'temp.parquet'
+        pl.DataFrame({'a': [1]}).write_parquet(temp_file)
+        output = tmp_path / 'out.parquet'
+        ExtractionJournalB3(output, {'010'}).mark_completed(
+            'a.zip', str(temp_file), 1
+        )
+
+        journal = ExtractionJournalB3(output, {'070'})
+        journal.load()
+
+        assert journal.get_checkpoint('a.zip') is None
+
+    def test_merged_checkpoint_needs_no_temp_file(self, tmp_path):
+        output = tmp_path / 'out.parquet'
+        temp_file = tmp_path / 'temp.parquet'
+        journal = ExtractionJournalB3(output, {'010'})
+        journal.mark_completed('a.zip', str(temp_file), 2)
+        journal.mark_merged(['a.zip'])
+
+        reloaded = ExtractionJournalB3(output, {'010'})
+        reloaded.load()
+
+        assert reloaded.get_checkpoint('a.zip') == {
+            'records': 2,
+            'temp_file': str(temp_file),
+            'merged': True,
+        }
+
+    def test_clear_removes_journal(self, tmp_path):
+        journal = ExtractionJournalB3(tmp_path / 'out.parquet', {'010'})
+        journal.mark_completed('a.zip', str(tmp_path / 'none'), 0)
+        assert journal.path.exists()
+
+        journal.clear()
+
+        assert not journal.path.exists()
+
+
+class TestResumableExtraction:
+    @pytest.mark.asyncio
+    async def test_rerun_skips_completed_zips(self, tmp_path):
+        zip_a = tmp_path / 'COTAHIST_A2023.ZIP'
+        zip_b = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(zip_a, ['PETR4', 'VALE3'])
+        write_zip(zip_b, ['ITUB4'])
+        output = tmp_path / 'out.parquet'
+        zip_files = {str(zip_a), str(zip_b)}
+
+        first_reader = FlakyZipReader(failing={str(zip_b)})
+        first = await build_service(first_reader).extract_from_zip_files(
+            zip_files, {'010'}, output, resume=True
+        )
+
+        assert first['error_count'] == 1
+        journal_path = tmp_path / 'out.parquet.journal.json'
+        assert journal_path.exists()
+        assert (tmp_path / 'out_COTAHIST_A2023_temp.parquet').exists()
+
+        second_reader = FlakyZipReader()
+        second = await build_service(second_reader).extract_from_zip_files(
+            zip_files, {'010'}, output, resume=True
+        )
+
+        assert second_reader.calls == [str(zip_b)]
+        assert second['resumed_count'] == 1
+        assert second['error_count'] == 0
+        assert second['total_records'] == 3
+        assert sorted(pl.read_parquet(output)['ticker'].to_list()) == [
+            'ITUB4',
+            'PETR4',
+            'VALE3',
+        ]
+        assert not journal_path.exists()
+        assert not list(tmp_path.glob('*_temp.parquet'))
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_then_resume_with_on_conflict_error(
+        self, tmp_path
+    ):
+        zip_a = tmp_path / 'COTAHIST_A2023.ZIP'
+        zip_b = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(zip_a, ['PETR4', 'VALE3'])
+        write_zip(zip_b, ['ITUB4'])
+        output = tmp_path / 'out.parquet'
+        zip_files = {str(zip_a), str(zip_b)}
+
+        first = await build_service(
+            FlakyZipReader(failing={str(zip_b)})
+        ).extract_from_zip_files(
+            zip_files,
+            {'010'},
+            output,
+            resume=True,
+            on_conflict=ConflictPolicyEnumB3.ERROR,
+        )
+
+        # The upserted ZIP is committed and no longer pending
+        assert first['error_count'] == 1
+        assert sorted(pl.read_parquet(output)['ticker'].to_list()) == [
+            'PETR4',
+            'VALE3',
+        ]
+        assert not (tmp_path / 'out_COTAHIST_A2023_temp.parquet').exists()
+
+        second_reader = FlakyZipReader()
+        second = await build_service(second_reader).extract_from_zip_files(
+            zip_files,
+            {'010'},
+            output,
+            resume=True,
+            on_conflict=ConflictPolicyEnumB3.ERROR,
+        )
+
+        assert second_reader.calls == [str(zip_b)]
+        assert second['resumed_count'] == 1
+        assert second['error_count'] == 0
+        assert sorted(pl.read_parquet(output)['ticker'].to_list()) == [
+            'ITUB4',
+            'PETR4',
+            'VALE3',
+        ]
+        assert not (tmp_path / 'out.parquet.journal.json').exists()
+        assert not list(tmp_path.glob('*_temp.parquet'))
+
+    @pytest.mark.asyncio
+    async def test_overwrite_rerun_reprocesses_merged_zips(self, tmp_path):
+        zip_a = tmp_path / 'COTAHIST_A2023.ZIP'
+        zip_b = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(zip_a, ['PETR4'])
+        write_zip(zip_b, ['ITUB4'])
+        output = tmp_path / 'out.parquet'
+        zip_files = {str(zip_a), str(zip_b)}
+
+        await build_service(
+            FlakyZipReader(failing={str(zip_b)})
+        ).extract_from_zip_files(
+            zip_files,
+            {'010'},
+            output,
+            resume=True,
+            on_conflict=ConflictPolicyEnumB3.REPLACE,
+        )
+
+        second_reader = FlakyZipReader()
+        await build_service(second_reader).extract_from_zip_files(
+            zip_files, {'010'}, output, resume=True
+        )
+
+        assert sorted(second_reader.calls) == sorted(zip_files)
+        assert sorted(pl.read_parquet(output)['ticker'].to_list()) == [
+            'ITUB4',
+            'PETR4',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_merge_failure_keeps_temp_files_when_resumable(
+        self, tmp_path
+    ):
+        good = tmp_path / 'good_temp.parquet'
+        pl.DataFrame({'a': [1]}).write_parquet(good)
+        corrupt = tmp_path / 'corrupt_temp.parquet'
+        corrupt.write_bytes(b'not parquet')
+
+        service = build_service(FlakyZipReader())
+
+        with pytest.raises(IOError):
+            await service._merge_temp_files_streaming(
+                [good, corrupt], tmp_path / 'out.parquet', resumable=True
+            )
+
+        assert good.exists()
+        assert corrupt.exists()
+        assert not (tmp_path / 'out.parquet').exists()
+
+    @pytest.mark.asyncio
+    async def test_without_resume_no_journal_is_written(self, tmp_path):
+        zip_a = tmp_path / 'COTAHIST_A2023.ZIP'
+        write_zip(zip_a, ['PETR4'])
+        output = tmp_path / 'out.parquet'
+
+        await build_service(FlakyZipReader()).extract_from_zip_files(
+            {str(zip_a)}, {'010'}, output
+        )
+
+        assert output.exists()
+        assert not (tmp_path / 'out.parquet.journal.json').exists()
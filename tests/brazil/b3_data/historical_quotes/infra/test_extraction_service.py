@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -442,7 +443,9 @@ async def test_extract_from_zip_files_success(
 
     service._process_and_write_zip = fake_process  # type: ignore
 
-    async def fake_merge(temp_files: list, final_output: Path) -> int:
+    async def fake_merge(
+        temp_files: list, final_output: Path, resumable: bool = False
+    ) -> int:
         return 3
 
     service._merge_temp_files_streaming = fake_merge  # type: ignore
@@ -566,3 +569,75 @@ def test_extraction_service_cleanup_handles_shutdown_errors(
         service.__del__()
     except Exception as e:
         pytest.fail(f'__del__ should handle shutdown errors gracefully: {e}')
+
+
+def write_zip(path: Path, size: int) -> str:
+    import zipfile
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('COTAHIST.TXT', b'0' * size)
+    return str(path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('slots', [1, 2])
+async def test_extract_from_zip_files_starts_largest_first(
+    monkeypatch, tmp_path, process_pool_spy, slots
+):
+    monitor = FakeResourceMonitor(safe_worker_cap=slots)
+    monkeypatch.setattr(
+        'globaldatafinance.brazil.b3_data.historical_quotes.infra.extraction_service.ResourceMonitor',
+        lambda: monitor,
+    )
+
+    service = ExtractionServiceB3(
+        zip_reader=FakeZipReader(),
+        parser=FakeParser(),
+        data_writer=FakeWriter(),
+        processing_mode=ProcessingModeEnumB3.FAST,
+    )
+    assert service.max_concurrent_files == slots
+
+    async def fake_wait(timeout_seconds: int = 30) -> bool:
+        return True
+
+    service._wait_for_resources = fake_wait  # type: ignore
+
+    started: list[str] = []
+    running = 0
+    peak = 0
+
+    async def fake_process(
+        zip_file: str, target_tpmerc_codes: set[str], output_path: Path
+    ):
+        nonlocal running, peak
+        started.append(Path(zip_file).name)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {'records': 1, 'temp_file': str(tmp_path / 'missing.parquet')}
+
+    service._process_and_write_zip = fake_process  # type: ignore
+
+    broken = tmp_path / 'COTAHIST_A1999.ZIP'
+    broken.write_bytes(b'not a zip')
+    zip_files = {
+        write_zip(tmp_path / 'COTAHIST_A1990.ZIP', 1_000),
+        write_zip(tmp_path / 'COTAHIST_A2024.ZIP', 50_000),
+        write_zip(tmp_path / 'COTAHIST_A2010.ZIP', 20_000),
+        str(broken),
+    }
+
+    result = await service.extract_from_zip_files(
+        zip_files, {'010'}, tmp_path / 'out.parquet'
+    )
+
+    assert result['success_count'] == 4
+    assert started == [
+        'COTAHIST_A2024.ZIP',
+        'COTAHIST_A2010.ZIP',
+        'COTAHIST_A1990.ZIP',
+        'COTAHIST_A1999.ZIP',
+    ]
+    assert peak == slots
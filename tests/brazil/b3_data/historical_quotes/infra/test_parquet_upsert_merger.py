@@ -0,0 +1,254 @@
+import zipfile
+from datetime import date
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain import (
+    ConflictPolicyEnumB3,
+    ProcessingModeEnumB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.exceptions import (
+    DuplicateQuotesError,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    CotahistParserB3,
+    ExtractionServiceB3,
+    ParquetUpsertMergerB3,
+    ParquetWriterB3,
+    ZipFileReaderB3,
+)
+
+
+def quotes(rows, with_prazo=True):
+    data = {
+        'data_pregao': [r[0] for r in rows],
+        'ticker': [r[1] for r in rows],
+        'tipo_mercado': ['010'] * len(rows),
+        'preco_fechamento': [r[2] for r in rows],
+    }
+    if with_prazo:
+        data['prazo_termo'] = [''] * len(rows)
+    return pl.DataFrame(data)
+
+
+JAN = date(2023, 1, 2)
+FEB = date(2024, 2, 1)
+MAR = date(2024, 3, 1)
+
+
+@pytest.fixture
+def existing(tmp_path):
+    path = tmp_path / 'out.parquet'
+    # Two row groups: one for 2023, one for 2024
+    writer = None
+    for frame in (
+        quotes([(JAN, 'PETR4', 1.0)]),
+        quotes([(FEB, 'PETR4', 2.0), (FEB, 'VALE3', 3.0)]),
+    ):
+        table = frame.to_arrow()
+        if writer is None:
+            writer = pq.ParquetWriter(str(path), table.schema)
+        writer.write_table(table)
+    writer.close()
+    return path
+
+
+def write_incoming(tmp_path, rows):
+    path = tmp_path / 'incoming.parquet'
+    quotes(rows).write_parquet(path)
+    return path
+
+
+def read_sorted(path):
+    return pl.read_parquet(path).sort(['data_pregao', 'ticker'])
+
+
+class TestParquetUpsertMerger:
+    def test_replace_overwrites_matching_keys(self, tmp_path, existing):
+        incoming = write_incoming(
+            tmp_path, [(FEB, 'PETR4', 20.0), (MAR, 'PETR4', 30.0)]
+        )
+
+        result = ParquetUpsertMergerB3().merge(
+            incoming, existing, ConflictPolicyEnumB3.REPLACE
+        )
+
+        df = read_sorted(existing)
+        assert df['preco_fechamento'].to_list() == [1.0, 20.0, 3.0, 30.0]
+        assert result == {
+            'total_records': 4,
+            'inserted': 2,
+            'replaced': 1,
+            'skipped': 0,
+        }
+
+    def test_skip_keeps_existing_records(self, tmp_path, existing):
+        incoming = write_incoming(
+            tmp_path, [(FEB, 'PETR4', 20.0), (MAR, 'PETR4', 30.0)]
+        )
+
+        result = ParquetUpsertMergerB3().merge(
+            incoming, existing, ConflictPolicyEnumB3.SKIP
+        )
+
+        df = read_sorted(existing)
+        assert df['preco_fechamento'].to_list() == [1.0, 2.0, 3.0, 30.0]
+        assert result['inserted'] == 1
+        assert result['skipped'] == 1
+
+    def test_error_policy_leaves_existing_untouched(self, tmp_path, existing):
+        before = existing.read_bytes()
+        incoming = write_incoming(tmp_path, [(FEB, 'VALE3', 9.0)])
+
+        with pytest.raises(DuplicateQuotesError):
+            ParquetUpsertMergerB3().merge(
+                incoming, existing, ConflictPolicyEnumB3.ERROR
+            )
+
+        assert existing.read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'incoming.parquet',
+            'out.parquet',
+        ]
+
+    def test_error_policy_without_conflicts_appends(self, tmp_path, existing):
+        incoming = write_incoming(tmp_path, [(MAR, 'VALE3', 9.0)])
+
+        result = ParquetUpsertMergerB3().merge(
+            incoming, existing, ConflictPolicyEnumB3.ERROR
+        )
+
+        assert result['total_records'] == 4
+
+    def test_incoming_duplicates_are_removed(self, tmp_path):
+        incoming = write_incoming(
+            tmp_path, [(MAR, 'PETR4', 1.0), (MAR, 'PETR4', 2.0)]
+        )
+        output = tmp_path / 'new.parquet'
+
+        result = ParquetUpsertMergerB3().merge(
+            incoming, output, ConflictPolicyEnumB3.REPLACE
+        )
+
+        assert pl.read_parquet(output)['preco_fechamento'].to_list() == [2.0]
+        assert result['total_records'] == 1
+
+    def test_existing_file_without_prazo_termo(self, tmp_path):
+        output = tmp_path / 'out.parquet'
+        quotes([(FEB, 'PETR4', 2.0)], with_prazo=False).write_parquet(output)
+        incoming = write_incoming(tmp_path, [(FEB, 'PETR4', 20.0)])
+
+        ParquetUpsertMergerB3().merge(
+            incoming, output, ConflictPolicyEnumB3.REPLACE
+        )
+
+        df = pl.read_parquet(output)
+        assert df['preco_fechamento'].to_list() == [20.0]
+        assert df['prazo_termo'].to_list() == ['']
+
+    def test_prazo_termo_is_part_of_the_key(self, tmp_path, existing):
+        incoming = tmp_path / 'incoming.parquet'
+        quotes([(FEB, 'PETR4', 5.0)]).with_columns(
+            pl.lit('030').alias('prazo_termo')
+        ).write_parquet(incoming)
+
+        result = ParquetUpsertMergerB3().merge(
+            incoming, existing, ConflictPolicyEnumB3.ERROR
+        )
+
+        assert result['total_records'] == 4
+
+
+def write_cotahist_zip(path, day, tickers, close=0):
+    lines = []
+    for ticker in tickers:
+        line = [' '] * 245
+        line[0:2] = list('01')
+        line[2:10] = list(day)
+        line[10:12] = list('02')
+        line[12:24] = list(ticker.ljust(12))
+        line[24:27] = list('010')
+        line[108:121] = list(f'{close:013d}')
+        lines.append(''.join(line))
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('COTAHIST.TXT', '\n'.join(lines) + '\n')
+
+
+def build_service():
+    return ExtractionServiceB3(
+        zip_reader=ZipFileReaderB3(),
+        parser=CotahistParserB3(),
+        data_writer=ParquetWriterB3(),
+        processing_mode=ProcessingModeEnumB3.SLOW,
+    )
+
+
+class TestExtractionWithConflictPolicy:
+    @pytest.mark.asyncio
+    async def test_reextraction_does_not_duplicate(self, tmp_path):
+        annual = tmp_path / 'COTAHIST_A2024.ZIP'
+        daily = tmp_path / 'COTAHIST_D02012024.ZIP'
+        write_cotahist_zip(annual, '20240102', ['PETR4', 'VALE3'])
+        write_cotahist_zip(daily, '20240102', ['PETR4'])
+        output = tmp_path / 'out.parquet'
+
+        first = await build_service().extract_from_zip_files(
+            {str(annual)}, {'010'}, output
+        )
+        second = await build_service().extract_from_zip_files(
+            {str(annual), str(daily)},
+            {'010'},
+            output,
+            on_conflict=ConflictPolicyEnumB3.REPLACE,
+        )
+
+        assert first['total_records'] == 2
+        assert second['total_records'] == 2
+        assert pl.read_parquet(output).height == 2
+        assert not list(tmp_path.glob('*_tmp*'))
+
+    @pytest.mark.asyncio
+    async def test_daily_file_wins_over_annual_file(self, tmp_path):
+        annual = tmp_path / 'COTAHIST_A2024.ZIP'
+        daily = tmp_path / 'COTAHIST_D02012024.ZIP'
+        write_cotahist_zip(annual, '20240102', ['PETR4'], close=1000)
+        # Larger, so it is scheduled and completed before the annual file
+        write_cotahist_zip(
+            daily,
+            '20240102',
+            ['PETR4'] + [f'TICK{i}' for i in range(50)],
+            close=1100,
+        )
+        output = tmp_path / 'out.parquet'
+
+        await build_service().extract_from_zip_files(
+            {str(annual), str(daily)},
+            {'010'},
+            output,
+            on_conflict=ConflictPolicyEnumB3.REPLACE,
+        )
+
+        petr4 = pl.read_parquet(output).filter(pl.col('ticker') == 'PETR4')
+        assert petr4.height == 1
+        assert float(petr4['preco_fechamento'][0]) == 11.0
+
+    @pytest.mark.asyncio
+    async def test_error_policy_raises_on_existing_records(self, tmp_path):
+        annual = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_cotahist_zip(annual, '20240102', ['PETR4'])
+        output = tmp_path / 'out.parquet'
+        await build_service().extract_from_zip_files(
+            {str(annual)}, {'010'}, output
+        )
+
+        with pytest.raises(DuplicateQuotesError):
+            await build_service().extract_from_zip_files(
+                {str(annual)},
+                {'010'},
+                output,
+                on_conflict=ConflictPolicyEnumB3.ERROR,
+            )
+
+        assert pl.read_parquet(output).height == 1
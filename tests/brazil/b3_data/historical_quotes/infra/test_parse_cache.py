@@ -0,0 +1,137 @@
+import os
+import zipfile
+
+import polars as pl
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.domain import (
+    ProcessingModeEnumB3,
+)
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    CotahistParserB3,
+    ExtractionServiceB3,
+    ParquetWriterB3,
+    ParseCacheB3,
+    ZipFileReaderB3,
+)
+
+
+def build_cotahist_line(ticker: str, tpmerc: str) -> str:
+    line = [' '] * 245
+    line[0:2] = list('01')
+    line[2:10] = list('20240102')
+    line[10:12] = list('02')
+    line[12:24] = list(ticker.ljust(12))
+    line[24:27] = list(tpmerc)
+    line[108:121] = list('0000000001234')
+    return ''.join(line)
+
+
+def write_zip(path, lines):
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('COTAHIST.TXT', '\n'.join(lines) + '\n')
+
+
+class CountingZipReader(ZipFileReaderB3):
+    def __init__(self):
+        self.calls = 0
+
+    async def read_lines_from_zip(self, zip_path: str):
+        self.calls += 1
+        async for line in super().read_lines_from_zip(zip_path):
+            yield line
+
+
+class TestParseCache:
+    def test_cache_key_includes_parser_version(self, tmp_path):
+        zip_path = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(zip_path, [build_cotahist_line('PETR4', '010')])
+
+        key = ParseCacheB3(tmp_path / 'cache').cache_key(str(zip_path))
+
+        assert key.endswith(f'-v{CotahistParserB3.PARSER_VERSION}')
+
+    def test_cache_key_is_content_addressed(self, tmp_path):
+        first = tmp_path / 'a.zip'
+        second = tmp_path / 'b.zip'
+        write_zip(first, [build_cotahist_line('PETR4', '010')])
+        second.write_bytes(first.read_bytes())
+        cache = ParseCacheB3(tmp_path / 'cache')
+
+        assert cache.cache_key(str(first)) == cache.cache_key(str(second))
+
+    def test_cache_key_changes_when_zip_changes(self, tmp_path):
+        zip_path = tmp_path / 'a.zip'
+        write_zip(zip_path, [build_cotahist_line('PETR4', '010')])
+        cache = ParseCacheB3(tmp_path / 'cache')
+        before = cache.cache_key(str(zip_path))
+
+        write_zip(zip_path, [build_cotahist_line('VALE3', '010')])
+        stat = zip_path.stat()
+        os.utime(zip_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.cache_key(str(zip_path)) != before
+
+    def test_materialize_filters_by_tpmerc(self, tmp_path):
+        cache = ParseCacheB3(tmp_path / 'cache')
+        key = 'abc-v1'
+        pl.DataFrame(
+            {'ticker': ['PETR4', 'PETR4F'], 'tipo_mercado': ['010', '020']}
+        ).write_parquet(cache.cached_path(key))
+        output = tmp_path / 'out.parquet'
+
+        records = cache.materialize(key, {'020'}, output)
+
+        assert records == 1
+        assert pl.read_parquet(output)['ticker'].to_list() == ['PETR4F']
+
+    def test_materialize_without_matches_writes_nothing(self, tmp_path):
+        cache = ParseCacheB3(tmp_path / 'cache')
+        key = 'abc-v1'
+        pl.DataFrame(
+            {'ticker': ['PETR4'], 'tipo_mercado': ['010']}
+        ).write_parquet(cache.cached_path(key))
+        output = tmp_path / 'out.parquet'
+
+        assert cache.materialize(key, {'070'}, output) == 0
+        assert not output.exists()
+
+
+class TestExtractionWithParseCache:
+    @pytest.mark.asyncio
+    async def test_second_extraction_is_served_from_cache(self, tmp_path):
+        zip_path = tmp_path / 'COTAHIST_A2024.ZIP'
+        write_zip(
+            zip_path,
+            [
+                build_cotahist_line('PETR4', '010'),
+                build_cotahist_line('VALE3', '010'),
+                build_cotahist_line('PETRA100', '070'),
+            ],
+        )
+        cache = ParseCacheB3(tmp_path / 'cache')
+        zip_reader = CountingZipReader()
+
+        def build_service():
+            return ExtractionServiceB3(
+                zip_reader=zip_reader,
+                parser=CotahistParserB3(),
+                data_writer=ParquetWriterB3(),
+                processing_mode=ProcessingModeEnumB3.SLOW,
+                parse_cache=cache,
+            )
+
+        stocks = await build_service().extract_from_zip_files(
+            {str(zip_path)}, {'010'}, tmp_path / 'stocks.parquet'
+        )
+        options = await build_service().extract_from_zip_files(
+            {str(zip_path)}, {'070'}, tmp_path / 'options.parquet'
+        )
+
+        assert zip_reader.calls == 1
+        assert stocks['total_records'] == 2
+        assert options['total_records'] == 1
+        assert pl.read_parquet(tmp_path / 'options.parquet')[
+            'ticker'
+        ].to_list() == ['PETRA100']
+        assert len(list((tmp_path / 'cache').glob('*-v*.parquet'))) == 1
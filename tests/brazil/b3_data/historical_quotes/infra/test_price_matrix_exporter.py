@@ -0,0 +1,250 @@
+import math
+import os
+from datetime import date
+
+import numpy as np
+import polars as pl
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    PriceMatrixExporterB3,
+)
+
+
+def _write_quotes(path, rows):
+    pl.DataFrame(
+        [
+            {
+                'data_pregao': day,
+                'ticker': ticker,
+                'preco_fechamento': close,
+                'volume_total': volume,
+            }
+            for day, ticker, close, volume in rows
+        ]
+    ).write_parquet(path)
+
+
+D1, D2, D3, D4 = (date(2024, 1, d) for d in (2, 3, 4, 5))
+
+
+class TestPriceMatrixExporter:
+    def test_exports_aligned_matrices(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        _write_quotes(
+            source,
+            [
+                (D2, 'BBBB4', 20.0, 200.0),
+                (D1, 'AAAA3', 10.0, 100.0),
+                (D2, 'AAAA3', 11.0, 110.0),
+            ],
+        )
+        output = tmp_path / 'matrices'
+
+        result = PriceMatrixExporterB3().export(source, output)
+
+        dates = np.load(output / 'dates.npy')
+        tickers = np.load(output / 'tickers.npy')
+        close = np.load(output / 'close.npy', mmap_mode='r')
+        volume = np.load(output / 'volume.npy', mmap_mode='r')
+
+        assert dates.dtype == np.dtype('datetime64[D]')
+        assert dates.tolist() == [D1, D2]
+        assert tickers.tolist() == ['AAAA3', 'BBBB4']
+        assert close.shape == (2, 2)
+        assert close[0, 0] == 10.0 and close[1, 0] == 11.0
+        assert math.isnan(close[0, 1]) and close[1, 1] == 20.0
+        assert volume[1, 1] == 200.0
+        assert result['total_dates'] == 2
+        assert result['total_tickers'] == 2
+
+    def test_returns_are_log_returns_of_close(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        _write_quotes(
+            source,
+            [
+                (D1, 'AAAA3', 10.0, 1.0),
+                (D2, 'AAAA3', 11.0, 1.0),
+                (D3, 'AAAA3', 0.0, 1.0),
+            ],
+        )
+        output = tmp_path / 'matrices'
+
+        PriceMatrixExporterB3().export(source, output)
+
+        returns = np.load(output / 'returns.npy')[:, 0]
+        assert math.isnan(returns[0])
+        assert returns[1] == pytest.approx(math.log(1.1))
+        assert math.isnan(returns[2])
+
+    def test_incremental_update_appends_dates_and_tickers(self, tmp_path):
+        output = tmp_path / 'matrices'
+        first = tmp_path / 'first.parquet'
+        _write_quotes(
+            first,
+            [(D1, 'BBBB4', 20.0, 1.0), (D2, 'BBBB4', 21.0, 1.0)],
+        )
+        PriceMatrixExporterB3().export(first, output)
+
+        second = tmp_path / 'second.parquet'
+        _write_quotes(
+            second,
+            [(D3, 'AAAA3', 10.0, 1.0), (D3, 'BBBB4', 22.0, 1.0)],
+        )
+        result = PriceMatrixExporterB3().export(second, output)
+
+        tickers = np.load(output / 'tickers.npy').tolist()
+        close = np.load(output / 'close.npy')
+        returns = np.load(output / 'returns.npy')
+
+        # Existing tickers keep their column, new ones are appended
+        assert tickers == ['BBBB4', 'AAAA3']
+        assert np.load(output / 'dates.npy').tolist() == [D1, D2, D3]
+        assert close[:, 0].tolist() == [20.0, 21.0, 22.0]
+        assert math.isnan(close[0, 1]) and close[2, 1] == 10.0
+        assert returns[2, 0] == pytest.approx(math.log(22.0 / 21.0))
+        assert result['new_dates'] == 1
+        assert result['new_tickers'] == 1
+
+    def test_non_incremental_rebuilds(self, tmp_path):
+        output = tmp_path / 'matrices'
+        first = tmp_path / 'first.parquet'
+        _write_quotes(first, [(D1, 'BBBB4', 20.0, 1.0)])
+        PriceMatrixExporterB3().export(first, output)
+
+        second = tmp_path / 'second.parquet'
+        _write_quotes(second, [(D4, 'AAAA3', 10.0, 1.0)])
+        PriceMatrixExporterB3().export(second, output, incremental=False)
+
+        assert np.load(output / 'tickers.npy').tolist() == ['AAAA3']
+        assert np.load(output / 'dates.npy').tolist() == [D4]
+
+    def test_ticker_filter(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        _write_quotes(
+            source,
+            [(D1, 'AAAA3', 10.0, 1.0), (D1, 'BBBB4', 20.0, 1.0)],
+        )
+        output = tmp_path / 'matrices'
+
+        PriceMatrixExporterB3().export(source, output, tickers=['BBBB4'])
+
+        assert np.load(output / 'tickers.npy').tolist() == ['BBBB4']
+        assert np.load(output / 'close.npy').tolist() == [[20.0]]
+
+    def test_small_batches_match_single_batch(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        rows = [
+            (day, ticker, float(i + j), float(i))
+            for i, day in enumerate((D1, D2, D3, D4))
+            for j, ticker in enumerate(('AAAA3', 'BBBB4', 'CCCC3'))
+        ]
+        _write_quotes(source, rows)
+
+        exporter = PriceMatrixExporterB3(batch_size=2)
+        exporter.ROW_BLOCK = 1
+        exporter.export(source, tmp_path / 'small')
+        PriceMatrixExporterB3().export(source, tmp_path / 'large')
+
+        for name in ('close.npy', 'volume.npy', 'returns.npy'):
+            np.testing.assert_array_equal(
+                np.load(tmp_path / 'small' / name),
+                np.load(tmp_path / 'large' / name),
+            )
+
+    def test_leaves_no_temporary_files(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        _write_quotes(source, [(D1, 'AAAA3', 10.0, 1.0)])
+        output = tmp_path / 'matrices'
+
+        PriceMatrixExporterB3().export(source, output)
+
+        assert sorted(p.name for p in output.iterdir()) == [
+            'close.npy',
+            'dates.npy',
+            'returns.npy',
+            'tickers.npy',
+            'volume.npy',
+        ]
+
+    def test_crash_after_commit_is_completed_by_next_export(self, tmp_path):
+        output = tmp_path / 'matrices'
+        first = tmp_path / 'first.parquet'
+        _write_quotes(first, [(D1, 'AAAA3', 10.0, 1.0)])
+        PriceMatrixExporterB3().export(first, output)
+
+        second = tmp_path / 'second.parquet'
+        _write_quotes(
+            second,
+            [(D2, 'AAAA3', 11.0, 1.0), (D2, 'BBBB4', 20.0, 1.0)],
+        )
+        crashing = PriceMatrixExporterB3()
+
+        def crash(output_dir, tmp_paths):
+            os.replace(tmp_paths['dates.npy'], output_dir / 'dates.npy')
+            raise OSError('crashed')
+
+        crashing._roll_forward = crash
+        with pytest.raises(IOError):
+            crashing.export(second, output)
+
+        # Only dates.npy was replaced, but the rest is committed
+        assert (output / '.export_commit.json').exists()
+
+        third = tmp_path / 'third.parquet'
+        _write_quotes(third, [(D3, 'AAAA3', 12.0, 1.0)])
+        PriceMatrixExporterB3().export(third, output)
+
+        close = np.load(output / 'close.npy')
+        assert np.load(output / 'dates.npy').tolist() == [D1, D2, D3]
+        assert np.load(output / 'tickers.npy').tolist() == ['AAAA3', 'BBBB4']
+        assert close[:, 0].tolist() == [10.0, 11.0, 12.0]
+        assert close[1, 1] == 20.0
+        assert not (output / '.export_commit.json').exists()
+
+    def test_failure_before_commit_keeps_previous_matrices(
+        self, tmp_path, monkeypatch
+    ):
+        output = tmp_path / 'matrices'
+        first = tmp_path / 'first.parquet'
+        _write_quotes(first, [(D1, 'AAAA3', 10.0, 1.0)])
+        PriceMatrixExporterB3().export(first, output)
+        before = {p.name: p.read_bytes() for p in output.iterdir()}
+
+        second = tmp_path / 'second.parquet'
+        _write_quotes(second, [(D2, 'BBBB4', 20.0, 1.0)])
+        exporter = PriceMatrixExporterB3()
+
+        def fail(path):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(exporter, '_fsync', fail)
+        with pytest.raises(IOError):
+            exporter.export(second, output)
+
+        assert {p.name: p.read_bytes() for p in output.iterdir()} == before
+
+    def test_inconsistent_matrices_are_rebuilt(self, tmp_path):
+        output = tmp_path / 'matrices'
+        first = tmp_path / 'first.parquet'
+        _write_quotes(
+            first,
+            [(D1, 'AAAA3', 10.0, 1.0), (D2, 'AAAA3', 11.0, 1.0)],
+        )
+        PriceMatrixExporterB3().export(first, output)
+        # A dates file that no longer matches the matrices
+        np.save(output / 'dates.npy', np.array([D1], dtype='datetime64[D]'))
+
+        PriceMatrixExporterB3().export(first, output)
+
+        dates = np.load(output / 'dates.npy')
+        close = np.load(output / 'close.npy')
+        assert dates.tolist() == [D1, D2]
+        assert close.shape == (2, 1)
+        assert close[:, 0].tolist() == [10.0, 11.0]
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            PriceMatrixExporterB3().export(
+                tmp_path / 'missing.parquet', tmp_path / 'matrices'
+            )
@@ -0,0 +1,142 @@
+import math
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+from globaldatafinance.brazil.b3_data.historical_quotes.infra import (
+    QuotesAnalyticsServiceB3,
+)
+
+
+def _write_quotes(path, closes_by_ticker, volume=1000.0):
+    rows = []
+    start = date(2024, 1, 1)
+    for ticker, closes in closes_by_ticker.items():
+        for offset, close in enumerate(closes):
+            rows.append(
+                {
+                    'data_pregao': start + timedelta(days=offset),
+                    'ticker': ticker,
+                    'tipo_mercado': '010',
+                    'preco_fechamento': close,
+                    'volume_total': volume * (offset + 1),
+                }
+            )
+    # Shuffle ticker order to make sure the service sorts the data itself
+    pl.DataFrame(rows).reverse().write_parquet(path)
+
+
+class TestQuotesAnalyticsService:
+    def test_computes_log_returns_per_ticker(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        _write_quotes(
+            source, {'AAAA3': [10.0, 11.0, 12.1], 'BBBB4': [5.0, 5.0, 4.0]}
+        )
+
+        result = QuotesAnalyticsServiceB3().compute(source, output, [2])
+
+        df = pl.read_parquet(output).sort(['ticker', 'data_pregao'])
+        aaaa = df.filter(pl.col('ticker') == 'AAAA3')['log_return'].to_list()
+        assert aaaa[0] is None
+        assert aaaa[1] == pytest.approx(math.log(1.1))
+        assert aaaa[2] == pytest.approx(math.log(1.1))
+        assert result['total_records'] == 6
+        assert result['total_tickers'] == 2
+
+    def test_output_contains_window_columns(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        _write_quotes(source, {'AAAA3': [10.0, 11.0, 12.0, 13.0]})
+
+        QuotesAnalyticsServiceB3().compute(source, output, [2, 3])
+
+        columns = pl.read_parquet(output).columns
+        for name in (
+            'ticker',
+            'data_pregao',
+            'log_return',
+            'market_return',
+            'volatility_2',
+            'adtv_2',
+            'beta_2',
+            'volatility_3',
+            'adtv_3',
+            'beta_3',
+        ):
+            assert name in columns
+
+    def test_adtv_is_rolling_mean_of_volume(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        _write_quotes(source, {'AAAA3': [10.0, 11.0, 12.0]}, volume=100.0)
+
+        QuotesAnalyticsServiceB3().compute(source, output, [2])
+
+        adtv = pl.read_parquet(output).sort('data_pregao')['adtv_2'].to_list()
+        assert adtv == [None, 150.0, 250.0]
+
+    def test_beta_against_benchmark_ticker(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        market = [100.0, 102.0, 99.0, 104.0, 103.0, 107.0]
+        # Twice the benchmark log return every session: beta == 2
+        levered = [100.0]
+        for previous, current in zip(market, market[1:]):
+            levered.append(levered[-1] * (current / previous) ** 2)
+        _write_quotes(source, {'BOVA11': market, 'LEVR3': levered})
+
+        QuotesAnalyticsServiceB3().compute(
+            source, output, [3], benchmark_ticker='BOVA11'
+        )
+
+        df = pl.read_parquet(output).sort(['ticker', 'data_pregao'])
+        betas = df.filter(pl.col('ticker') == 'LEVR3')['beta_3'].to_list()
+        assert betas[-1] == pytest.approx(2.0)
+        bova = df.filter(pl.col('ticker') == 'BOVA11')['beta_3'].to_list()
+        assert bova[-1] == pytest.approx(1.0)
+
+    def test_ticker_history_is_not_split_across_batches(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        closes = [10.0 + i for i in range(10)]
+        _write_quotes(source, {'AAAA3': closes, 'BBBB4': closes})
+
+        QuotesAnalyticsServiceB3(batch_size=3).compute(source, output, [4])
+        small = pl.read_parquet(output).sort(['ticker', 'data_pregao'])
+
+        QuotesAnalyticsServiceB3().compute(source, output, [4])
+        large = pl.read_parquet(output).sort(['ticker', 'data_pregao'])
+
+        assert small.equals(large)
+
+    def test_non_positive_prices_yield_null_returns(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        _write_quotes(source, {'AAAA3': [10.0, 0.0, 12.0]})
+
+        QuotesAnalyticsServiceB3().compute(source, output, [2])
+
+        returns = (
+            pl.read_parquet(output).sort('data_pregao')['log_return'].to_list()
+        )
+        assert returns == [None, None, None]
+
+    def test_removes_temporary_files(self, tmp_path):
+        source = tmp_path / 'quotes.parquet'
+        output = tmp_path / 'analytics.parquet'
+        _write_quotes(source, {'AAAA3': [10.0, 11.0]})
+
+        QuotesAnalyticsServiceB3().compute(source, output, [2])
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'analytics.parquet',
+            'quotes.parquet',
+        ]
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            QuotesAnalyticsServiceB3().compute(
+                tmp_path / 'missing.parquet', tmp_path / 'out.parquet', [2]
+            )
@@ -226,3 +226,29 @@ class TestFileExtractorInstanceChecks:
 
         obj = NotAnExtractor()
         assert not isinstance(obj, FileExtractorRepositoryCVM)
+
+
+@pytest.mark.unit
+class TestFileExtractorBufferFallback:
+    def test_extract_from_buffer_uses_temporary_file(self, tmp_path):
+        import io
+
+        calls = []
+
+        class RecordingExtractor(FileExtractorRepositoryCVM):
+            def extract(self, source_path: str, destination_path: str) -> None:
+                with open(source_path, 'rb') as f:
+                    calls.append((source_path, destination_path, f.read()))
+
+        buffer = io.BytesIO(b'zip bytes')
+        buffer.seek(4)
+
+        RecordingExtractor().extract_from_buffer(
+            buffer, 'dfp_2023.zip', str(tmp_path)
+        )
+
+        source_path, destination_path, content = calls[0]
+        assert content == b'zip bytes'
+        assert destination_path == str(tmp_path)
+        assert source_path.endswith('.zip')
+        assert not list(tmp_path.iterdir())
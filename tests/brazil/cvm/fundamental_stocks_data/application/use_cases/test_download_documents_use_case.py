@@ -257,6 +257,45 @@ class TestDownloadDocumentsUseCaseErrorHandling:
             )
 
 
+@pytest.mark.asyncio
+class TestDownloadDocumentsUseCaseAsync:
+    async def test_execute_async_defaults_to_download_docs(self, tmp_path):
+        mock_repo = MockRepository()
+        use_case = DownloadDocumentsUseCaseCVM(mock_repo)
+
+        result = await use_case.execute_async(
+            destination_path=str(tmp_path),
+            list_docs=['DFP'],
+            initial_year=2020,
+            last_year=2021,
+        )
+
+        assert mock_repo.download_docs_called
+        assert len(mock_repo.last_tasks) == 2
+        assert result.success_count_downloads == 2
+        assert result.elapsed_time >= 0
+
+    async def test_execute_async_uses_native_async_repository(self, tmp_path):
+        class AsyncRepository(MockRepository):
+            async def download_docs_async(self, tasks):
+                self.last_tasks = tasks
+                return DownloadResultCVM(successful_downloads=['DFP_2020'])
+
+        repo = AsyncRepository()
+        use_case = DownloadDocumentsUseCaseCVM(repo)
+
+        result = await use_case.execute_async(
+            destination_path=str(tmp_path),
+            list_docs=['DFP'],
+            initial_year=2020,
+            last_year=2020,
+        )
+
+        assert not repo.download_docs_called
+        assert repo.last_tasks[0][1:3] == ('DFP', '2020')
+        assert result.successful_downloads == ['DFP_2020']
+
+
 @pytest.mark.unit
 class TestDownloadDocumentsUseCaseInitialization:
     def test_init_with_valid_repository(self):
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
+    DownloadDocsCVMRepositoryCVM,
+    DownloadResultCVM,
+    InvalidRepositoryTypeError,
+    SyncMirrorUseCaseCVM,
+)
+
+
+class MockRepository(DownloadDocsCVMRepositoryCVM):
+    def __init__(self):
+        self.last_tasks = None
+
+    def download_docs(self, tasks: list) -> DownloadResultCVM:
+        self.last_tasks = tasks
+        return DownloadResultCVM(
+            successful_downloads=['DFP_2022'],
+            skipped_downloads=['DFP_2023'],
+        )
+
+
+@pytest.mark.unit
+class TestSyncMirrorUseCase:
+    def test_rejects_invalid_repository(self):
+        with pytest.raises(InvalidRepositoryTypeError):
+            SyncMirrorUseCaseCVM(object())
+
+    def test_files_keep_their_portal_paths(self, tmp_path):
+        repository = MockRepository()
+
+        result = SyncMirrorUseCaseCVM(repository).execute(
+            str(tmp_path), list_docs=['DFP'], initial_year=2022, last_year=2023
+        )
+
+        assert result.success_count_downloads == 1
+        assert result.skipped_count_downloads == 1
+        directory = tmp_path / 'dados/CIA_ABERTA/DOC/DFP/DADOS'
+        assert directory.is_dir()
+        assert sorted(repository.last_tasks) == [
+            (
+                'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/'
+                f'dfp_cia_aberta_{year}.zip',
+                'DFP',
+                year,
+                str(directory),
+            )
+            for year in ('2022', '2023')
+        ]
+
+    def test_skips_years_not_published_for_a_doc(self, tmp_path):
+        repository = MockRepository()
+
+        SyncMirrorUseCaseCVM(repository).execute(
+            str(tmp_path),
+            list_docs=['DFP', 'ITR'],
+            initial_year=2010,
+            last_year=2011,
+        )
+
+        files = sorted(
+            (doc, year) for _, doc, year, _ in repository.last_tasks
+        )
+        assert files == [('DFP', '2010'), ('DFP', '2011'), ('ITR', '2011')]
+
+    def test_custom_origin_url(self, tmp_path):
+        repository = MockRepository()
+
+        SyncMirrorUseCaseCVM(
+            repository, origin_url='http://upstream.lan'
+        ).execute(
+            str(tmp_path), list_docs=['FRE'], initial_year=2020, last_year=2020
+        )
+
+        url, _, _, directory = repository.last_tasks[0]
+        assert url.startswith('http://upstream.lan/dados/CIA_ABERTA/DOC/FRE/')
+        assert Path(directory) == tmp_path / 'dados/CIA_ABERTA/DOC/FRE/DADOS'
+
+    def test_rejects_empty_mirror_path(self):
+        with pytest.raises(ValueError):
+            SyncMirrorUseCaseCVM(MockRepository()).execute('  ')
@@ -314,3 +314,22 @@ class TestUrlDocs:
         assert len(set_docs) == 7
         assert isinstance(urls, dict)
         assert isinstance(set_docs, set)
+
+    def test_default_base_url_is_cvm_portal(self, url_docs):
+        urls, _ = url_docs.get_url_docs(['DFP'])
+
+        assert url_docs.base_url == UrlDocsCVM.ORIGIN_URL
+        assert urls['DFP'] == (
+            'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/'
+            'dfp_cia_aberta_'
+        )
+
+    def test_custom_base_url_keeps_portal_paths(self):
+        url_docs = UrlDocsCVM('http://mirror.lan:8000/cvm/')
+
+        urls, _ = url_docs.get_url_docs(['ITR'])
+
+        assert urls['ITR'] == (
+            'http://mirror.lan:8000/cvm/dados/CIA_ABERTA/DOC/ITR/DADOS/'
+            'itr_cia_aberta_'
+        )
@@ -282,3 +282,10 @@ class TestAvailableYears:
             available_years.get_minimal_cgvn_vlmo_year()
             <= available_years.get_current_year()
         )
+
+    def test_is_year_available_for_doc(self, available_years):
+        assert available_years.is_year_available_for_doc('DFP', 2010)
+        assert not available_years.is_year_available_for_doc('ITR', 2010)
+        assert available_years.is_year_available_for_doc('itr', 2011)
+        assert not available_years.is_year_available_for_doc('CGVN', 2017)
+        assert available_years.is_year_available_for_doc('VLMO', 2018)
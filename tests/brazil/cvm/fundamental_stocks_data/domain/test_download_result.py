@@ -14,6 +14,10 @@ class TestDownloadResultInitialization:
         assert result.failed_downloads == {}
         assert result.success_count_downloads == 0
         assert result.error_count_downloads == 0
+        assert result.download_time == 0.0
+        assert result.skipped_downloads == []
+        assert result.extraction_time == 0.0
+        assert result.disk_write_time == 0.0
 
     def test_init_with_successful_downloads_list(self):
         downloads = ['DFP_2020', 'DFP_2021']
@@ -502,3 +506,27 @@ class TestDownloadResultIntegration:
             f'ITR_{year}' in result.failed_downloads
             for year in range(2010, 2015)
         )
+
+
+@pytest.mark.unit
+class TestDownloadResultSkipped:
+    def test_skipped_downloads_count_as_successful(self):
+        result = DownloadResultCVM()
+
+        result.add_skipped_downloads('DFP_2020')
+        result.add_skipped_downloads('DFP_2020')
+
+        assert result.skipped_downloads == ['DFP_2020']
+        assert result.skipped_count_downloads == 1
+        assert result.successful_downloads == ['DFP_2020']
+
+    def test_unavailable_downloads_are_neither_success_nor_error(self):
+        result = DownloadResultCVM()
+
+        result.add_unavailable_downloads('ITR_2026')
+        result.add_unavailable_downloads('ITR_2026')
+
+        assert result.unavailable_downloads == ['ITR_2026']
+        assert result.unavailable_count_downloads == 1
+        assert result.success_count_downloads == 0
+        assert result.error_count_downloads == 0
@@ -0,0 +1,149 @@
+import httpx
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter import (
+    DadosIndexCVM,
+    ListedFileCVM,
+)
+from globaldatafinance.macro_infra import RequestsAdapter
+
+DIRECTORY = 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/'
+
+APACHE_PAGE = """<html><body><h1>Index of /dados/CIA_ABERTA/DOC/DFP/DADOS</h1>
+<pre><a href="?C=N;O=D">Name</a>  <a href="?C=M;O=A">Last modified</a>
+<a href="/dados/CIA_ABERTA/DOC/DFP/">Parent Directory</a>        -
+<a href="dfp_cia_aberta_2022.zip">dfp_cia_aberta_2022.zip</a>  2024-10-12 06:01   16M
+<a href="dfp_cia_aberta_2023.zip">dfp_cia_aberta_2023..&gt;</a> 2025-01-02 07:30  1.5M
+<a href="old/">old/</a>  2024-10-12 06:01    -
+</pre></body></html>
+"""
+
+NGINX_PAGE = """<html><body><pre><a href="../">../</a>
+<a href="dfp_cia_aberta_2024.zip">dfp_cia_aberta_2024.zip</a>        12-Oct-2025 06:01     16777216
+</pre></body></html>
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_index(handler, **kwargs):
+    adapter = RequestsAdapter()
+    adapter._build_client = lambda timeout: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return DadosIndexCVM(adapter, **kwargs)
+
+
+@pytest.mark.unit
+class TestDadosIndexParse:
+    def test_parses_apache_listing(self):
+        files = DadosIndexCVM.parse(APACHE_PAGE, DIRECTORY)
+
+        assert sorted(files) == [
+            'dfp_cia_aberta_2022.zip',
+            'dfp_cia_aberta_2023.zip',
+        ]
+        assert files['dfp_cia_aberta_2022.zip'] == ListedFileCVM(
+            name='dfp_cia_aberta_2022.zip',
+            url=DIRECTORY + 'dfp_cia_aberta_2022.zip',
+            modified='2024-10-12T06:01',
+            size=16 * 1024**2,
+        )
+        assert files['dfp_cia_aberta_2023.zip'].size == int(1.5 * 1024**2)
+
+    def test_parses_html_table_listing(self):
+        page = (
+            '<tr><td><img src="/icons/compressed.gif" alt="[   ]"></td>'
+            '<td><a href="dfp_cia_aberta_2021.zip">dfp_cia_aberta_2021.zip'
+            '</a></td><td align="right">2025-03-04 08:00  </td>'
+            '<td align="right">830K</td><td>&nbsp;</td></tr>\n'
+        )
+
+        listed = DadosIndexCVM.parse(page, DIRECTORY)[
+            'dfp_cia_aberta_2021.zip'
+        ]
+
+        assert listed.modified == '2025-03-04T08:00'
+        assert listed.size == 830 * 1024
+
+    def test_parses_nginx_listing(self):
+        files = DadosIndexCVM.parse(NGINX_PAGE, DIRECTORY)
+
+        assert list(files) == ['dfp_cia_aberta_2024.zip']
+        assert files['dfp_cia_aberta_2024.zip'].signature == {
+            'modified': '2025-10-12T06:01',
+            'size': 16777216,
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDadosIndexCache:
+    async def test_listing_is_cached_for_ttl(self):
+        clock = FakeClock()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text=APACHE_PAGE)
+
+        index = make_index(handler, ttl=60, clock=clock)
+
+        first = await index.list_directory(DIRECTORY)
+        clock.now = 59
+        second = await index.list_directory(DIRECTORY)
+        clock.now = 61
+        await index.list_directory(DIRECTORY)
+
+        assert first == second
+        assert len(requests) == 2
+
+    async def test_expired_listing_is_revalidated_with_etag(self):
+        clock = FakeClock()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, text=APACHE_PAGE, headers={'ETag': '"v1"'}
+            )
+
+        index = make_index(handler, ttl=60, clock=clock)
+
+        first = await index.list_directory(DIRECTORY)
+        clock.now = 100
+        second = await index.list_directory(DIRECTORY)
+
+        assert second == first
+        assert requests[1].headers['If-None-Match'] == '"v1"'
+
+    async def test_failures_fall_back_to_last_listing(self):
+        clock = FakeClock()
+        responses = [httpx.Response(200, text=APACHE_PAGE)]
+
+        def handler(request):
+            if responses:
+                return responses.pop()
+            raise httpx.ConnectError('refused', request=request)
+
+        index = make_index(handler, ttl=60, clock=clock)
+
+        first = await index.list_directory(DIRECTORY)
+        clock.now = 100
+
+        assert await index.list_directory(DIRECTORY) == first
+        index.invalidate()
+        assert await index.list_directory(DIRECTORY) is None
+
+    async def test_error_status_returns_none(self):
+        index = make_index(lambda request: httpx.Response(404))
+
+        assert await index.list_directory(DIRECTORY) is None
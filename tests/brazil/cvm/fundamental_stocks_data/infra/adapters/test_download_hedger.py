@@ -0,0 +1,95 @@
+import asyncio
+import os
+
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter import (
+    DownloadHedgerCVM,
+)
+
+
+def make_hedger(*durations):
+    hedger = DownloadHedgerCVM()
+    for duration in durations:
+        hedger.record(duration)
+    return hedger
+
+
+@pytest.mark.unit
+class TestDownloadHedgerDelay:
+    def test_needs_enough_samples(self):
+        hedger = make_hedger(*[1.0] * 4)
+        assert hedger.delay() is None
+
+        for duration in range(2, 18):
+            hedger.record(float(duration))
+        assert hedger.delay() == 16.0
+
+
+@pytest.mark.asyncio
+class TestDownloadHedgerRun:
+    @staticmethod
+    def _run(hedger, download, filepath, slots):
+        discarded, promoted = [], []
+        run = hedger.run(
+            download,
+            str(filepath),
+            slots,
+            'DFP_2023',
+            discarded.append,
+            lambda source, target: promoted.append((source, target)),
+        )
+        return run, discarded, promoted
+
+    async def test_second_copy_wins_when_first_is_slow(self, tmp_path):
+        hedger = make_hedger(*[0.01] * 10)
+        slots = asyncio.Semaphore(2)
+        started = []
+
+        async def download(path):
+            started.append(os.path.basename(path))
+            if not path.endswith(DownloadHedgerCVM.SUFFIX):
+                await asyncio.sleep(10)
+
+        target = tmp_path / 'DFP_2023.zip'
+        run, discarded, promoted = self._run(hedger, download, target, slots)
+        await run
+
+        assert started == ['DFP_2023.zip', 'DFP_2023.zip.hedge']
+        assert promoted == [(f'{target}.hedge', str(target))]
+        assert discarded == []
+        assert not slots.locked()
+
+    async def test_no_second_copy_without_free_slot(self, tmp_path):
+        hedger = make_hedger(*[0.01] * 10)
+        slots = asyncio.Semaphore(1)
+        await slots.acquire()
+        started = []
+
+        async def download(path):
+            started.append(path)
+            await asyncio.sleep(0.05)
+
+        run, discarded, promoted = self._run(
+            hedger, download, tmp_path / 'DFP_2023.zip', slots
+        )
+        await run
+
+        assert len(started) == 1
+        assert discarded == promoted == []
+
+    async def test_error_of_original_request_is_raised(self, tmp_path):
+        hedger = make_hedger(*[0.01] * 10)
+
+        async def download(path):
+            await asyncio.sleep(0.05)
+            raise IOError(os.path.basename(path))
+
+        target = tmp_path / 'DFP_2023.zip'
+        run, discarded, _ = self._run(
+            hedger, download, target, asyncio.Semaphore(2)
+        )
+        with pytest.raises(IOError, match=r'^DFP_2023\.zip$'):
+            await run
+
+        assert discarded == [f'{target}.hedge']
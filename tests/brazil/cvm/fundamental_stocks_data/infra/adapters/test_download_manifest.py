@@ -0,0 +1,240 @@
+import io
+import zipfile
+from unittest.mock import MagicMock
+
+import httpx
+import polars as pl
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
+    AsyncDownloadAdapterCVM,
+)
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter import (
+    DownloadManifestCVM,
+)
+from globaldatafinance.macro_infra import DownloadInfo
+
+URL = 'https://dados.cvm.gov.br/DFP/dfp_cia_aberta_2023.zip'
+
+
+def make_info(**kwargs):
+    values = {
+        'bytes_written': 3,
+        'etag': '"v1"',
+        'last_modified': 'Tue, 01 Oct 2024 00:00:00 GMT',
+        'digest': 'abc',
+    }
+    values.update(kwargs)
+    return DownloadInfo(**values)
+
+
+@pytest.mark.unit
+class TestDownloadManifestCVM:
+    def test_record_persists_and_reloads(self, tmp_path):
+        artifact = tmp_path / 'file.zip'
+        artifact.write_bytes(b'zip')
+
+        DownloadManifestCVM(tmp_path).record(
+            URL, make_info(), [str(artifact)], extracted=False
+        )
+        entry = DownloadManifestCVM(tmp_path).get(URL)
+
+        assert entry['etag'] == '"v1"'
+        assert entry['sha256'] == 'abc'
+        assert entry['size'] == 3
+        assert entry['artifacts'] == [str(artifact)]
+
+    def test_conditional_headers_need_existing_artifacts(self, tmp_path):
+        artifact = tmp_path / 'file.zip'
+        artifact.write_bytes(b'zip')
+        manifest = DownloadManifestCVM(tmp_path)
+        manifest.record(URL, make_info(), [str(artifact)], extracted=False)
+
+        assert manifest.conditional_headers(URL, extracted=False) == {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Tue, 01 Oct 2024 00:00:00 GMT',
+        }
+        # ZIP on disk does not satisfy a request for Parquet output
+        assert manifest.conditional_headers(URL, extracted=True) == {}
+
+        artifact.write_bytes(b'truncated zip')
+        assert manifest.conditional_headers(URL, extracted=False) == {}
+
+        artifact.unlink()
+        assert manifest.conditional_headers(URL, extracted=False) == {}
+
+    def test_has_same_content(self, tmp_path):
+        manifest = DownloadManifestCVM(tmp_path)
+        manifest.record(URL, make_info(), [], extracted=True)
+
+        assert manifest.has_same_content(URL, make_info(etag=None))
+        assert not manifest.has_same_content(URL, make_info(digest='other'))
+        assert not manifest.has_same_content('other', make_info())
+
+    def test_refresh_and_forget(self, tmp_path):
+        manifest = DownloadManifestCVM(tmp_path)
+        manifest.record(URL, make_info(), [], extracted=True)
+
+        manifest.refresh(URL, make_info(etag='"v2"', last_modified=None))
+        assert manifest.get(URL)['etag'] == '"v2"'
+        assert manifest.get(URL)['last_modified'] is not None
+
+        manifest.forget(URL)
+        assert DownloadManifestCVM(tmp_path).get(URL) is None
+
+    def test_matches_listing(self, tmp_path):
+        artifact = tmp_path / 'file.zip'
+        artifact.write_bytes(b'zip')
+        listing = {'modified': '2024-10-01T00:00', 'size': 3}
+        manifest = DownloadManifestCVM(tmp_path)
+        manifest.record(
+            URL, make_info(), [str(artifact)], extracted=False, listing=None
+        )
+
+        assert not manifest.matches_listing(URL, False, listing)
+
+        manifest.refresh(URL, make_info(), listing)
+        assert manifest.matches_listing(URL, False, listing)
+        assert not manifest.matches_listing(URL, True, listing)
+        assert not manifest.matches_listing(
+            URL, False, {'modified': '2024-11-01T00:00', 'size': 3}
+        )
+
+        artifact.unlink()
+        assert not manifest.matches_listing(URL, False, listing)
+
+    def test_unreadable_manifest_is_ignored(self, tmp_path):
+        (tmp_path / DownloadManifestCVM.FILENAME).write_text('{not json')
+
+        assert DownloadManifestCVM(tmp_path).get(URL) is None
+
+
+def zip_bytes():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr('dfp_cia_aberta_2023.csv', 'a;b\n1;2\n')
+    return buffer.getvalue()
+
+
+class FakeServer:
+    """Serves one ZIP, honouring If-None-Match when use_etag is set."""
+
+    def __init__(self, use_etag=True):
+        self.body = zip_bytes()
+        self.use_etag = use_etag
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        if not self.use_etag:
+            return httpx.Response(200, content=self.body)
+        if request.headers.get('if-none-match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, content=self.body, headers={'ETag': '"v1"'})
+
+
+def make_adapter(server, automatic_extractor):
+    def fake_extract(zip_path, dest_path):
+        with zipfile.ZipFile(zip_path) as zf:
+            for name in zf.namelist():
+                stem = name.rsplit('.', 1)[0]
+                pl.DataFrame({'a': [1]}).write_parquet(
+                    f'{dest_path}/{stem}.parquet'
+                )
+
+    extractor = MagicMock()
+    extractor.extract.side_effect = fake_extract
+    adapter = AsyncDownloadAdapterCVM(
+        file_extractor_repository=extractor,
+        automatic_extractor=automatic_extractor,
+    )
+    adapter.requests_adapter._build_client = lambda timeout: httpx.AsyncClient(
+        transport=httpx.MockTransport(server.handler)
+    )
+    return adapter
+
+
+@pytest.mark.asyncio
+class TestConditionalDownloads:
+    async def test_unchanged_zip_is_not_downloaded_again(self, tmp_path):
+        server = FakeServer()
+        adapter = make_adapter(server, automatic_extractor=False)
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        first = await adapter.download_docs_async(tasks)
+        zip_path = tmp_path / 'dfp_cia_aberta_2023.zip'
+        mtime = zip_path.stat().st_mtime_ns
+        second = await adapter.download_docs_async(tasks)
+
+        assert first.successful_downloads == ['DFP_2023']
+        assert first.skipped_downloads == []
+        assert second.skipped_downloads == ['DFP_2023']
+        assert second.success_count_downloads == 1
+        assert server.requests[1].headers['if-none-match'] == '"v1"'
+        assert zip_path.stat().st_mtime_ns == mtime
+
+    async def test_not_modified_skips_extraction(self, tmp_path):
+        server = FakeServer()
+        adapter = make_adapter(server, automatic_extractor=True)
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        await adapter.download_docs_async(tasks)
+        result = await adapter.download_docs_async(tasks)
+
+        assert result.skipped_downloads == ['DFP_2023']
+        adapter.file_extractor_repository.extract.assert_called_once()
+        assert (tmp_path / 'dfp_cia_aberta_2023.parquet').exists()
+        assert not (tmp_path / 'dfp_cia_aberta_2023.zip').exists()
+
+    async def test_same_hash_skips_extraction_without_etag(self, tmp_path):
+        server = FakeServer(use_etag=False)
+        adapter = make_adapter(server, automatic_extractor=True)
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        await adapter.download_docs_async(tasks)
+        result = await adapter.download_docs_async(tasks)
+
+        assert len(server.requests) == 2
+        assert result.skipped_downloads == ['DFP_2023']
+        adapter.file_extractor_repository.extract.assert_called_once()
+        assert not (tmp_path / 'dfp_cia_aberta_2023.zip').exists()
+
+    async def test_missing_outputs_force_full_download(self, tmp_path):
+        server = FakeServer()
+        adapter = make_adapter(server, automatic_extractor=True)
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        await adapter.download_docs_async(tasks)
+        (tmp_path / 'dfp_cia_aberta_2023.parquet').unlink()
+        result = await adapter.download_docs_async(tasks)
+
+        assert 'if-none-match' not in server.requests[1].headers
+        assert result.skipped_downloads == []
+        assert result.successful_downloads == ['DFP_2023']
+        assert adapter.file_extractor_repository.extract.call_count == 2
+
+    async def test_failed_extraction_is_not_recorded(self, tmp_path):
+        server = FakeServer()
+        adapter = make_adapter(server, automatic_extractor=True)
+        adapter.file_extractor_repository.extract.side_effect = RuntimeError(
+            'boom'
+        )
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        result = await adapter.download_docs_async(tasks)
+
+        assert result.error_count_downloads == 1
+        assert DownloadManifestCVM(tmp_path).get(URL) is None
+
+    async def test_disabled_conditional_requests(self, tmp_path):
+        server = FakeServer()
+        adapter = make_adapter(server, automatic_extractor=False)
+        adapter.conditional_requests = False
+        tasks = [(URL, 'DFP', '2023', str(tmp_path))]
+
+        await adapter.download_docs_async(tasks)
+        result = await adapter.download_docs_async(tasks)
+
+        assert result.skipped_downloads == []
+        assert 'if-none-match' not in server.requests[1].headers
+        assert not (tmp_path / DownloadManifestCVM.FILENAME).exists()
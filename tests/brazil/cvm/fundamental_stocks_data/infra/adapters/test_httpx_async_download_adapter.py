@@ -6,6 +6,12 @@ import pytest
 from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
     AsyncDownloadAdapterCVM,
     DownloadResultCVM,
+    RetryConfigCVM,
+    SchedulingConfigCVM,
+    TransferConfigCVM,
+)
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter import (
+    DownloadManifestCVM,
 )
 from globaldatafinance.macro_exceptions import (
     DiskFullError,
@@ -27,6 +33,7 @@ class TestHttpxAsyncDownloadAdapterInitialization:
         assert adapter.chunk_size == 8192
         assert adapter.max_retries == 3
         assert adapter.automatic_extractor is False
+        assert adapter.scheduling.max_concurrent_extractions == 2
         assert adapter.file_extractor_repository is mock_extractor
 
     def test_init_with_custom_values(self):
@@ -310,6 +317,9 @@ class TestHttpxAsyncDownloadAdapterStreamDownload:
             url='https://example.com/file.zip',
             output_path='/tmp/file.zip',
             chunk_size=8192,
+            headers=None,
+            digest_algorithm='sha256',
+            resume=True,
         )
 
     async def test_stream_download_uses_custom_chunk_size(self):
@@ -329,6 +339,9 @@ class TestHttpxAsyncDownloadAdapterStreamDownload:
             url='https://example.com/file.zip',
             output_path='/tmp/file.zip',
             chunk_size=16384,
+            headers=None,
+            digest_algorithm='sha256',
+            resume=True,
         )
 
 
@@ -373,11 +386,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None  # No Content-Length available
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -422,7 +431,8 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
 
         df1 = pl.DataFrame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']})
         df2 = pl.DataFrame({'col3': [4, 5, 6], 'col4': ['d', 'e', 'f']})
-        df1.write_parquet(output_dir / 'file1.parquet')
+        # Output of data.csv; file2.parquet belongs to another ZIP
+        df1.write_parquet(output_dir / 'data.parquet')
         df2.write_parquet(output_dir / 'file2.parquet')
 
         mock_extractor = MagicMock()
@@ -433,11 +443,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -457,6 +463,46 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         )
         assert result.success_count_downloads == 1
 
+    @patch(
+        'globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter.async_download_adapter.remove_file'
+    )
+    async def test_extraction_ignores_parquet_files_of_other_zips(
+        self, mock_remove, tmp_path
+    ):
+        import zipfile
+
+        import polars as pl
+
+        output_dir = tmp_path / 'output'
+        output_dir.mkdir()
+        with zipfile.ZipFile(output_dir / 'file.zip', 'w') as zf:
+            zf.writestr('data.csv', 'col1,col2\n1,2\n')
+        # Written by a concurrent extraction of another ZIP
+        pl.DataFrame({'col1': [1]}).write_parquet(output_dir / 'other.parquet')
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(), automatic_extractor=True
+        )
+
+        async def mock_download_with_retry(url, filepath, doc_name, year):
+            return True, None
+
+        adapter._download_with_retry = mock_download_with_retry
+        result = DownloadResultCVM()
+
+        await adapter._download_and_extract(
+            'https://example.com/file.zip',
+            str(output_dir),
+            'DRE',
+            '2023',
+            result,
+            MagicMock(),
+        )
+
+        assert result.success_count_downloads == 0
+        assert result.error_count_downloads == 1
+        assert not mock_remove.called
+
     @patch(
         'globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter.async_download_adapter.remove_file'
     )
@@ -488,11 +534,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -550,11 +592,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -605,11 +643,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -660,11 +694,7 @@ class TestHttpxAsyncDownloadAdapterDownloadAndExtract:
         async def mock_download_with_retry(url, filepath, doc_name, year):
             return True, None
 
-        async def mock_get_content_length(url):
-            return None
-
         adapter._download_with_retry = mock_download_with_retry
-        adapter._get_content_length = mock_get_content_length
 
         mock_progress = MagicMock()
         result = DownloadResultCVM()
@@ -785,6 +815,1228 @@ class TestHttpxAsyncDownloadAdapterConcurrency:
         assert result.error_count_downloads == 0
 
 
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterExtractionPipeline:
+    @staticmethod
+    def _make_adapter(extract, **kwargs):
+        import zipfile
+
+        import polars as pl
+
+        def fake_extract(zip_path, dest_path):
+            extract()
+            with zipfile.ZipFile(zip_path) as zf:
+                for name in zf.namelist():
+                    stem = name.rsplit('.', 1)[0]
+                    pl.DataFrame({'a': [1]}).write_parquet(
+                        f'{dest_path}/{stem}.parquet'
+                    )
+
+        mock_extractor = MagicMock()
+        mock_extractor.extract.side_effect = fake_extract
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=mock_extractor,
+            automatic_extractor=True,
+            **kwargs,
+        )
+
+        async def mock_download_with_retry(url, filepath, doc_name, year):
+            await asyncio.sleep(0.01)
+            with zipfile.ZipFile(filepath, 'w') as zf:
+                zf.writestr(f'{doc_name}_{year}.csv', 'a\n1\n')
+            return True, None
+
+        adapter._download_with_retry = mock_download_with_retry
+        adapter._validate_downloaded_file = lambda *args: True
+        return adapter
+
+    @staticmethod
+    def _tasks(output_dir, count):
+        return [
+            (
+                f'https://example.com/DOC{i}_2023.zip',
+                f'DOC{i}',
+                '2023',
+                str(output_dir),
+            )
+            for i in range(count)
+        ]
+
+    async def test_slow_extraction_does_not_block_downloads(self, tmp_path):
+        import threading
+
+        release = threading.Event()
+        adapter = self._make_adapter(
+            lambda: release.wait(5),
+            scheduling=SchedulingConfigCVM(max_concurrent_extractions=1),
+        )
+        result = DownloadResultCVM()
+
+        pipeline = asyncio.create_task(
+            adapter._execute_async_downloads(self._tasks(tmp_path, 4), result)
+        )
+        await asyncio.sleep(0.3)
+
+        # The first extraction is stuck, yet the loop kept downloading
+        assert len(list(tmp_path.glob('*.zip'))) >= 2
+        assert result.success_count_downloads == 0
+
+        release.set()
+        await pipeline
+
+        assert result.success_count_downloads == 4
+        assert result.error_count_downloads == 0
+        assert not list(tmp_path.glob('*.zip'))
+
+    async def test_respects_max_concurrent_extractions(self, tmp_path):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def slow_extract():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        adapter = self._make_adapter(
+            slow_extract,
+            scheduling=SchedulingConfigCVM(max_concurrent_extractions=2),
+        )
+        result = DownloadResultCVM()
+
+        await adapter._execute_async_downloads(
+            self._tasks(tmp_path, 6), result
+        )
+
+        assert result.success_count_downloads == 6
+        assert peak <= 2
+        assert adapter._extraction_executor is None
+
+    async def test_outcomes_are_recorded_on_the_loop_thread(self, tmp_path):
+        import threading
+
+        threads = set()
+
+        class ThreadRecordingResult(DownloadResultCVM):
+            def add_success_downloads(self, item):
+                threads.add(threading.get_ident())
+                super().add_success_downloads(item)
+
+        adapter = self._make_adapter(lambda: None)
+        result = ThreadRecordingResult()
+
+        await adapter._execute_async_downloads(
+            self._tasks(tmp_path, 3), result
+        )
+
+        assert result.success_count_downloads == 3
+        assert threads == {threading.get_ident()}
+
+    async def test_records_time_per_stage(self, tmp_path):
+        import time
+
+        adapter = self._make_adapter(lambda: time.sleep(0.02))
+        result = DownloadResultCVM()
+
+        await adapter._execute_async_downloads(
+            self._tasks(tmp_path, 2), result
+        )
+
+        assert result.download_time > 0
+        assert result.extraction_time >= 0.04
+
+    async def test_download_failures_skip_extraction(self, tmp_path):
+        adapter = self._make_adapter(lambda: None)
+
+        async def failing_download(url, filepath, doc_name, year):
+            return False, 'Network error'
+
+        adapter._download_with_retry = failing_download
+        result = DownloadResultCVM()
+
+        await adapter._execute_async_downloads(
+            self._tasks(tmp_path, 3), result
+        )
+
+        assert result.error_count_downloads == 3
+        adapter.file_extractor_repository.extract.assert_not_called()
+        assert result.extraction_time == 0.0
+
+    async def test_cancelled_run_does_not_wait_for_extractions(self, tmp_path):
+        import threading
+        import time
+
+        release = threading.Event()
+        started = threading.Event()
+
+        def stuck_extract():
+            started.set()
+            release.wait(5)
+
+        adapter = self._make_adapter(
+            stuck_extract,
+            scheduling=SchedulingConfigCVM(max_concurrent_extractions=1),
+        )
+        pipeline = asyncio.create_task(
+            adapter._execute_async_downloads(
+                self._tasks(tmp_path, 3), DownloadResultCVM()
+            )
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        pipeline.cancel()
+        waited = time.perf_counter()
+        with pytest.raises(asyncio.CancelledError):
+            await pipeline
+
+        try:
+            # The conversion still running in its thread is not awaited
+            assert time.perf_counter() - waited < 1
+            assert adapter._extraction_executor is None
+        finally:
+            release.set()
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterResponseValidation:
+    @staticmethod
+    def _make_adapter(info_for):
+        import zipfile
+
+        from globaldatafinance.macro_infra import DownloadInfo
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock()
+        )
+
+        async def fake_download_file(url, output_path, chunk_size, **kwargs):
+            with zipfile.ZipFile(output_path, 'w') as zf:
+                zf.writestr('data.csv', 'a;b\n1;2\n')
+            size = len(open(output_path, 'rb').read())
+            return DownloadInfo(**info_for(size))
+
+        adapter.requests_adapter.async_download_file = fake_download_file
+        adapter.requests_adapter.async_head = AsyncMock()
+        return adapter
+
+    async def test_validates_from_get_response_without_head(self, tmp_path):
+        adapter = self._make_adapter(
+            lambda size: {
+                'bytes_written': size,
+                'content_length': size,
+                'etag': '"abc"',
+            }
+        )
+        result = DownloadResultCVM()
+
+        await adapter._download_and_extract(
+            'https://example.com/DFP_2023.zip',
+            str(tmp_path),
+            'DFP',
+            '2023',
+            result,
+            MagicMock(),
+        )
+
+        assert result.success_count_downloads == 1
+        adapter.requests_adapter.async_head.assert_not_awaited()
+        assert adapter._download_info == {}
+
+    async def test_short_body_is_rejected(self, tmp_path):
+        adapter = self._make_adapter(
+            lambda size: {'bytes_written': size, 'content_length': size * 2}
+        )
+        result = DownloadResultCVM()
+
+        await adapter._download_and_extract(
+            'https://example.com/DFP_2023.zip',
+            str(tmp_path),
+            'DFP',
+            '2023',
+            result,
+            MagicMock(),
+        )
+
+        assert result.error_count_downloads == 1
+        assert 'Incomplete download' in result.failed_downloads['DFP_2023']
+        assert not (tmp_path / 'DFP_2023.zip').exists()
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterResume:
+    async def test_retry_resumes_from_partial_file(self, tmp_path):
+        import io
+        import random
+        import zipfile
+
+        import httpx
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('data.csv', random.randbytes(200_000))
+        body = buffer.getvalue()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            range_header = request.headers.get('range')
+            if range_header:
+                start = int(range_header.split('=')[1].rstrip('-'))
+                return httpx.Response(
+                    206,
+                    content=body[start:],
+                    headers={
+                        'ETag': '"v1"',
+                        'Content-Range': (
+                            f'bytes {start}-{len(body) - 1}/{len(body)}'
+                        ),
+                    },
+                )
+
+            async def broken_body():
+                yield body[:100_000]
+                raise httpx.ReadError('Connection reset by peer')
+
+            return httpx.Response(
+                200, content=broken_body(), headers={'ETag': '"v1"'}
+            )
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_retries=1,
+            initial_backoff=0.01,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert len(requests) == 2
+        assert requests[1].headers['range'].startswith('bytes=')
+        assert (tmp_path / 'DFP_2023.zip').read_bytes() == body
+        assert not (tmp_path / 'DFP_2023.zip.part').exists()
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterSegmented:
+    async def test_large_files_are_downloaded_as_ranges(self, tmp_path):
+        import io
+        import random
+        import zipfile
+
+        import httpx
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('data.csv', random.randbytes(200_000))
+        body = buffer.getvalue()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            first, _, last = (
+                request.headers['range'].split('=')[1].partition('-')
+            )
+            start = int(first)
+            end = int(last) if last else len(body) - 1
+            return httpx.Response(
+                206,
+                content=body[start : end + 1],
+                headers={
+                    'ETag': '"v1"',
+                    'Content-Range': f'bytes {start}-{end}/{len(body)}',
+                },
+            )
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_concurrent=4,
+            transfer=TransferConfigCVM(
+                segmented_download_threshold=100_000, download_segments=4
+            ),
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (f'https://example.com/DFP_{year}.zip', 'DFP', year, path)
+                for year, path in (
+                    ('2022', str(tmp_path)),
+                    ('2023', str(tmp_path)),
+                )
+            ]
+        )
+
+        assert sorted(result.successful_downloads) == ['DFP_2022', 'DFP_2023']
+        for year in ('2022', '2023'):
+            ranges = sorted(
+                r.headers['range']
+                for r in requests
+                if r.url.path == f'/DFP_{year}.zip'
+            )
+            assert len(ranges) == 4
+            assert ranges[0] == 'bytes=0-'
+            assert (tmp_path / f'DFP_{year}.zip').read_bytes() == body
+        assert adapter._download_slots is None
+        assert result.disk_write_time > 0
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterThrottling:
+    async def test_throttled_download_is_retried_and_shrinks_limit(
+        self, tmp_path
+    ):
+        import io
+        import zipfile
+
+        import httpx
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('data.csv', 'a;b\n1;2\n')
+        body = buffer.getvalue()
+        statuses = []
+
+        def handler(request):
+            if not statuses:
+                statuses.append(429)
+                return httpx.Response(429, headers={'Retry-After': '0'})
+            statuses.append(200)
+            return httpx.Response(200, content=body)
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_concurrent=8,
+            max_retries=1,
+            initial_backoff=0.01,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert statuses == [429, 200]
+        assert adapter.concurrency_limiter.limit == 4
+        assert adapter.concurrency_limiter.in_flight == 0
+
+    async def test_fixed_concurrency_without_adaptive_limiter(self):
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            scheduling=SchedulingConfigCVM(
+                adaptive_concurrency=False, requests_per_second=5.0
+            ),
+        )
+
+        assert adapter.concurrency_limiter is None
+        assert adapter.rate_limiter.rate == 5.0
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterStalls:
+    @staticmethod
+    def _zip_body():
+        import io
+        import random
+        import zipfile
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('data.csv', random.randbytes(200_000))
+        return buffer.getvalue()
+
+    @staticmethod
+    def _make_adapter(handler, **kwargs):
+        import httpx
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            initial_backoff=0.01,
+            **kwargs,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return adapter
+
+    async def test_stalled_transfer_is_retried_and_resumed(self, tmp_path):
+        import httpx
+
+        body = self._zip_body()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            range_header = request.headers.get('range')
+            if range_header:
+                start = int(range_header.split('=')[1].rstrip('-'))
+                return httpx.Response(
+                    206,
+                    content=body[start:],
+                    headers={
+                        'ETag': '"v1"',
+                        'Content-Range': (
+                            f'bytes {start}-{len(body) - 1}/{len(body)}'
+                        ),
+                    },
+                )
+
+            async def stalling_body():
+                yield body[:100_000]
+                await asyncio.sleep(10)
+                yield body[100_000:]
+
+            return httpx.Response(
+                200, content=stalling_body(), headers={'ETag': '"v1"'}
+            )
+
+        adapter = self._make_adapter(
+            handler,
+            max_retries=1,
+            transfer=TransferConfigCVM(min_throughput=1024, stall_window=0.1),
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert len(requests) == 2
+        # Whole chunks received before the stall are kept
+        resumed_from = int(requests[1].headers['range'][6:].rstrip('-'))
+        assert 90_000 <= resumed_from <= 100_000
+        assert (tmp_path / 'DFP_2023.zip').read_bytes() == body
+
+    async def test_slow_download_is_hedged(self, tmp_path):
+        import httpx
+
+        body = self._zip_body()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) > 1:
+                return httpx.Response(200, content=body)
+
+            async def slow_body():
+                yield body[:1000]
+                await asyncio.sleep(10)
+                yield body[1000:]
+
+            return httpx.Response(200, content=slow_body())
+
+        adapter = self._make_adapter(
+            handler,
+            max_concurrent=4,
+            max_retries=0,
+            transfer=TransferConfigCVM(min_throughput=None),
+            scheduling=SchedulingConfigCVM(hedge_downloads=True),
+        )
+        for _ in range(10):
+            adapter.hedger.record(0.01)
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert len(requests) == 2
+        assert (tmp_path / 'DFP_2023.zip').read_bytes() == body
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            DownloadManifestCVM.FILENAME,
+            'DFP_2023.zip',
+        ]
+        assert adapter.concurrency_limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterRetryLimits:
+    @staticmethod
+    def _run(adapter, tmp_path, count):
+        return adapter.download_docs_async(
+            [
+                (
+                    f'https://example.com/DFP_{2010 + i}.zip',
+                    'DFP',
+                    str(2010 + i),
+                    str(tmp_path),
+                )
+                for i in range(count)
+            ]
+        )
+
+    @staticmethod
+    def _make_adapter(handler, **kwargs):
+        import httpx
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_concurrent=1,
+            scheduling=SchedulingConfigCVM(adaptive_concurrency=False),
+            initial_backoff=0.001,
+            **kwargs,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return adapter
+
+    async def test_open_circuit_fails_fast(self, tmp_path):
+        import httpx
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            raise httpx.ConnectError('Connection refused')
+
+        adapter = self._make_adapter(
+            handler,
+            max_retries=3,
+            retry=RetryConfigCVM(circuit_failure_threshold=2),
+        )
+
+        result = await self._run(adapter, tmp_path, 5)
+
+        assert len(requests) == 2
+        assert result.error_count_downloads == 5
+        assert 'CircuitOpenError' in result.failed_downloads['DFP_2014']
+        assert adapter.circuit_breaker.is_open('https://example.com/')
+
+    async def test_retry_budget_caps_retries_of_a_run(self, tmp_path):
+        import httpx
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(500)
+
+        adapter = self._make_adapter(
+            handler,
+            max_retries=5,
+            retry=RetryConfigCVM(
+                retry_budget_ratio=0.0,
+                min_retry_budget=2,
+                circuit_failure_threshold=100,
+            ),
+        )
+
+        result = await self._run(adapter, tmp_path, 3)
+
+        # One attempt per file plus the two retries of the budget
+        assert len(requests) == 5
+        assert result.error_count_downloads == 3
+
+    async def test_client_errors_do_not_open_the_circuit(self, tmp_path):
+        import httpx
+
+        adapter = self._make_adapter(
+            lambda request: httpx.Response(404),
+            max_retries=3,
+            retry=RetryConfigCVM(circuit_failure_threshold=1),
+        )
+
+        result = await self._run(adapter, tmp_path, 3)
+
+        assert result.error_count_downloads == 3
+        assert not adapter.circuit_breaker.is_open('https://example.com/')
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterSpooledZip:
+    async def test_zip_is_extracted_without_touching_disk(self, tmp_path):
+        import io
+        import zipfile
+
+        import httpx
+
+        from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
+            ParquetExtractorAdapterCVM,
+        )
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('dfp_cia_aberta_2023.csv', 'CNPJ;VALOR\n1;10\n')
+            zf.writestr('dfp_cia_aberta_DRE_2023.csv', 'CNPJ;VALOR\n1;7\n')
+        body = buffer.getvalue()
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=ParquetExtractorAdapterCVM(),
+            automatic_extractor=True,
+            keep_zip=False,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, content=body)
+                )
+            )
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert 'dfp_cia_aberta_2023.parquet' in names
+        assert 'dfp_cia_aberta_DRE_2023.parquet' in names
+        assert not [n for n in names if n.endswith(('.zip', '.part'))]
+        assert adapter._buffers == {}
+
+    async def test_keep_zip_can_be_overridden_per_call(self, tmp_path):
+        import io
+        import zipfile
+
+        import httpx
+
+        from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
+            ParquetExtractorAdapterCVM,
+        )
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('dfp_cia_aberta_2023.csv', 'CNPJ;VALOR\n1;10\n')
+        body = buffer.getvalue()
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=ParquetExtractorAdapterCVM(),
+            automatic_extractor=True,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, content=body)
+                )
+            )
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ],
+            keep_zip=False,
+        )
+
+        assert result.successful_downloads == ['DFP_2023']
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert 'dfp_cia_aberta_2023.parquet' in names
+        assert not [n for n in names if n.endswith(('.zip', '.part'))]
+        assert adapter.keep_zip is True
+
+    async def test_failed_extraction_releases_buffer(self, tmp_path):
+        import io
+        import zipfile
+
+        import httpx
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('dfp_cia_aberta_2023.csv', 'CNPJ;VALOR\n1;10\n')
+        body = buffer.getvalue()
+
+        extractor = MagicMock()
+        extractor.extract_from_buffer.side_effect = ExtractionError(
+            'DFP_2023.zip', 'boom'
+        )
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=extractor,
+            automatic_extractor=True,
+            keep_zip=False,
+            max_retries=0,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, content=body)
+                )
+            )
+        )
+
+        result = await adapter.download_docs_async(
+            [
+                (
+                    'https://example.com/DFP_2023.zip',
+                    'DFP',
+                    '2023',
+                    str(tmp_path),
+                )
+            ]
+        )
+
+        assert result.error_count_downloads == 1
+        extractor.extract.assert_not_called()
+        assert adapter._buffers == {}
+        assert not (tmp_path / 'DFP_2023.zip').exists()
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterMirror:
+    URL = 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2023.zip'
+
+    @staticmethod
+    def _zip_bytes(content='CNPJ;VALOR\n1;10\n'):
+        import io
+        import zipfile
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('dfp_cia_aberta_2023.csv', content)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _make_adapter(handler, mirror_url):
+        import httpx
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_retries=0,
+            mirror_url=mirror_url,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return adapter
+
+    async def _run(self, adapter, dest):
+        return await adapter.download_docs_async(
+            [(self.URL, 'DFP', '2023', str(dest))]
+        )
+
+    async def test_http_mirror_serves_the_file(self, tmp_path):
+        import httpx
+
+        body = self._zip_bytes()
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200, content=body)
+
+        adapter = self._make_adapter(handler, 'http://mirror.lan:8000/')
+
+        result = await self._run(adapter, tmp_path)
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert hosts == ['mirror.lan']
+        assert (tmp_path / 'dfp_cia_aberta_2023.zip').read_bytes() == body
+
+    @pytest.mark.parametrize(
+        'mirror_failure', ['missing', 'unreachable'], ids=str
+    )
+    async def test_falls_back_to_origin(self, tmp_path, mirror_failure):
+        import httpx
+
+        body = self._zip_bytes()
+        paths = []
+
+        def handler(request):
+            paths.append((request.url.host, request.url.path))
+            if request.url.host == 'mirror.lan':
+                if mirror_failure == 'unreachable':
+                    raise httpx.ConnectError('refused', request=request)
+                return httpx.Response(404)
+            return httpx.Response(200, content=body)
+
+        adapter = self._make_adapter(handler, 'http://mirror.lan')
+
+        result = await self._run(adapter, tmp_path)
+
+        assert result.successful_downloads == ['DFP_2023']
+        path = '/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2023.zip'
+        assert paths == [('mirror.lan', path), ('dados.cvm.gov.br', path)]
+        assert (tmp_path / 'dfp_cia_aberta_2023.zip').read_bytes() == body
+
+    async def test_mirror_server_error_is_not_masked(self, tmp_path):
+        import httpx
+
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(500)
+
+        adapter = self._make_adapter(handler, 'http://mirror.lan')
+
+        result = await self._run(adapter, tmp_path)
+
+        assert result.error_count_downloads == 1
+        assert hosts == ['mirror.lan']
+
+    async def test_local_mirror_directory(self, tmp_path):
+        body = self._zip_bytes()
+        mirror = tmp_path / 'mirror'
+        source = mirror / 'dados/CIA_ABERTA/DOC/DFP/DADOS'
+        source.mkdir(parents=True)
+        (source / 'dfp_cia_aberta_2023.zip').write_bytes(body)
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+
+        def handler(request):
+            raise AssertionError('the origin must not be contacted')
+
+        adapter = self._make_adapter(handler, mirror.as_uri())
+
+        first = await self._run(adapter, dest)
+        second = await self._run(adapter, dest)
+
+        assert first.successful_downloads == ['DFP_2023']
+        assert (dest / 'dfp_cia_aberta_2023.zip').read_bytes() == body
+        entry = DownloadManifestCVM(dest).get(self.URL)
+        assert entry['size'] == len(body)
+        assert second.skipped_downloads == ['DFP_2023']
+
+    async def test_local_mirror_missing_file_uses_origin(self, tmp_path):
+        import httpx
+
+        body = self._zip_bytes()
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200, content=body)
+
+        adapter = self._make_adapter(handler, str(tmp_path / 'empty'))
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+
+        result = await self._run(adapter, dest)
+
+        assert result.successful_downloads == ['DFP_2023']
+        assert hosts == ['dados.cvm.gov.br']
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterDiscovery:
+    DIRECTORY = 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/'
+
+    @staticmethod
+    def _zip_bytes():
+        import io
+        import zipfile
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('dfp_cia_aberta_2022.csv', 'CNPJ;VALOR\n1;10\n')
+        return buffer.getvalue()
+
+    def _make_adapter(self, listing, requests):
+        import httpx
+
+        body = self._zip_bytes()
+
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path.endswith('/'):
+                return httpx.Response(200, text=listing['page'])
+            return httpx.Response(200, content=body)
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_retries=3,
+            discover_files=True,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return adapter
+
+    def _tasks(self, tmp_path):
+        return [
+            (
+                f'{self.DIRECTORY}dfp_cia_aberta_{year}.zip',
+                'DFP',
+                year,
+                str(tmp_path),
+            )
+            for year in ('2022', '2023')
+        ]
+
+    @staticmethod
+    def _page(date):
+        return (
+            '<a href="dfp_cia_aberta_2022.zip">dfp_cia_aberta_2022.zip</a>'
+            f'  {date}  1.2K\n'
+        )
+
+    async def test_unlisted_files_are_not_requested(self, tmp_path):
+        requests = []
+        listing = {'page': self._page('2024-10-12 06:01')}
+        adapter = self._make_adapter(listing, requests)
+
+        result = await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert result.successful_downloads == ['DFP_2022']
+        assert result.unavailable_downloads == ['DFP_2023']
+        assert result.error_count_downloads == 0
+        assert requests == [
+            '/dados/CIA_ABERTA/DOC/DFP/DADOS/',
+            '/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2022.zip',
+        ]
+
+    async def test_unchanged_listing_skips_without_request(self, tmp_path):
+        requests = []
+        listing = {'page': self._page('2024-10-12 06:01')}
+        adapter = self._make_adapter(listing, requests)
+
+        await adapter.download_docs_async(self._tasks(tmp_path))
+        requests.clear()
+        second = await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert second.skipped_downloads == ['DFP_2022']
+        assert requests == []
+
+        listing['page'] = self._page('2025-01-02 07:30')
+        adapter.planner.remote_index.invalidate()
+        third = await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert third.successful_downloads == ['DFP_2022']
+        assert (
+            '/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2022.zip'
+            in requests
+        )
+
+    async def test_unlistable_directory_is_not_filtered(self, tmp_path):
+        import httpx
+
+        requests = []
+        body = self._zip_bytes()
+
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path.endswith('/'):
+                return httpx.Response(403)
+            return httpx.Response(200, content=body)
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            discover_files=True,
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+
+        result = await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert sorted(result.successful_downloads) == ['DFP_2022', 'DFP_2023']
+        assert result.unavailable_downloads == []
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterScheduling:
+    SIZES = {'2021': 3_000, '2022': 90_000, '2023': 40_000}
+
+    def _make_adapter(self, requests, **scheduling):
+        import io
+        import zipfile
+
+        import httpx
+
+        bodies = {}
+        for year, size in self.SIZES.items():
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+                zf.writestr(f'itr_{year}.csv', b'x' * size)
+            bodies[f'/ITR_{year}.zip'] = buffer.getvalue()
+
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            body = bodies[request.url.path]
+            if request.method == 'HEAD':
+                return httpx.Response(
+                    200, headers={'Content-Length': str(len(body))}
+                )
+            return httpx.Response(200, content=body)
+
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_concurrent=1,
+            scheduling=SchedulingConfigCVM(
+                adaptive_concurrency=False, **scheduling
+            ),
+        )
+        adapter.requests_adapter._build_client = lambda timeout: (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return adapter
+
+    def _tasks(self, tmp_path):
+        return [
+            (f'https://example.com/ITR_{year}.zip', 'ITR', year, str(tmp_path))
+            for year in self.SIZES
+        ]
+
+    @staticmethod
+    def _downloads(requests):
+        return [path for method, path in requests if method == 'GET']
+
+    async def test_head_prefetch_orders_largest_first(self, tmp_path):
+        requests = []
+        adapter = self._make_adapter(requests, prefetch_sizes=True)
+
+        result = await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert result.success_count_downloads == 3
+        assert self._downloads(requests) == [
+            '/ITR_2022.zip',
+            '/ITR_2023.zip',
+            '/ITR_2021.zip',
+        ]
+
+    async def test_manifest_sizes_are_used_without_requests(self, tmp_path):
+        requests = []
+        adapter = self._make_adapter(requests)
+        await adapter.download_docs_async(self._tasks(tmp_path))
+        for name in ('ITR_2021.zip', 'ITR_2022.zip', 'ITR_2023.zip'):
+            (tmp_path / name).unlink()
+        requests.clear()
+
+        await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert all(method == 'GET' for method, _ in requests)
+        assert self._downloads(requests) == [
+            '/ITR_2022.zip',
+            '/ITR_2023.zip',
+            '/ITR_2021.zip',
+        ]
+
+    async def test_unknown_sizes_keep_task_order(self, tmp_path):
+        requests = []
+        adapter = self._make_adapter(requests)
+
+        await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert self._downloads(requests) == [
+            '/ITR_2021.zip',
+            '/ITR_2022.zip',
+            '/ITR_2023.zip',
+        ]
+
+    async def test_largest_first_can_be_disabled(self, tmp_path):
+        requests = []
+        adapter = self._make_adapter(
+            requests, prefetch_sizes=True, largest_first=False
+        )
+
+        await adapter.download_docs_async(self._tasks(tmp_path))
+
+        assert requests == [
+            ('GET', '/ITR_2021.zip'),
+            ('GET', '/ITR_2022.zip'),
+            ('GET', '/ITR_2023.zip'),
+        ]
+
+
+@pytest.mark.asyncio
+class TestHttpxAsyncDownloadAdapterSession:
+    async def test_download_docs_async_shares_one_client_per_run(self):
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock()
+        )
+        seen = []
+
+        async def mock_execute(tasks, result):
+            seen.append(adapter.requests_adapter._pooled_client)
+
+        adapter._execute_async_downloads = mock_execute
+        tasks = [('https://example.com/a.zip', 'DFP', '2023', '/tmp')]
+
+        await adapter.download_docs_async(tasks)
+
+        assert seen[0] is not None
+        assert not adapter.requests_adapter.is_open
+
+    async def test_opened_adapter_reuses_client_across_calls(self):
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock()
+        )
+        seen = []
+
+        async def mock_execute(tasks, result):
+            seen.append(adapter.requests_adapter._pooled_client)
+
+        adapter._execute_async_downloads = mock_execute
+        tasks = [('https://example.com/a.zip', 'DFP', '2023', '/tmp')]
+
+        async with adapter:
+            await adapter.download_docs_async(tasks)
+            await adapter.download_docs_async(tasks)
+            assert adapter.requests_adapter.is_open
+
+        assert seen[0] is not None and seen[0] is seen[1]
+        assert not adapter.requests_adapter.is_open
+
+    async def test_pool_limits_follow_max_concurrent(self):
+        adapter = AsyncDownloadAdapterCVM(
+            file_extractor_repository=MagicMock(),
+            max_concurrent=4,
+            transfer=TransferConfigCVM(keepalive_expiry=12.0),
+        )
+
+        limits = adapter.requests_adapter.limits
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 4
+        assert limits.keepalive_expiry == 12.0
+
+
 @pytest.mark.unit
 class TestHttpxAsyncDownloadAdapterEdgeCases:
     def test_adapter_with_none_extractor(self):
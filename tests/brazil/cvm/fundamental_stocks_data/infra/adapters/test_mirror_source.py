@@ -0,0 +1,78 @@
+import io
+import os
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.requests_adapter import (
+    MirrorSourceCVM,
+)
+
+URL = 'https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2023.zip'
+PATH = 'dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2023.zip'
+
+
+def status_error(status):
+    request = httpx.Request('GET', URL)
+    return httpx.HTTPStatusError(
+        'error', request=request, response=httpx.Response(status)
+    )
+
+
+@pytest.mark.unit
+class TestMirrorSourceLocate:
+    def test_http_mirror_keeps_the_path(self):
+        mirror = MirrorSourceCVM('http://mirror.lan:8000/')
+
+        assert mirror.remote
+        assert mirror.locate(URL) == f'http://mirror.lan:8000/{PATH}'
+
+    @pytest.mark.parametrize('prefix', ['', 'file://'], ids=['path', 'url'])
+    def test_local_mirror_maps_to_a_file(self, tmp_path, prefix):
+        mirror = MirrorSourceCVM(f'{prefix}{tmp_path}')
+
+        assert not mirror.remote
+        assert mirror.locate(URL) == str(tmp_path / PATH)
+
+
+@pytest.mark.unit
+class TestMirrorSourceIsMiss:
+    @pytest.mark.parametrize('status', [403, 404, 410])
+    def test_missing_files(self, status):
+        assert MirrorSourceCVM.is_miss(status_error(status))
+
+    def test_unreachable_mirror_and_missing_local_file(self):
+        assert MirrorSourceCVM.is_miss(httpx.ConnectError('refused'))
+        assert MirrorSourceCVM.is_miss(FileNotFoundError())
+
+    def test_server_errors_are_not_misses(self):
+        assert not MirrorSourceCVM.is_miss(status_error(500))
+        assert not MirrorSourceCVM.is_miss(ValueError())
+
+
+@pytest.mark.unit
+class TestMirrorSourceCopy:
+    def test_copies_and_hashes(self, tmp_path):
+        import hashlib
+
+        source = tmp_path / 'source.zip'
+        source.write_bytes(b'zip bytes')
+        buffer = io.BytesIO()
+
+        info = MirrorSourceCVM.copy(str(source), buffer)
+
+        assert buffer.getvalue() == b'zip bytes'
+        assert info.bytes_written == info.content_length == 9
+        assert info.digest == hashlib.sha256(b'zip bytes').hexdigest()
+
+    def test_unchanged_file_is_not_copied(self, tmp_path):
+        source = tmp_path / 'source.zip'
+        source.write_bytes(b'zip bytes')
+        target = tmp_path / 'target.zip'
+        since = formatdate(os.stat(source).st_mtime + 60, usegmt=True)
+
+        info = MirrorSourceCVM.copy(str(source), str(target), since)
+
+        assert info.not_modified
+        assert not target.exists()
@@ -1,3 +1,5 @@
+import io
+import threading
 import zipfile
 
 import pytest
@@ -7,6 +9,7 @@ from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
 )
 from globaldatafinance.macro_exceptions import (
     CorruptedZipError,
+    DiskFullError,
     ExtractionError,
 )
 
@@ -153,3 +156,171 @@ class TestParquetExtractorFileExtractorInterface:
 
         extractor: FileExtractorRepositoryCVM = ParquetExtractorAdapterCVM()
         assert isinstance(extractor, ParquetExtractorAdapterCVM)
+
+
+@pytest.mark.unit
+class TestParquetExtractorConcurrentMembers:
+    @staticmethod
+    def make_zip(tmp_path, count):
+        zip_path = tmp_path / 'multi.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            for i in range(count):
+                zf.writestr(f'file_{i}.csv', f'a;b\n{i};x\n')
+        return zip_path
+
+    def test_members_are_converted_concurrently(self, tmp_path, monkeypatch):
+        zip_path = self.make_zip(tmp_path, 4)
+        extractor = ParquetExtractorAdapterCVM(max_workers=2)
+        monkeypatch.setattr(
+            extractor.resource_monitor,
+            'get_safe_worker_count',
+            lambda max_workers=None: max_workers,
+        )
+
+        barrier = threading.Barrier(2, timeout=5)
+        original = extractor.extractor_adapter.extract_csv_from_zip_to_parquet
+        handles = []
+
+        def convert(zip_file, *args, **kwargs):
+            handles.append(zip_file)
+            barrier.wait()  # Only passes if two members run at once
+            return original(zip_file, *args, **kwargs)
+
+        monkeypatch.setattr(
+            extractor.extractor_adapter,
+            'extract_csv_from_zip_to_parquet',
+            convert,
+        )
+
+        extractor.extract(str(zip_path), str(tmp_path))
+
+        assert len({id(h) for h in handles}) == 4  # One ZipFile per member
+        assert sorted(p.name for p in tmp_path.glob('*.parquet')) == [
+            f'file_{i}.parquet' for i in range(4)
+        ]
+
+    def test_failed_member_rolls_back_all(self, tmp_path, monkeypatch):
+        zip_path = self.make_zip(tmp_path, 5)
+        extractor = ParquetExtractorAdapterCVM()
+        original = extractor.extractor_adapter.extract_csv_from_zip_to_parquet
+
+        def convert(
+            zip_file, parquet_path, parquet_filename, csv_filename, **kw
+        ):
+            if csv_filename == 'file_3.csv':
+                raise ExtractionError(csv_filename, 'boom')
+            return original(
+                zip_file, parquet_path, parquet_filename, csv_filename, **kw
+            )
+
+        monkeypatch.setattr(
+            extractor.extractor_adapter,
+            'extract_csv_from_zip_to_parquet',
+            convert,
+        )
+
+        with pytest.raises(ExtractionError) as exc_info:
+            extractor.extract(str(zip_path), str(tmp_path))
+
+        assert 'file_3.csv' in str(exc_info.value)
+        assert not list(tmp_path.glob('*.parquet'))
+
+    def test_disk_full_cleans_up_and_propagates(self, tmp_path, monkeypatch):
+        zip_path = self.make_zip(tmp_path, 3)
+        extractor = ParquetExtractorAdapterCVM()
+        original = extractor.extractor_adapter.extract_csv_from_zip_to_parquet
+
+        def convert(
+            zip_file, parquet_path, parquet_filename, csv_filename, **kw
+        ):
+            if csv_filename == 'file_1.csv':
+                raise DiskFullError(str(parquet_path))
+            return original(
+                zip_file, parquet_path, parquet_filename, csv_filename, **kw
+            )
+
+        monkeypatch.setattr(
+            extractor.extractor_adapter,
+            'extract_csv_from_zip_to_parquet',
+            convert,
+        )
+
+        with pytest.raises(DiskFullError):
+            extractor.extract(str(zip_path), str(tmp_path))
+
+        assert not list(tmp_path.glob('*.parquet'))
+
+    def test_member_crc_mismatch_raises_corrupted_zip(self, tmp_path):
+        zip_path = self.make_zip(tmp_path, 3)
+        with zipfile.ZipFile(zip_path) as zf:
+            info = zf.getinfo('file_1.csv')
+        data = bytearray(zip_path.read_bytes())
+        # Flip a byte inside the stored member data (header is 30 bytes)
+        offset = info.header_offset + 30 + len(info.filename) + 5
+        data[offset] ^= 0x01
+        zip_path.write_bytes(bytes(data))
+
+        with pytest.raises(CorruptedZipError) as exc_info:
+            ParquetExtractorAdapterCVM().extract(str(zip_path), str(tmp_path))
+
+        assert 'CRC' in str(exc_info.value)
+        assert not list(tmp_path.glob('*.parquet'))
+
+
+@pytest.mark.unit
+class TestParquetExtractorFromBuffer:
+    @staticmethod
+    def make_buffer(count):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            for i in range(count):
+                zf.writestr(f'file_{i}.csv', f'a;b\n{i};x\n')
+        buffer.seek(0)
+        return buffer
+
+    def test_extracts_members_without_zip_on_disk(self, tmp_path):
+        import polars as pl
+
+        extractor = ParquetExtractorAdapterCVM(max_workers=2)
+
+        extractor.extract_from_buffer(
+            self.make_buffer(3), 'dfp_2023.zip', str(tmp_path)
+        )
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            f'file_{i}.parquet' for i in range(3)
+        ]
+        frame = pl.read_parquet(tmp_path / 'file_2.parquet')
+        assert frame.height == 1
+
+    def test_members_share_one_zip_handle(self, tmp_path, monkeypatch):
+        extractor = ParquetExtractorAdapterCVM()
+        original = extractor.extractor_adapter.extract_csv_from_zip_to_parquet
+        handles = []
+
+        def convert(zip_file, *args, **kwargs):
+            handles.append(zip_file)
+            return original(zip_file, *args, **kwargs)
+
+        monkeypatch.setattr(
+            extractor.extractor_adapter,
+            'extract_csv_from_zip_to_parquet',
+            convert,
+        )
+
+        extractor.extract_from_buffer(
+            self.make_buffer(4), 'dfp_2023.zip', str(tmp_path)
+        )
+
+        assert len({id(h) for h in handles}) == 1
+
+    def test_invalid_buffer_raises_corrupted_zip(self, tmp_path):
+        extractor = ParquetExtractorAdapterCVM()
+
+        with pytest.raises(CorruptedZipError) as exc_info:
+            extractor.extract_from_buffer(
+                io.BytesIO(b'Not a ZIP'), 'dfp_2023.zip', str(tmp_path)
+            )
+
+        assert 'dfp_2023.zip' in str(exc_info.value)
+        assert not list(tmp_path.iterdir())
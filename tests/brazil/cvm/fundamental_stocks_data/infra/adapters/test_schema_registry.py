@@ -0,0 +1,133 @@
+import zipfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from globaldatafinance.brazil.cvm.fundamental_stocks_data import (
+    ParquetExtractorAdapterCVM,
+)
+from globaldatafinance.brazil.cvm.fundamental_stocks_data.infra.adapters.extractors_docs_adapter import (
+    SchemaRegistryCVM,
+)
+
+CODE = pa.dictionary(pa.int32(), pa.string())
+
+STATEMENT_HEADER = [
+    'CNPJ_CIA',
+    'DT_REFER',
+    'VERSAO',
+    'DENOM_CIA',
+    'CD_CVM',
+    'GRUPO_DFP',
+    'MOEDA',
+    'ESCALA_MOEDA',
+    'ORDEM_EXERC',
+    'DT_FIM_EXERC',
+    'CD_CONTA',
+    'DS_CONTA',
+    'VL_CONTA',
+    'ST_CONTA_FIXA',
+]
+
+
+@pytest.mark.unit
+class TestSchemaRegistryCVM:
+    @pytest.mark.parametrize(
+        'filename, expected',
+        [
+            ('dfp_cia_aberta_BPA_con_2023.csv', 'dfp_cia_aberta_BPA_con'),
+            ('itr_cia_aberta_2024.csv', 'itr_cia_aberta'),
+            (
+                'fre_cia_aberta_remuneracao_2022.csv',
+                'fre_cia_aberta_remuneracao',
+            ),
+            ('no_year.csv', 'no_year'),
+        ],
+    )
+    def test_family_strips_year(self, filename, expected):
+        assert SchemaRegistryCVM().family(filename) == expected
+
+    def test_statement_types(self):
+        types = SchemaRegistryCVM().column_types(
+            'itr_cia_aberta_DRE_ind_2023.csv', STATEMENT_HEADER
+        )
+
+        assert types['DT_REFER'] == pa.date32()
+        assert types['DT_FIM_EXERC'] == pa.date32()
+        assert types['VL_CONTA'] == pa.float64()
+        assert types['VERSAO'] == pa.int32()
+        assert types['CD_CONTA'] == CODE
+        assert types['ESCALA_MOEDA'] == CODE
+        assert set(types) == set(STATEMENT_HEADER)
+
+    def test_document_index_types(self):
+        types = SchemaRegistryCVM().column_types(
+            'dfp_cia_aberta_2023.csv', ['CD_CVM', 'ID_DOC', 'DT_RECEB']
+        )
+
+        assert types == {
+            'CD_CVM': CODE,
+            'ID_DOC': pa.int64(),
+            'DT_RECEB': pa.date32(),
+        }
+
+    def test_unknown_family_uses_prefix_rules(self):
+        types = SchemaRegistryCVM().column_types(
+            'fre_cia_aberta_remuneracao_2023.csv',
+            ['CNPJ_CIA', 'DT_INI', 'VL_TOTAL', 'OBSERVACAO'],
+        )
+
+        assert types == {
+            'CNPJ_CIA': CODE,
+            'DT_INI': pa.date32(),
+            'VL_TOTAL': pa.float64(),
+        }
+
+    @pytest.mark.parametrize('as_dictionary', [True, False])
+    def test_normalize_escala_moeda(self, as_dictionary):
+        values = pa.array([' Mil', 'MIL', 'unidade', None])
+        if as_dictionary:
+            values = values.dictionary_encode()
+        batch = pa.record_batch(
+            [values, pa.array([1, 2, 3, 4])], ['ESCALA_MOEDA', 'X']
+        )
+
+        result = SchemaRegistryCVM().normalize(batch)
+
+        assert result.column(0).to_pylist() == ['MIL', 'MIL', 'UNIDADE', None]
+        assert result.column(1).to_pylist() == [1, 2, 3, 4]
+
+    def test_normalize_without_column_is_noop(self):
+        batch = pa.record_batch([pa.array([1])], ['X'])
+        assert SchemaRegistryCVM().normalize(batch) is batch
+
+
+@pytest.mark.unit
+class TestTypedExtraction:
+    def test_statement_file_is_written_with_registry_types(self, tmp_path):
+        rows = [
+            ';'.join(STATEMENT_HEADER),
+            '00.000.000/0001-91;2023-12-31;1;PETROBRAS;009512;DF Consolidado'
+            ';REAL;Mil;ÚLTIMO;2023-12-31;1;Ativo Total;1000.5;S',
+            '00.000.000/0001-91;2023-12-31;1;PETROBRAS;009512;DF Consolidado'
+            ';REAL;MIL;ÚLTIMO;2023-12-31;1.01;Ativo Circulante;;S',
+        ]
+        zip_path = tmp_path / 'dfp_cia_aberta_2023.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr(
+                'dfp_cia_aberta_BPA_con_2023.csv',
+                '\n'.join(rows).encode('latin-1'),
+            )
+
+        ParquetExtractorAdapterCVM().extract(str(zip_path), str(tmp_path))
+
+        table = pq.read_table(tmp_path / 'dfp_cia_aberta_BPA_con_2023.parquet')
+        assert table.schema.field('DT_REFER').type == pa.date32()
+        assert table.schema.field('VL_CONTA').type == pa.float64()
+        assert table.schema.field('CD_CVM').type == CODE
+        assert table.column('CD_CVM').to_pylist() == ['009512', '009512']
+        assert table.column('CD_CONTA').to_pylist() == ['1', '1.01']
+        assert table.column('ESCALA_MOEDA').to_pylist() == ['MIL', 'MIL']
+        assert table.column('VL_CONTA').to_pylist() == [1000.5, None]
+        assert table.column('ORDEM_EXERC').to_pylist() == ['ÚLTIMO'] * 2
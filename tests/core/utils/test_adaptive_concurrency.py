@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from globaldatafinance.core.utils import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=20, max_limit=8)
+
+        assert limiter.limit == 8
+        assert limiter.min_limit == 1
+
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=4, decrease_factor=1.5)
+
+    def test_congestion_halves_limit_once_per_cooldown(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=8, min_limit=3, cooldown=1.0, clock=clock
+        )
+
+        limiter.record_congestion()
+        limiter.record_congestion()
+        assert limiter.limit == 4
+
+        clock.now += 1.0
+        limiter.record_congestion()
+        assert limiter.limit == 3
+
+    def test_successes_increase_limit_additively(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=8, max_limit=8, clock=clock
+        )
+        limiter.record_congestion()
+        assert limiter.limit == 4
+
+        for _ in range(4):
+            limiter.record_success(0.1)
+        assert limiter.limit == 5
+
+        for _ in range(100):
+            limiter.record_success(0.1)
+        assert limiter.limit == 8
+
+    def test_slow_responses_count_as_congestion(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=8, latency_tolerance=2.0, smoothing=1.0
+        )
+
+        limiter.record_success(0.1)
+        limiter.record_success(0.15)
+        assert limiter.limit == 8
+
+        limiter.record_success(0.5)
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_release(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+
+        await limiter.acquire()
+        assert limiter.locked()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+
+        limiter.release()
+        assert not limiter.locked()
+
+    @pytest.mark.asyncio
+    async def test_lower_limit_applies_to_new_acquirers(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        limiter.record_congestion()
+        limiter.release()
+        assert limiter.locked()
+
+        limiter.release()
+        async with limiter:
+            assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_permit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert not limiter.locked()
+
+    def test_release_without_acquire(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=1).release()
@@ -0,0 +1,91 @@
+import pytest
+
+from globaldatafinance.core.utils import CircuitBreaker
+from globaldatafinance.macro_exceptions import CircuitOpenError
+
+URL = 'https://dados.cvm.gov.br/DFP/dfp_cia_aberta_2023.zip'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+
+        for _ in range(2):
+            breaker.record_failure(URL)
+            breaker.before_request(URL)
+        breaker.record_failure(URL)
+
+        assert breaker.is_open(URL)
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request(URL)
+        assert exc_info.value.host == 'https://dados.cvm.gov.br'
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure(URL)
+        breaker.record_success(URL)
+        breaker.record_failure(URL)
+
+        assert not breaker.is_open(URL)
+
+    def test_hosts_are_independent(self):
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        breaker.record_failure(URL)
+
+        breaker.before_request('https://example.com/file.zip')
+        assert breaker.is_open('https://DADOS.cvm.gov.br/ITR/file.zip')
+        assert not breaker.is_open('https://example.com/file.zip')
+
+    def test_half_open_lets_one_probe_through(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10.0, clock=clock
+        )
+        breaker.record_failure(URL)
+
+        clock.now += 10.0
+        breaker.before_request(URL)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request(URL)
+
+        breaker.record_success(URL)
+        breaker.before_request(URL)
+        assert not breaker.is_open(URL)
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10.0, clock=clock
+        )
+        breaker.record_failure(URL)
+        clock.now += 10.0
+        breaker.before_request(URL)
+
+        clock.now += 1.0
+        breaker.record_failure(URL)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request(URL)
+        assert exc_info.value.retry_in == pytest.approx(10.0)
+
+    def test_lost_probe_is_replaced_after_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10.0, clock=clock
+        )
+        breaker.record_failure(URL)
+        clock.now += 10.0
+        breaker.before_request(URL)
+
+        clock.now += 10.0
+        breaker.before_request(URL)
@@ -0,0 +1,75 @@
+import pytest
+
+from globaldatafinance.core.utils import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_is_free_then_requests_are_spaced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+
+        bucket.reserve()
+        clock.now += 1.0
+
+        assert bucket.reserve() == 0.0
+
+    def test_pause_delays_requests(self):
+        clock = FakeClock()
+        bucket = TokenBucket(clock=clock)
+
+        assert bucket.reserve() == 0.0
+        bucket.pause(5.0)
+        assert bucket.reserve() == pytest.approx(5.0)
+
+        clock.now += 5.0
+        assert bucket.reserve() == 0.0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_without_wait(self):
+        bucket = TokenBucket(rate=1000.0)
+
+        await bucket.acquire()
+
+
+class TestHostRateLimiter:
+    def test_one_bucket_per_host(self):
+        limiter = HostRateLimiter(rate=1.0, clock=FakeClock())
+
+        a = limiter.bucket('https://dados.cvm.gov.br/dados/DFP.zip')
+        b = limiter.bucket('https://DADOS.cvm.gov.br/dados/ITR.zip')
+        c = limiter.bucket('https://bvmf.bmfbovespa.com.br/file.zip')
+
+        assert a is b
+        assert a is not c
+
+    def test_pause_only_affects_host(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(clock=clock)
+
+        limiter.pause('https://dados.cvm.gov.br/a.zip', 3.0)
+
+        assert limiter.bucket('https://dados.cvm.gov.br/b.zip').reserve() == (
+            pytest.approx(3.0)
+        )
+        assert limiter.bucket('https://example.com/c.zip').reserve() == 0.0
@@ -1,7 +1,10 @@
+import httpx
+import pytest
 import requests  # type: ignore
 
-from globaldatafinance.core.utils import RetryStrategy
+from globaldatafinance.core.utils import RetryBudget, RetryStrategy
 from globaldatafinance.macro_exceptions import (
+    CircuitOpenError,
     DiskFullError,
     NetworkError,
     PathPermissionError,
@@ -297,3 +300,109 @@ class TestRetryStrategy:
         backoff1_second = strategy.calculate_backoff(retry_count=1)
 
         assert backoff1_first == backoff1_second
+
+    def test_jitter_scales_backoff_randomly(self):
+        draws = iter([0.0, 0.5, 1.0])
+        strategy = RetryStrategy(
+            initial_backoff=1.0,
+            max_backoff=60.0,
+            multiplier=2.0,
+            jitter=True,
+            random_source=lambda: next(draws),
+        )
+
+        backoffs = [strategy.calculate_backoff(2) for _ in range(3)]
+        assert backoffs == [0.0, 2.0, 4.0]
+
+    def test_jitter_stays_below_max_backoff(self):
+        strategy = RetryStrategy(
+            initial_backoff=1.0, max_backoff=10.0, multiplier=2.0, jitter=True
+        )
+
+        backoffs = [strategy.calculate_backoff(20) for _ in range(100)]
+        assert all(0.0 <= backoff <= 10.0 for backoff in backoffs)
+        assert len(set(backoffs)) > 1
+
+
+def _status_error(status_code):
+    request = httpx.Request('GET', 'https://example.com/file.zip')
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(
+        f'{status_code} error', request=request, response=response
+    )
+
+
+class TestRetryStrategyTypedErrors:
+    @pytest.fixture
+    def strategy(self):
+        return RetryStrategy(
+            initial_backoff=1.0, max_backoff=60.0, multiplier=2.0
+        )
+
+    @pytest.mark.parametrize('status_code', [408, 429, 500, 502, 503, 504])
+    def test_transient_statuses_are_retryable(self, strategy, status_code):
+        assert strategy.is_retryable(_status_error(status_code)) is True
+
+    @pytest.mark.parametrize('status_code', [400, 401, 403, 404, 410])
+    def test_client_errors_are_not_retryable(self, strategy, status_code):
+        assert strategy.is_retryable(_status_error(status_code)) is False
+
+    @pytest.mark.parametrize(
+        'error',
+        [
+            httpx.ConnectError('boom'),
+            httpx.ReadError('boom'),
+            httpx.ReadTimeout('boom'),
+            httpx.RemoteProtocolError('boom'),
+        ],
+    )
+    def test_transport_errors_are_retryable(self, strategy, error):
+        assert strategy.is_retryable(error) is True
+
+    @pytest.mark.parametrize(
+        'error',
+        [
+            httpx.UnsupportedProtocol('timeout'),
+            httpx.TooManyRedirects('try again'),
+            httpx.InvalidURL('unavailable'),
+        ],
+    )
+    def test_permanent_httpx_errors_ignore_message(self, strategy, error):
+        assert strategy.is_retryable(error) is False
+
+    def test_builtin_connection_errors_are_retryable(self, strategy):
+        assert strategy.is_retryable(ConnectionResetError()) is True
+
+    def test_open_circuit_is_not_retryable(self, strategy):
+        error = CircuitOpenError('https://example.com', 5.0)
+        assert strategy.is_retryable(error) is False
+
+
+class TestRetryBudget:
+    def test_min_retries_are_always_available(self):
+        budget = RetryBudget(ratio=0.0, min_retries=2)
+
+        assert budget.try_spend() is True
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+
+    def test_requests_deposit_ratio(self):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+
+        for _ in range(4):
+            budget.record_request()
+
+        assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+    def test_reset_starts_a_new_run(self):
+        budget = RetryBudget(ratio=0.0, min_retries=1)
+        budget.try_spend()
+
+        budget.reset()
+
+        assert budget.retries == 0
+        assert budget.try_spend() is True
+
+    def test_negative_ratio_is_rejected(self):
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1.0)
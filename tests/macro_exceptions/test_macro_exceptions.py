@@ -1,6 +1,7 @@
 import pytest
 
 from globaldatafinance.macro_exceptions import (
+    CircuitOpenError,
     CorruptedZipError,
     DiskFullError,
     EmptyDirectoryError,
@@ -10,6 +11,7 @@ from globaldatafinance.macro_exceptions import (
     PathIsNotDirectoryError,
     PathPermissionError,
     SecurityError,
+    StalledTransferError,
     TimeoutError,
 )
 
@@ -238,6 +240,22 @@ class TestNetworkError:
         error = NetworkError('', 'Error message')
         assert isinstance(error, NetworkError)
 
+
+class TestStalledTransferError:
+    def test_is_a_network_error(self):
+        error = StalledTransferError('file.zip', 512.0, 16384.0)
+
+        assert isinstance(error, NetworkError)
+        assert error.rate == 512.0
+        assert error.min_rate == 16384.0
+
+    def test_message_contains_rates(self):
+        error = StalledTransferError('file.zip', 512.0, 16384.0)
+
+        assert "'file.zip'" in str(error)
+        assert '512 B/s' in str(error)
+        assert '16,384 B/s' in str(error)
+
     def test_with_special_characters_in_doc_name(self):
         doc_name = 'COTAHIST_A2023_ção.zip'
         error = NetworkError(doc_name, 'Failed')
@@ -636,3 +654,16 @@ class TestExceptionIntegration:
             caught = False
 
         assert caught
+
+
+class TestCircuitOpenError:
+    def test_message_contains_host_and_delay(self):
+        error = CircuitOpenError('https://dados.cvm.gov.br', 12.34)
+
+        assert "'https://dados.cvm.gov.br'" in str(error)
+        assert '12.3s' in str(error)
+        assert error.host == 'https://dados.cvm.gov.br'
+        assert error.retry_in == 12.34
+
+    def test_is_not_a_network_error(self):
+        assert not issubclass(CircuitOpenError, NetworkError)
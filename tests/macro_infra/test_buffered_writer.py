@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from globaldatafinance.macro_infra.buffered_writer import BufferedFileWriter
+
+
+class RecordingSink:
+    def __init__(self, block=None):
+        self.calls = []
+        self.threads = set()
+        self.block = block
+
+    def __call__(self, data, position):
+        if self.block is not None:
+            self.block.wait(5)
+        self.threads.add(threading.current_thread().name)
+        self.calls.append((bytes(data), position))
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='test-io')
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+class TestBufferedFileWriter:
+    async def test_coalesces_chunks_with_positions(self, executor):
+        sink = RecordingSink()
+        writer = BufferedFileWriter(
+            sink, executor, start=100, min_buffer=10, max_buffer=10
+        )
+
+        for _ in range(5):
+            await writer.write(b'abcd')
+        await writer.close()
+
+        assert sink.calls == [
+            (b'abcdabcdabcd', 100),
+            (b'abcdabcd', 112),
+        ]
+        assert writer.bytes_written == 20
+        assert writer.write_time >= 0
+        assert sink.threads == {'test-io_0'}
+
+    async def test_backpressure_bounds_queued_buffers(self, executor):
+        release = threading.Event()
+        sink = RecordingSink(block=release)
+        writer = BufferedFileWriter(
+            sink, executor, min_buffer=1, max_buffer=1, max_pending=2
+        )
+
+        await writer.write(b'a')
+        await writer.write(b'b')
+        blocked = asyncio.create_task(writer.write(b'c'))
+        await asyncio.sleep(0.05)
+
+        # Two buffers are queued; the third write waits for the disk
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await writer.close()
+
+        assert [data for data, _ in sink.calls] == [b'a', b'b', b'c']
+        assert writer.wait_time > 0
+
+    async def test_buffer_grows_with_throughput(self, executor):
+        writer = BufferedFileWriter(
+            RecordingSink(),
+            executor,
+            min_buffer=1024,
+            max_buffer=64 * 1024,
+            flush_interval=10.0,
+        )
+
+        for _ in range(4):
+            await writer.write(b'x' * 2048)
+        await writer.close()
+
+        assert writer.buffer_size == 64 * 1024
+
+    async def test_write_errors_are_reported(self, executor):
+        def failing_sink(data, position):
+            raise OSError('No space left on device')
+
+        writer = BufferedFileWriter(
+            failing_sink, executor, name='out.zip', min_buffer=1
+        )
+        await writer.write(b'data')
+
+        with pytest.raises(OSError, match='Failed to write chunk to out.zip'):
+            await writer.close()
+
+    async def test_abort_drops_buffer_and_waits(self, executor):
+        sink = RecordingSink()
+        writer = BufferedFileWriter(sink, executor, min_buffer=4)
+
+        await writer.write(b'1234')
+        await writer.write(b'56')
+        await writer.abort()
+
+        assert sink.calls == [(b'1234', 0)]
@@ -1,6 +1,8 @@
 import asyncio
 import zipfile
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from globaldatafinance.macro_exceptions import (
@@ -255,3 +257,90 @@ class TestExtractorEdgeCases:
         for i, lines in enumerate(results):
             assert len(lines) >= 1
             assert f'Content {i}' in lines[0]
+
+
+class TestExtractorCsvToParquet:
+    def convert(self, tmp_path, content, block_size=None):
+        zip_path = tmp_path / 'data.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('data.csv', content)
+
+        extractor = ExtractorAdapter()
+        if block_size is not None:
+            extractor.CSV_BLOCK_SIZE = block_size
+
+        parquet_path = tmp_path / 'data.parquet'
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            extractor.extract_csv_from_zip_to_parquet(
+                zf, parquet_path, 'data.parquet', 'data.csv'
+            )
+        return pq.read_table(parquet_path)
+
+    def test_converts_csv_with_inferred_types(self, tmp_path):
+        content = 'id;nome;valor\n1;Ação;1.5\n2;Fundo;2.5\n'
+        table = self.convert(tmp_path, content.encode('latin-1'))
+
+        assert table.schema.field('id').type == pa.int64()
+        assert table.schema.field('valor').type == pa.float64()
+        assert table.column('nome').to_pylist() == ['Ação', 'Fundo']
+
+    def test_dates_are_kept_as_text(self, tmp_path):
+        content = b'DT_REFER;x\n2023-12-31;1\n'
+        table = self.convert(tmp_path, content)
+
+        assert table.schema.field('DT_REFER').type == pa.string()
+        assert table.column('DT_REFER').to_pylist() == ['2023-12-31']
+
+    def test_type_change_in_later_block_falls_back_to_text(self, tmp_path):
+        rows = ''.join(f'{i};a\n' for i in range(200))
+        content = f'code;name\n{rows}X1;b\n'.encode('ascii')
+        table = self.convert(tmp_path, content, block_size=256)
+
+        assert table.num_rows == 201
+        assert table.schema.field('code').type == pa.string()
+        assert table.column('code').to_pylist()[-1] == 'X1'
+
+    def test_latin1_after_ascii_sample_falls_back(self, tmp_path):
+        rows = 'n;t\n' + '1;a\n' * 20_000
+        content = rows.encode('ascii') + 'Ç;ã\n'.encode('latin-1')
+        table = self.convert(tmp_path, content)
+
+        assert table.num_rows == 20_001
+        assert table.column('t').to_pylist()[-1] == 'ã'
+
+    def test_empty_csv_writes_no_file(self, tmp_path):
+        zip_path = tmp_path / 'data.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('data.csv', b'a;b\n')
+
+        parquet_path = tmp_path / 'data.parquet'
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            ExtractorAdapter().extract_csv_from_zip_to_parquet(
+                zf, parquet_path, 'data.parquet', 'data.csv'
+            )
+
+        assert not parquet_path.exists()
+
+    def test_explicit_column_types_and_transform(self, tmp_path):
+        zip_path = tmp_path / 'data.zip'
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr('data.csv', b'DT;code\n2023-12-31;007\n')
+
+        def add_marker(batch):
+            return batch.append_column('marker', pa.array([1] * len(batch)))
+
+        parquet_path = tmp_path / 'data.parquet'
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            ExtractorAdapter().extract_csv_from_zip_to_parquet(
+                zf,
+                parquet_path,
+                'data.parquet',
+                'data.csv',
+                column_types={'DT': pa.date32(), 'code': pa.string()},
+                batch_transform=add_marker,
+            )
+
+        table = pq.read_table(parquet_path)
+        assert table.schema.field('DT').type == pa.date32()
+        assert table.column('code').to_pylist() == ['007']
+        assert table.column('marker').to_pylist() == [1]
@@ -68,3 +68,65 @@ class TestReadFilesAdapter:
         )
         assert len(chunks) == 2
         assert all(isinstance(chunk, pd.DataFrame) for chunk in chunks)
+
+
+def make_zip(tmp_path, content, name='test.csv'):
+    zip_path = tmp_path / 'test.zip'
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        zf.writestr(name, content)
+    return zip_path
+
+
+@pytest.mark.unit
+class TestDetectEncoding:
+    @pytest.mark.parametrize(
+        'content, expected',
+        [
+            ('col1;col2\n1;2\n'.encode('ascii'), 'utf-8'),
+            ('col1;col2\n1;Ação\n'.encode('utf-8'), 'utf-8'),
+            (b'\xef\xbb\xbfcol1;col2\n1;2\n', 'utf-8'),
+            ('col1;col2\n1;Ação\n'.encode('latin-1'), 'latin-1'),
+        ],
+    )
+    def test_detects_encoding(self, tmp_path, content, expected):
+        zip_path = make_zip(tmp_path, content)
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            detected = ReadFilesAdapter.detect_encoding(zf, 'test.csv')
+        assert detected == expected
+
+    def test_character_cut_at_sample_end_is_utf8(self, tmp_path):
+        content = 'col1\nÇ\n'.encode('utf-8')
+        zip_path = make_zip(tmp_path, content)
+        sample_size = content.index('Ç'.encode('utf-8')) + 1
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            detected = ReadFilesAdapter.detect_encoding(
+                zf, 'test.csv', sample_size=sample_size
+            )
+        assert detected == 'utf-8'
+
+
+@pytest.mark.unit
+class TestCsvStream:
+    def test_read_csv_header(self, tmp_path):
+        content = b'\xef\xbb\xbfCNPJ_CIA;"DENOM;CIA";VL_CONTA\r\n1;x;2\r\n'
+        zip_path = make_zip(tmp_path, content)
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            header = ReadFilesAdapter.read_csv_header(zf, 'test.csv', 'utf-8')
+        assert header == ['CNPJ_CIA', 'DENOM;CIA', 'VL_CONTA']
+
+    def test_open_csv_stream_skips_bad_rows(self):
+        content = b'a;b\n1;x\n2;y;extra\n3;z\n'
+        with ReadFilesAdapter.open_csv_stream(
+            io.BytesIO(content), 'utf-8', block_size=1 << 20
+        ) as reader:
+            table = reader.read_all()
+        assert table.column('a').to_pylist() == [1, 3]
+        assert table.column('b').to_pylist() == ['x', 'z']
+
+    def test_open_csv_stream_decodes_latin1(self):
+        content = 'a;b\n1;Ação\n'.encode('latin-1')
+        with ReadFilesAdapter.open_csv_stream(
+            io.BytesIO(content), 'latin-1', block_size=1 << 20
+        ) as reader:
+            table = reader.read_all()
+        assert table.column('b').to_pylist() == ['Ação']
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -89,6 +90,7 @@ class TestRequestsAdapterDownload:
 
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
         mock_response.aiter_bytes = MagicMock(return_value=chunk_generator())
 
         mock_stream = AsyncMock()
@@ -109,9 +111,8 @@ class TestRequestsAdapterDownload:
             'https://example.com/file.zip', 'dummy_file.zip'
         )
 
-        assert mock_file.write.call_count == 2
-        mock_file.write.assert_any_call(b'chunk1')
-        mock_file.write.assert_any_call(b'chunk2')
+        # Chunks are coalesced into one buffer before hitting the disk
+        mock_file.write.assert_called_once_with(b'chunk1chunk2')
         mock_file.close.assert_called_once()
 
     @pytest.mark.asyncio
@@ -126,6 +127,7 @@ class TestRequestsAdapterDownload:
 
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
         mock_response.aiter_bytes = MagicMock(return_value=chunk_generator())
 
         mock_stream = AsyncMock()
@@ -203,6 +205,7 @@ class TestRequestsAdapterDownload:
 
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
         mock_response.aiter_bytes = MagicMock(return_value=chunk_generator())
 
         mock_stream = AsyncMock()
@@ -228,3 +231,802 @@ class TestRequestsAdapterDownload:
             )
 
         mock_remove.assert_called_once_with('dummy_file.zip')
+
+
+class TestRequestsAdapterPooledClient:
+    @pytest.mark.asyncio
+    @patch('globaldatafinance.macro_infra.requests_adapter.httpx.AsyncClient')
+    async def test_open_adapter_reuses_one_client(self, mock_client_class):
+        mock_client = AsyncMock()
+        mock_client.head.return_value = Mock(status_code=200)
+        mock_client_class.return_value = mock_client
+
+        adapter = RequestsAdapter(
+            max_connections=4, max_keepalive_connections=2
+        )
+        async with adapter:
+            assert adapter.is_open
+            await adapter.async_head('https://example.com/a')
+            await adapter.async_head('https://example.com/b', timeout=5.0)
+
+        mock_client_class.assert_called_once()
+        limits = mock_client_class.call_args[1]['limits']
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 2
+        assert mock_client.head.call_count == 2
+        assert mock_client.head.call_args[1]['timeout'] == 5.0
+        mock_client.aclose.assert_awaited_once()
+        assert not adapter.is_open
+
+    @pytest.mark.asyncio
+    @patch('globaldatafinance.macro_infra.requests_adapter.httpx.AsyncClient')
+    async def test_session_keeps_outer_client_open(self, mock_client_class):
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        adapter = RequestsAdapter()
+        await adapter.open()
+        async with adapter.session():
+            await adapter.async_head('https://example.com')
+
+        assert adapter.is_open
+        mock_client.aclose.assert_not_awaited()
+
+        await adapter.aclose()
+        mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_download_through_pooled_client(self, tmp_path):
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, content=b'payload')
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        output = tmp_path / 'file.zip'
+
+        async with adapter.session():
+            await adapter.async_download_file(
+                'https://example.com/f', str(output)
+            )
+            await adapter.async_download_file(
+                'https://example.com/f', str(output)
+            )
+
+        assert output.read_bytes() == b'payload'
+        assert not adapter.is_open
+
+
+class TestRequestsAdapterDownloadInfo:
+    @staticmethod
+    def _adapter(handler):
+        import httpx
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_returns_headers_from_get_response(self, tmp_path):
+        import httpx
+
+        def handler(request):
+            assert request.method == 'GET'
+            return httpx.Response(
+                200,
+                content=b'0123456789',
+                headers={
+                    'ETag': '"v1"',
+                    'Last-Modified': 'Tue, 01 Oct 2024 00:00:00 GMT',
+                },
+            )
+
+        output = tmp_path / 'file.zip'
+        info = await self._adapter(handler).async_download_file(
+            'https://example.com/file.zip', str(output)
+        )
+
+        assert info.bytes_written == 10
+        assert info.content_length == 10
+        assert info.etag == '"v1"'
+        assert info.last_modified == 'Tue, 01 Oct 2024 00:00:00 GMT'
+        assert info.is_complete
+
+    @pytest.mark.asyncio
+    async def test_ignores_content_length_of_encoded_body(self, tmp_path):
+        import gzip
+
+        import httpx
+
+        body = gzip.compress(b'x' * 1000)
+
+        def handler(request):
+            return httpx.Response(
+                200, content=body, headers={'Content-Encoding': 'gzip'}
+            )
+
+        info = await self._adapter(handler).async_download_file(
+            'https://example.com/file.zip', str(tmp_path / 'file.zip')
+        )
+
+        assert info.bytes_written == 1000
+        assert info.content_length is None
+        assert info.is_complete
+
+    @pytest.mark.asyncio
+    async def test_not_modified_leaves_file_untouched(self, tmp_path):
+        import httpx
+
+        def handler(request):
+            assert request.headers['if-none-match'] == '"v1"'
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+
+        output = tmp_path / 'file.zip'
+        output.write_bytes(b'existing')
+
+        info = await self._adapter(handler).async_download_file(
+            'https://example.com/file.zip',
+            str(output),
+            headers={'If-None-Match': '"v1"'},
+        )
+
+        assert info.not_modified
+        assert info.bytes_written == 0
+        assert info.etag == '"v1"'
+        assert output.read_bytes() == b'existing'
+
+    @pytest.mark.asyncio
+    async def test_digest_is_computed_while_streaming(self, tmp_path):
+        import hashlib
+
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, content=b'payload' * 1000)
+
+        info = await self._adapter(handler).async_download_file(
+            'https://example.com/file.zip',
+            str(tmp_path / 'file.zip'),
+            chunk_size=100,
+            digest_algorithm='sha256',
+        )
+
+        assert info.digest == hashlib.sha256(b'payload' * 1000).hexdigest()
+
+
+class FlakyRangeServer:
+    """Serves BODY, dropping the connection after `fail_after` bytes once."""
+
+    BODY = bytes(range(256)) * 400
+
+    def __init__(self, fail_after=None, etag='"v1"'):
+        self.fail_after = fail_after
+        self.etag = etag
+        self.requests = []
+
+    def handler(self, request):
+        import httpx
+
+        self.requests.append(request)
+        headers = {'ETag': self.etag} if self.etag else {}
+        range_header = request.headers.get('range')
+
+        if range_header and request.headers.get('if-range') == self.etag:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            if start >= len(self.BODY):
+                return httpx.Response(416)
+            headers['Content-Range'] = (
+                f'bytes {start}-{len(self.BODY) - 1}/{len(self.BODY)}'
+            )
+            return httpx.Response(
+                206, content=self.BODY[start:], headers=headers
+            )
+
+        if self.fail_after is None:
+            return httpx.Response(200, content=self.BODY, headers=headers)
+
+        fail_after, self.fail_after = self.fail_after, None
+
+        async def broken_body():
+            yield self.BODY[:fail_after]
+            raise httpx.ReadError('connection dropped')
+
+        return httpx.Response(200, content=broken_body(), headers=headers)
+
+
+class TestRequestsAdapterGet:
+    @pytest.mark.asyncio
+    async def test_returns_response_with_body(self):
+        import httpx
+
+        def handler(request):
+            assert request.headers['If-None-Match'] == '"v1"'
+            return httpx.Response(200, text='<html>index</html>')
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        response = await adapter.async_get(
+            'https://example.com/dir/', headers={'If-None-Match': '"v1"'}
+        )
+
+        assert response.status_code == 200
+        assert response.text == '<html>index</html>'
+
+
+class TestRequestsAdapterBufferDownload:
+    @staticmethod
+    def _adapter(handler):
+        import httpx
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_writes_body_into_buffer(self):
+        import hashlib
+        import io
+
+        import httpx
+
+        body = bytes(range(256)) * 100
+        buffer = io.BytesIO()
+
+        info = await self._adapter(
+            lambda request: httpx.Response(
+                200, content=body, headers={'ETag': '"v1"'}
+            )
+        ).async_download_to_buffer(
+            'https://example.com/file.zip', buffer, digest_algorithm='md5'
+        )
+
+        assert buffer.getvalue() == body
+        assert info.bytes_written == len(body)
+        assert info.etag == '"v1"'
+        assert info.digest == hashlib.md5(body).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_writes_nothing(self):
+        import io
+
+        import httpx
+
+        buffer = io.BytesIO()
+
+        info = await self._adapter(
+            lambda request: httpx.Response(304)
+        ).async_download_to_buffer(
+            'https://example.com/file.zip',
+            buffer,
+            headers={'If-None-Match': '"v1"'},
+        )
+
+        assert info.not_modified
+        assert buffer.getvalue() == b''
+
+    @pytest.mark.asyncio
+    async def test_raises_for_error_status(self):
+        import io
+
+        import httpx
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await self._adapter(
+                lambda request: httpx.Response(500)
+            ).async_download_to_buffer(
+                'https://example.com/file.zip', io.BytesIO()
+            )
+
+
+class TestRequestsAdapterResumableDownload:
+    @staticmethod
+    def _adapter(server):
+        import httpx
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(server.handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_resumes_partial_download_with_range(self, tmp_path):
+        import hashlib
+
+        import httpx
+
+        server = FlakyRangeServer(fail_after=30_000)
+        adapter = self._adapter(server)
+        output = tmp_path / 'file.zip'
+
+        with pytest.raises(httpx.ReadError):
+            await adapter.async_download_file(
+                'https://example.com/file.zip', str(output), resume=True
+            )
+
+        part = tmp_path / 'file.zip.part'
+        offset = part.stat().st_size
+        assert 0 < offset <= 30_000
+        assert (tmp_path / 'file.zip.part.json').exists()
+        assert not output.exists()
+
+        info = await adapter.async_download_file(
+            'https://example.com/file.zip',
+            str(output),
+            digest_algorithm='sha256',
+            resume=True,
+        )
+
+        assert server.requests[1].headers['range'] == f'bytes={offset}-'
+        assert server.requests[1].headers['if-range'] == '"v1"'
+        assert output.read_bytes() == server.BODY
+        assert info.resumed_from == offset
+        assert info.bytes_written == len(server.BODY)
+        assert info.content_length == len(server.BODY)
+        assert info.is_complete
+        assert info.digest == hashlib.sha256(server.BODY).hexdigest()
+        assert not part.exists()
+        assert not (tmp_path / 'file.zip.part.json').exists()
+
+    @pytest.mark.asyncio
+    async def test_changed_validator_downloads_from_start(self, tmp_path):
+        import httpx
+
+        server = FlakyRangeServer(fail_after=10_000)
+        adapter = self._adapter(server)
+        output = tmp_path / 'file.zip'
+
+        with pytest.raises(httpx.ReadError):
+            await adapter.async_download_file(
+                'https://example.com/file.zip', str(output), resume=True
+            )
+
+        server.etag = '"v2"'
+        info = await adapter.async_download_file(
+            'https://example.com/file.zip', str(output), resume=True
+        )
+
+        assert info.resumed_from == 0
+        assert output.read_bytes() == server.BODY
+
+    @pytest.mark.asyncio
+    async def test_unsatisfiable_range_restarts(self, tmp_path):
+        server = FlakyRangeServer()
+        adapter = self._adapter(server)
+        output = tmp_path / 'file.zip'
+        (tmp_path / 'file.zip.part').write_bytes(server.BODY + b'extra')
+        (tmp_path / 'file.zip.part.json').write_text(
+            '{"url": "https://example.com/file.zip", "validator": "\\"v1\\""}'
+        )
+
+        info = await adapter.async_download_file(
+            'https://example.com/file.zip', str(output), resume=True
+        )
+
+        assert [r.headers.get('range') for r in server.requests] == [
+            f'bytes={len(server.BODY) + 5}-',
+            None,
+        ]
+        assert info.resumed_from == 0
+        assert output.read_bytes() == server.BODY
+
+    @pytest.mark.asyncio
+    async def test_part_without_validator_is_discarded(self, tmp_path):
+        import httpx
+
+        server = FlakyRangeServer(fail_after=10_000, etag=None)
+        adapter = self._adapter(server)
+        output = tmp_path / 'file.zip'
+
+        with pytest.raises(httpx.ReadError):
+            await adapter.async_download_file(
+                'https://example.com/file.zip', str(output), resume=True
+            )
+
+        assert not (tmp_path / 'file.zip.part').exists()
+        assert not (tmp_path / 'file.zip.part.json').exists()
+
+
+class RangeServer:
+    """Serves BODY with byte-range support, recording every request."""
+
+    BODY = bytes(range(256)) * 400
+
+    def __init__(self, ranges=True, etag='"v1"'):
+        self.ranges = ranges
+        self.etag = etag
+        self.requests = []
+
+    def handler(self, request):
+        import httpx
+
+        self.requests.append(request)
+        headers = {'ETag': self.etag}
+
+        if request.headers.get('if-none-match') == self.etag:
+            return httpx.Response(304, headers=headers)
+
+        if_match = request.headers.get('if-match')
+        if if_match is not None and if_match != self.etag:
+            return httpx.Response(412)
+
+        range_header = request.headers.get('range')
+        if not self.ranges or range_header is None:
+            return httpx.Response(200, content=self.BODY, headers=headers)
+
+        first, _, last = range_header.split('=')[1].partition('-')
+        start = int(first)
+        end = int(last) if last else len(self.BODY) - 1
+        headers['Content-Range'] = f'bytes {start}-{end}/{len(self.BODY)}'
+        return httpx.Response(
+            206, content=self.BODY[start : end + 1], headers=headers
+        )
+
+
+class TestRequestsAdapterStallDetection:
+    URL = 'https://example.com/file.zip'
+
+    @staticmethod
+    def _adapter(handler, **kwargs):
+        import httpx
+
+        adapter = RequestsAdapter(**kwargs)
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_idle_body_raises_and_keeps_part(self, tmp_path):
+        import httpx
+
+        from globaldatafinance.macro_exceptions import StalledTransferError
+
+        async def stalling_body():
+            yield b'x' * 4096
+            await asyncio.sleep(10)
+            yield b'y'
+
+        adapter = self._adapter(
+            lambda request: httpx.Response(
+                200, content=stalling_body(), headers={'ETag': '"v1"'}
+            ),
+            min_throughput=1024,
+            stall_window=0.05,
+        )
+        output = tmp_path / 'file.zip'
+
+        with pytest.raises(StalledTransferError):
+            await adapter.async_download_file(
+                self.URL, str(output), chunk_size=1024, resume=True
+            )
+
+        assert not output.exists()
+        assert (tmp_path / 'file.zip.part').read_bytes() == b'x' * 4096
+
+    @pytest.mark.asyncio
+    async def test_slow_body_raises(self, tmp_path):
+        import httpx
+
+        from globaldatafinance.macro_exceptions import StalledTransferError
+
+        async def slow_body():
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                yield b'x'
+
+        adapter = self._adapter(
+            lambda request: httpx.Response(200, content=slow_body()),
+            min_throughput=1024,
+            stall_window=0.1,
+        )
+
+        with pytest.raises(StalledTransferError):
+            await adapter.async_download_file(
+                self.URL, str(tmp_path / 'file.zip'), chunk_size=1
+            )
+
+        assert not (tmp_path / 'file.zip').exists()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path):
+        server = RangeServer()
+
+        info = await self._adapter(server.handler).async_download_file(
+            self.URL, str(tmp_path / 'file.zip')
+        )
+
+        assert RequestsAdapter().min_throughput is None
+        assert info.bytes_written == len(server.BODY)
+
+
+class TestRequestsAdapterSegmentedDownload:
+    URL = 'https://example.com/file.zip'
+
+    @staticmethod
+    def _adapter(server):
+        import httpx
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(server.handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_large_file_is_fetched_as_ranges(self, tmp_path):
+        import hashlib
+
+        server = RangeServer()
+        output = tmp_path / 'file.zip'
+
+        info = await self._adapter(server).async_download_segmented(
+            self.URL,
+            str(output),
+            segments=4,
+            min_size=1024,
+            chunk_size=4096,
+            digest_algorithm='sha256',
+        )
+
+        assert sorted(r.headers['range'] for r in server.requests) == [
+            'bytes=0-',
+            'bytes=25600-51199',
+            'bytes=51200-76799',
+            'bytes=76800-102399',
+        ]
+        assert all(
+            r.headers['if-match'] == '"v1"' for r in server.requests[1:]
+        )
+        assert output.read_bytes() == server.BODY
+        assert info.bytes_written == len(server.BODY)
+        assert info.content_length == len(server.BODY)
+        assert info.is_complete
+        assert info.digest == hashlib.sha256(server.BODY).hexdigest()
+        assert not (tmp_path / 'file.zip.part').exists()
+
+    @pytest.mark.asyncio
+    async def test_small_file_uses_single_request(self, tmp_path):
+        server = RangeServer()
+        output = tmp_path / 'file.zip'
+
+        info = await self._adapter(server).async_download_segmented(
+            self.URL, str(output), min_size=len(server.BODY) + 1
+        )
+
+        assert len(server.requests) == 1
+        assert output.read_bytes() == server.BODY
+        assert info.is_complete
+
+    @pytest.mark.asyncio
+    async def test_server_without_ranges_streams_full_body(self, tmp_path):
+        server = RangeServer(ranges=False)
+        output = tmp_path / 'file.zip'
+
+        info = await self._adapter(server).async_download_segmented(
+            self.URL, str(output), min_size=1024
+        )
+
+        assert len(server.requests) == 1
+        assert output.read_bytes() == server.BODY
+        assert info.bytes_written == info.content_length == len(server.BODY)
+
+    @pytest.mark.asyncio
+    async def test_extra_ranges_only_use_free_slots(self, tmp_path):
+        import asyncio
+
+        server = RangeServer()
+        slots = asyncio.Semaphore(1)
+        await slots.acquire()
+
+        await self._adapter(server).async_download_segmented(
+            self.URL,
+            str(tmp_path / 'file.zip'),
+            segments=4,
+            min_size=1024,
+            slots=slots,
+        )
+
+        # No free slot: the first connection fetches every range in turn
+        assert [r.headers['range'] for r in server.requests] == [
+            'bytes=0-',
+            'bytes=25600-51199',
+            'bytes=51200-76799',
+            'bytes=76800-102399',
+        ]
+        assert (tmp_path / 'file.zip').read_bytes() == server.BODY
+
+        slots.release()
+        await self._adapter(server).async_download_segmented(
+            self.URL,
+            str(tmp_path / 'other.zip'),
+            segments=4,
+            min_size=1024,
+            slots=slots,
+        )
+
+        assert not slots.locked()
+        assert (tmp_path / 'other.zip').read_bytes() == server.BODY
+
+    @pytest.mark.asyncio
+    async def test_late_join_takes_slots_freed_during_download(self, tmp_path):
+        import asyncio
+
+        import httpx
+
+        server = RangeServer()
+        in_flight = {'now': 0, 'max': 0}
+
+        async def slow_body(data):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            try:
+                for i in range(0, len(data), 2560):
+                    await asyncio.sleep(0.01)
+                    yield data[i : i + 2560]
+            finally:
+                in_flight['now'] -= 1
+
+        def handler(request):
+            response = server.handler(request)
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                content=slow_body(response.content),
+            )
+
+        adapter = RequestsAdapter()
+        adapter._build_client = lambda timeout: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        slots = asyncio.Semaphore(3)
+        for _ in range(3):
+            await slots.acquire()
+
+        async def free_slots():
+            await asyncio.sleep(0.05)
+            for _ in range(3):
+                slots.release()
+
+        freeing = asyncio.create_task(free_slots())
+        await adapter.async_download_segmented(
+            self.URL,
+            str(tmp_path / 'file.zip'),
+            segments=4,
+            min_size=1024,
+            chunk_size=2560,
+            slots=slots,
+            join_late=True,
+        )
+        await freeing
+
+        # Every slot was busy at the start; the freed ones took ranges
+        assert in_flight['max'] >= 2
+        assert len(server.requests) == 4
+        assert (tmp_path / 'file.zip').read_bytes() == server.BODY
+        assert not slots.locked()
+        assert slots._value == 3
+
+    @pytest.mark.asyncio
+    async def test_changed_file_fails_and_removes_part(self, tmp_path):
+        import httpx
+
+        server = RangeServer()
+        original = server.handler
+
+        def changing_handler(request):
+            response = original(request)
+            server.etag = '"v2"'
+            return response
+
+        server.handler = changing_handler
+        output = tmp_path / 'file.zip'
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await self._adapter(server).async_download_segmented(
+                self.URL, str(output), segments=4, min_size=1024
+            )
+
+        assert not output.exists()
+        assert not (tmp_path / 'file.zip.part').exists()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_leaves_file_untouched(self, tmp_path):
+        server = RangeServer()
+        output = tmp_path / 'file.zip'
+        output.write_bytes(b'previous')
+
+        info = await self._adapter(server).async_download_segmented(
+            self.URL,
+            str(output),
+            min_size=1024,
+            headers={'If-None-Match': '"v1"'},
+        )
+
+        assert info.not_modified
+        assert output.read_bytes() == b'previous'
+
+
+class TestRequestsAdapterThrottleDelay:
+    @staticmethod
+    def _error(status, headers=None):
+        import httpx
+
+        request = httpx.Request('GET', 'https://example.com/file.zip')
+        response = httpx.Response(status, headers=headers, request=request)
+        return httpx.HTTPStatusError(
+            'error', request=request, response=response
+        )
+
+    def test_retry_after_seconds(self):
+        error = self._error(429, {'Retry-After': '7'})
+
+        assert RequestsAdapter.throttle_delay(error) == 7.0
+
+    def test_retry_after_http_date(self):
+        import time
+        from email.utils import formatdate
+
+        error = self._error(
+            503, {'Retry-After': formatdate(time.time() + 60, usegmt=True)}
+        )
+
+        assert 55 <= RequestsAdapter.throttle_delay(error) <= 60
+
+    def test_missing_retry_after(self):
+        assert RequestsAdapter.throttle_delay(self._error(503)) == 0.0
+
+    def test_other_errors_are_not_throttling(self):
+        assert RequestsAdapter.throttle_delay(self._error(404)) is None
+        assert RequestsAdapter.throttle_delay(ValueError('boom')) is None
+
+    @pytest.mark.asyncio
+    async def test_download_reports_response_time(self, tmp_path):
+        server = RangeServer()
+        adapter = TestRequestsAdapterSegmentedDownload._adapter(server)
+
+        info = await adapter.async_download_file(
+            'https://example.com/file.zip', str(tmp_path / 'file.zip')
+        )
+
+        assert info.response_time is not None
+        assert info.response_time >= 0
+
+    @pytest.mark.asyncio
+    async def test_download_writes_on_io_thread(self, tmp_path):
+        import threading
+
+        server = RangeServer()
+        adapter = TestRequestsAdapterSegmentedDownload._adapter(server)
+        threads = set()
+        original = adapter._write_at
+
+        def recording_write_at(fd, data, offset):
+            threads.add(threading.current_thread().name)
+            original(fd, data, offset)
+
+        adapter._write_at = recording_write_at
+
+        info = await adapter.async_download_segmented(
+            'https://example.com/file.zip',
+            str(tmp_path / 'file.zip'),
+            min_size=1024,
+        )
+
+        assert threads == {'download-io_0'}
+        assert info.write_time is not None and info.write_time > 0
+        assert info.transfer_time is not None and info.transfer_time > 0
+        assert (tmp_path / 'file.zip').read_bytes() == server.BODY
+
+        await adapter.aclose()
+        assert adapter._io_executor is None
@@ -0,0 +1,67 @@
+import pytest
+
+from globaldatafinance.macro_exceptions import StalledTransferError
+from globaldatafinance.macro_infra.throughput_monitor import (
+    ThroughputMonitor,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestThroughputMonitor:
+    def test_no_check_before_a_full_window(self):
+        clock = FakeClock()
+        monitor = ThroughputMonitor(1000, 10.0, clock=clock)
+
+        clock.now = 9.0
+        monitor.record(1)
+
+        assert monitor.rate is None
+
+    def test_fast_transfer_passes(self):
+        clock = FakeClock()
+        monitor = ThroughputMonitor(1000, 10.0, clock=clock)
+
+        for second in range(1, 31):
+            clock.now = float(second)
+            monitor.record(2000)
+
+        assert monitor.rate == pytest.approx(2000)
+
+    def test_slow_window_raises(self):
+        clock = FakeClock()
+        monitor = ThroughputMonitor(1000, 10.0, name='a.zip', clock=clock)
+
+        for second in range(1, 11):
+            clock.now = float(second)
+            monitor.record(5000)
+
+        # Fast start, then the connection degrades to 100 B/s
+        with pytest.raises(StalledTransferError) as exc_info:
+            for second in range(11, 31):
+                clock.now = float(second)
+                monitor.record(100)
+
+        assert exc_info.value.min_rate == 1000
+        assert exc_info.value.rate < 1000
+        assert 'a.zip' in str(exc_info.value)
+
+    def test_idle_error(self):
+        monitor = ThroughputMonitor(1000, 10.0, name='a.zip')
+
+        error = monitor.idle()
+
+        assert isinstance(error, StalledTransferError)
+        assert error.rate == 0.0
+
+    @pytest.mark.parametrize('min_rate, window', [(0, 1.0), (1.0, 0)])
+    def test_invalid_arguments(self, min_rate, window):
+        with pytest.raises(ValueError):
+            ThroughputMonitor(min_rate, window)